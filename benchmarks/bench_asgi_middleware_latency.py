@@ -0,0 +1,143 @@
+"""bench_asgi_middleware_latency.py
+
+Measures the per-request latency VeronicaASGIMiddleware adds on top of a
+trivial ASGI app. Three scenarios are compared:
+
+- bare:  the app called directly (baseline)
+- full:  middleware with full per-request ExecutionContexts (default)
+- lite:  middleware with lite per-request ExecutionContexts (lite_contexts=True)
+
+Each request runs one wrap_llm_call inside the handler when --wrap is set, so
+the lazy graph in lite mode is exercised too. Reported latencies are the
+middleware overhead (scenario minus bare) at p50 and p99.
+
+Usage:
+    python benchmarks/bench_asgi_middleware_latency.py
+    python benchmarks/bench_asgi_middleware_latency.py --requests 20000 --wrap
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from veronica_core.containment import ExecutionConfig
+from veronica_core.middleware import (
+    VeronicaASGIMiddleware,
+    get_current_execution_context,
+)
+
+
+# ---------------------------------------------------------------------------
+# App and transport
+# ---------------------------------------------------------------------------
+
+
+def make_app(wrap: bool) -> Any:
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        if wrap:
+            ctx = get_current_execution_context()
+            if ctx is not None:
+                ctx.wrap_llm_call(fn=lambda: None)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok", "more_body": False})
+
+    return app
+
+
+_SCOPE: dict[str, Any] = {
+    "type": "http",
+    "method": "GET",
+    "path": "/",
+    "query_string": b"",
+    "headers": [],
+}
+
+
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: dict[str, Any]) -> None:
+    return None
+
+
+async def measure(app: Any, requests: int, warmup: int) -> list[float]:
+    for _ in range(warmup):
+        await app(_SCOPE, _receive, _send)
+    latencies: list[float] = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        await app(_SCOPE, _receive, _send)
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    latencies.sort()
+    return latencies
+
+
+def _pct(sorted_us: list[float], q: float) -> float:
+    return sorted_us[min(len(sorted_us) - 1, int(q * len(sorted_us)))]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--wrap", action="store_true", help="wrap one call per request")
+    args = parser.parse_args()
+
+    config = ExecutionConfig(max_cost_usd=1.0, max_steps=100, max_retries_total=10)
+    app = make_app(args.wrap)
+    apps = {
+        "bare": app,
+        "full": VeronicaASGIMiddleware(app, config=config),
+        "lite": VeronicaASGIMiddleware(app, config=config, lite_contexts=True),
+    }
+
+    print("=" * 60)
+    print("BENCHMARK: VeronicaASGIMiddleware per-request overhead")
+    print(f"requests={args.requests} wrap={args.wrap}")
+    print("=" * 60)
+
+    raw = {
+        name: asyncio.run(measure(a, args.requests, args.warmup))
+        for name, a in apps.items()
+    }
+    bare_p50 = _pct(raw["bare"], 0.50)
+    bare_p99 = _pct(raw["bare"], 0.99)
+    scenarios = {}
+    for name, lat in raw.items():
+        scenarios[name] = {
+            "p50_us": round(_pct(lat, 0.50), 2),
+            "p99_us": round(_pct(lat, 0.99), 2),
+            "added_p50_us": round(_pct(lat, 0.50) - bare_p50, 2),
+            "added_p99_us": round(_pct(lat, 0.99) - bare_p99, 2),
+        }
+
+    results = {
+        "benchmark": "asgi_middleware_latency",
+        "requests": args.requests,
+        "wrap": args.wrap,
+        "scenarios": scenarios,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':<10} {'p50 us':>10} {'p99 us':>10} {'+p50 us':>10} {'+p99 us':>10}")
+    print("-" * 54)
+    for name, r in scenarios.items():
+        print(
+            f"{name:<10} {r['p50_us']:>10.2f} {r['p99_us']:>10.2f} "
+            f"{r['added_p50_us']:>10.2f} {r['added_p99_us']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
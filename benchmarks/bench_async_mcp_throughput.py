@@ -0,0 +1,204 @@
+"""bench_async_mcp_throughput.py
+
+Measures concurrent async tool calls per second through AsyncMCPContainmentAdapter
+backed by a RedisBudgetBackend.
+
+fakeredis stands in for a local Redis server. Each Redis command is delayed by a
+configurable round-trip time (RTT) to model network latency, which is what makes
+a synchronous backend stall the event loop. Two scenarios are compared:
+
+- blocking:     offload_blocking_io=False -- reserve/commit run on the event loop
+- non-blocking: offload_blocking_io=True  -- reserve/commit run in worker threads
+
+Usage:
+    python benchmarks/bench_async_mcp_throughput.py
+    python benchmarks/bench_async_mcp_throughput.py --calls 400 --concurrency 50 --rtt-ms 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+from veronica_core.adapters.mcp import MCPToolCost
+from veronica_core.adapters.mcp_async import AsyncMCPContainmentAdapter
+from veronica_core.containment import ExecutionConfig, ExecutionContext
+from veronica_core.distributed import LocalBudgetBackend, RedisBudgetBackend
+
+
+# ---------------------------------------------------------------------------
+# Redis stand-in with simulated RTT
+# ---------------------------------------------------------------------------
+
+
+class _LatentPipeline:
+    def __init__(self, pipe: Any, rtt_s: float) -> None:
+        self._pipe = pipe
+        self._rtt_s = rtt_s
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pipe, name)
+
+    def execute(self) -> Any:
+        time.sleep(self._rtt_s)
+        return self._pipe.execute()
+
+
+class LatentRedis:
+    """Wraps a fakeredis client and sleeps rtt_s before every round trip."""
+
+    def __init__(self, client: Any, rtt_s: float) -> None:
+        self._client = client
+        self._rtt_s = rtt_s
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            time.sleep(self._rtt_s)
+            return attr(*args, **kwargs)
+
+        return _call
+
+    def pipeline(self, *args: Any, **kwargs: Any) -> _LatentPipeline:
+        return _LatentPipeline(self._client.pipeline(*args, **kwargs), self._rtt_s)
+
+
+def make_redis_backend(client: Any, chain_id: str) -> RedisBudgetBackend:
+    """Build a RedisBudgetBackend around *client* without calling redis.from_url."""
+    backend = RedisBudgetBackend.__new__(RedisBudgetBackend)
+    backend._redis_url = "redis://bench"
+    backend._chain_id = chain_id
+    backend._key = f"{RedisBudgetBackend.KEY_PREFIX}{chain_id}"
+    backend._ttl = 3600
+    backend._fallback_on_error = False
+    backend._fallback = LocalBudgetBackend()
+    backend._using_fallback = False
+    backend._client = client
+    backend._lock = threading.Lock()
+    backend._fallback_seed_base = 0.0
+    return backend
+
+
+# ---------------------------------------------------------------------------
+# Scenario
+# ---------------------------------------------------------------------------
+
+
+async def run_scenario(
+    offload: bool,
+    calls: int,
+    concurrency: int,
+    rtt_ms: float,
+    tool_ms: float,
+) -> dict[str, Any]:
+    import fakeredis
+
+    client = LatentRedis(fakeredis.FakeRedis(decode_responses=True), rtt_ms / 1000.0)
+    backend = make_redis_backend(client, chain_id=f"bench-{offload}")
+    ctx = ExecutionContext(
+        config=ExecutionConfig(
+            max_cost_usd=1e9,
+            max_steps=calls * 2,
+            max_retries_total=10,
+            budget_backend=backend,
+        )
+    )
+    adapter = AsyncMCPContainmentAdapter(
+        execution_context=ctx,
+        tool_costs={"search": MCPToolCost("search", cost_per_call=0.001)},
+        offload_blocking_io=offload,
+    )
+
+    async def tool(**kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(tool_ms / 1000.0)
+        return {"ok": True}
+
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> bool:
+        async with sem:
+            t0 = time.perf_counter()
+            result = await adapter.wrap_tool_call("search", {}, tool)
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+            return result.success
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    ctx.close()
+
+    latencies.sort()
+    return {
+        "scenario": "non-blocking" if offload else "blocking",
+        "calls": calls,
+        "succeeded": sum(results),
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2], 2),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))], 2),
+        "committed_usd": round(backend.get(), 6),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--tool-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    try:
+        import fakeredis  # noqa: F401
+    except ImportError:
+        print("fakeredis is required: pip install fakeredis lupa")
+        return
+
+    print("=" * 60)
+    print("BENCHMARK: Async MCP tool-call throughput (RedisBudgetBackend)")
+    print(
+        f"calls={args.calls} concurrency={args.concurrency} "
+        f"rtt={args.rtt_ms}ms tool={args.tool_ms}ms"
+    )
+    print("=" * 60)
+
+    blocking = asyncio.run(
+        run_scenario(False, args.calls, args.concurrency, args.rtt_ms, args.tool_ms)
+    )
+    non_blocking = asyncio.run(
+        run_scenario(True, args.calls, args.concurrency, args.rtt_ms, args.tool_ms)
+    )
+
+    results = {
+        "benchmark": "async_mcp_throughput",
+        "blocking": blocking,
+        "non_blocking": non_blocking,
+        "speedup": round(non_blocking["calls_per_s"] / blocking["calls_per_s"], 2),
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':<16} {'calls/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    print("-" * 50)
+    for r in (blocking, non_blocking):
+        print(
+            f"{r['scenario']:<16} {r['calls_per_s']:>10.1f} "
+            f"{r['p50_ms']:>10.2f} {r['p99_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
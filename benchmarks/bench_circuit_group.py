@@ -0,0 +1,127 @@
+"""bench_circuit_group.py
+
+Measures pre-dispatch cost when one agent turn is guarded by N
+DistributedCircuitBreakers:
+
+- individual: breaker.check() on each of the N breakers
+- group:      CircuitBreakerGroup.check() over the same N breakers
+
+plus recording N outcomes (record_success() each vs one group.record()).
+Round trips are counted at the client; latencies are on fakeredis, so real
+Redis adds one network RTT per round trip.
+
+Usage:
+    python benchmarks/bench_circuit_group.py
+    python benchmarks/bench_circuit_group.py --turns 2000 --sizes 1 5 10 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import fakeredis
+
+from veronica_core.distributed import CircuitBreakerGroup, DistributedCircuitBreaker
+from veronica_core.runtime_policy import PolicyContext
+
+_CTX = PolicyContext()
+
+
+def _counting_client() -> tuple[fakeredis.FakeRedis, list]:
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    count = [0]
+    execute = client.execute_command
+    make_pipeline = client.pipeline
+
+    def counting(*args, **kwargs):
+        count[0] += 1
+        return execute(*args, **kwargs)
+
+    def counting_pipeline(*args, **kwargs):
+        count[0] += 1  # one round trip per pipeline execute
+        return make_pipeline(*args, **kwargs)
+
+    client.execute_command = counting  # type: ignore[method-assign]
+    client.pipeline = counting_pipeline  # type: ignore[method-assign]
+    return client, count
+
+
+def bench(turns: int, size: int) -> dict[str, float]:
+    client, count = _counting_client()
+    breakers = [
+        DistributedCircuitBreaker(
+            redis_url="redis://bench", circuit_id=f"tool{i}", redis_client=client
+        )
+        for i in range(size)
+    ]
+    group = CircuitBreakerGroup(breakers)
+    outcomes = {b._circuit_id: True for b in breakers}
+    group.check(_CTX)
+    group.record(outcomes)
+    for b in breakers:
+        b.check(_CTX)
+        b.record_success()
+
+    def run(fn) -> tuple[float, float]:
+        before = count[0]
+        t0 = time.perf_counter()
+        for _ in range(turns):
+            fn()
+        elapsed = time.perf_counter() - t0
+        return (count[0] - before) / turns, elapsed / turns * 1e6
+
+    def individual_check() -> None:
+        for b in breakers:
+            b.check(_CTX)
+
+    def individual_record() -> None:
+        for b in breakers:
+            b.record_success()
+
+    ic_rt, ic_us = run(individual_check)
+    gc_rt, gc_us = run(lambda: group.check(_CTX))
+    ir_rt, ir_us = run(individual_record)
+    gr_rt, gr_us = run(lambda: group.record(outcomes))
+    return {
+        "breakers": size,
+        "check_individual_rtt": ic_rt,
+        "check_group_rtt": gc_rt,
+        "check_individual_us": round(ic_us, 1),
+        "check_group_us": round(gc_us, 1),
+        "record_individual_rtt": ir_rt,
+        "record_group_rtt": gr_rt,
+        "record_individual_us": round(ir_us, 1),
+        "record_group_us": round(gr_us, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1, 5, 10])
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: CircuitBreakerGroup vs per-breaker calls")
+    print(f"turns={args.turns} sizes={args.sizes}")
+    print("=" * 60)
+
+    rows = [bench(args.turns, size) for size in args.sizes]
+    print(json.dumps({"benchmark": "circuit_group", "rows": rows}, indent=2))
+
+    print()
+    print(f"{'N':>3} {'check rtt':>14} {'check us':>16} {'record rtt':>14}")
+    print("-" * 50)
+    for r in rows:
+        print(
+            f"{r['breakers']:>3} "
+            f"{r['check_individual_rtt']:>6.1f} -> {r['check_group_rtt']:<4.1f}"
+            f"{r['check_individual_us']:>8.0f} -> {r['check_group_us']:<6.0f}"
+            f"{r['record_individual_rtt']:>6.1f} -> {r['record_group_rtt']:<4.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
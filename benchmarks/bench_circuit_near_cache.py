@@ -0,0 +1,95 @@
+"""bench_circuit_near_cache.py
+
+Measures DistributedCircuitBreaker with and without the near-cache on the
+hot path of a healthy tool: check() + record_success() per call while the
+circuit stays CLOSED.
+
+Reported per mode:
+
+- Redis round trips issued per call (counted at the client)
+- latency per call in microseconds (fakeredis, so no network RTT; real Redis
+  adds one RTT per command)
+
+Usage:
+    python benchmarks/bench_circuit_near_cache.py
+    python benchmarks/bench_circuit_near_cache.py --calls 50000 --batch 128
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import fakeredis
+
+from veronica_core.distributed import DistributedCircuitBreaker
+from veronica_core.runtime_policy import PolicyContext
+
+_CTX = PolicyContext()
+
+
+def _counting_client(server: fakeredis.FakeServer) -> tuple[fakeredis.FakeRedis, list]:
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    count = [0]
+    execute = client.execute_command
+
+    def counting(*args, **kwargs):
+        count[0] += 1
+        return execute(*args, **kwargs)
+
+    client.execute_command = counting  # type: ignore[method-assign]
+    return client, count
+
+
+def bench(calls: int, near_cache_ttl: float, batch: int) -> dict[str, float]:
+    client, count = _counting_client(fakeredis.FakeServer())
+    breaker = DistributedCircuitBreaker(
+        redis_url="redis://bench",
+        circuit_id="tool",
+        redis_client=client,
+        near_cache_ttl=near_cache_ttl,
+        success_batch_size=batch,
+    )
+    before = count[0]
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        if breaker.check(_CTX).allowed:
+            breaker.record_success()
+    elapsed = time.perf_counter() - t0
+    breaker.close()
+    issued = count[0] - before
+    return {
+        "redis_cmds_per_call": round(issued / calls, 4),
+        "us_per_call": round(elapsed / calls * 1e6, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--lease", type=float, default=1.0)
+    parser.add_argument("--batch", type=int, default=64)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: DistributedCircuitBreaker near-cache (CLOSED hot path)")
+    print(f"calls={args.calls} lease={args.lease}s batch={args.batch}")
+    print("=" * 60)
+
+    modes = {
+        "redis": bench(args.calls, 0.0, args.batch),
+        "near_cache": bench(args.calls, args.lease, args.batch),
+    }
+    results = {"benchmark": "circuit_near_cache", "calls": args.calls, "modes": modes}
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Mode':<12} {'cmds/call':>10} {'us/call':>10}")
+    print("-" * 34)
+    for name, r in modes.items():
+        print(f"{name:<12} {r['redis_cmds_per_call']:>10.4f} {r['us_per_call']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""bench_exec_fetch.py
+
+Measures SecureExecutor HTTP fetch throughput against a local keep-alive
+server that adds a fixed per-request delay (simulating upstream latency):
+
+- fresh:      fetch_url() with the connection pool dropped before every call
+              (one TCP connection per request, the previous behaviour)
+- pooled:     fetch_url() in a loop, reusing keep-alive connections
+- fetch_urls: fetch_urls(..., max_concurrency=N)
+
+Reported per scenario: wall time, requests/s and TCP connections accepted.
+
+Usage:
+    python benchmarks/bench_exec_fetch.py
+    python benchmarks/bench_exec_fetch.py --requests 200 --delay-ms 20 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import json
+import threading
+import time
+from typing import Callable
+from unittest.mock import Mock
+
+from veronica_core.adapters.exec import AdapterConfig, SecureExecutor
+from veronica_core.security.capabilities import CapabilitySet
+from veronica_core.security.policy_engine import ExecPolicyDecision, PolicyEngine
+
+
+def make_server(delay_s: float) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; without TCP_NODELAY the body
+        # waits on the client's delayed ACK (~40 ms) on a kept-alive socket.
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            super().setup()
+            with self.server.lock:  # type: ignore[attr-defined]
+                self.server.connections += 1  # type: ignore[attr-defined]
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(delay_s)
+            body = b"x" * 2048
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.connections = 0  # type: ignore[attr-defined]
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_executor() -> SecureExecutor:
+    # Allow-all engine: the benchmark measures transport, not policy.
+    engine = Mock(spec=PolicyEngine)
+    engine.evaluate.return_value = ExecPolicyDecision(
+        verdict="ALLOW", rule_id="BENCH", reason="bench", risk_score_delta=0
+    )
+    return SecureExecutor(
+        AdapterConfig(repo_root=".", policy_engine=engine, caps=CapabilitySet.dev())
+    )
+
+
+def measure(
+    server: http.server.ThreadingHTTPServer, fn: Callable[[], None], requests: int
+) -> dict[str, float]:
+    before = server.connections  # type: ignore[attr-defined]
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    return {
+        "seconds": round(elapsed, 3),
+        "req_per_s": round(requests / elapsed, 1),
+        "connections": server.connections - before,  # type: ignore[attr-defined]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--delay-ms", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server = make_server(args.delay_ms / 1000)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/item/{i}" for i in range(args.requests)]
+
+    print("=" * 60)
+    print("BENCHMARK: SecureExecutor fetch_url / fetch_urls")
+    print(
+        f"requests={args.requests} delay_ms={args.delay_ms} "
+        f"concurrency={args.concurrency}"
+    )
+    print("=" * 60)
+
+    exe = make_executor()
+
+    def _fresh() -> None:
+        for url in urls:
+            exe.fetch_url(url)
+            exe.close()
+
+    def _pooled() -> None:
+        for url in urls:
+            exe.fetch_url(url)
+
+    def _concurrent() -> None:
+        exe.fetch_urls(urls, max_concurrency=args.concurrency)
+
+    scenarios = {
+        "fresh": measure(server, _fresh, args.requests),
+        "pooled": measure(server, _pooled, args.requests),
+        "fetch_urls": measure(server, _concurrent, args.requests),
+    }
+    exe.close()
+    server.shutdown()
+
+    results = {
+        "benchmark": "exec_fetch",
+        "requests": args.requests,
+        "delay_ms": args.delay_ms,
+        "concurrency": args.concurrency,
+        "scenarios": scenarios,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':<12} {'seconds':>10} {'req/s':>10} {'conns':>8}")
+    print("-" * 43)
+    for name, r in scenarios.items():
+        print(
+            f"{name:<12} {r['seconds']:>10.3f} {r['req_per_s']:>10.1f} "
+            f"{r['connections']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""bench_exec_file_stream.py
+
+Measures peak Python heap (tracemalloc) and throughput of SecureExecutor
+file I/O on a large log file:
+
+- read_file:        whole file read, decoded and masked in memory
+- read_file_iter:   chunked read with StreamingMasker
+- write_file:       one str written at once
+- write_file_iter:  chunks streamed through a temp file
+
+Usage:
+    python benchmarks/bench_exec_file_stream.py
+    python benchmarks/bench_exec_file_stream.py --mib 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from veronica_core.adapters.exec import AdapterConfig, SecureExecutor
+from veronica_core.security.capabilities import CapabilitySet
+from veronica_core.security.policy_engine import PolicyEngine
+
+
+def make_log(path: Path, mib: int) -> None:
+    line = "2024-01-01T00:00:00Z INFO request handled in 12ms path=/api/v1/items\n"
+    secret = "2024-01-01T00:00:00Z WARN password=hunter2hunter2 leaked\n"
+    block = (line * 99 + secret).encode("utf-8")
+    with path.open("wb") as fh:
+        for _ in range(mib * 1024 * 1024 // len(block) + 1):
+            fh.write(block)
+
+
+def measure(fn: Callable[[], object], size_bytes: int) -> dict[str, float]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 3),
+        "mib_per_s": round(size_bytes / 2**20 / elapsed, 1),
+        "peak_heap_mib": round(peak / 2**20, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mib", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_exec_") as work:
+        root = Path(work)
+        log = root / "app.log"
+        make_log(log, args.mib)
+        size = log.stat().st_size
+        exe = SecureExecutor(
+            AdapterConfig(
+                repo_root=work, policy_engine=PolicyEngine(), caps=CapabilitySet.dev()
+            )
+        )
+
+        print("=" * 60)
+        print("BENCHMARK: SecureExecutor streaming file I/O")
+        print(f"file_mib={size / 2**20:.1f}")
+        print("=" * 60)
+
+        def _drain() -> None:
+            for _ in exe.read_file_iter(str(log)):
+                pass
+
+        def _write_whole() -> None:
+            exe.write_file("copy_whole.log", log.read_text(encoding="utf-8"))
+
+        def _write_iter() -> None:
+            with log.open("rb") as fh:
+                chunks = iter(lambda: fh.read(1 << 16), b"")
+                exe.write_file_iter("copy_iter.log", chunks)
+
+        scenarios = {
+            "read_file": measure(lambda: exe.read_file(str(log)), size),
+            "read_file_iter": measure(_drain, size),
+            "write_file": measure(_write_whole, size),
+            "write_file_iter": measure(_write_iter, size),
+        }
+
+    results = {"benchmark": "exec_file_stream", "bytes": size, "scenarios": scenarios}
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':<18} {'seconds':>10} {'MiB/s':>10} {'peak MiB':>10}")
+    print("-" * 51)
+    for name, r in scenarios.items():
+        print(
+            f"{name:<18} {r['seconds']:>10.3f} {r['mib_per_s']:>10.1f} "
+            f"{r['peak_heap_mib']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
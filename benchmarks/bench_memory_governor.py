@@ -0,0 +1,173 @@
+"""bench_memory_governor.py
+
+Measures MemoryGovernor.evaluate() with a cheap namespace gate followed by
+several slow policy hooks (simulated remote lookups that release the GIL),
+registered slow-first as a naive configuration would:
+
+- legacy:   hooks without MemoryHookTraits (registration order, no memo)
+- ordered:  the same hooks declared pure; the cheap gate runs first, so
+            denied operations skip the slow hooks
+- memo:     as ordered, with a chain_id so repeated operations in a chain
+            reuse pure-hook decisions
+- parallel: as ordered (no memo), with max_workers so the slow hooks overlap
+
+Reported: milliseconds per evaluate() call.
+
+Usage:
+    python benchmarks/bench_memory_governor.py
+    python benchmarks/bench_memory_governor.py --ops 400 --slow-hooks 4 --delay-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from typing import Any
+
+from veronica_core.memory.governor import MemoryGovernor
+from veronica_core.memory.hooks import MemoryHookTraits
+from veronica_core.memory.types import (
+    GovernanceVerdict,
+    MemoryAction,
+    MemoryGovernanceDecision,
+    MemoryOperation,
+    MemoryPolicyContext,
+)
+
+
+class SlowHook:
+    """Allows everything after waiting *delay_s* (a remote policy lookup)."""
+
+    def __init__(self, name: str, delay_s: float, traits: bool) -> None:
+        self._name = name
+        self._delay_s = delay_s
+        if traits:
+            self.memory_hook_traits = MemoryHookTraits(cost="expensive", pure=True)
+
+    def before_op(
+        self, operation: MemoryOperation, context: MemoryPolicyContext | None
+    ) -> MemoryGovernanceDecision:
+        threading.Event().wait(self._delay_s)
+        return MemoryGovernanceDecision(
+            verdict=GovernanceVerdict.ALLOW, policy_id=self._name, operation=operation
+        )
+
+    def after_op(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class NamespaceGate:
+    """Denies operations outside the allowed namespaces."""
+
+    def __init__(self, allowed: frozenset[str], traits: bool) -> None:
+        self._allowed = allowed
+        if traits:
+            self.memory_hook_traits = MemoryHookTraits(pure=True)
+
+    def before_op(
+        self, operation: MemoryOperation, context: MemoryPolicyContext | None
+    ) -> MemoryGovernanceDecision:
+        verdict = (
+            GovernanceVerdict.ALLOW
+            if operation.namespace in self._allowed
+            else GovernanceVerdict.DENY
+        )
+        return MemoryGovernanceDecision(
+            verdict=verdict, policy_id="gate", operation=operation
+        )
+
+    def after_op(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def make_governor(
+    slow_hooks: int, delay_s: float, traits: bool, **kwargs: Any
+) -> MemoryGovernor:
+    gov = MemoryGovernor(**kwargs)
+    for i in range(slow_hooks):
+        gov.add_hook(SlowHook(f"slow-{i}", delay_s, traits))
+    gov.add_hook(NamespaceGate(frozenset({"ns-0", "ns-1", "ns-2"}), traits))
+    return gov
+
+
+def make_ops(ops: int, distinct: int) -> list[MemoryOperation]:
+    # Agents re-read the same few resources; a third of the namespaces are denied.
+    rng = random.Random(42)
+    pool = [
+        MemoryOperation(
+            action=MemoryAction.READ,
+            resource_id=f"doc-{i}",
+            agent_id="agent",
+            namespace=f"ns-{i % 4}",
+        )
+        for i in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(ops)]
+
+
+def run(gov: MemoryGovernor, operations: list[MemoryOperation], chain: str) -> float:
+    t0 = time.perf_counter()
+    for op in operations:
+        gov.evaluate(op, MemoryPolicyContext(operation=op, chain_id=chain))
+    elapsed = time.perf_counter() - t0
+    gov.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=40)
+    parser.add_argument("--slow-hooks", type=int, default=3)
+    parser.add_argument("--delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    delay_s = args.delay_ms / 1000
+    operations = make_ops(args.ops, args.distinct)
+
+    print("=" * 60)
+    print("BENCHMARK: MemoryGovernor hook scheduling")
+    print(
+        f"ops={args.ops} distinct={args.distinct} slow_hooks={args.slow_hooks} "
+        f"delay_ms={args.delay_ms}"
+    )
+    print("=" * 60)
+
+    scenarios = {
+        "legacy": (make_governor(args.slow_hooks, delay_s, False), ""),
+        "ordered": (make_governor(args.slow_hooks, delay_s, True), ""),
+        "memo": (make_governor(args.slow_hooks, delay_s, True), "chain"),
+        "parallel": (
+            make_governor(
+                args.slow_hooks, delay_s, True, max_workers=args.slow_hooks
+            ),
+            "",
+        ),
+    }
+    rows = {
+        name: round(run(gov, operations, chain) / args.ops * 1e3, 3)
+        for name, (gov, chain) in scenarios.items()
+    }
+
+    results = {
+        "benchmark": "memory_governor",
+        "ops": args.ops,
+        "distinct": args.distinct,
+        "slow_hooks": args.slow_hooks,
+        "delay_ms": args.delay_ms,
+        "ms_per_evaluate": rows,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':>10} {'ms/op':>9} {'speedup':>9}")
+    print("-" * 30)
+    for name, ms in rows.items():
+        print(f"{name:>10} {ms:>9.3f} {rows['legacy'] / ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
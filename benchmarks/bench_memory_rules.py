@@ -0,0 +1,183 @@
+"""bench_memory_rules.py
+
+Measures MemoryRuleEvaluator.before_op() on a policy bundle of many
+namespace-scoped rules (one allow rule per tenant namespace, a handful of
+global deny/degrade rules, and a catch-all deny):
+
+- linear:  the previous evaluator, testing every rule in order
+- indexed: MemoryRuleEvaluator(cache_size=0), (action, namespace) index only
+- cached:  MemoryRuleEvaluator with the default operation-shape LRU
+
+Reported per bundle size: microseconds per before_op() call.
+
+Usage:
+    python benchmarks/bench_memory_rules.py
+    python benchmarks/bench_memory_rules.py --ops 50000 --rules 100 500 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from veronica_core.memory.types import (
+    GovernanceVerdict,
+    MemoryAction,
+    MemoryGovernanceDecision,
+    MemoryOperation,
+    MemoryPolicyContext,
+    MemoryProvenance,
+)
+from veronica_core.policy.bundle import PolicyRule
+from veronica_core.policy.memory_rules import (
+    CompiledMemoryRule,
+    MemoryRuleCompiler,
+    MemoryRuleEvaluator,
+)
+
+
+def make_rules(count: int) -> list[PolicyRule]:
+    rules = [
+        PolicyRule(
+            rule_id="deny-quarantined",
+            rule_type="memory",
+            parameters={"allowed_provenance": ["quarantined"], "verdict": "deny"},
+            priority=0,
+        ),
+        PolicyRule(
+            rule_id="degrade-consolidate",
+            rule_type="memory",
+            parameters={"action": "consolidate", "verdict": "degrade"},
+            priority=1,
+        ),
+    ]
+    for i in range(count):
+        rules.append(
+            PolicyRule(
+                rule_id=f"tenant-{i:05d}",
+                rule_type="memory",
+                parameters={
+                    "namespace": f"tenant-{i}",
+                    "actions": ["read", "retrieve", "write"],
+                    "verdict": "allow",
+                },
+                priority=10,
+            )
+        )
+    rules.append(
+        PolicyRule(
+            rule_id="catch-all",
+            rule_type="memory",
+            parameters={"verdict": "deny"},
+            priority=1000,
+        )
+    )
+    return rules
+
+
+class LinearEvaluator(MemoryRuleEvaluator):
+    """The pre-index first-match scan, kept for comparison."""
+
+    def before_op(
+        self,
+        operation: MemoryOperation,
+        context: MemoryPolicyContext | None,
+    ) -> MemoryGovernanceDecision:
+        for rule in self._rules:
+            if _linear_matches(rule, operation, context):
+                return self._apply(rule, operation, context)
+        return MemoryGovernanceDecision(
+            verdict=GovernanceVerdict.DENY,
+            reason="no matching memory rule (fail-closed)",
+            operation=operation,
+        )
+
+
+def _linear_matches(
+    rule: CompiledMemoryRule,
+    op: MemoryOperation,
+    ctx: MemoryPolicyContext | None,
+) -> bool:
+    if rule.actions and op.action.value not in rule.actions:
+        return False
+    if rule.namespaces and op.namespace not in rule.namespaces:
+        return False
+    if rule.allowed_provenance and op.provenance.value not in rule.allowed_provenance:
+        return False
+    if rule.verified_only and op.provenance is not MemoryProvenance.VERIFIED:
+        return False
+    if rule.allowed_views:
+        if ctx is None or ctx.memory_view.value not in rule.allowed_views:
+            return False
+    if rule.allowed_modes:
+        if ctx is None or ctx.execution_mode.value not in rule.allowed_modes:
+            return False
+    return True
+
+
+def make_ops(ops: int, tenants: int, active: int) -> list[MemoryOperation]:
+    # High-frequency reads concentrate on a working set of active tenants.
+    rng = random.Random(42)
+    hot = rng.sample(range(tenants), min(active, tenants))
+    return [
+        MemoryOperation(
+            action=rng.choice((MemoryAction.READ, MemoryAction.RETRIEVE)),
+            namespace=f"tenant-{rng.choice(hot)}",
+            provenance=MemoryProvenance.VERIFIED,
+        )
+        for _ in range(ops)
+    ]
+
+
+def bench(ops: int, tenants: int, active: int) -> dict[str, float]:
+    compiled = MemoryRuleCompiler().compile_bundle(make_rules(tenants))
+    operations = make_ops(ops, tenants, active)
+    evaluators = {
+        "linear": LinearEvaluator(compiled, cache_size=0),
+        "indexed": MemoryRuleEvaluator(compiled, cache_size=0),
+        "cached": MemoryRuleEvaluator(compiled),
+    }
+    row: dict[str, float] = {"rules": len(compiled)}
+    for name, evaluator in evaluators.items():
+        t0 = time.perf_counter()
+        for op in operations:
+            evaluator.before_op(op, None)
+        row[f"{name}_us"] = round((time.perf_counter() - t0) / ops * 1e6, 3)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--rules", type=int, nargs="*", default=[50, 300, 1000])
+    parser.add_argument("--active", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: MemoryRuleEvaluator dispatch")
+    print(f"ops={args.ops} tenant_rules={args.rules} active_tenants={args.active}")
+    print("=" * 60)
+
+    rows = [bench(args.ops, n, args.active) for n in args.rules]
+    results = {
+        "benchmark": "memory_rules",
+        "ops": args.ops,
+        "active": args.active,
+        "rows": rows,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Rules':>7} {'linear us':>11} {'indexed us':>11} {'cached us':>11}")
+    print("-" * 43)
+    for r in rows:
+        print(
+            f"{r['rules']:>7} {r['linear_us']:>11.3f} "
+            f"{r['indexed_us']:>11.3f} {r['cached_us']:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
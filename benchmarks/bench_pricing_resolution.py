@@ -0,0 +1,114 @@
+"""bench_pricing_resolution.py
+
+Measures model pricing resolution when calls are routed across many
+distinct model IDs (dated snapshots, fine-tuned IDs), so the
+resolve_model_pricing LRU cache misses on most calls.
+
+Compared per catalog size:
+
+- linear:  the previous fallback, scanning every key with str.startswith
+- trie:    resolve_model_pricing (prefix trie) with its cache cleared each call
+- batch:   estimate_cost_usd_batch over the whole call list
+
+Usage:
+    python benchmarks/bench_pricing_resolution.py
+    python benchmarks/bench_pricing_resolution.py --calls 50000 --catalog 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+
+from veronica_core import pricing
+from veronica_core.pricing import (
+    PRICING_TABLE,
+    Pricing,
+    estimate_cost_usd_batch,
+    resolve_model_pricing,
+    set_pricing_table,
+)
+
+
+def make_catalog(size: int) -> dict[str, Pricing]:
+    catalog = dict(PRICING_TABLE)
+    for i in range(size - len(catalog)):
+        catalog[f"vendor{i % 50}-model-{i}"] = Pricing(0.001, 0.002)
+    return catalog
+
+
+def make_models(calls: int, catalog: dict[str, Pricing]) -> list[str]:
+    keys = sorted(catalog)
+    return [f"{keys[i % len(keys)]}:org:run-{i}" for i in range(calls)]
+
+
+def linear_resolve(model: str, table: dict[str, Pricing]) -> Pricing:
+    if model in table:
+        return table[model]
+    matches = [key for key in table if model.startswith(key)]
+    if matches:
+        return table[max(matches, key=len)]
+    return pricing._UNKNOWN_MODEL_FALLBACK
+
+
+def bench(calls: int, catalog_size: int) -> dict[str, float]:
+    catalog = make_catalog(catalog_size)
+    saved = dict(PRICING_TABLE)
+    set_pricing_table(catalog)
+    try:
+        models = make_models(calls, catalog)
+
+        t0 = time.perf_counter()
+        for m in models:
+            linear_resolve(m, catalog)
+        linear_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for m in models:
+            resolve_model_pricing.__wrapped__(m)
+        trie_s = time.perf_counter() - t0
+
+        tokens = [1000] * calls
+        t0 = time.perf_counter()
+        estimate_cost_usd_batch(models, tokens, tokens)
+        batch_s = time.perf_counter() - t0
+    finally:
+        set_pricing_table(saved)
+    return {
+        "catalog": len(catalog),
+        "linear_us": round(linear_s / calls * 1e6, 3),
+        "trie_us": round(trie_s / calls * 1e6, 3),
+        "batch_us": round(batch_s / calls * 1e6, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--catalog", type=int, nargs="*", default=[17, 200, 2000])
+    args = parser.parse_args()
+    logging.getLogger("veronica_core.pricing").setLevel(logging.ERROR)
+
+    print("=" * 60)
+    print("BENCHMARK: model pricing resolution (cache misses)")
+    print(f"calls={args.calls} catalog_sizes={args.catalog}")
+    print("=" * 60)
+
+    rows = [bench(args.calls, size) for size in args.catalog]
+    results = {"benchmark": "pricing_resolution", "calls": args.calls, "rows": rows}
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Catalog':>8} {'linear us':>11} {'trie us':>11} {'batch us':>11}")
+    print("-" * 44)
+    for r in rows:
+        print(
+            f"{r['catalog']:>8} {r['linear_us']:>11.3f} "
+            f"{r['trie_us']:>11.3f} {r['batch_us']:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
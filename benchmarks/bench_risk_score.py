@@ -0,0 +1,180 @@
+"""bench_risk_score.py
+
+Measures RiskScoreAccumulator on the RiskAwareHook hot path (one
+``is_safe_mode`` read per call, one ``add()`` per denial):
+
+- list:    the previous accumulator (list of entries, re-sliced on overflow,
+           score recomputed with sum() on every read)
+- ring:    RiskScoreAccumulator (ring buffer with a running sum)
+- map:     RiskScoreMap, each thread scoring its own agent key
+
+Also reports multi-threaded throughput of one shared accumulator versus a
+RiskScoreMap with one key per thread.
+
+Usage:
+    python benchmarks/bench_risk_score.py
+    python benchmarks/bench_risk_score.py --ops 200000 --window 1000 --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import dataclass
+
+from veronica_core.security.risk_score import (
+    RiskScoreAccumulator,
+    RiskScoreConfig,
+    RiskScoreMap,
+)
+
+
+@dataclass
+class _Entry:
+    delta: int
+    verdict: str
+
+
+class ListAccumulator:
+    """The pre-ring-buffer implementation, kept for comparison."""
+
+    def __init__(self, config: RiskScoreConfig) -> None:
+        self._config = config
+        self._lock = threading.Lock()
+        self._window: list[_Entry] = []
+
+    def add(self, delta: int, verdict: str) -> None:
+        with self._lock:
+            self._window.append(_Entry(delta=delta, verdict=verdict))
+            max_size = self._config.window_size
+            if len(self._window) > max_size:
+                self._window = self._window[-max_size:]
+
+    @property
+    def is_safe_mode(self) -> bool:
+        with self._lock:
+            return sum(e.delta for e in self._window) >= self._config.deny_threshold
+
+
+def hook_loop(acc: object, ops: int, deny_every: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(ops):
+        acc.is_safe_mode  # type: ignore[attr-defined]  # noqa: B018
+        if i % deny_every == 0:
+            acc.add(0, "DENY")  # type: ignore[attr-defined]
+    return time.perf_counter() - t0
+
+
+def map_loop(scores: RiskScoreMap, key: str, ops: int, deny_every: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(ops):
+        scores.is_safe_mode(key)
+        if i % deny_every == 0:
+            scores.add(key, 0, "DENY")
+    return time.perf_counter() - t0
+
+
+def threaded(threads: int, target: object) -> float:
+    workers = [
+        threading.Thread(target=target, args=(n,))  # type: ignore[arg-type]
+        for n in range(threads)
+    ]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--window", type=int, nargs="*", default=[100, 1000])
+    parser.add_argument("--deny-every", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: RiskScoreAccumulator / RiskScoreMap")
+    print(
+        f"ops={args.ops} windows={args.window} deny_every={args.deny_every} "
+        f"threads={args.threads}"
+    )
+    print("=" * 60)
+
+    rows = []
+    for window in args.window:
+        config = RiskScoreConfig(deny_threshold=1, window_size=window)
+        # Pre-fill the windows so every read sees a full window.
+        old = ListAccumulator(config)
+        new = RiskScoreAccumulator(config)
+        scores = RiskScoreMap(config)
+        for _ in range(window):
+            old.add(0, "DENY")
+            new.add(0, "DENY")
+            scores.add("agent", 0, "DENY")
+        rows.append(
+            {
+                "window": window,
+                "list_us": round(
+                    hook_loop(old, args.ops, args.deny_every) / args.ops * 1e6, 3
+                ),
+                "ring_us": round(
+                    hook_loop(new, args.ops, args.deny_every) / args.ops * 1e6, 3
+                ),
+                "map_us": round(
+                    map_loop(scores, "agent", args.ops, args.deny_every)
+                    / args.ops
+                    * 1e6,
+                    3,
+                ),
+            }
+        )
+
+    config = RiskScoreConfig(deny_threshold=10**9, window_size=100)
+    shared = RiskScoreAccumulator(config)
+    scores = RiskScoreMap(config)
+    per_thread = args.ops // args.threads
+    shared_s = threaded(
+        args.threads, lambda n: hook_loop(shared, per_thread, args.deny_every)
+    )
+    map_s = threaded(
+        args.threads,
+        lambda n: map_loop(scores, f"agent-{n}", per_thread, args.deny_every),
+    )
+    contention = {
+        "shared_ops_per_s": round(per_thread * args.threads / shared_s),
+        "map_ops_per_s": round(per_thread * args.threads / map_s),
+    }
+
+    results = {
+        "benchmark": "risk_score",
+        "ops": args.ops,
+        "deny_every": args.deny_every,
+        "rows": rows,
+        "threads": args.threads,
+        "contention": contention,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Window':>8} {'list us':>10} {'ring us':>10} {'map us':>10}")
+    print("-" * 41)
+    for r in rows:
+        print(
+            f"{r['window']:>8} {r['list_us']:>10.3f} {r['ring_us']:>10.3f} "
+            f"{r['map_us']:>10.3f}"
+        )
+    print()
+    print(
+        f"{args.threads} threads: shared accumulator "
+        f"{contention['shared_ops_per_s']:,} ops/s, "
+        f"per-key map {contention['map_ops_per_s']:,} ops/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""bench_sandbox_pool.py
+
+Measures sandbox acquisition latency for a bursty agent workload: bursts of
+short sandbox sessions separated by idle gaps.
+
+- runner: a fresh SandboxRunner per session (setup + teardown on the caller)
+- pool:   SandboxPool.acquire() (workspaces prepared and deleted on the
+          pool's background thread)
+
+Reported per scenario: enter and exit latency percentiles as seen by the
+caller, plus pool hit/miss counts.
+
+Usage:
+    python benchmarks/bench_sandbox_pool.py
+    python benchmarks/bench_sandbox_pool.py --files 2000 --bursts 10 --burst-size 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from veronica_core.runner import SandboxConfig, SandboxPool, SandboxRunner
+
+
+def make_repo(root: Path, files: int, file_kb: int) -> None:
+    payload = os.urandom(file_kb * 1024)
+    for i in range(files):
+        d = root / f"pkg{i % 50}"
+        d.mkdir(exist_ok=True)
+        (d / f"mod{i}.py").write_bytes(payload)
+
+
+def run_bursts(
+    make_runner: Callable[[], SandboxRunner],
+    bursts: int,
+    burst_size: int,
+    gap_s: float,
+) -> dict[str, float]:
+    enter_ms: list[float] = []
+    exit_ms: list[float] = []
+    for _ in range(bursts):
+        for _ in range(burst_size):
+            runner = make_runner()
+            t0 = time.perf_counter()
+            runner.__enter__()
+            enter_ms.append((time.perf_counter() - t0) * 1e3)
+            t0 = time.perf_counter()
+            runner.__exit__(None, None, None)
+            exit_ms.append((time.perf_counter() - t0) * 1e3)
+        time.sleep(gap_s)
+    enter_ms.sort()
+    exit_ms.sort()
+    return {
+        "enter_p50_ms": round(_pct(enter_ms, 0.50), 3),
+        "enter_p99_ms": round(_pct(enter_ms, 0.99), 3),
+        "exit_p50_ms": round(_pct(exit_ms, 0.50), 3),
+        "exit_p99_ms": round(_pct(exit_ms, 0.99), 3),
+    }
+
+
+def _pct(sorted_ms: list[float], q: float) -> float:
+    return sorted_ms[min(len(sorted_ms) - 1, int(q * len(sorted_ms)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1_000)
+    parser.add_argument("--file-kb", type=int, default=16)
+    parser.add_argument("--bursts", type=int, default=8)
+    parser.add_argument("--burst-size", type=int, default=4)
+    parser.add_argument("--gap-s", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_pool_") as work:
+        repo = Path(work) / "repo"
+        repo.mkdir()
+        make_repo(repo, args.files, args.file_kb)
+        config = SandboxConfig(repo_root=str(repo), executor=None)
+
+        print("=" * 60)
+        print("BENCHMARK: SandboxPool acquisition latency (bursty workload)")
+        print(
+            f"files={args.files} file_kb={args.file_kb} bursts={args.bursts} "
+            f"burst_size={args.burst_size} gap_s={args.gap_s}"
+        )
+        print("=" * 60)
+
+        runner = run_bursts(
+            lambda: SandboxRunner(config), args.bursts, args.burst_size, args.gap_s
+        )
+        with SandboxPool(config, size=args.burst_size) as pool:
+            time.sleep(args.gap_s)
+            pooled = run_bursts(
+                pool.acquire, args.bursts, args.burst_size, args.gap_s
+            )
+            stats = pool.stats()
+        pooled.update(hits=stats.hits, misses=stats.misses)
+
+    results = {
+        "benchmark": "sandbox_pool",
+        "files": args.files,
+        "file_kb": args.file_kb,
+        "scenarios": {"runner": runner, "pool": pooled},
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(
+        f"{'Scenario':<10} {'enter p50':>10} {'enter p99':>10} "
+        f"{'exit p50':>10} {'exit p99':>10}"
+    )
+    print("-" * 54)
+    for name, r in results["scenarios"].items():
+        print(
+            f"{name:<10} {r['enter_p50_ms']:>10.3f} {r['enter_p99_ms']:>10.3f} "
+            f"{r['exit_p50_ms']:>10.3f} {r['exit_p99_ms']:>10.3f}"
+        )
+    print(f"pool hits={stats.hits} misses={stats.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""bench_sandbox_setup.py
+
+Measures SandboxRunner setup + teardown time for a synthetic repository
+under each workspace provider:
+
+- copy:            full byte copy of the filtered repo (previous behaviour)
+- reflink:         FICLONE clones, falling back to copy where unsupported
+- reflink+cache:   clone from a cached template snapshot
+- hardlink+cache:  hard links into a read-only cached template snapshot
+
+The first cached run builds the template and is reported separately as
+"cold"; the remaining runs reuse it.
+
+Usage:
+    python benchmarks/bench_sandbox_setup.py
+    python benchmarks/bench_sandbox_setup.py --files 5000 --file-kb 64 --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from veronica_core.runner.sandbox import SandboxConfig, SandboxRunner
+from veronica_core.runner.workspace import reflink_supported
+
+
+def make_repo(root: Path, files: int, file_kb: int) -> None:
+    payload = os.urandom(file_kb * 1024)
+    for i in range(files):
+        d = root / f"pkg{i % 50}"
+        d.mkdir(exist_ok=True)
+        (d / f"mod{i}.py").write_bytes(payload)
+    (root / ".git").mkdir()
+    (root / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+
+
+def measure(config: SandboxConfig, runs: int) -> dict[str, float]:
+    timings: list[float] = []
+    for _ in range(runs + 1):
+        t0 = time.perf_counter()
+        with SandboxRunner(config):
+            pass
+        timings.append((time.perf_counter() - t0) * 1e3)
+    cold, warm = timings[0], timings[1:]
+    return {
+        "cold_ms": round(cold, 2),
+        "median_ms": round(statistics.median(warm), 2),
+        "min_ms": round(min(warm), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--file-kb", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_sandbox_") as work:
+        repo = Path(work) / "repo"
+        repo.mkdir()
+        make_repo(repo, args.files, args.file_kb)
+        cache = str(Path(work) / "templates")
+
+        print("=" * 60)
+        print("BENCHMARK: SandboxRunner workspace setup + teardown")
+        print(
+            f"files={args.files} file_kb={args.file_kb} runs={args.runs} "
+            f"reflink={reflink_supported(work)}"
+        )
+        print("=" * 60)
+
+        scenarios = {
+            "copy": dict(workspace="copy"),
+            "reflink": dict(workspace="reflink"),
+            "reflink+cache": dict(workspace="reflink", template_cache_dir=cache),
+            "hardlink+cache": dict(workspace="hardlink", template_cache_dir=cache),
+        }
+        timings = {
+            name: measure(
+                SandboxConfig(repo_root=str(repo), executor=None, **kwargs),
+                args.runs,
+            )
+            for name, kwargs in scenarios.items()
+        }
+
+        results = {
+            "benchmark": "sandbox_setup",
+            "files": args.files,
+            "file_kb": args.file_kb,
+            "reflink_supported": reflink_supported(work),
+            "scenarios": timings,
+        }
+        print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Scenario':<16} {'cold ms':>10} {'median ms':>10} {'min ms':>10}")
+    print("-" * 49)
+    for name, r in timings.items():
+        print(
+            f"{name:<16} {r['cold_ms']:>10.2f} {r['median_ms']:>10.2f} "
+            f"{r['min_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
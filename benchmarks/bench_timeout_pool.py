@@ -0,0 +1,111 @@
+"""bench_timeout_pool.py
+
+Measures SharedTimeoutPool under the per-context timeout pattern: every
+short-lived ExecutionContext schedules one timeout and cancels it on exit,
+long before the deadline.
+
+Reported per scenario:
+
+- schedule / cancel cost in microseconds per call
+- timers still held by the pool after every handle was cancelled
+- fired callbacks and dispatch batches for a burst of near-term timers
+
+Usage:
+    python benchmarks/bench_timeout_pool.py
+    python benchmarks/bench_timeout_pool.py --timers 200000 --timeout-s 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+
+from veronica_core.containment.timeout_pool import SharedTimeoutPool
+
+
+def bench_schedule_cancel(timers: int, timeout_s: float) -> dict[str, float]:
+    pool = SharedTimeoutPool()
+    now = time.monotonic()
+    t0 = time.perf_counter()
+    handles = [pool.schedule(now + timeout_s, lambda: None) for _ in range(timers)]
+    schedule_s = time.perf_counter() - t0
+    depth_before = pool.pending()
+    t0 = time.perf_counter()
+    for h in handles:
+        pool.cancel(h)
+    cancel_s = time.perf_counter() - t0
+    stats = pool.stats()
+    pool.shutdown()
+    return {
+        "schedule_us": round(schedule_s / timers * 1e6, 3),
+        "cancel_us": round(cancel_s / timers * 1e6, 3),
+        "pending_before_cancel": depth_before,
+        "pending_after_cancel": stats.pending,
+    }
+
+
+def bench_burst_dispatch(timers: int) -> dict[str, float]:
+    pool = SharedTimeoutPool()
+    done = threading.Event()
+    remaining = [timers]
+    lock = threading.Lock()
+
+    def _cb() -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                done.set()
+
+    deadline = time.monotonic() + 0.05
+    for i in range(timers):
+        # Spread over ~20 ms so several ticks are due.
+        pool.schedule(deadline + (i % 20) * 0.001, _cb)
+    t0 = time.perf_counter()
+    done.wait(timeout=30.0)
+    elapsed = time.perf_counter() - t0
+    stats = pool.stats()
+    pool.shutdown()
+    return {
+        "fired": stats.fired_total,
+        "dispatch_batches": stats.dispatch_batches,
+        "max_batch_size": stats.max_batch_size,
+        "drain_ms": round(elapsed * 1e3, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timers", type=int, default=100_000)
+    parser.add_argument("--timeout-s", type=float, default=30.0)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: SharedTimeoutPool (hierarchical timing wheel)")
+    print(f"timers={args.timers} timeout_s={args.timeout_s}")
+    print("=" * 60)
+
+    results = {
+        "benchmark": "timeout_pool",
+        "timers": args.timers,
+        "schedule_cancel": bench_schedule_cancel(args.timers, args.timeout_s),
+        "burst_dispatch": bench_burst_dispatch(min(args.timers, 20_000)),
+    }
+    print(json.dumps(results, indent=2))
+
+    sc = results["schedule_cancel"]
+    bd = results["burst_dispatch"]
+    print()
+    print(f"{'Metric':<28} {'Value':>12}")
+    print("-" * 41)
+    print(f"{'schedule (us/call)':<28} {sc['schedule_us']:>12.3f}")
+    print(f"{'cancel (us/call)':<28} {sc['cancel_us']:>12.3f}")
+    print(f"{'pending after cancel':<28} {sc['pending_after_cancel']:>12}")
+    print(f"{'burst fired':<28} {bd['fired']:>12}")
+    print(f"{'burst dispatch batches':<28} {bd['dispatch_batches']:>12}")
+    print(f"{'burst max batch size':<28} {bd['max_batch_size']:>12}")
+
+
+if __name__ == "__main__":
+    main()
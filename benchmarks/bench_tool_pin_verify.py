@@ -0,0 +1,116 @@
+"""bench_tool_pin_verify.py
+
+Measures ToolPinRegistry verification of a tool list that is presented
+again and again (an MCP server resending the same schemas each session):
+
+- uncached:    verify() with hash_cache_size=0 (canonical JSON + SHA-256
+               on every call, the previous behaviour)
+- cached:      verify() with the default schema hash cache
+- verify_many: verify_many() over the whole tool list, cache enabled
+
+Reported per schema size: microseconds per tool verification.
+
+Usage:
+    python benchmarks/bench_tool_pin_verify.py
+    python benchmarks/bench_tool_pin_verify.py --tools 50 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+from typing import Any
+
+from veronica_core.security.tool_pinning import ToolPinRegistry
+
+
+def make_schema(index: int, properties: int) -> dict[str, Any]:
+    return {
+        "name": f"tool_{index}",
+        "description": f"Tool number {index}. " * 4,
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                f"arg_{p}": {
+                    "type": "string",
+                    "description": f"Argument {p} of tool {index}.",
+                    "maxLength": 256,
+                    "enum": [f"v{k}" for k in range(3)],
+                }
+                for p in range(properties)
+            },
+            "required": [f"arg_{p}" for p in range(min(properties, 3))],
+            "additionalProperties": False,
+        },
+    }
+
+
+def bench(tools: int, rounds: int, properties: int) -> dict[str, float]:
+    pinned = {f"tool_{i}": make_schema(i, properties) for i in range(tools)}
+    # The server sends fresh objects each session; reuse one decoded copy
+    # per round the way a client would after json.loads().
+    presented = [copy.deepcopy(pinned) for _ in range(2)]
+    size = len(json.dumps(pinned["tool_0"]))
+    calls = tools * rounds
+    timings: dict[str, float] = {}
+
+    for name, cache_size in (("uncached", 0), ("cached", 1024)):
+        reg = ToolPinRegistry(hash_cache_size=cache_size)
+        for tool, schema in pinned.items():
+            reg.register(tool, schema)
+        t0 = time.perf_counter()
+        for r in range(rounds):
+            for tool, schema in presented[r % 2].items():
+                assert reg.verify(tool, schema)
+        timings[name] = time.perf_counter() - t0
+
+    reg = ToolPinRegistry()
+    for tool, schema in pinned.items():
+        reg.register(tool, schema)
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        results = reg.verify_many(presented[r % 2])
+        assert all(results.values())
+    timings["verify_many"] = time.perf_counter() - t0
+
+    row: dict[str, float] = {"schema_bytes": size}
+    for name, seconds in timings.items():
+        row[f"{name}_us"] = round(seconds / calls * 1e6, 2)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--properties", type=int, nargs="*", default=[2, 20, 100])
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK: ToolPinRegistry verify (repeated tool lists)")
+    print(f"tools={args.tools} rounds={args.rounds} properties={args.properties}")
+    print("=" * 60)
+
+    rows = [bench(args.tools, args.rounds, p) for p in args.properties]
+    results = {
+        "benchmark": "tool_pin_verify",
+        "tools": args.tools,
+        "rounds": args.rounds,
+        "rows": rows,
+    }
+    print(json.dumps(results, indent=2))
+
+    print()
+    print(f"{'Bytes':>8} {'uncached us':>12} {'cached us':>11} {'many us':>10}")
+    print("-" * 44)
+    for r in rows:
+        print(
+            f"{r['schema_bytes']:>8} {r['uncached_us']:>12.2f} "
+            f"{r['cached_us']:>11.2f} {r['verify_many_us']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
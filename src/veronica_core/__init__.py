@@ -35,6 +35,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "PersistenceBackend": ("veronica_core.backends", "PersistenceBackend"),
     "JSONBackend": ("veronica_core.backends", "JSONBackend"),
     "MemoryBackend": ("veronica_core.backends", "MemoryBackend"),
+    "WALBackend": ("veronica_core.backends", "WALBackend"),
     # Exit handling
     "ExitTier": ("veronica_core.exit", "ExitTier"),
     "VeronicaExit": ("veronica_core.exit", "VeronicaExit"),
@@ -113,6 +114,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "CancellationToken": ("veronica_core.containment", "CancellationToken"),
     "ChainMetadata": ("veronica_core.containment", "ChainMetadata"),
     "ContextSnapshot": ("veronica_core.containment", "ContextSnapshot"),
+    "ContextCounters": ("veronica_core.containment", "ContextCounters"),
+    "NodeRetentionPolicy": ("veronica_core.containment", "NodeRetentionPolicy"),
     "ExecutionGraph": ("veronica_core.containment", "ExecutionGraph"),
     "NodeEvent": ("veronica_core.containment", "NodeEvent"),
     "NodeRecord": ("veronica_core.containment", "NodeRecord"),
@@ -143,6 +146,11 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "SemanticLoopGuard": ("veronica_core.semantic", "SemanticLoopGuard"),
     # Auto Pricing (v0.10.0)
     "estimate_cost_usd": ("veronica_core.pricing", "estimate_cost_usd"),
+    "estimate_cost_usd_batch": ("veronica_core.pricing", "estimate_cost_usd_batch"),
+    "load_pricing_catalog": ("veronica_core.pricing", "load_pricing_catalog"),
+    "set_pricing_table": ("veronica_core.pricing", "set_pricing_table"),
+    "reload_pricing_catalog": ("veronica_core.pricing", "reload_pricing_catalog"),
+    "watch_pricing_catalog": ("veronica_core.pricing", "watch_pricing_catalog"),
     "resolve_model_pricing": ("veronica_core.pricing", "resolve_model_pricing"),
     "Pricing": ("veronica_core.pricing", "Pricing"),
     "extract_usage_from_response": (
@@ -156,6 +164,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "RedisBudgetBackend": ("veronica_core.distributed", "RedisBudgetBackend"),
     "get_default_backend": ("veronica_core.distributed", "get_default_backend"),
     "CircuitSnapshot": ("veronica_core.distributed", "CircuitSnapshot"),
+    "CircuitBreakerGroup": ("veronica_core.distributed", "CircuitBreakerGroup"),
     "DistributedCircuitBreaker": (
         "veronica_core.distributed",
         "DistributedCircuitBreaker",
@@ -164,6 +173,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
         "veronica_core.distributed",
         "get_default_circuit_breaker",
     ),
+    "RedisPoolRegistry": ("veronica_core.redis_pool", "RedisPoolRegistry"),
+    "get_redis_pool_registry": ("veronica_core.redis_pool", "get_redis_pool_registry"),
     # OpenTelemetry (v0.10.0)
     "enable_otel": ("veronica_core.otel", "enable_otel"),
     "disable_otel": ("veronica_core.otel", "disable_otel"),
@@ -178,6 +189,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     ),
     # MCP containment adapter (v1.6.0)
     "MCPContainmentAdapter": ("veronica_core.adapters.mcp", "MCPContainmentAdapter"),
+    "MCPToolCall": ("veronica_core.adapters.mcp", "MCPToolCall"),
     "MCPToolCost": ("veronica_core.adapters.mcp", "MCPToolCost"),
     "MCPToolResult": ("veronica_core.adapters.mcp", "MCPToolResult"),
     "MCPToolStats": ("veronica_core.adapters.mcp", "MCPToolStats"),
@@ -263,6 +275,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
         "MemoryGovernanceDecision",
     ),
     "MemoryGovernanceHook": ("veronica_core.memory.hooks", "MemoryGovernanceHook"),
+    "MemoryHookTraits": ("veronica_core.memory.hooks", "MemoryHookTraits"),
     "DefaultMemoryGovernanceHook": (
         "veronica_core.memory.hooks",
         "DefaultMemoryGovernanceHook",
@@ -125,6 +125,9 @@ class A2AClientConfig:
             response before forced termination.
             Reserved for future streaming API.
         stats_cap: Maximum distinct agent IDs tracked in stats.
+        max_in_flight_per_agent: Maximum concurrent send_message calls to a
+            single remote agent. Further calls wait for a free slot.
+            None = unbounded.
     """
 
     default_cost_per_message: float = 0.01
@@ -135,6 +138,7 @@ class A2AClientConfig:
     max_stream_bytes: int = 10_485_760  # 10 MB
     max_stream_duration_s: float = 300.0
     stats_cap: int = _STATS_WARN_LIMIT
+    max_in_flight_per_agent: int | None = None
 
     def __post_init__(self) -> None:
         if isinstance(self.default_cost_per_message, bool):
@@ -232,6 +236,19 @@ class A2AClientConfig:
             )
         if self.stats_cap <= 0:
             raise ValueError(f"stats_cap must be > 0, got {self.stats_cap}")
+        if self.max_in_flight_per_agent is not None:
+            if not isinstance(self.max_in_flight_per_agent, int) or isinstance(
+                self.max_in_flight_per_agent, bool
+            ):
+                raise TypeError(
+                    f"max_in_flight_per_agent must be int or None, "
+                    f"got {type(self.max_in_flight_per_agent).__name__}"
+                )
+            if self.max_in_flight_per_agent <= 0:
+                raise ValueError(
+                    f"max_in_flight_per_agent must be > 0 or None, "
+                    f"got {self.max_in_flight_per_agent}"
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -335,6 +352,8 @@ class A2AStats:
         error_count: Number of invocations that raised or returned error.
         avg_latency_ms: Rolling average latency of successful calls.
         trust_level: Current trust level for this agent.
+        coalesced_count: Invocations answered by joining an identical
+            in-flight idempotent request instead of a new outbound call.
     """
 
     agent_id: str
@@ -343,6 +362,7 @@ class A2AStats:
     error_count: int = 0
     avg_latency_ms: float = 0.0
     trust_level: TrustLevel = TrustLevel.UNTRUSTED
+    coalesced_count: int = 0
 
     # Internal; not part of public summary.
     _total_latency_ms: float = field(default=0.0, repr=False)
@@ -0,0 +1,161 @@
+"""Keep-alive connection pool for SecureExecutor.fetch_url().
+
+urllib's stock HTTP(S) handlers open a new connection per request and send
+``Connection: close``.  The handlers here plug into a normal
+``urllib.request`` opener (so ProxyHandler, HTTPErrorProcessor and the
+executor's redirect handler keep working) but take connections from a
+``ConnectionPool`` keyed by (scheme, host) and return them once the response
+body has been read to the end.
+
+A connection is only reused when the previous response was fully consumed
+and the server did not ask to close it.  A request on a reused connection
+that fails before any response arrives is retried once on a fresh
+connection, which covers servers that silently drop idle keep-alive
+connections.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import urllib.request
+from collections import deque
+from typing import Any, Callable
+from urllib.error import URLError
+
+_PoolKey = tuple[str, str]
+
+# Errors that mean "the idle connection was closed by the peer".
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back to the pool on close()."""
+
+    _release: Callable[[bool], None] | None = None
+
+    def close(self) -> None:
+        # _close_conn() clears fp once the body was read to the end.
+        fully_read = self.fp is None
+        super().close()
+        release, self._release = self._release, None
+        if release is not None:
+            release(fully_read and not self.will_close)
+
+
+class ConnectionPool:
+    """Idle HTTP(S) connections keyed by (scheme, host).
+
+    Args:
+        max_idle_per_host: Idle connections kept per key; extras are closed.
+    """
+
+    def __init__(self, max_idle_per_host: int = 4) -> None:
+        if max_idle_per_host < 1:
+            raise ValueError(
+                f"max_idle_per_host must be >= 1, got {max_idle_per_host}"
+            )
+        self._max_idle = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[_PoolKey, deque[http.client.HTTPConnection]] = {}
+        self.created = 0
+        self.reused = 0
+
+    def checkout(self, key: _PoolKey) -> http.client.HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+        return None
+
+    def checkin(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+    def open(
+        self,
+        conn_class: type[http.client.HTTPConnection],
+        req: urllib.request.Request,
+        **conn_kwargs: Any,
+    ) -> http.client.HTTPResponse:
+        """Send *req* over a pooled connection (urllib ``do_open`` equivalent)."""
+        host = req.host
+        if not host:
+            raise URLError("no host given")
+        key = (req.type, host)
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items() if k not in headers)
+        headers["Connection"] = "keep-alive"
+        headers = {name.title(): value for name, value in headers.items()}
+
+        conn = self.checkout(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = conn_class(host, timeout=req.timeout, **conn_kwargs)
+                conn.response_class = _PooledResponse
+                with self._lock:
+                    self.created += 1
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                resp = conn.getresponse()
+            except _STALE_ERRORS as exc:
+                conn.close()
+                if reused:
+                    conn, reused = None, False
+                    continue
+                raise URLError(exc) from exc
+            except OSError as exc:
+                conn.close()
+                raise URLError(exc) from exc
+            break
+
+        def _release(reusable: bool, _conn: Any = conn) -> None:
+            if reusable:
+                self.checkin(key, _conn)
+            else:
+                _conn.close()
+
+        resp._release = _release  # type: ignore[attr-defined]
+        resp.url = req.get_full_url()  # type: ignore[attr-defined]
+        resp.msg = resp.reason  # type: ignore[assignment]
+        return resp
+
+
+class PooledHTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self._pool.open(http.client.HTTPConnection, req)
+
+
+class PooledHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, pool: ConnectionPool) -> None:
+        super().__init__()
+        self._pool = pool
+
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self._pool.open(
+            http.client.HTTPSConnection, req, context=self._context
+        )
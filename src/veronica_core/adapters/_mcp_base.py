@@ -6,6 +6,7 @@ AsyncMCPContainmentAdapter (async).
 
 Public types (re-exported from mcp.py and mcp_async.py):
     MCPToolCost       -- cost configuration for a single MCP tool
+    MCPToolCall       -- one entry of a wrap_tool_calls() batch
     MCPToolResult     -- result of a contained MCP tool call
     MCPToolStats      -- per-tool usage statistics
 """
@@ -15,8 +16,9 @@ from __future__ import annotations
 import logging
 import math
 import dataclasses
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence, Union
 
 from veronica_core.circuit_breaker import CircuitBreaker, FailurePredicate
 from veronica_core.containment.execution_context import ExecutionContext, WrapOptions
@@ -50,6 +52,25 @@ class MCPToolCost:
     cost_per_token: float = 0.0
 
 
+@dataclass(frozen=True)
+class MCPToolCall:
+    """One tool invocation in a wrap_tool_calls() batch.
+
+    Plain ``(tool_name, arguments, call_fn)`` tuples are accepted wherever an
+    MCPToolCall is expected.
+
+    Attributes:
+        tool_name: Name of the MCP tool being invoked.
+        arguments: Tool arguments dict passed to call_fn via **kwargs.
+        call_fn: Callable to invoke (sync adapter) or async callable (async
+            adapter).
+    """
+
+    tool_name: str
+    arguments: dict[str, Any]
+    call_fn: Callable[..., Any]
+
+
 @dataclass(frozen=True)
 class MCPToolResult:
     """Result of a contained MCP tool call.
@@ -89,6 +110,12 @@ class MCPToolStats:
         total_cost_usd: Cumulative cost across all successful invocations.
         error_count: Number of invocations that raised an exception.
         avg_duration_ms: Rolling average duration of successful invocations.
+        p50_duration_ms: Median duration of successful invocations.
+        p95_duration_ms: 95th percentile duration of successful invocations.
+        p99_duration_ms: 99th percentile duration of successful invocations.
+
+    Percentiles come from a log-linear histogram (16 buckets per power of
+    two of microseconds), so they are accurate to about 3%.
     """
 
     tool_name: str
@@ -96,11 +123,233 @@ class MCPToolStats:
     total_cost_usd: float = 0.0
     error_count: int = 0
     avg_duration_ms: float = 0.0
+    p50_duration_ms: float = 0.0
+    p95_duration_ms: float = 0.0
+    p99_duration_ms: float = 0.0
 
     # Internal tracking; not part of the public summary.
     _total_duration_ms: float = field(default=0.0, repr=False)
 
 
+# ---------------------------------------------------------------------------
+# Lock-free stats recording
+# ---------------------------------------------------------------------------
+
+# Log-linear latency histogram over integer microseconds: values below
+# 2 * _HIST_SUB get one bucket each, every power of two above that is split
+# into _HIST_SUB equal buckets. Durations are clamped to _HIST_MAX_US, which
+# bounds a tool's histogram to _HIST_BUCKETS entries.
+_HIST_SUB_BITS = 4
+_HIST_SUB = 1 << _HIST_SUB_BITS
+_HIST_MAX_US = (1 << 40) - 1  # ~12.7 days
+
+
+def _latency_bucket(duration_ms: float) -> int:
+    """Return the histogram bucket index for *duration_ms*."""
+    us = int(duration_ms * 1000.0)
+    if us <= 0:
+        return 0
+    if us > _HIST_MAX_US:
+        us = _HIST_MAX_US
+    if us < 2 * _HIST_SUB:
+        return us
+    shift = us.bit_length() - (_HIST_SUB_BITS + 1)
+    return (shift + 1) * _HIST_SUB + (us >> shift) - _HIST_SUB
+
+
+def _bucket_midpoint_ms(index: int) -> float:
+    """Return the midpoint (in ms) of the values mapped to bucket *index*."""
+    if index < 2 * _HIST_SUB:
+        return index / 1000.0
+    shift = index // _HIST_SUB - 1
+    lower = (index % _HIST_SUB + _HIST_SUB) << shift
+    return (lower + ((1 << shift) - 1) / 2.0) / 1000.0
+
+
+_HIST_BUCKETS = _latency_bucket(_HIST_MAX_US / 1000.0) + 1
+
+
+class _ToolCounters:
+    """Counters and latency histogram for one tool within one shard."""
+
+    __slots__ = ("calls", "errors", "cost_usd", "duration_ms", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cost_usd = 0.0
+        self.duration_ms = 0.0
+        # Sparse histogram: bucket index -> count (at most _HIST_BUCKETS keys).
+        self.buckets: dict[int, int] = {}
+
+    def merge_into(self, other: "_ToolCounters") -> None:
+        other.calls += self.calls
+        other.errors += self.errors
+        other.cost_usd += self.cost_usd
+        other.duration_ms += self.duration_ms
+        for index, count in list(self.buckets.items()):
+            other.buckets[index] = other.buckets.get(index, 0) + count
+
+
+class _StatsShard:
+    """Counters written by exactly one thread."""
+
+    __slots__ = ("owner", "tools")
+
+    def __init__(self, owner: threading.Thread) -> None:
+        self.owner = owner
+        self.tools: dict[str, _ToolCounters] = {}
+
+
+class _ToolStatsRecorder:
+    """Per-thread tool counters, merged lazily when stats are read.
+
+    Each thread writes only to its own shard, so recording needs no lock:
+    a sync adapter's worker threads never contend, and an async adapter's
+    coroutines share their loop thread's shard, where a record() call cannot
+    be interleaved because it contains no await. The lock below is taken
+    only when a thread records for the first time and when stats are read.
+    Shards of exited threads are folded into a retired total at those
+    points, so memory stays bounded by live threads x tools x _HIST_BUCKETS.
+
+    Readers may observe a call whose counters are only partly applied; the
+    snapshot is best-effort for monitoring, exactly like the locked version
+    it replaces was between calls.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_StatsShard] = []
+        self._retired: dict[str, _ToolCounters] = {}
+
+    def record(
+        self,
+        tool_name: str,
+        *,
+        error: bool = False,
+        cost_usd: float = 0.0,
+        duration_ms: Optional[float] = None,
+    ) -> None:
+        """Count one invocation; *duration_ms* is given for successful calls."""
+        shard: Optional[_StatsShard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._register_shard()
+        counters = shard.tools.get(tool_name)
+        if counters is None:
+            counters = shard.tools[tool_name] = _ToolCounters()
+        counters.calls += 1
+        if error:
+            counters.errors += 1
+        counters.cost_usd += cost_usd
+        if duration_ms is not None:
+            counters.duration_ms += duration_ms
+            index = _latency_bucket(duration_ms)
+            counters.buckets[index] = counters.buckets.get(index, 0) + 1
+
+    def snapshot(self, base: MCPToolStats) -> MCPToolStats:
+        """Return *base* plus everything recorded for its tool."""
+        total = _ToolCounters()
+        with self._lock:
+            self._retire_dead_shards_locked()
+            retired = self._retired.get(base.tool_name)
+            if retired is not None:
+                retired.merge_into(total)
+            for shard in self._shards:
+                counters = shard.tools.get(base.tool_name)
+                if counters is not None:
+                    counters.merge_into(total)
+
+        call_count = base.call_count + total.calls
+        error_count = base.error_count + total.errors
+        total_duration_ms = base._total_duration_ms + total.duration_ms
+        successful_calls = call_count - error_count
+        p50, p95, p99 = _percentiles_ms(total.buckets, (0.50, 0.95, 0.99))
+        return dataclasses.replace(
+            base,
+            call_count=call_count,
+            error_count=error_count,
+            total_cost_usd=base.total_cost_usd + total.cost_usd,
+            _total_duration_ms=total_duration_ms,
+            avg_duration_ms=(
+                total_duration_ms / successful_calls if successful_calls > 0 else 0.0
+            ),
+            p50_duration_ms=p50,
+            p95_duration_ms=p95,
+            p99_duration_ms=p99,
+        )
+
+    def _register_shard(self) -> _StatsShard:
+        shard = _StatsShard(threading.current_thread())
+        with self._lock:
+            self._retire_dead_shards_locked()
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _retire_dead_shards_locked(self) -> None:
+        live: list[_StatsShard] = []
+        for shard in self._shards:
+            if shard.owner.is_alive():
+                live.append(shard)
+                continue
+            for tool_name, counters in shard.tools.items():
+                retired = self._retired.get(tool_name)
+                if retired is None:
+                    retired = self._retired[tool_name] = _ToolCounters()
+                counters.merge_into(retired)
+        if len(live) != len(self._shards):
+            self._shards = live
+
+
+def _percentiles_ms(
+    buckets: dict[int, int], quantiles: tuple[float, ...]
+) -> tuple[float, ...]:
+    """Return the bucket midpoint (ms) at each quantile; 0.0 when empty."""
+    total = sum(buckets.values())
+    if total == 0:
+        return tuple(0.0 for _ in quantiles)
+    ranks = [max(1, math.ceil(q * total)) for q in quantiles]
+    results = [0.0] * len(quantiles)
+    seen = 0
+    pending = 0
+    for index in sorted(buckets):
+        seen += buckets[index]
+        while pending < len(ranks) and seen >= ranks[pending]:
+            results[pending] = _bucket_midpoint_ms(index)
+            pending += 1
+        if pending == len(ranks):
+            break
+    return tuple(results)
+
+
+@dataclass
+class _CallOutcome:
+    """Raw outcome of one call_fn invocation inside a batch."""
+
+    result: Any = None
+    error: Optional[BaseException] = None
+    duration_ms: float = 0.0
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    """Raise unless *max_concurrency* is a positive int (bool rejected)."""
+    if isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int):
+        raise TypeError(
+            f"max_concurrency must be an int, got {type(max_concurrency).__name__}"
+        )
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+
+def _validate_timeout(value: float, name: str) -> None:
+    """Raise unless *value* is a finite non-negative number (bool rejected)."""
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(f"{name} must be a finite non-negative number, got {value}")
+
+
 def _extract_token_count(result: Any) -> int:
     """Extract token count from a call result, returning 0 if not found."""
     if result is None:
@@ -130,6 +379,9 @@ class _MCPAdapterBase:
     - Implement _ensure_stats (sync or async).
     """
 
+    # MCPToolResult.error used when a tool result carries isError=True.
+    _IS_ERROR_MESSAGE = "Tool returned isError=True"
+
     def __init__(
         self,
         execution_context: ExecutionContext,
@@ -142,16 +394,7 @@ class _MCPAdapterBase:
         if default_cost_per_call < 0:
             raise ValueError("default_cost_per_call must be >= 0")
         if timeout_seconds is not None:
-            if not isinstance(timeout_seconds, (int, float)) or isinstance(
-                timeout_seconds, bool
-            ):
-                raise TypeError(
-                    f"timeout_seconds must be a number, got {type(timeout_seconds).__name__}"
-                )
-            if not math.isfinite(timeout_seconds) or timeout_seconds < 0:
-                raise ValueError(
-                    f"timeout_seconds must be a finite non-negative number, got {timeout_seconds}"
-                )
+            _validate_timeout(timeout_seconds, "timeout_seconds")
         self._ctx = execution_context
         self._tool_costs: dict[str, MCPToolCost] = tool_costs or {}
         self._circuit_breaker = circuit_breaker
@@ -166,6 +409,8 @@ class _MCPAdapterBase:
         #   async: asyncio.Lock()
         # This placeholder is overwritten immediately in each subclass __init__.
         self._stats_lock: Any = None
+        # Hot-path counters; _stats only registers (and caps) tool names.
+        self._recorder = _ToolStatsRecorder()
 
     # ------------------------------------------------------------------
     # Public API (shared)
@@ -174,8 +419,9 @@ class _MCPAdapterBase:
     def get_tool_stats(self) -> dict[str, MCPToolStats]:
         """Return an immutable snapshot of per-tool usage statistics.
 
-        Each MCPToolStats value is a deep copy created via dataclasses.replace(),
-        so callers receive a stable view that is unaffected by concurrent writes.
+        Each MCPToolStats value is a new object built by merging the per-thread
+        counters, so callers receive a stable view that is unaffected by
+        concurrent writes.
 
         WARNING: Subclasses that use asyncio.Lock for _stats_lock MUST override
         this method. Calling this method with an asyncio.Lock set as _stats_lock
@@ -192,14 +438,167 @@ class _MCPAdapterBase:
         # Sync subclasses set _stats_lock to threading.Lock(); async subclasses
         # must override this method (see warning above).
         with self._stats_lock:
-            return {
-                name: dataclasses.replace(stats) for name, stats in self._stats.items()
-            }
+            items = list(self._stats.items())
+        return self._merge_stats(items)
 
     # ------------------------------------------------------------------
     # Internal helpers (shared)
     # ------------------------------------------------------------------
 
+    def _merge_stats(
+        self, items: list[tuple[str, MCPToolStats]]
+    ) -> dict[str, MCPToolStats]:
+        """Fold recorded counters into each registered tool's base stats."""
+        return {name: self._recorder.snapshot(stats) for name, stats in items}
+
+    def _increment_call_count(self, tool_name: str) -> None:
+        """Count a blocked invocation; ignored for unregistered tool names."""
+        if tool_name in self._stats:
+            self._recorder.record(tool_name)
+
+    def _increment_error_count(self, tool_name: str) -> None:
+        """Count a failed invocation; ignored for unregistered tool names."""
+        if tool_name in self._stats:
+            self._recorder.record(tool_name, error=True)
+
+    def _record_success_stats(
+        self, tool_name: str, cost_usd: float, duration_ms: float
+    ) -> None:
+        """Count a successful invocation with its cost and duration."""
+        if tool_name in self._stats:
+            self._recorder.record(tool_name, cost_usd=cost_usd, duration_ms=duration_ms)
+
+    @staticmethod
+    def _normalize_calls(
+        calls: Sequence[Union[MCPToolCall, tuple[str, dict[str, Any], Any]]],
+    ) -> list[MCPToolCall]:
+        """Coerce a wrap_tool_calls() argument into a list of MCPToolCall."""
+        normalized: list[MCPToolCall] = []
+        for call in calls:
+            if not isinstance(call, MCPToolCall):
+                tool_name, arguments, call_fn = call
+                call = MCPToolCall(tool_name, arguments, call_fn)
+            if not call.tool_name or not isinstance(call.tool_name, str):
+                raise ValueError(
+                    f"tool_name must be a non-empty string, got {call.tool_name!r}"
+                )
+            normalized.append(call)
+        return normalized
+
+    def _batch_reservation_plan(
+        self, calls: list[MCPToolCall]
+    ) -> tuple[list[float], float]:
+        """Return per-call cost estimates and their sum."""
+        estimates = [self._compute_cost_estimate(c.tool_name) for c in calls]
+        return estimates, sum(estimates)
+
+    def _outcome_to_result(
+        self, call: MCPToolCall, estimate: float, outcome: _CallOutcome
+    ) -> tuple[MCPToolResult, float]:
+        """Build the MCPToolResult for one batch entry.
+
+        Returns (result, charge) where *charge* is the USD amount to commit
+        against the shared reservation. Mirrors wrap_tool_call(): failed calls
+        and isError results release their share of the escrow (charge 0.0).
+        """
+        if outcome.error is not None:
+            return (
+                MCPToolResult(
+                    success=False,
+                    error="tool call failed",
+                    decision=Decision.ALLOW,
+                    cost_usd=estimate,
+                ),
+                0.0,
+            )
+        if getattr(outcome.result, "isError", False):
+            return (
+                MCPToolResult(
+                    success=False,
+                    result=outcome.result,
+                    error=self._IS_ERROR_MESSAGE,
+                    decision=Decision.ALLOW,
+                    cost_usd=estimate,
+                ),
+                0.0,
+            )
+        actual = self._compute_actual_cost(call.tool_name, outcome.result)
+        return (
+            MCPToolResult(
+                success=True,
+                result=outcome.result,
+                decision=Decision.ALLOW,
+                cost_usd=actual,
+            ),
+            actual,
+        )
+
+    def _record_batch_node(
+        self, call: MCPToolCall, result: MCPToolResult, outcome: Optional[_CallOutcome]
+    ) -> None:
+        """Record the ExecutionContext node for one batch entry.
+
+        *outcome* is None for entries that never ran (HALT results).
+        """
+        name = f"mcp:{call.tool_name}"
+        if outcome is None:
+            self._ctx._record_batch_call(name, "halted", stop_reason=result.error)
+        elif result.success:
+            self._ctx._record_batch_call(
+                name, "ok", cost_usd=result.cost_usd, duration_ms=outcome.duration_ms
+            )
+        else:
+            error_class = (
+                type(outcome.error).__name__ if outcome.error is not None else "isError"
+            )
+            self._ctx._record_batch_call(
+                name, "error", duration_ms=outcome.duration_ms, stop_reason=error_class
+            )
+
+    def _halt_calls(self, calls: list[MCPToolCall], error: str) -> list[MCPToolResult]:
+        """Count and record every call in *calls*; return one HALT result each."""
+        results = self._halt_results(len(calls), error)
+        for call, result in zip(calls, results):
+            self._increment_call_count(call.tool_name)
+            self._record_batch_node(call, result, None)
+        return results
+
+    @staticmethod
+    def _halt_results(n: int, error: str) -> list[MCPToolResult]:
+        """Return *n* HALT results carrying *error*."""
+        return [
+            MCPToolResult(
+                success=False, error=error, decision=Decision.HALT, cost_usd=0.0
+            )
+            for _ in range(n)
+        ]
+
+    def _settle_reservation(self, reservation_id: str, amount: float) -> None:
+        """Commit *amount* and release the rest of *reservation_id* (sync).
+
+        Uses the backend's single-step ``settle()`` when available, otherwise
+        ``rollback()`` + ``add()``. An expired reservation is charged with
+        ``add()`` so the spend is not lost (mirrors ExecutionContext).
+        """
+        backend = self._ctx._budget_backend
+        try:
+            if hasattr(backend, "settle"):
+                backend.settle(reservation_id, amount)
+                return
+            backend.rollback(reservation_id)
+        except KeyError:
+            pass
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "[MCP_ADAPTER] settle(%s, %.6f) failed -- cost may be untracked",
+                reservation_id,
+                amount,
+                exc_info=True,
+            )
+            return
+        if amount > 0:
+            backend.add(amount)
+
     def _compute_cost_estimate(self, tool_name: str) -> float:
         """Return the cost estimate (USD) for the given tool_name."""
         tool_cost = self._tool_costs.get(tool_name)
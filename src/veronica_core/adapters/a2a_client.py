@@ -39,9 +39,11 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import hashlib
+import json
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Hashable, Optional
 
 if TYPE_CHECKING:
     from veronica_core.adapter_capabilities import AdapterCapabilities
@@ -66,6 +68,33 @@ logger = logging.getLogger(__name__)
 __all__ = ["A2AClientContainmentAdapter", "BoundA2AAdapter", "wrap_a2a_agent"]
 
 
+# Outcome of one outbound send_message: (response, error).
+_CallOutcome = tuple[Any, Optional[BaseException]]
+
+
+def _payload_fingerprint(message: Any) -> str | None:
+    """Return a SHA-256 hex digest of a canonical JSON encoding of *message*.
+
+    Pydantic-style models (a2a-sdk types) are dumped via ``model_dump``.
+    Returns None when the payload has no deterministic JSON form, in which
+    case the request is never coalesced.
+    """
+    payload = message
+    dump = getattr(message, "model_dump", None)
+    if callable(dump):
+        try:
+            payload = dump(mode="json")
+        except Exception:  # noqa: BLE001
+            return None
+    try:
+        encoded = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 def _extract_token_count(response: Any) -> int:
     """Extract token count from an A2A response, returning 0 if not found.
 
@@ -104,6 +133,13 @@ class A2AClientContainmentAdapter:
       threaded through each call for governance hooks.
     - Stats are keyed by agent_id. Future versions will scope by tenant_id.
     - timeout_seconds applies an asyncio.wait_for() around client.send_message().
+    - config.max_in_flight_per_agent bounds concurrent outbound calls per
+      remote agent; excess calls queue for a slot.
+    - Calls marked ``idempotent=True`` that are identical (same tenant, caller,
+      client, agent and payload hash) to one already in flight share its
+      outcome instead of issuing a second outbound call.
+    - Stats are updated without locking: every mutation runs synchronously on
+      the event loop (no await inside), so coroutines cannot interleave it.
 
     Args:
         execution_context: Chain-level containment context. Controls budget
@@ -133,10 +169,18 @@ class A2AClientContainmentAdapter:
         self._failure_predicate = failure_predicate
 
         # Per-agent stats keyed by agent_id.
-        # asyncio.Lock required: stats updates occur after await, so two
-        # coroutines can interleave without locking.
+        # Lock-free: each read-modify-write below contains no await, so it
+        # cannot interleave with another coroutine on the same event loop.
         self._stats: dict[str, A2AStats] = {}
-        self._stats_lock = asyncio.Lock()
+
+        # Per-agent in-flight slots (only when max_in_flight_per_agent is set).
+        # _slot_users counts holders + waiters; an agent's semaphore is dropped
+        # once that count returns to zero so idle agents cost nothing.
+        self._agent_slots: dict[str, asyncio.Semaphore] = {}
+        self._slot_users: dict[str, int] = {}
+
+        # In-flight idempotent requests: coalesce key -> outcome future.
+        self._pending: dict[Hashable, asyncio.Future[_CallOutcome]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -151,6 +195,7 @@ class A2AClientContainmentAdapter:
         identity: AgentIdentity,
         provenance: A2AIdentityProvenance | None = None,
         client: A2AClientProtocol,
+        idempotent: bool = False,
     ) -> A2AResult:
         """Send a message to a remote A2A agent under containment.
 
@@ -165,6 +210,10 @@ class A2AClientContainmentAdapter:
             identity: Caller's AgentIdentity for governance hooks.
             provenance: Optional verification metadata for the remote agent.
             client: A2A client that satisfies A2AClientProtocol.
+            idempotent: When True and an identical request is already in
+                flight, wait for it and return its response (the same object)
+                with cost_usd=0.0 instead of sending a duplicate. If that
+                request is cancelled, this call is sent on its own.
 
         Returns:
             A2AResult with success/failure, response, decision, and cost.
@@ -178,7 +227,7 @@ class A2AClientContainmentAdapter:
                 f"tenant_id must be a non-empty, non-whitespace string, got {tenant_id!r}"
             )
 
-        await self._ensure_stats(agent_id)
+        self._ensure_stats(agent_id)
 
         # B3-H2: provenance is accepted but not yet wired into the containment
         # check.  The parameter is reserved for future trust-escalation and
@@ -195,6 +244,25 @@ class A2AClientContainmentAdapter:
                 getattr(provenance, "card_verified", "unknown"),
             )
 
+        coalesce_key: Hashable | None = None
+        if idempotent:
+            fingerprint = _payload_fingerprint(message)
+            if fingerprint is not None:
+                coalesce_key = (
+                    tenant_id,
+                    identity.agent_id,
+                    id(client),
+                    agent_id,
+                    fingerprint,
+                )
+                pending = self._pending.get(coalesce_key)
+                if pending is not None:
+                    joined = await self._join_pending(agent_id, pending, identity)
+                    if joined is not None:
+                        return joined
+                    # The in-flight request was cancelled; send our own.
+                    coalesce_key = None
+
         # Circuit breaker pre-check.
         if self._circuit_breaker is not None:
             cb_decision = self._circuit_breaker.check(PolicyContext())
@@ -205,7 +273,7 @@ class A2AClientContainmentAdapter:
                     tenant_id,
                     cb_decision.reason,
                 )
-                await self._increment_call_count(agent_id)
+                self._increment_call_count(agent_id)
                 return A2AResult(
                     success=False,
                     error="Agent unavailable",
@@ -237,7 +305,7 @@ class A2AClientContainmentAdapter:
                 agent_id,
                 tenant_id,
             )
-            await self._increment_call_count(agent_id)
+            self._increment_call_count(agent_id)
             return A2AResult(
                 success=False,
                 error="Budget limit exceeded",
@@ -245,24 +313,25 @@ class A2AClientContainmentAdapter:
                 cost_usd=0.0,
             )
 
+        # Publish this call so identical idempotent requests can join it.
+        # No await has happened since the _pending lookup above, so no other
+        # coroutine can have registered the same key in between.
+        pending_fut: Optional[asyncio.Future[_CallOutcome]] = None
+        if coalesce_key is not None and coalesce_key not in self._pending:
+            pending_fut = asyncio.get_running_loop().create_future()
+            self._pending[coalesce_key] = pending_fut
+
         # Execute send_message with optional timeout.
-        call_error: Optional[BaseException] = None
-        response: Any = None
-        t0 = time.monotonic()
         try:
-            if self._config.timeout_seconds is not None:
-                response = await asyncio.wait_for(
-                    client.send_message(message),
-                    timeout=self._config.timeout_seconds,
-                )
-            else:
-                response = await client.send_message(message)
-        except asyncio.CancelledError:
-            raise  # propagate cancellation -- do not treat as a call failure
-        except Exception as exc:  # noqa: BLE001
-            call_error = exc
-        finally:
-            latency_ms = (time.monotonic() - t0) * 1000.0
+            response, call_error, latency_ms = await self._send(
+                agent_id, client, message
+            )
+        except BaseException:
+            if pending_fut is not None:
+                self._resolve_pending(coalesce_key, pending_fut, None)
+            raise
+        if pending_fut is not None:
+            self._resolve_pending(coalesce_key, pending_fut, (response, call_error))
 
         # Handle call errors -- error message must not contain str(exc) or type name.
         if call_error is not None:
@@ -278,7 +347,7 @@ class A2AClientContainmentAdapter:
                     call_error
                 ):
                     self._circuit_breaker.record_failure(error=call_error)
-            await self._increment_error_count(agent_id, cost_usd=cost_estimate)
+            self._increment_error_count(agent_id, cost_usd=cost_estimate)
             return A2AResult(
                 success=False,
                 error="Agent call failed",
@@ -309,29 +378,17 @@ class A2AClientContainmentAdapter:
         if self._circuit_breaker is not None:
             self._circuit_breaker.record_success()
 
-        # Update stats under async lock.
-        async with self._stats_lock:
-            stats = self._stats.get(agent_id)
-            if stats is not None:
-                stats.message_count += 1
-                stats.total_cost_usd += actual_cost
-                stats._total_latency_ms += latency_ms
-                stats._latency_sample_count += 1
-                stats.avg_latency_ms = (
-                    stats._total_latency_ms / stats._latency_sample_count
-                )
-                stats.trust_level = identity.trust_level
-
-        # Determine whether the response is a Task or Message object.
-        _is_task = hasattr(response, "id") and hasattr(response, "status")
-        return A2AResult(
-            success=True,
-            task=response if _is_task else None,
-            message=response if not _is_task else None,
-            decision=Decision.ALLOW,
-            cost_usd=actual_cost,
-            trust_level=identity.trust_level,
-        )
+        # Update stats (lock-free; see __init__).
+        stats = self._stats.get(agent_id)
+        if stats is not None:
+            stats.message_count += 1
+            stats.total_cost_usd += actual_cost
+            stats._total_latency_ms += latency_ms
+            stats._latency_sample_count += 1
+            stats.avg_latency_ms = stats._total_latency_ms / stats._latency_sample_count
+            stats.trust_level = identity.trust_level
+
+        return _success_result(response, actual_cost, identity)
 
     def capabilities(self) -> "AdapterCapabilities":
         """Return the capability descriptor for this adapter."""
@@ -350,18 +407,16 @@ class A2AClientContainmentAdapter:
         Returns:
             Mapping of agent_id -> A2AStats snapshot.
         """
-        async with self._stats_lock:
-            return {
-                agent_id: dataclasses.replace(stats)
-                for agent_id, stats in self._stats.items()
-            }
+        return {
+            agent_id: dataclasses.replace(stats)
+            for agent_id, stats in self._stats.items()
+        }
 
     def get_stats(self) -> dict[str, A2AStats]:
         """Synchronous best-effort snapshot -- safe only from non-async context.
 
         Callers inside an asyncio event loop should use get_stats_async()
-        instead. This method does not acquire the asyncio.Lock, so it is
-        safe to call from synchronous code without risk of deadlock.
+        instead, which snapshots between two mutations on the owning loop.
 
         Returns a best-effort snapshot: captures dict items at one point in
         time. Individual A2AStats copies may reflect a mix of states under
@@ -377,39 +432,160 @@ class A2AClientContainmentAdapter:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _ensure_stats(self, agent_id: str) -> None:
-        """Create an A2AStats entry for agent_id if it does not exist."""
-        if agent_id in self._stats:  # fast path: skip lock for existing agents
+    async def _send(
+        self, agent_id: str, client: A2AClientProtocol, message: Any
+    ) -> tuple[Any, Optional[BaseException], float]:
+        """Issue one outbound call within the agent's in-flight slot.
+
+        Returns (response, error, latency_ms). Latency excludes time spent
+        waiting for a slot. CancelledError propagates.
+        """
+        await self._acquire_slot(agent_id)
+        call_error: Optional[BaseException] = None
+        response: Any = None
+        t0 = time.monotonic()
+        try:
+            if self._config.timeout_seconds is not None:
+                response = await asyncio.wait_for(
+                    client.send_message(message),
+                    timeout=self._config.timeout_seconds,
+                )
+            else:
+                response = await client.send_message(message)
+        except asyncio.CancelledError:
+            raise  # propagate cancellation -- do not treat as a call failure
+        except Exception as exc:  # noqa: BLE001
+            call_error = exc
+        finally:
+            latency_ms = (time.monotonic() - t0) * 1000.0
+            self._release_slot(agent_id)
+        return response, call_error, latency_ms
+
+    async def _acquire_slot(self, agent_id: str) -> None:
+        """Wait for an in-flight slot for agent_id (no-op when unbounded)."""
+        limit = self._config.max_in_flight_per_agent
+        if limit is None:
             return
-        async with self._stats_lock:
-            if agent_id not in self._stats:
-                cap = self._config.stats_cap
-                if len(self._stats) >= cap:
-                    logger.warning(
-                        "[A2A_CLIENT_ADAPTER] stats tracking %d+ distinct agent IDs; "
-                        "dropping new agent ID to prevent DoS",
-                        cap,
-                    )
-                    return
-                self._stats[agent_id] = A2AStats(agent_id=agent_id)
-
-    async def _increment_call_count(self, agent_id: str) -> None:
-        """Safely increment message_count for agent_id."""
-        async with self._stats_lock:
-            stats = self._stats.get(agent_id)
-            if stats is not None:
-                stats.message_count += 1
-
-    async def _increment_error_count(
-        self, agent_id: str, cost_usd: float = 0.0
+        slots = self._agent_slots.get(agent_id)
+        if slots is None:
+            slots = asyncio.Semaphore(limit)
+            self._agent_slots[agent_id] = slots
+        self._slot_users[agent_id] = self._slot_users.get(agent_id, 0) + 1
+        try:
+            await slots.acquire()
+        except BaseException:
+            self._drop_slot_user(agent_id)
+            raise
+
+    def _release_slot(self, agent_id: str) -> None:
+        """Release a slot taken by _acquire_slot()."""
+        if self._config.max_in_flight_per_agent is None:
+            return
+        self._agent_slots[agent_id].release()
+        self._drop_slot_user(agent_id)
+
+    def _drop_slot_user(self, agent_id: str) -> None:
+        remaining = self._slot_users[agent_id] - 1
+        if remaining:
+            self._slot_users[agent_id] = remaining
+        else:
+            del self._slot_users[agent_id]
+            del self._agent_slots[agent_id]
+
+    def _resolve_pending(
+        self,
+        key: Hashable,
+        fut: asyncio.Future[_CallOutcome],
+        outcome: Optional[_CallOutcome],
     ) -> None:
-        """Safely increment both message_count and error_count for agent_id."""
-        async with self._stats_lock:
-            stats = self._stats.get(agent_id)
-            if stats is not None:
-                stats.message_count += 1
+        """Unpublish an in-flight idempotent call and wake its joiners.
+
+        outcome=None means the call never completed (cancelled); joiners
+        then send their own request.
+        """
+        if self._pending.get(key) is fut:
+            del self._pending[key]
+        if fut.done():
+            return
+        if outcome is None:
+            fut.cancel()
+        else:
+            fut.set_result(outcome)
+
+    async def _join_pending(
+        self,
+        agent_id: str,
+        fut: asyncio.Future[_CallOutcome],
+        identity: AgentIdentity,
+    ) -> Optional[A2AResult]:
+        """Wait for an identical in-flight call and build this caller's result.
+
+        Returns None when that call was cancelled before completing.
+        """
+        # asyncio.wait() never cancels fut, so a cancelled joiner leaves the
+        # shared call (and its other joiners) untouched.
+        await asyncio.wait({fut})
+        if fut.cancelled():
+            return None
+        response, call_error = fut.result()
+        stats = self._stats.get(agent_id)
+        if stats is not None:
+            stats.message_count += 1
+            stats.coalesced_count += 1
+            if call_error is not None:
                 stats.error_count += 1
-                stats.total_cost_usd += cost_usd
+        if call_error is not None:
+            return A2AResult(
+                success=False,
+                error="Agent call failed",
+                decision=Decision.ALLOW,
+                cost_usd=0.0,
+            )
+        return _success_result(response, 0.0, identity)
+
+    def _ensure_stats(self, agent_id: str) -> None:
+        """Create an A2AStats entry for agent_id if it does not exist."""
+        if agent_id in self._stats:
+            return
+        cap = self._config.stats_cap
+        if len(self._stats) >= cap:
+            logger.warning(
+                "[A2A_CLIENT_ADAPTER] stats tracking %d+ distinct agent IDs; "
+                "dropping new agent ID to prevent DoS",
+                cap,
+            )
+            return
+        self._stats[agent_id] = A2AStats(agent_id=agent_id)
+
+    def _increment_call_count(self, agent_id: str) -> None:
+        """Increment message_count for agent_id."""
+        stats = self._stats.get(agent_id)
+        if stats is not None:
+            stats.message_count += 1
+
+    def _increment_error_count(self, agent_id: str, cost_usd: float = 0.0) -> None:
+        """Increment both message_count and error_count for agent_id."""
+        stats = self._stats.get(agent_id)
+        if stats is not None:
+            stats.message_count += 1
+            stats.error_count += 1
+            stats.total_cost_usd += cost_usd
+
+
+def _success_result(
+    response: Any, cost_usd: float, identity: AgentIdentity
+) -> A2AResult:
+    """Build the ALLOW A2AResult for a successful response."""
+    # Determine whether the response is a Task or Message object.
+    _is_task = hasattr(response, "id") and hasattr(response, "status")
+    return A2AResult(
+        success=True,
+        task=response if _is_task else None,
+        message=response if not _is_task else None,
+        decision=Decision.ALLOW,
+        cost_usd=cost_usd,
+        trust_level=identity.trust_level,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -440,6 +616,7 @@ class BoundA2AAdapter(A2AClientContainmentAdapter):
         tenant_id: str,
         identity: AgentIdentity,
         provenance: A2AIdentityProvenance | None = None,
+        idempotent: bool = False,
     ) -> A2AResult:
         """Send a message using the pre-bound client under containment.
 
@@ -449,6 +626,7 @@ class BoundA2AAdapter(A2AClientContainmentAdapter):
             tenant_id: Tenant scope for this request.
             identity: Caller's AgentIdentity for governance hooks.
             provenance: Optional verification metadata for the remote agent.
+            idempotent: Coalesce with an identical in-flight request.
 
         Returns:
             A2AResult from the parent send_message call.
@@ -460,6 +638,7 @@ class BoundA2AAdapter(A2AClientContainmentAdapter):
             identity=identity,
             provenance=provenance,
             client=self._client,
+            idempotent=idempotent,
         )
 
 
@@ -7,18 +7,30 @@ Command injection is prevented by enforcing shell=False.
 
 from __future__ import annotations
 
+import codecs
 import hashlib
+import io
 import logging
+import os
 import re
+import stat
 import subprocess
+import threading
 import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-from urllib.error import URLError
+from typing import Any, Iterable, Iterator
+from urllib.error import HTTPError, URLError
 
+from veronica_core.adapters._http_pool import (
+    ConnectionPool,
+    PooledHTTPHandler,
+    PooledHTTPSHandler,
+)
 from veronica_core.security.capabilities import Capability, CapabilitySet, has_cap
-from veronica_core.security.masking import SecretMasker
+from veronica_core.security.masking import SecretMasker, StreamingMasker
 from veronica_core.security.policy_engine import (
     PolicyContext,
     PolicyEngine,
@@ -31,6 +43,9 @@ logger = logging.getLogger(__name__)
 # itself contains the word "blocked".
 _RE_REDIRECT_BLOCKED = re.compile(r"Redirect to (.+?) blocked")
 
+# Bytes read per chunk by the streaming file and HTTP APIs.
+_READ_CHUNK_SIZE = 64 * 1024
+
 # ---------------------------------------------------------------------------
 # Custom exceptions
 # ---------------------------------------------------------------------------
@@ -57,6 +72,130 @@ class ApprovalRequiredError(RuntimeError):
         )
 
 
+class FileTooLargeError(ValueError):
+    """Raised when a file read or write exceeds its ``max_bytes`` limit."""
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        super().__init__(f"{path} exceeds max_bytes={max_bytes}")
+
+
+class ResponseTooLargeError(ValueError):
+    """Raised when an HTTP response body exceeds its ``max_bytes`` limit."""
+
+    def __init__(self, url: str, max_bytes: int) -> None:
+        self.url = url
+        self.max_bytes = max_bytes
+        super().__init__(f"Response from {url} exceeds max_bytes={max_bytes}")
+
+
+class _RedirectBlocked(URLError):
+    """A redirect intercepted so its target can be checked against policy."""
+
+    def __init__(self, newurl: str) -> None:
+        self.newurl = newurl
+        super().__init__(f"Redirect to {newurl} blocked (policy requires pre-check)")
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Turn every redirect into _RedirectBlocked instead of following it.
+
+    This prevents outbound connections to non-allowlisted hosts: the caller
+    re-evaluates policy for the target before requesting it.
+    """
+
+    def redirect_request(
+        self, req: Any, fp: Any, code: int, msg: str, headers: Any, newurl: str
+    ) -> None:
+        # Drain a short redirect body so the pooled connection can be reused.
+        try:
+            fp.read(_READ_CHUNK_SIZE)
+        finally:
+            fp.close()
+        raise _RedirectBlocked(newurl)
+
+
+# ---------------------------------------------------------------------------
+# Streaming reader
+# ---------------------------------------------------------------------------
+
+
+class MaskedFileReader(io.TextIOBase):
+    """Read-only text stream over masked chunks from SecureExecutor.
+
+    Returned by ``SecureExecutor.open_for_read()``.  Supports ``read()``,
+    ``readline()`` and line iteration; only the chunks needed to satisfy a
+    call are read from disk.  Closing the reader closes the file.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        self._check_open()
+        if size is None or size < 0:
+            while self._pull():
+                pass
+            end = len(self._buf)
+        else:
+            while len(self._buf) - self._pos < size and self._pull():
+                pass
+            end = min(len(self._buf), self._pos + size)
+        return self._take(end)
+
+    def readline(self, size: int | None = -1) -> str:
+        self._check_open()
+        while True:
+            idx = self._buf.find("\n", self._pos)
+            if idx >= 0 or not self._pull():
+                break
+        end = idx + 1 if idx >= 0 else len(self._buf)
+        if size is not None and size >= 0:
+            end = min(end, self._pos + size)
+        return self._take(end)
+
+    def close(self) -> None:
+        if not self.closed:
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+            self._buf = ""
+            self._pos = 0
+        super().close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def _pull(self) -> bool:
+        """Append the next chunk to the buffer; False at end of file."""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def _take(self, end: int) -> str:
+        out = self._buf[self._pos : end]
+        self._pos = end
+        return out
+
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -96,6 +235,16 @@ class SecureExecutor:
     def __init__(self, config: AdapterConfig) -> None:
         self._config = config
         self._masker = SecretMasker()
+        self._http_pool: ConnectionPool | None = None
+        self._opener: urllib.request.OpenerDirector | None = None
+        self._opener_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held for fetch_url()."""
+        with self._opener_lock:
+            pool, self._http_pool, self._opener = self._http_pool, None, None
+        if pool is not None:
+            pool.close()
 
     # ------------------------------------------------------------------
     # Shell execution
@@ -158,7 +307,7 @@ class SecureExecutor:
     # File I/O
     # ------------------------------------------------------------------
 
-    def read_file(self, path: str) -> str:
+    def read_file(self, path: str, max_bytes: int | None = None) -> str:
         """Read and return the contents of *path*.
 
         Path traversal outside repo_root is blocked unless the
@@ -166,6 +315,8 @@ class SecureExecutor:
 
         Args:
             path: Absolute or relative file path.
+            max_bytes: If set, refuse files larger than this many bytes
+                without reading more than ``max_bytes + 1`` of them.
 
         Returns:
             File contents with secrets masked.
@@ -175,28 +326,59 @@ class SecureExecutor:
             ApprovalRequiredError: If PolicyEngine returns REQUIRE_APPROVAL.
             PermissionError: If path escapes repo_root without the capability.
             FileNotFoundError: If the file does not exist.
+            FileTooLargeError: If the file exceeds *max_bytes*.
         """
-        abs_path = self._abs_path(path)
-        resolved = abs_path.resolve()
-        if not has_cap(self._config.caps, Capability.FILE_READ_SENSITIVE):
-            self._check_within_repo(resolved)
+        resolved = self._authorize_read(path)
+        if max_bytes is None:
+            content = resolved.read_text(encoding="utf-8", errors="replace")
+        else:
+            content = "".join(
+                _decoded_chunks(resolved, path, max_bytes, _READ_CHUNK_SIZE)
+            )
+        return self._masker.mask(content)
 
-        # Reject symlinks on the unresolved path.  Path.resolve() follows
-        # symlinks, so checking after resolve() would always return False.
-        if abs_path.is_symlink():
-            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
+    def read_file_iter(
+        self,
+        path: str,
+        max_bytes: int | None = None,
+        chunk_size: int = _READ_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Return an iterator of masked text chunks of *path*.
+
+        Policy and path checks run once, before this method returns.  The
+        file is then read *chunk_size* bytes at a time and masked with a
+        StreamingMasker, so memory stays bounded regardless of file size and
+        secrets spanning chunk boundaries are still redacted.  Chunks follow
+        masking boundaries (usually line ends), not *chunk_size*.
 
-        # Evaluate policy on BOTH original path (for pattern matching like
-        # .env) and the resolved real path (to catch symlink-based bypass).
-        ctx = self._make_ctx("file_read", [path], None)
-        self._enforce(ctx, [path])
-        resolved_str = str(resolved)
-        if resolved_str != str(abs_path):
-            ctx2 = self._make_ctx("file_read", [resolved_str], None)
-            self._enforce(ctx2, [resolved_str])
+        Args:
+            path: Absolute or relative file path.
+            max_bytes: If set, files larger than this raise FileTooLargeError
+                (up front from the file size, or while reading if it grows).
+            chunk_size: Bytes read from disk per step.
 
-        content = resolved.read_text(encoding="utf-8", errors="replace")
-        return self._masker.mask(content)
+        Raises:
+            Same as read_file().
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        resolved = self._authorize_read(path)
+        if max_bytes is not None and resolved.stat().st_size > max_bytes:
+            raise FileTooLargeError(path, max_bytes)
+        return self._iter_masked(resolved, path, max_bytes, chunk_size)
+
+    def open_for_read(
+        self,
+        path: str,
+        max_bytes: int | None = None,
+        chunk_size: int = _READ_CHUNK_SIZE,
+    ) -> MaskedFileReader:
+        """Open *path* as a read-only, masked text stream.
+
+        Same checks and limits as read_file_iter(); use as a context manager
+        so the underlying file is closed promptly.
+        """
+        return MaskedFileReader(self.read_file_iter(path, max_bytes, chunk_size))
 
     def write_file(self, path: str, content: str) -> None:
         """Write *content* to *path* with policy enforcement.
@@ -210,31 +392,68 @@ class SecureExecutor:
             ApprovalRequiredError: If PolicyEngine returns REQUIRE_APPROVAL.
             PermissionError: If path escapes repo_root.
         """
-        abs_path = self._abs_path(path)
-        resolved = abs_path.resolve()
-        self._check_within_repo(resolved)
+        final = self._authorize_write(path)
+        final.write_text(content, encoding="utf-8")
 
-        # Reject symlinks on the unresolved path (before resolve() follows them).
-        if abs_path.exists() and abs_path.is_symlink():
-            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
+    def write_file_iter(
+        self,
+        path: str,
+        chunks: Iterable[str | bytes],
+        max_bytes: int | None = None,
+    ) -> int:
+        """Stream *chunks* into *path* with policy enforcement.
+
+        Chunks (``str`` is UTF-8 encoded, ``bytes`` written as-is) go to a
+        temporary file in the target directory, which replaces *path* only
+        after the last chunk, so readers never see a partial file and a
+        failed or oversized write leaves the original untouched.  When
+        *path* exists, its permission bits (and owner, where permitted)
+        carry over to the new file, as with an in-place write_file().
 
-        # Evaluate policy on BOTH original path (for pattern matching like
-        # .github/workflows/**) and the resolved real path.
-        ctx = self._make_ctx("file_write", [path], None)
-        self._enforce(ctx, [path])
-        resolved_str = str(resolved)
-        if resolved_str != str(abs_path):
-            ctx2 = self._make_ctx("file_write", [resolved_str], None)
-            self._enforce(ctx2, [resolved_str])
+        Args:
+            path: Absolute or relative file path.
+            chunks: Iterable of text or byte chunks.
+            max_bytes: If set, abort once more than this many bytes would be
+                written.
 
-        resolved.parent.mkdir(parents=True, exist_ok=True)
-        # Re-check the unresolved path for symlink swaps (TOCTOU mitigation).
-        if abs_path.is_symlink():
-            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
-        # Re-resolve after mkdir to verify the target is still within repo.
-        final = abs_path.resolve()
-        self._check_within_repo(final)
-        final.write_text(content, encoding="utf-8")
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            Same as write_file(), plus FileTooLargeError.
+        """
+        final = self._authorize_write(path)
+        tmp = final.with_name(f".{final.name}.{uuid.uuid4().hex}.tmp")
+        written = 0
+        try:
+            existing: os.stat_result | None = os.stat(final)
+        except OSError:
+            existing = None
+        # O_EXCL + 0o666 so a new file honours the umask like write_file();
+        # a replacement starts private and takes the target's mode below.
+        fd = os.open(
+            tmp,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            0o666 if existing is None else 0o600,
+        )
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                if existing is not None:
+                    _copy_ownership(fh.fileno(), tmp, existing)
+                for chunk in chunks:
+                    data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                    written += len(data)
+                    if max_bytes is not None and written > max_bytes:
+                        raise FileTooLargeError(path, max_bytes)
+                    fh.write(data)
+            os.replace(tmp, final)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return written
 
     # ------------------------------------------------------------------
     # HTTP fetch
@@ -242,16 +461,24 @@ class SecureExecutor:
 
     _MAX_REDIRECTS = 10
 
-    def fetch_url(self, url: str, method: str = "GET") -> str:
+    def fetch_url(
+        self,
+        url: str,
+        method: str = "GET",
+        max_bytes: int | None = None,
+    ) -> str:
         """Fetch *url* with policy enforcement.
 
         Only GET requests are permitted. Uses urllib.request (no
-        external dependencies). Redirects are followed up to
+        external dependencies) over keep-alive connections pooled per
+        host for the lifetime of the executor. Redirects are followed up to
         ``_MAX_REDIRECTS`` hops, with each target checked against policy.
 
         Args:
             url: Target URL.
             method: HTTP method (must be GET).
+            max_bytes: If set, abort once the body exceeds this many bytes;
+                the body is read in chunks, so no more than that is buffered.
 
         Returns:
             Response body as a string with secrets masked.
@@ -260,46 +487,95 @@ class SecureExecutor:
             SecurePermissionError: If PolicyEngine returns DENY.
             ApprovalRequiredError: If PolicyEngine returns REQUIRE_APPROVAL.
             ValueError: If method is not GET.
+            ResponseTooLargeError: If the body exceeds *max_bytes*.
             URLError: If the request fails or redirect limit exceeded.
         """
         if method.upper() != "GET":
             raise ValueError(f"Only GET requests are permitted, got {method!r}")
+        return self._fetch(url, method, max_bytes, prechecked=False)
 
-        # Use a custom opener that does NOT follow redirects automatically.
-        # This prevents outbound connections to non-allowlisted hosts.
-        class _NoRedirect(urllib.request.HTTPRedirectHandler):
-            def redirect_request(
-                self, req: Any, fp: Any, code: int, msg: str, headers: Any, newurl: str
-            ) -> None:
-                raise URLError(
-                    f"Redirect to {newurl} blocked (policy requires pre-check)"
-                )
+    def fetch_urls(
+        self,
+        urls: list[str],
+        max_concurrency: int = 4,
+        max_bytes: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Fetch several URLs concurrently with policy enforcement.
+
+        Policy is evaluated for every URL before any request is sent, so a
+        denied URL fails the whole call without network I/O. The fetches
+        then run on up to *max_concurrency* threads sharing the executor's
+        connection pool; redirect hops are still checked one by one.
 
-        opener = urllib.request.build_opener(
-            urllib.request.ProxyHandler({}),  # Disable proxy to prevent egress bypass
-            _NoRedirect,
-        )
+        Args:
+            urls: Target URLs.
+            max_concurrency: Maximum number of requests in flight.
+            max_bytes: Per-response body limit, as in fetch_url().
+            return_exceptions: If True, a failed fetch puts its exception
+                in the result list instead of raising it.
+
+        Returns:
+            Masked bodies (or exceptions) in the order of *urls*.
+
+        Raises:
+            SecurePermissionError / ApprovalRequiredError: From the up-front
+                policy checks.
+            ValueError: If max_concurrency < 1.
+            Otherwise, the first failure in *urls* order, after every fetch
+            has finished, unless *return_exceptions* is set.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        for url in urls:
+            self._enforce(self._make_ctx("net", [url, "GET"], None), [url, "GET"])
+        if not urls:
+            return []
+
+        def _one(url: str) -> Any:
+            try:
+                return self._fetch(url, "GET", max_bytes, prechecked=True)
+            except Exception as exc:  # noqa: BLE001
+                return exc
+
+        workers = min(max_concurrency, len(urls))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="veronica-fetch"
+        ) as pool:
+            results = list(pool.map(_one, urls))
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    def _fetch(
+        self,
+        url: str,
+        method: str,
+        max_bytes: int | None,
+        prechecked: bool,
+    ) -> str:
+        """Request *url*, re-checking policy on every redirect hop."""
+        opener = self._get_opener()
         visited: set[str] = set()
         current = url
 
-        for _ in range(self._MAX_REDIRECTS):
-            ctx = self._make_ctx("net", [current, method], None)
-            self._enforce(ctx, [current, method])
+        for hop in range(self._MAX_REDIRECTS):
+            if hop or not prechecked:
+                ctx = self._make_ctx("net", [current, method], None)
+                self._enforce(ctx, [current, method])
 
             req = urllib.request.Request(current, method=method)
             try:
                 with opener.open(req, timeout=30) as resp:
-                    body = resp.read().decode("utf-8", errors="replace")
-                return self._masker.mask(body)
+                    body = _read_body(resp, current, max_bytes)
+                return self._masker.mask(body.decode("utf-8", errors="replace"))
             except URLError as exc:
-                err_msg = str(exc.reason) if hasattr(exc, "reason") else str(exc)
-                _redirect_match = (
-                    _RE_REDIRECT_BLOCKED.search(err_msg)
-                    if "Redirect to " in err_msg
-                    else None
-                )
-                if _redirect_match:
-                    redirect_url = _redirect_match.group(1)
+                if isinstance(exc, HTTPError):
+                    exc.close()
+                redirect_url = _redirect_target(exc)
+                if redirect_url is not None:
                     if redirect_url in visited:
                         raise URLError(
                             f"Redirect loop detected: {redirect_url}"
@@ -312,10 +588,92 @@ class SecureExecutor:
 
         raise URLError(f"Too many redirects (>{self._MAX_REDIRECTS}) for {url}")
 
+    def _get_opener(self) -> urllib.request.OpenerDirector:
+        with self._opener_lock:
+            if self._opener is None:
+                self._http_pool = ConnectionPool()
+                self._opener = urllib.request.build_opener(
+                    # Disable proxy to prevent egress bypass
+                    urllib.request.ProxyHandler({}),
+                    PooledHTTPHandler(self._http_pool),
+                    PooledHTTPSHandler(self._http_pool),
+                    _NoRedirect,
+                )
+            return self._opener
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _authorize_read(self, path: str) -> Path:
+        """Run path and policy checks for reading *path*; return resolved."""
+        abs_path = self._abs_path(path)
+        resolved = abs_path.resolve()
+        if not has_cap(self._config.caps, Capability.FILE_READ_SENSITIVE):
+            self._check_within_repo(resolved)
+
+        # Reject symlinks on the unresolved path.  Path.resolve() follows
+        # symlinks, so checking after resolve() would always return False.
+        if abs_path.is_symlink():
+            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
+
+        # Evaluate policy on BOTH original path (for pattern matching like
+        # .env) and the resolved real path (to catch symlink-based bypass).
+        ctx = self._make_ctx("file_read", [path], None)
+        self._enforce(ctx, [path])
+        resolved_str = str(resolved)
+        if resolved_str != str(abs_path):
+            ctx2 = self._make_ctx("file_read", [resolved_str], None)
+            self._enforce(ctx2, [resolved_str])
+        return resolved
+
+    def _authorize_write(self, path: str) -> Path:
+        """Run path and policy checks for writing *path*; return the target.
+
+        Creates missing parent directories.
+        """
+        abs_path = self._abs_path(path)
+        resolved = abs_path.resolve()
+        self._check_within_repo(resolved)
+
+        # Reject symlinks on the unresolved path (before resolve() follows them).
+        if abs_path.exists() and abs_path.is_symlink():
+            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
+
+        # Evaluate policy on BOTH original path (for pattern matching like
+        # .github/workflows/**) and the resolved real path.
+        ctx = self._make_ctx("file_write", [path], None)
+        self._enforce(ctx, [path])
+        resolved_str = str(resolved)
+        if resolved_str != str(abs_path):
+            ctx2 = self._make_ctx("file_write", [resolved_str], None)
+            self._enforce(ctx2, [resolved_str])
+
+        resolved.parent.mkdir(parents=True, exist_ok=True)
+        # Re-check the unresolved path for symlink swaps (TOCTOU mitigation).
+        if abs_path.is_symlink():
+            raise PermissionError(f"Symlinks are not allowed: {abs_path}")
+        # Re-resolve after mkdir to verify the target is still within repo.
+        final = abs_path.resolve()
+        self._check_within_repo(final)
+        return final
+
+    def _iter_masked(
+        self,
+        resolved: Path,
+        path: str,
+        max_bytes: int | None,
+        chunk_size: int,
+    ) -> Iterator[str]:
+        masker = StreamingMasker(self._masker)
+        for text in _decoded_chunks(resolved, path, max_bytes, chunk_size):
+            out = masker.feed(text)
+            if out:
+                yield out
+        tail = masker.flush()
+        if tail:
+            yield tail
+
     def _make_ctx(
         self,
         action: str,
@@ -362,3 +720,89 @@ class SecureExecutor:
             resolved.relative_to(repo)
         except ValueError:
             raise PermissionError(f"Path '{resolved}' is outside repo_root '{repo}'")
+
+
+def _decoded_chunks(
+    resolved: Path,
+    path: str,
+    max_bytes: int | None,
+    chunk_size: int,
+) -> Iterator[str]:
+    """Yield the text of *resolved* decoded like ``read_text(errors="replace")``.
+
+    Universal newlines are translated across chunk boundaries.  Raises
+    FileTooLargeError as soon as more than *max_bytes* bytes were read.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    total = 0
+    with open(resolved, "rb") as fh:
+        while True:
+            limit = chunk_size
+            if max_bytes is not None:
+                # Read at most one byte past the limit to detect overflow.
+                limit = min(chunk_size, max_bytes + 1 - total)
+            chunk = fh.read(limit)
+            if not chunk:
+                break
+            total += len(chunk)
+            if max_bytes is not None and total > max_bytes:
+                raise FileTooLargeError(path, max_bytes)
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def _copy_ownership(fd: int, path: Path, st: os.stat_result) -> None:
+    """Give the file open as *fd* the owner and permission bits in *st*.
+
+    The owner is copied only where permitted (typically as root); the mode
+    is set afterwards because chown may clear setuid/setgid bits.
+    """
+    if hasattr(os, "fchown") and (st.st_uid, st.st_gid) != (
+        os.geteuid(),
+        os.getegid(),
+    ):
+        try:
+            os.fchown(fd, st.st_uid, st.st_gid)
+        except OSError:
+            pass
+    mode = stat.S_IMODE(st.st_mode)
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, mode)
+    else:  # Windows before Python 3.13
+        os.chmod(path, mode)
+
+
+def _read_body(resp: Any, url: str, max_bytes: int | None) -> bytes:
+    """Read *resp* in chunks, raising ResponseTooLargeError past *max_bytes*."""
+    parts: list[bytes] = []
+    total = 0
+    while True:
+        chunk = resp.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            raise ResponseTooLargeError(url, max_bytes)
+        parts.append(chunk)
+        # HTTPResponse.read(n) only returns fewer than n bytes at the end of
+        # the body; stopping here saves one round through the reader.
+        if len(chunk) < _READ_CHUNK_SIZE:
+            break
+    return b"".join(parts)
+
+
+def _redirect_target(exc: URLError) -> str | None:
+    """Return the redirect URL carried by *exc*, or None."""
+    if isinstance(exc, _RedirectBlocked):
+        return exc.newurl
+    err_msg = str(exc.reason) if hasattr(exc, "reason") else str(exc)
+    if "Redirect to " not in err_msg:
+        return None
+    match = _RE_REDIRECT_BLOCKED.search(err_msg)
+    return match.group(1) if match else None
@@ -9,6 +9,7 @@ configurable per tool.
 
 Public API:
     MCPToolCost -- cost configuration for a single MCP tool
+    MCPToolCall -- one entry of a wrap_tool_calls() batch
     MCPToolResult -- result of a contained MCP tool call
     MCPToolStats -- per-tool usage statistics
     MCPContainmentAdapter -- wraps tool calls with budget + circuit breaker
@@ -37,17 +38,22 @@ import inspect
 import logging
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
 
 if TYPE_CHECKING:
     from veronica_core.adapter_capabilities import AdapterCapabilities
 
 from veronica_core.adapters._mcp_base import (
+    MCPToolCall,
     MCPToolCost,
     MCPToolResult,
     MCPToolStats,
+    _CallOutcome,
     _MCPAdapterBase,
     _STATS_WARN_LIMIT,
+    _validate_max_concurrency,
+    _validate_timeout,
     _extract_token_count,  # noqa: F401 -- re-exported for backward compatibility
 )
 from veronica_core.circuit_breaker import FailurePredicate
@@ -57,6 +63,7 @@ from veronica_core.shield.types import Decision
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "MCPToolCall",
     "MCPToolCost",
     "MCPToolResult",
     "MCPToolStats",
@@ -76,7 +83,8 @@ class MCPContainmentAdapter(_MCPAdapterBase):
     flapping, all tools on that server are blocked, but tools on other
     servers are unaffected.
 
-    Thread-safe: wrap_tool_call() may be called concurrently.
+    Thread-safe: wrap_tool_call() and wrap_tool_calls() may be called
+    concurrently.
 
     Args:
         execution_context: Chain-level containment context. Controls budget
@@ -96,6 +104,8 @@ class MCPContainmentAdapter(_MCPAdapterBase):
             AsyncMCPContainmentAdapter with asyncio.wait_for().
     """
 
+    _IS_ERROR_MESSAGE = "MCP tool returned isError=True"
+
     def __init__(
         self,
         execution_context: ExecutionContext,
@@ -113,6 +123,8 @@ class MCPContainmentAdapter(_MCPAdapterBase):
             timeout_seconds=timeout_seconds,
             failure_predicate=failure_predicate,
         )
+        # Guards tool-name registration in _ensure_stats (check-then-insert
+        # against the cardinality cap). Counters themselves are lock-free.
         self._stats_lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -249,18 +261,7 @@ class MCPContainmentAdapter(_MCPAdapterBase):
         # Record success in circuit breaker and stats.
         self._record_circuit_breaker_success()
 
-        with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
-                stats.total_cost_usd += actual_cost
-                stats._total_duration_ms += call_duration_ms
-                successful_calls = stats.call_count - stats.error_count
-                stats.avg_duration_ms = (
-                    stats._total_duration_ms / successful_calls
-                    if successful_calls > 0
-                    else 0.0
-                )
+        self._record_success_stats(tool_name, actual_cost, call_duration_ms)
 
         return MCPToolResult(
             success=True,
@@ -269,6 +270,149 @@ class MCPContainmentAdapter(_MCPAdapterBase):
             cost_usd=actual_cost,
         )
 
+    def wrap_tool_calls(
+        self,
+        calls: Sequence[Union[MCPToolCall, tuple[str, dict[str, Any], Callable[..., Any]]]],
+        max_concurrency: int = 8,
+        per_call_timeout: Optional[float] = None,
+    ) -> list[MCPToolResult]:
+        """Invoke a batch of tool calls concurrently under one budget reservation.
+
+        The summed cost estimate of every call is reserved against the chain
+        ceiling in a single backend operation. If the reservation is refused,
+        no call_fn runs and every entry gets a HALT result. Steps are then
+        reserved for the whole batch: when fewer than ``len(calls)`` steps
+        remain below max_steps, the batch is trimmed to the remaining steps
+        and the trailing entries get a HALT result without running. The
+        remaining calls run on at most *max_concurrency* worker threads and,
+        once all have finished, the actual cost of the successful calls is
+        committed and the rest of the escrow released in one ``settle()``
+        step. Every dispatched call takes a step and records a node, but
+        failed, timed-out and isError calls are not charged (as in
+        AsyncMCPContainmentAdapter).
+
+        The circuit breaker and chain limits are checked once for the whole
+        batch. Backends without reserve() fall back to concurrent
+        wrap_tool_call() invocations.
+
+        Args:
+            calls: MCPToolCall entries or ``(tool_name, arguments, call_fn)``
+                tuples.
+            max_concurrency: Maximum number of calls in flight at once.
+            per_call_timeout: Post-hoc timeout applied to each call; defaults
+                to timeout_seconds.
+
+        Returns:
+            One MCPToolResult per input call, in input order.
+        """
+        _validate_max_concurrency(max_concurrency)
+        if per_call_timeout is not None:
+            _validate_timeout(per_call_timeout, "per_call_timeout")
+        batch = self._normalize_calls(calls)
+        if not batch:
+            return []
+        for call in batch:
+            if inspect.iscoroutinefunction(call.call_fn):
+                raise TypeError(
+                    "call_fn is a coroutine function; use AsyncMCPContainmentAdapter instead"
+                )
+        timeout = per_call_timeout if per_call_timeout is not None else self._timeout_seconds
+        workers = min(max_concurrency, len(batch))
+
+        backend = self._ctx._budget_backend
+        if not hasattr(backend, "reserve"):
+            return self._wrap_tool_calls_unreserved(batch, workers, timeout)
+
+        for call in batch:
+            self._ensure_stats(call.tool_name)
+
+        halt_result = self._check_circuit_breaker(batch[0].tool_name)
+        if halt_result is not None:
+            for call in batch:
+                self._increment_call_count(call.tool_name)
+            return [halt_result] * len(batch)
+
+        if self._ctx._check_limits_delegate() is not None:
+            return self._halt_calls(batch, "Budget limit exceeded")
+
+        estimates, total_estimate = self._batch_reservation_plan(batch)
+        reservation_id: Optional[str] = None
+        if total_estimate > 0.0:
+            try:
+                reservation_id = backend.reserve(
+                    total_estimate, self._ctx._config.max_cost_usd
+                )
+            except OverflowError:
+                logger.debug(
+                    "[MCP_ADAPTER] batch of %d blocked by budget HALT (reserve %.6f)",
+                    len(batch),
+                    total_estimate,
+                )
+                return self._halt_calls(batch, "Budget limit exceeded")
+
+        granted = self._ctx._reserve_steps(len(batch))
+        batch, refused = batch[:granted], batch[granted:]
+        if not batch:
+            if reservation_id is not None:
+                self._settle_reservation(reservation_id, 0.0)
+            return self._halt_calls(refused, "Step limit exceeded")
+
+        def _invoke(call: MCPToolCall) -> _CallOutcome:
+            t0 = time.monotonic()
+            try:
+                result = call.call_fn(**call.arguments)
+            except Exception as exc:  # noqa: BLE001
+                return _CallOutcome(error=exc, duration_ms=(time.monotonic() - t0) * 1000.0)
+            duration_ms = (time.monotonic() - t0) * 1000.0
+            if timeout is not None and duration_ms > timeout * 1000.0:
+                return _CallOutcome(
+                    result=result,
+                    error=TimeoutError(f"Tool call exceeded {timeout}s timeout"),
+                    duration_ms=duration_ms,
+                )
+            return _CallOutcome(result=result, duration_ms=duration_ms)
+
+        try:
+            if workers == 1:
+                outcomes = [_invoke(call) for call in batch]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="veronica-mcp-batch"
+                ) as pool:
+                    outcomes = list(pool.map(_invoke, batch))
+        except BaseException:
+            if reservation_id is not None:
+                self._settle_reservation(reservation_id, 0.0)
+            raise
+
+        results: list[MCPToolResult] = []
+        charged = 0.0
+        for call, estimate, outcome in zip(batch, estimates, outcomes):
+            result, charge = self._outcome_to_result(call, estimate, outcome)
+            results.append(result)
+            if outcome.error is not None:
+                logger.debug(
+                    "[MCP_ADAPTER] tool=%s raised %s: %s",
+                    call.tool_name,
+                    type(outcome.error).__name__,
+                    outcome.error,
+                )
+                self._record_circuit_breaker_failure(outcome.error)
+                self._increment_error_count(call.tool_name)
+            elif not result.success:
+                self._increment_error_count(call.tool_name)
+            else:
+                charged += charge
+                self._record_circuit_breaker_success()
+                self._record_success_stats(call.tool_name, charge, outcome.duration_ms)
+            self._record_batch_node(call, result, outcome)
+
+        if reservation_id is not None:
+            self._settle_reservation(reservation_id, charged)
+        elif charged > 0.0:
+            backend.add(charged)
+        return results + self._halt_calls(refused, "Step limit exceeded")
+
     def capabilities(self) -> "AdapterCapabilities":
         """Return the capability descriptor for this adapter."""
         from veronica_core.adapter_capabilities import AdapterCapabilities
@@ -282,20 +426,36 @@ class MCPContainmentAdapter(_MCPAdapterBase):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _increment_call_count(self, tool_name: str) -> None:
-        """Safely increment call_count, tolerating missing stats entries."""
-        with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
-
-    def _increment_error_count(self, tool_name: str) -> None:
-        """Safely increment both call_count and error_count."""
-        with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
-                stats.error_count += 1
+    def _wrap_tool_calls_unreserved(
+        self,
+        batch: list[MCPToolCall],
+        workers: int,
+        timeout: Optional[float],
+    ) -> list[MCPToolResult]:
+        """wrap_tool_calls() for backends without reserve(): one wrap_tool_call each."""
+
+        def _timed(call: MCPToolCall) -> Callable[..., Any]:
+            if timeout is None or timeout == self._timeout_seconds:
+                return call.call_fn
+
+            def _call(**kwargs: Any) -> Any:
+                t0 = time.monotonic()
+                result = call.call_fn(**kwargs)
+                if time.monotonic() - t0 > timeout:
+                    raise TimeoutError(f"Tool call exceeded {timeout}s timeout")
+                return result
+
+            return _call
+
+        def _one(call: MCPToolCall) -> MCPToolResult:
+            return self.wrap_tool_call(call.tool_name, call.arguments, _timed(call))
+
+        if workers == 1:
+            return [_one(call) for call in batch]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="veronica-mcp-batch"
+        ) as pool:
+            return list(pool.map(_one, batch))
 
     def _ensure_stats(self, tool_name: str) -> None:
         """Create a MCPToolStats entry for tool_name if it does not exist."""
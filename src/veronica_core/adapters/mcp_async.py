@@ -10,7 +10,7 @@ Public API:
     AsyncMCPContainmentAdapter -- wraps async tool calls with budget + CB
 
 Reuses from .mcp:
-    MCPToolCost, MCPToolResult, MCPToolStats
+    MCPToolCall, MCPToolCost, MCPToolResult, MCPToolStats
 
 Example::
 
@@ -38,25 +38,28 @@ Example::
 from __future__ import annotations
 
 import asyncio
-import dataclasses
-import inspect
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Sequence, Union
 
 if TYPE_CHECKING:
     from veronica_core.adapter_capabilities import AdapterCapabilities
 
 from veronica_core.adapters._mcp_base import (
+    MCPToolCall,
     MCPToolCost,
     MCPToolResult,
     MCPToolStats,
+    _CallOutcome,
     _MCPAdapterBase,
     _STATS_WARN_LIMIT,
+    _validate_max_concurrency,
+    _validate_timeout,
     _extract_token_count,  # noqa: F401 -- re-exported for backward compatibility
 )
 from veronica_core.circuit_breaker import CircuitBreaker, FailurePredicate
 from veronica_core.containment.execution_context import ExecutionContext
+from veronica_core.distributed import AsyncBudgetBackend
 from veronica_core.shield.types import Decision
 
 logger = logging.getLogger(__name__)
@@ -76,8 +79,13 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
     - ``call_fn`` must be an async callable (``async def``); it is awaited.
     - ``timeout_seconds`` adds an ``asyncio.wait_for`` timeout around the call.
     - ``failure_predicate`` restricts which exceptions trip the circuit breaker.
-    - Stats mutations are protected by ``self._stats_lock`` (asyncio.Lock) to prevent
-      interleaving between coroutines that resume after ``await call_fn()``.
+    - Stats counters are recorded without locking (see _ToolStatsRecorder);
+      ``self._stats_lock`` (asyncio.Lock) only guards tool-name registration.
+    - Budget reserve/commit/rollback and circuit-breaker checks never block the
+      event loop. Async-native backends are awaited; in-process backends
+      (LocalBudgetBackend, CircuitBreaker) are called inline; anything that may
+      do network I/O (RedisBudgetBackend, DistributedCircuitBreaker, custom
+      backends) is dispatched to a worker thread.
 
     Args:
         execution_context: Chain-level containment context. Controls budget
@@ -95,6 +103,10 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
             returns True will trip the circuit breaker. Exceptions that
             return False are still recorded as tool errors but do not
             increment the CB failure count.
+        offload_blocking_io: When True (default), sync budget backends and
+            circuit breakers that may perform network I/O are called from a
+            worker thread. Set to False to call them inline on the event loop
+            (the previous behaviour).
     """
 
     def __init__(
@@ -105,6 +117,7 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
         default_cost_per_call: float = 0.001,
         timeout_seconds: Optional[float] = None,
         failure_predicate: Optional[FailurePredicate] = None,
+        offload_blocking_io: bool = True,
     ) -> None:
         super().__init__(
             execution_context=execution_context,
@@ -114,19 +127,26 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
             timeout_seconds=timeout_seconds,
             failure_predicate=failure_predicate,
         )
-        # Per-tool stats; keyed by tool_name.
-        # Lock required: stats updates occur after `await call_fn()`, so two
-        # coroutines can interleave and produce torn reads/writes without locking.
+        # Guards tool-name registration in _ensure_stats (check-then-insert
+        # against the cardinality cap). Counters themselves are lock-free.
         self._stats_lock = asyncio.Lock()
         # Cache backend reserve capability once (doesn't change after init).
         # True when the backend exposes reserve/commit/rollback (sync or async).
-        # At call time we use inspect.isawaitable() on the return value to
-        # decide whether to await -- this handles both async def and sync
-        # functions that return awaitables.
         _backend = getattr(self._ctx, "_budget_backend", None)
         self._backend_supports_reserve: bool = _backend is not None and hasattr(
             _backend, "reserve"
         )
+        self._offload_blocking_io = offload_blocking_io
+        # Awaitable facade over the context's budget backend; rebuilt lazily if
+        # the backend object is swapped after construction.
+        self._async_budget: Optional[AsyncBudgetBackend] = None
+        # In-process CircuitBreaker is cheap to call inline; anything else
+        # (e.g. DistributedCircuitBreaker) may do a Redis round trip.
+        self._offload_circuit_breaker: bool = (
+            offload_blocking_io
+            and circuit_breaker is not None
+            and not isinstance(circuit_breaker, CircuitBreaker)
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -143,9 +163,8 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
             Mapping of tool_name -> MCPToolStats snapshot.
         """
         async with self._stats_lock:
-            return {
-                name: dataclasses.replace(stats) for name, stats in self._stats.items()
-            }
+            items = list(self._stats.items())
+        return self._merge_stats(items)
 
     def get_tool_stats(self) -> dict[str, MCPToolStats]:
         """Synchronous snapshot -- safe only when called from a non-async context.
@@ -162,7 +181,7 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
         """
         # Take a stable list of items without holding an async lock from sync code.
         items = list(self._stats.items())
-        return {name: dataclasses.replace(stats) for name, stats in items}
+        return self._merge_stats(items)
 
     async def wrap_tool_call(
         self,
@@ -196,9 +215,9 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
         await self._ensure_stats(tool_name)
 
         # Circuit breaker pre-check.
-        halt_result = self._check_circuit_breaker(tool_name)
+        halt_result = await self._check_circuit_breaker_async(tool_name)
         if halt_result is not None:
-            await self._increment_call_count(tool_name)
+            self._increment_call_count(tool_name)
             return halt_result
 
         # Determine cost estimate.
@@ -206,28 +225,24 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
 
         # Budget gate: use reserve/commit/rollback when available (two-phase
         # atomicity), otherwise fall back to the sync _budget_probe no-op.
-        budget_backend = getattr(self._ctx, "_budget_backend", None)
-        _use_reserve = cost_estimate > 0.0 and self._backend_supports_reserve
+        budget = self._get_async_budget()
+        _use_reserve = (
+            cost_estimate > 0.0 and self._backend_supports_reserve and budget is not None
+        )
         _reservation_id: Optional[str] = None
 
         if _use_reserve:
             # Phase 1a: reserve the cost estimate against the ceiling.
-            # Support both sync and async reserve implementations.
             try:
-                _reserve_result = budget_backend.reserve(
+                _reservation_id = await budget.reserve(
                     cost_estimate, self._ctx._config.max_cost_usd
                 )
-                _reservation_id = (
-                    await _reserve_result
-                    if inspect.isawaitable(_reserve_result)
-                    else _reserve_result
-                )
             except OverflowError:
                 logger.debug(
                     "[ASYNC_MCP_ADAPTER] tool=%s blocked by budget HALT (reserve)",
                     tool_name,
                 )
-                await self._increment_call_count(tool_name)
+                self._increment_call_count(tool_name)
                 return MCPToolResult(
                     success=False,
                     error="Budget limit exceeded",
@@ -240,13 +255,18 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
                 pass
 
             opts = self._build_wrap_options(tool_name, cost_estimate)
-            ec_decision = self._ctx.wrap_tool_call(fn=_budget_probe, options=opts)
+            if budget is not None and budget.offloaded:
+                ec_decision = await asyncio.to_thread(
+                    self._ctx.wrap_tool_call, fn=_budget_probe, options=opts
+                )
+            else:
+                ec_decision = self._ctx.wrap_tool_call(fn=_budget_probe, options=opts)
 
             if ec_decision == Decision.HALT:
                 logger.debug(
                     "[ASYNC_MCP_ADAPTER] tool=%s blocked by budget HALT", tool_name
                 )
-                await self._increment_call_count(tool_name)
+                self._increment_call_count(tool_name)
                 return MCPToolResult(
                     success=False,
                     error="Budget limit exceeded",
@@ -265,6 +285,11 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
                 )
             else:
                 result_value = await call_fn(**arguments)
+        except asyncio.CancelledError:
+            # Release the escrow before propagating cancellation.
+            if _reservation_id is not None:
+                await self._rollback_quietly(budget, _reservation_id)
+            raise
         except Exception as exc:  # noqa: BLE001
             call_error = exc
         finally:
@@ -279,14 +304,9 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
                 call_error,
             )
             if _reservation_id is not None:
-                try:
-                    _rb = budget_backend.rollback(_reservation_id)
-                    if inspect.isawaitable(_rb):
-                        await _rb
-                except Exception:  # noqa: BLE001
-                    pass
-            self._record_circuit_breaker_failure(call_error)
-            await self._increment_error_count(tool_name)
+                await self._rollback_quietly(budget, _reservation_id)
+            await self._record_circuit_breaker_failure_async(call_error)
+            self._increment_error_count(tool_name)
             return MCPToolResult(
                 success=False,
                 error="tool call failed",
@@ -298,13 +318,8 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
         if getattr(result_value, "isError", False):
             logger.debug("[ASYNC_MCP_ADAPTER] tool=%s returned isError=True", tool_name)
             if _reservation_id is not None:
-                try:
-                    _rb = budget_backend.rollback(_reservation_id)
-                    if inspect.isawaitable(_rb):
-                        await _rb
-                except Exception:  # noqa: BLE001
-                    pass
-            await self._increment_error_count(tool_name)
+                await self._rollback_quietly(budget, _reservation_id)
+            self._increment_error_count(tool_name)
             return MCPToolResult(
                 success=False,
                 result=result_value,
@@ -322,12 +337,10 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
         token_delta = actual_cost - cost_estimate
         if _reservation_id is not None:
             try:
-                _cm = budget_backend.commit(_reservation_id)
-                if inspect.isawaitable(_cm):
-                    await _cm
+                await budget.commit(_reservation_id)
                 # Charge per-token delta not included in the original reservation.
                 if token_delta > 0:
-                    self._ctx._budget_backend.add(token_delta)
+                    await budget.add(token_delta)
                     self._ctx._limits.budget.add(token_delta)
             except Exception as _commit_exc:  # noqa: BLE001
                 # Commit failed (expired, already committed, or backend error).
@@ -344,24 +357,16 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
             # wrap_tool_call.  Only add the per-token delta (if any) to avoid
             # double-charging the base cost_per_call.
             if token_delta > 0:
-                self._ctx._budget_backend.add(token_delta)
+                if budget is not None:
+                    await budget.add(token_delta)
+                else:
+                    self._ctx._budget_backend.add(token_delta)
                 self._ctx._limits.budget.add(token_delta)
 
         # Record success in CB and stats.
-        self._record_circuit_breaker_success()
+        await self._record_circuit_breaker_success_async()
 
-        async with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
-                stats.total_cost_usd += actual_cost
-                stats._total_duration_ms += duration_ms
-                successful_calls = stats.call_count - stats.error_count
-                stats.avg_duration_ms = (
-                    stats._total_duration_ms / successful_calls
-                    if successful_calls > 0
-                    else 0.0
-                )
+        self._record_success_stats(tool_name, actual_cost, duration_ms)
 
         return MCPToolResult(
             success=True,
@@ -370,6 +375,152 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
             cost_usd=actual_cost,
         )
 
+    async def wrap_tool_calls(
+        self,
+        calls: Sequence[Union[MCPToolCall, tuple[str, dict[str, Any], AsyncCallFn]]],
+        max_concurrency: int = 8,
+        per_call_timeout: Optional[float] = None,
+    ) -> list[MCPToolResult]:
+        """Await a batch of tool calls concurrently under one budget reservation.
+
+        The summed cost estimate of every call is reserved in a single backend
+        operation. If the reservation is refused, no call_fn is awaited and
+        every entry gets a HALT result. Steps are then reserved for the whole
+        batch; entries beyond the steps remaining below max_steps get a HALT
+        result without running. At most *max_concurrency* calls run at once,
+        each under ``asyncio.wait_for(per_call_timeout)``. When all have
+        finished, the actual cost of the successful calls is committed and
+        the rest of the escrow released in one ``settle()`` step. The
+        in-process chain cost and the node history are updated exactly as
+        the sync adapter does. If the batch is cancelled the whole
+        reservation is rolled back (the steps stay taken).
+
+        The circuit breaker and chain limits are checked once for the whole
+        batch. When the backend has no reserve() (or the batch costs nothing
+        up front), the calls fall back to concurrent wrap_tool_call()
+        invocations.
+
+        Args:
+            calls: MCPToolCall entries or ``(tool_name, arguments, call_fn)``
+                tuples whose call_fn is an async callable.
+            max_concurrency: Maximum number of calls in flight at once.
+            per_call_timeout: Timeout applied to each call; defaults to
+                timeout_seconds.
+
+        Returns:
+            One MCPToolResult per input call, in input order.
+        """
+        _validate_max_concurrency(max_concurrency)
+        if per_call_timeout is not None:
+            _validate_timeout(per_call_timeout, "per_call_timeout")
+        batch = self._normalize_calls(calls)
+        if not batch:
+            return []
+        timeout = per_call_timeout if per_call_timeout is not None else self._timeout_seconds
+        semaphore = asyncio.Semaphore(min(max_concurrency, len(batch)))
+
+        budget = self._get_async_budget()
+        estimates, total_estimate = self._batch_reservation_plan(batch)
+        if not (
+            total_estimate > 0.0 and self._backend_supports_reserve and budget is not None
+        ):
+            return await self._wrap_tool_calls_unreserved(batch, semaphore, timeout)
+
+        for call in batch:
+            await self._ensure_stats(call.tool_name)
+
+        halt_result = await self._check_circuit_breaker_async(batch[0].tool_name)
+        if halt_result is not None:
+            for call in batch:
+                self._increment_call_count(call.tool_name)
+            return [halt_result] * len(batch)
+
+        if budget.offloaded:
+            halt_reason = await asyncio.to_thread(self._ctx._check_limits_delegate)
+        else:
+            halt_reason = self._ctx._check_limits_delegate()
+        if halt_reason is not None:
+            return self._halt_calls(batch, "Budget limit exceeded")
+
+        try:
+            reservation_id = await budget.reserve(
+                total_estimate, self._ctx._config.max_cost_usd
+            )
+        except OverflowError:
+            logger.debug(
+                "[ASYNC_MCP_ADAPTER] batch of %d blocked by budget HALT (reserve %.6f)",
+                len(batch),
+                total_estimate,
+            )
+            return self._halt_calls(batch, "Budget limit exceeded")
+
+        granted = self._ctx._reserve_steps(len(batch))
+        batch, refused = batch[:granted], batch[granted:]
+        if not batch:
+            await self._rollback_quietly(budget, reservation_id)
+            return self._halt_calls(refused, "Step limit exceeded")
+
+        async def _invoke(call: MCPToolCall) -> _CallOutcome:
+            async with semaphore:
+                t0 = time.monotonic()
+                try:
+                    if timeout is not None:
+                        result = await asyncio.wait_for(
+                            call.call_fn(**call.arguments), timeout=timeout
+                        )
+                    else:
+                        result = await call.call_fn(**call.arguments)
+                except Exception as exc:  # noqa: BLE001
+                    return _CallOutcome(
+                        error=exc, duration_ms=(time.monotonic() - t0) * 1000.0
+                    )
+                return _CallOutcome(
+                    result=result, duration_ms=(time.monotonic() - t0) * 1000.0
+                )
+
+        try:
+            outcomes = await asyncio.gather(*(_invoke(call) for call in batch))
+        except BaseException:
+            # Cancellation (or an unexpected BaseException) -- release the escrow.
+            await self._rollback_quietly(budget, reservation_id)
+            raise
+
+        results: list[MCPToolResult] = []
+        charged = 0.0
+        for call, estimate, outcome in zip(batch, estimates, outcomes):
+            result, charge = self._outcome_to_result(call, estimate, outcome)
+            results.append(result)
+            if outcome.error is not None:
+                logger.debug(
+                    "[ASYNC_MCP_ADAPTER] tool=%s raised %s: %s",
+                    call.tool_name,
+                    type(outcome.error).__name__,
+                    outcome.error,
+                )
+                await self._record_circuit_breaker_failure_async(outcome.error)
+                self._increment_error_count(call.tool_name)
+            elif not result.success:
+                self._increment_error_count(call.tool_name)
+            else:
+                charged += charge
+                await self._record_circuit_breaker_success_async()
+                self._record_success_stats(
+                    call.tool_name, charge, outcome.duration_ms
+                )
+            # Takes no lock held across an await; charges the in-process chain
+            # cost for successful calls (the backend is charged by settle()).
+            self._record_batch_node(call, result, outcome)
+
+        try:
+            await budget.settle(reservation_id, charged)
+        except Exception as settle_exc:  # noqa: BLE001
+            logger.warning(
+                "[ASYNC_MCP_ADAPTER] settle(%s) failed: %s -- cost may be untracked",
+                reservation_id,
+                settle_exc,
+            )
+        return results + self._halt_calls(refused, "Step limit exceeded")
+
     def capabilities(self) -> "AdapterCapabilities":
         """Return the capability descriptor for this adapter."""
         from veronica_core.adapter_capabilities import AdapterCapabilities
@@ -384,20 +535,80 @@ class AsyncMCPContainmentAdapter(_MCPAdapterBase):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _increment_call_count(self, tool_name: str) -> None:
-        """Safely increment call_count, tolerating missing stats entries."""
-        async with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
+    def _get_async_budget(self) -> Optional[AsyncBudgetBackend]:
+        """Return the awaitable facade for the context's current budget backend."""
+        backend = getattr(self._ctx, "_budget_backend", None)
+        if backend is None:
+            return None
+        cached = self._async_budget
+        if cached is None or cached.backend is not backend:
+            cached = AsyncBudgetBackend(
+                backend, offload=None if self._offload_blocking_io else False
+            )
+            self._async_budget = cached
+        return cached
 
-    async def _increment_error_count(self, tool_name: str) -> None:
-        """Safely increment both call_count and error_count."""
-        async with self._stats_lock:
-            stats = self._stats.get(tool_name)
-            if stats is not None:
-                stats.call_count += 1
-                stats.error_count += 1
+    async def _rollback_quietly(
+        self, budget: Optional[AsyncBudgetBackend], reservation_id: str
+    ) -> None:
+        """Roll back *reservation_id*, swallowing backend errors."""
+        if budget is None:
+            return
+        try:
+            await budget.rollback(reservation_id)
+        except Exception:  # noqa: BLE001
+            logger.debug(
+                "[ASYNC_MCP_ADAPTER] rollback(%s) failed; reservation may leak",
+                reservation_id,
+                exc_info=True,
+            )
+
+    async def _check_circuit_breaker_async(
+        self, tool_name: str
+    ) -> Optional[MCPToolResult]:
+        """Non-blocking variant of _check_circuit_breaker()."""
+        if self._offload_circuit_breaker:
+            return await asyncio.to_thread(self._check_circuit_breaker, tool_name)
+        return self._check_circuit_breaker(tool_name)
+
+    async def _record_circuit_breaker_failure_async(self, exc: BaseException) -> None:
+        """Non-blocking variant of _record_circuit_breaker_failure()."""
+        if self._offload_circuit_breaker:
+            await asyncio.to_thread(self._record_circuit_breaker_failure, exc)
+        else:
+            self._record_circuit_breaker_failure(exc)
+
+    async def _record_circuit_breaker_success_async(self) -> None:
+        """Non-blocking variant of _record_circuit_breaker_success()."""
+        if self._offload_circuit_breaker:
+            await asyncio.to_thread(self._record_circuit_breaker_success)
+        else:
+            self._record_circuit_breaker_success()
+
+    async def _wrap_tool_calls_unreserved(
+        self,
+        batch: list[MCPToolCall],
+        semaphore: asyncio.Semaphore,
+        timeout: Optional[float],
+    ) -> list[MCPToolResult]:
+        """wrap_tool_calls() without a shared reservation: one wrap_tool_call each."""
+
+        def _timed(call: MCPToolCall) -> AsyncCallFn:
+            if timeout is None or timeout == self._timeout_seconds:
+                return call.call_fn
+
+            async def _call(**kwargs: Any) -> Any:
+                return await asyncio.wait_for(call.call_fn(**kwargs), timeout=timeout)
+
+            return _call
+
+        async def _one(call: MCPToolCall) -> MCPToolResult:
+            async with semaphore:
+                return await self.wrap_tool_call(
+                    call.tool_name, call.arguments, _timed(call)
+                )
+
+        return list(await asyncio.gather(*(_one(call) for call in batch)))
 
     async def _ensure_stats(self, tool_name: str) -> None:
         """Create a MCPToolStats entry for tool_name if it does not exist."""
@@ -6,9 +6,10 @@ __all__ = [
     "PersistenceBackend",
     "JSONBackend",
     "MemoryBackend",
+    "WALBackend",
 ]
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import IO, Any, Optional, Dict
 import json
 import copy
 import os
@@ -55,6 +56,27 @@ class PersistenceBackend(ABC):
         """
         return False  # Default: no-op
 
+    #: True for backends that persist per-operation deltas via append_delta().
+    supports_deltas: bool = False
+
+    def append_delta(self, delta: Dict) -> bool:
+        """Persist one state-machine delta (optional).
+
+        See ``VeronicaStateMachine.set_delta_listener()`` for the delta format.
+
+        Returns:
+            True on success, False on failure (or if not supported)
+        """
+        return False  # Default: not supported
+
+    def compact(self) -> bool:
+        """Fold logged deltas into a full snapshot (optional).
+
+        Returns:
+            True on success, False on failure (or if not supported)
+        """
+        return False  # Default: no-op
+
 
 class JSONBackend(PersistenceBackend):
     """JSON file-based persistence backend (default).
@@ -187,3 +209,333 @@ class MemoryBackend(PersistenceBackend):
             return None
         logger.debug("[MemoryBackend] State loaded from memory")
         return copy.deepcopy(self._data)
+
+
+_HISTORY_CAP = 100
+
+
+def _empty_state() -> Dict[str, Any]:
+    return {
+        "fail_counts": {},
+        "cooldowns": {},
+        "current_state": "IDLE",
+        "state_history": [],
+    }
+
+
+def _apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply one state-machine delta to a ``to_dict()``-shaped mapping."""
+    op = delta["op"]
+    if op == "fail":
+        state["fail_counts"][delta["pair"]] = delta["count"]
+    elif op == "pass":
+        state["fail_counts"].pop(delta["pair"], None)
+    elif op == "cooldown":
+        state["cooldowns"][delta["pair"]] = delta["until"]
+        if "count" in delta:
+            state["fail_counts"][delta["pair"]] = delta["count"]
+    elif op == "expire":
+        state["cooldowns"].pop(delta["pair"], None)
+        state["fail_counts"].pop(delta["pair"], None)
+    elif op == "transition":
+        history = state["state_history"]
+        history.append(
+            {
+                "from_state": delta["from_state"],
+                "to_state": delta["to_state"],
+                "timestamp": delta["timestamp"],
+                "reason": delta["reason"],
+            }
+        )
+        cap = state.get("history_limit", _HISTORY_CAP)
+        if len(history) > cap:
+            del history[:-cap]
+        state["current_state"] = delta["to_state"]
+    else:
+        raise ValueError(f"unknown delta op {op!r}")
+
+
+class WALBackend(PersistenceBackend):
+    """Snapshot + write-ahead-log persistence backend.
+
+    Each state-machine mutation is appended to ``<path>.wal`` as one JSON
+    line (O(1) per operation).  Every ``compact_every`` deltas a background
+    thread writes the current state atomically to ``path`` (same JSON
+    layout as JSONBackend) and starts a new log; ``save()`` / ``compact()``
+    do the same on the caller's thread.  ``load()`` reads the snapshot and
+    replays the log on top of it.
+
+    append_delta() runs inside the state machine's lock, so it never writes
+    a snapshot itself: compaction only serialises the state under the
+    backend lock, then writes and fsyncs the snapshot without holding it.
+    The log is rotated to ``<path>.wal.old`` at that point and removed once
+    the snapshot is in place; ``load()`` replays both.
+
+    Crash consistency: every delta carries a sequence number and the
+    snapshot records the last one it includes, so a crash between the
+    snapshot rename and the log removal does not replay deltas twice.
+    A torn or invalid record ends the replay, and ``load()`` truncates the
+    log there so later appends are not hidden behind it.
+
+    A delta that cannot be appended is still applied to the backend's view
+    of the state, and a compaction is started so the next snapshot
+    persists it.
+
+    Args:
+        path: Snapshot file path; the log lives next to it with a ``.wal``
+            suffix.
+        compact_every: Deltas between automatic compactions.
+        fsync: fsync the log after every delta (survives power loss, at the
+            cost of one disk flush per operation).  By default deltas are
+            flushed to the OS, which survives a process crash.
+    """
+
+    supports_deltas = True
+
+    def __init__(
+        self, path: str | Path, compact_every: int = 1000, fsync: bool = False
+    ):
+        if compact_every < 1:
+            raise ValueError(f"compact_every must be >= 1, got {compact_every}")
+        self.path = Path(path)
+        self.wal_path = self.path.with_name(self.path.name + ".wal")
+        self.old_wal_path = self.path.with_name(self.path.name + ".wal.old")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._compact_every = compact_every
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        # Serialises compactions; never taken by append_delta().
+        self._compact_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._seq = 0
+        self._pending = 0
+        self._wal: Optional[IO[str]] = None
+
+    # ------------------------------------------------------------------
+    # PersistenceBackend
+    # ------------------------------------------------------------------
+
+    def save(self, data: Dict) -> bool:
+        """Replace the stored state with *data* and start a new log."""
+        with self._lock:
+            self._state = copy.deepcopy(data)
+        return self._compact()
+
+    def load(self) -> Optional[Dict]:
+        """Load the snapshot and replay the log on top of it."""
+        self._join_compactor()
+        with self._lock:
+            self._close_wal_locked()
+            state: Optional[Dict[str, Any]] = None
+            snapshot_seq = 0
+            if self.path.exists():
+                try:
+                    with open(self.path, "r") as f:
+                        state = json.load(f)
+                except Exception as e:
+                    logger.error("[WALBackend] Snapshot load failed")
+                    logger.debug("[WALBackend] Snapshot load error detail: %s", e)
+                    return None
+                if not isinstance(state, dict):
+                    logger.error(
+                        "[WALBackend] Load failed: expected a JSON object, got %s",
+                        type(state).__name__,
+                    )
+                    return None
+                snapshot_seq = int(state.pop("wal_seq", 0))
+            seq, replayed = snapshot_seq, 0
+            for log_path in (self.old_wal_path, self.wal_path):
+                if log_path.exists():
+                    state, seq, count = self._replay_locked(
+                        log_path, state, snapshot_seq, seq
+                    )
+                    replayed += count
+            self._state, self._seq, self._pending = state, seq, replayed
+            if state is None:
+                logger.info(f"[WALBackend] No state at {self.path}")
+                return None
+            logger.info(
+                f"[WALBackend] State loaded from {self.path} "
+                f"({replayed} deltas replayed)"
+            )
+            return copy.deepcopy(state)
+
+    def append_delta(self, delta: Dict) -> bool:
+        """Append one delta to the log; compact every ``compact_every`` deltas."""
+        with self._lock:
+            if self._state is None:
+                self._state = _empty_state()
+            # Applied even if the append fails, so the next snapshot keeps it.
+            _apply_delta(self._state, delta)
+            seq = self._seq + 1
+            try:
+                if self._wal is None:
+                    self._wal = open(self.wal_path, "a")
+                self._wal.write(json.dumps({"seq": seq, **delta}) + "\n")
+                self._wal.flush()
+                if self._fsync:
+                    os.fsync(self._wal.fileno())
+            except Exception as e:
+                logger.error("[WALBackend] Delta append failed; compacting")
+                logger.debug("[WALBackend] Delta append error detail: %s", e)
+                self._close_wal_locked()
+                self._pending = self._compact_every
+                self._schedule_compaction_locked()
+                return False
+            self._seq = seq
+            self._pending += 1
+            if self._pending >= self._compact_every:
+                self._schedule_compaction_locked()
+            return True
+
+    def compact(self) -> bool:
+        """Write the current state as a snapshot and start a new log."""
+        return self._compact()
+
+    def close(self) -> None:
+        """Wait for a running compaction and close the log file handle.
+
+        The log is reopened on the next append.
+        """
+        self._join_compactor()
+        with self._lock:
+            self._close_wal_locked()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _close_wal_locked(self) -> None:
+        wal, self._wal = self._wal, None
+        if wal is not None:
+            try:
+                wal.close()
+            except OSError:
+                pass
+
+    def _replay_locked(
+        self,
+        log_path: Path,
+        state: Optional[Dict[str, Any]],
+        snapshot_seq: int,
+        seq: int,
+    ) -> tuple[Optional[Dict[str, Any]], int, int]:
+        """Replay *log_path* onto *state*; truncate it at the first bad record."""
+        replayed = 0
+        with open(log_path, "r+b") as f:
+            offset = 0
+            for lineno, raw in enumerate(f, 1):
+                try:
+                    delta = json.loads(raw)
+                    if delta["seq"] > snapshot_seq:
+                        if state is None:
+                            state = _empty_state()
+                        _apply_delta(state, delta)
+                        seq = delta["seq"]
+                        replayed += 1
+                except Exception as e:
+                    logger.warning(
+                        "[WALBackend] Stopping replay at %s line %d "
+                        "(torn or invalid record); truncating the log there",
+                        log_path.name,
+                        lineno,
+                    )
+                    logger.debug("[WALBackend] Replay error detail: %s", e)
+                    f.truncate(offset)
+                    break
+                offset += len(raw)
+                if not raw.endswith(b"\n"):
+                    # Complete record missing only its newline: terminate it
+                    # so the next append starts on a fresh line.
+                    f.write(b"\n")
+                    break
+        return state, seq, replayed
+
+    def _schedule_compaction_locked(self) -> None:
+        if self._compactor is not None:
+            return  # The running compactor re-checks _pending when done.
+        self._compactor = threading.Thread(
+            target=self._background_compact,
+            name="veronica-wal-compact",
+            daemon=True,
+        )
+        self._compactor.start()
+
+    def _background_compact(self) -> None:
+        while True:
+            ok = self._compact()
+            with self._lock:
+                if not ok or self._pending < self._compact_every:
+                    self._compactor = None
+                    return
+
+    def _join_compactor(self) -> None:
+        with self._lock:
+            compactor = self._compactor
+        if compactor is not None and compactor is not threading.current_thread():
+            compactor.join()
+
+    def _rotate_wal_locked(self) -> None:
+        """Move the current log aside so new deltas start a fresh one."""
+        self._close_wal_locked()
+        if not self.wal_path.exists():
+            return
+        if self.old_wal_path.exists():
+            # A previous compaction failed after rotating: keep both logs' deltas.
+            with open(self.wal_path, "rb") as src, open(self.old_wal_path, "ab") as dst:
+                while chunk := src.read(1 << 20):
+                    dst.write(chunk)
+            self.wal_path.unlink()
+        else:
+            self.wal_path.replace(self.old_wal_path)
+
+    def _compact(self) -> bool:
+        import tempfile as _tempfile
+
+        with self._compact_lock:
+            with self._lock:
+                if self._state is None:
+                    return False
+                try:
+                    snapshot = dict(self._state)
+                    snapshot["wal_seq"] = self._seq
+                    text = json.dumps(snapshot)
+                    self._rotate_wal_locked()
+                except Exception as e:
+                    logger.error("[WALBackend] Compaction failed")
+                    logger.debug("[WALBackend] Compaction error detail: %s", e)
+                    self._pending = 0
+                    return False
+                seq, self._pending = self._seq, 0
+            # Slow part (write + fsync) without the lock: appends continue
+            # into the fresh log.
+            try:
+                fd, tmp_name = _tempfile.mkstemp(
+                    dir=str(self.path.parent), suffix=".tmp"
+                )
+                fdopen_ok = False
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        fdopen_ok = True
+                        f.write(text)
+                        if self._fsync:
+                            f.flush()
+                            os.fsync(f.fileno())
+                    Path(tmp_name).replace(self.path)
+                except BaseException:
+                    if not fdopen_ok:
+                        try:
+                            os.close(fd)
+                        except OSError:
+                            pass
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+                # The snapshot now covers every rotated delta.
+                self.old_wal_path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error("[WALBackend] Compaction failed")
+                logger.debug("[WALBackend] Compaction error detail: %s", e)
+                return False
+        logger.debug(f"[WALBackend] Compacted to {self.path} (seq={seq})")
+        return True
@@ -6,7 +6,9 @@ Public surface exported from this package:
 - ChainMetadata: immutable chain descriptor (org, team, service, IDs, tags)
 - WrapOptions: per-call options passed alongside the wrapped callable
 - ContextSnapshot: immutable snapshot of chain state at a point in time
+- ContextCounters: counter-only snapshot, O(1) in chain length
 - NodeRecord: record of a single LLM or tool call within the chain
+- NodeRetentionPolicy: bound on in-memory node history (count, age, spill file)
 - CancellationToken: simple threading.Event wrapper for cooperative cancellation
 - ExecutionGraph: directed acyclic graph tracking every node in one agent chain
 """
@@ -14,10 +16,12 @@ Public surface exported from this package:
 from veronica_core.containment.execution_context import (
     CancellationToken,
     ChainMetadata,
+    ContextCounters,
     ContextSnapshot,
     ExecutionConfig,
     ExecutionContext,
     NodeRecord,
+    NodeRetentionPolicy,
     WrapOptions,
     get_current_partial_buffer,
     attach_partial_buffer,
@@ -34,12 +38,14 @@ from veronica_core.containment.budget_allocator import (
 __all__ = [
     "CancellationToken",
     "ChainMetadata",
+    "ContextCounters",
     "ContextSnapshot",
     "ExecutionConfig",
     "ExecutionContext",
     "ExecutionGraph",
     "NodeEvent",
     "NodeRecord",
+    "NodeRetentionPolicy",
     "WrapOptions",
     "get_current_partial_buffer",
     "attach_partial_buffer",
@@ -129,6 +129,10 @@ class _LimitChecker:
         """Add *amount* and return the new accumulated cost atomically."""
         return self.budget.add_returning(amount)
 
+    def reserve_steps(self, count: int) -> int:
+        """Reserve up to *count* steps below max_steps; return how many were granted."""
+        return self.steps.reserve(count, self._config.max_steps)
+
     def increment_retries(self) -> None:
         """Increment retry counter by 1 (called when RETRY decision is taken)."""
         self.retries.increment()
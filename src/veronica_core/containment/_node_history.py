@@ -0,0 +1,227 @@
+"""Internal node-history helper for ExecutionContext.
+
+_NodeHistory owns the NodeRecord sequence of one chain.  Without a
+NodeRetentionPolicy it reproduces the legacy behaviour (keep the first
+``legacy_cap`` nodes, drop the rest).  With a policy it is a ring buffer:
+the oldest nodes are evicted by count or age, folded into running
+aggregates, and optionally appended to an NDJSON spill file.
+
+The spill path comes from the (shared, frozen) ExecutionConfig, so several
+contexts may append to the same file.  Every record carries the chain_id
+and a per-history ``history_id``; reads filter on the latter, and each
+record is written with a single append so records never interleave.
+
+This module is package-internal (_-prefix); do NOT import it from outside
+veronica_core.containment.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import IO, Any, Iterator
+
+from veronica_core.containment.types import NodeRecord, NodeRetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+
+def _node_to_json(node: NodeRecord, chain_id: str, history_id: str) -> str:
+    return json.dumps(
+        {
+            "chain_id": chain_id,
+            "history_id": history_id,
+            "node_id": node.node_id,
+            "parent_id": node.parent_id,
+            "kind": node.kind,
+            "operation_name": node.operation_name,
+            "start_ts": node.start_ts.isoformat(),
+            "end_ts": node.end_ts.isoformat() if node.end_ts is not None else None,
+            "status": node.status,
+            "cost_usd": node.cost_usd,
+            "retries_used": node.retries_used,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _node_from_json(data: dict[str, Any]) -> NodeRecord:
+    end_ts = data["end_ts"]
+    return NodeRecord(
+        node_id=data["node_id"],
+        parent_id=data["parent_id"],
+        kind=data["kind"],
+        operation_name=data["operation_name"],
+        start_ts=datetime.fromisoformat(data["start_ts"]),
+        end_ts=datetime.fromisoformat(end_ts) if end_ts is not None else None,
+        status=data["status"],
+        cost_usd=data["cost_usd"],
+        retries_used=data["retries_used"],
+    )
+
+
+class _NodeHistory:
+    """NodeRecord storage with an optional retention policy.
+
+    Not thread-safe on its own: the owning ExecutionContext calls every
+    method while holding its ``_lock``, except the file reads in
+    ``iter_spilled()``, which only touch lines already flushed.
+    """
+
+    def __init__(
+        self,
+        policy: NodeRetentionPolicy | None,
+        legacy_cap: int,
+        chain_id: str = "",
+    ) -> None:
+        self._policy = policy
+        self._legacy_cap = legacy_cap
+        self._chain_id = chain_id
+        self._history_id = uuid.uuid4().hex
+        # (monotonic time recorded, node) pairs, oldest first.
+        self._entries: deque[tuple[float, NodeRecord]] = deque()
+        self._evicted_count = 0
+        self._evicted_cost_usd = 0.0
+        self._evicted_retries = 0
+        self._evicted_by_status: dict[str, int] = {}
+        self._evicted_by_kind: dict[str, int] = {}
+        self._spilled_count = 0
+        self._spill_file: IO[str] | None = None
+        self._spill_failed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def last_node_id(self) -> str | None:
+        return self._entries[-1][1].node_id if self._entries else None
+
+    def append(self, node: NodeRecord) -> bool:
+        """Record *node*.  Returns False if it was dropped (legacy cap only)."""
+        policy = self._policy
+        if policy is None:
+            if len(self._entries) >= self._legacy_cap:
+                return False
+            self._entries.append((0.0, node))
+            return True
+        now = time.monotonic()
+        self._entries.append((now, node))
+        while len(self._entries) > policy.max_nodes:
+            self._evict_oldest()
+        self._evict_expired(now)
+        return True
+
+    def snapshot(self) -> list[NodeRecord]:
+        """Return the in-memory nodes, oldest first, after age eviction."""
+        if self._policy is not None:
+            self._evict_expired(time.monotonic())
+        return [node for _, node in self._entries]
+
+    def summary(self) -> dict[str, Any] | None:
+        """Aggregates of evicted nodes, or None when no policy is set."""
+        if self._policy is None:
+            return None
+        return {
+            "retained_count": len(self._entries),
+            "evicted_count": self._evicted_count,
+            "evicted_cost_usd": self._evicted_cost_usd,
+            "evicted_retries": self._evicted_retries,
+            "evicted_by_status": dict(self._evicted_by_status),
+            "evicted_by_kind": dict(self._evicted_by_kind),
+            "spilled_count": self._spilled_count,
+        }
+
+    def prepare_spill_read(self) -> int:
+        """Flush the spill file and return how many lines are readable."""
+        if self._spill_file is not None:
+            try:
+                self._spill_file.flush()
+            except OSError:
+                logger.warning(
+                    "ExecutionContext: node spill flush failed", exc_info=True
+                )
+        return self._spilled_count
+
+    def iter_spilled(self, count: int) -> Iterator[NodeRecord]:
+        """Yield the first *count* nodes this history spilled, lazily.
+
+        Records written by other contexts sharing the spill path are
+        skipped.
+        """
+        if count <= 0 or self._policy is None or self._policy.spill_path is None:
+            return
+        marker = f'"history_id":"{self._history_id}"'
+        yielded = 0
+        with open(self._policy.spill_path, encoding="utf-8") as fh:
+            for line in fh:
+                if marker not in line:
+                    continue
+                data = json.loads(line)
+                if data.get("history_id") != self._history_id:
+                    continue
+                yield _node_from_json(data)
+                yielded += 1
+                if yielded >= count:
+                    return
+
+    def close(self) -> None:
+        """Close the spill file; a later eviction reopens it in append mode."""
+        fh, self._spill_file = self._spill_file, None
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                logger.debug("ExecutionContext: node spill close failed", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _evict_expired(self, now: float) -> None:
+        max_age = self._policy.max_age_s if self._policy is not None else None
+        if max_age is None:
+            return
+        cutoff = now - max_age
+        while self._entries and self._entries[0][0] < cutoff:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        _, node = self._entries.popleft()
+        self._evicted_count += 1
+        self._evicted_cost_usd += node.cost_usd
+        self._evicted_retries += node.retries_used
+        self._evicted_by_status[node.status] = (
+            self._evicted_by_status.get(node.status, 0) + 1
+        )
+        self._evicted_by_kind[node.kind] = self._evicted_by_kind.get(node.kind, 0) + 1
+        self._spill(node)
+
+    def _spill(self, node: NodeRecord) -> None:
+        policy = self._policy
+        if policy is None or policy.spill_path is None or self._spill_failed:
+            return
+        try:
+            if self._spill_file is None:
+                # Line buffering: one write() per record, appended atomically
+                # (O_APPEND) even when other contexts share the file.
+                self._spill_file = open(
+                    policy.spill_path, "a", encoding="utf-8", buffering=1
+                )
+            self._spill_file.write(
+                _node_to_json(node, self._chain_id, self._history_id) + "\n"
+            )
+        except OSError:
+            # Keep enforcing with aggregates only; one warning per context.
+            self._spill_failed = True
+            logger.warning(
+                "ExecutionContext: cannot spill evicted nodes to %s; "
+                "keeping aggregates only",
+                policy.spill_path,
+                exc_info=True,
+            )
+            self.close()
+            return
+        self._spilled_count += 1
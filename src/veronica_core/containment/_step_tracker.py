@@ -38,6 +38,17 @@ class StepTracker:
             self._count += 1
             return self._count
 
+    def reserve(self, count: int, limit: int) -> int:
+        """Add up to *count* steps without exceeding *limit*; return how many.
+
+        The check and the increment happen under one lock acquisition, so
+        concurrent reservations can never push the counter past *limit*.
+        """
+        with self._lock:
+            granted = max(0, min(count, limit - self._count))
+            self._count += granted
+            return granted
+
     def set(self, value: int) -> None:
         """Set step count to an absolute *value* (for test setup and compatibility)."""
         if isinstance(value, bool):
@@ -3,12 +3,21 @@
 _TimeoutManager wraps a CancellationToken and the shared timeout pool.
 It tracks elapsed time and manages the scheduled watcher callback.
 
+With ``backend="asyncio"`` the deadline is scheduled with ``loop.call_at``
+on the event loop running at construction instead of the pool thread, so
+the callback runs on the loop itself.
+
+A task registered with bind_task() is cancelled when the deadline fires
+(with either backend).  No task is cancelled implicitly: the task that
+happened to create the context may outlive it, or belong to a parent.
+
 This module is package-internal (_-prefix); do NOT import it from outside
 veronica_core.containment.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -30,6 +39,10 @@ class TimeoutManager:
 
     The caller is responsible for calling cancel_watcher() during cleanup to
     release the pool handle and avoid spurious callbacks.
+
+    ``_pool_handle`` is either a shared-pool handle (int) or, for the asyncio
+    backend, an ``asyncio.TimerHandle`` owned by ``_loop``.  ``_task`` is the
+    task bound with bind_task(), if any.
     """
 
     def __init__(self, token: "CancellationToken") -> None:
@@ -37,6 +50,8 @@ class TimeoutManager:
         self._start_time: float = time.monotonic()
         self._lock = threading.Lock()
         self._pool_handle: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[Any] | None = None
 
     @property
     def elapsed_ms(self) -> float:
@@ -54,13 +69,44 @@ class TimeoutManager:
             return "timeout"
         return None
 
+    def bind_task(self, task: "asyncio.Task[Any] | None") -> None:
+        """Cancel *task* when the deadline fires; None unbinds."""
+        with self._lock:
+            self._task = task
+
+    def _cancel_bound_task(self, msg: str) -> None:
+        """Cancel the bound task on its own loop.  Safe from any thread."""
+        with self._lock:
+            task, self._task = self._task, None
+        if task is None or task.done():
+            return
+
+        def _cancel() -> None:
+            if not task.done():
+                task.cancel(msg)
+
+        loop = task.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if running is loop:
+                _cancel()
+            else:
+                loop.call_soon_threadsafe(_cancel)
+        except RuntimeError:
+            # Loop already closed: the task can no longer run anyway.
+            pass
+
     def start_watcher(
         self,
         timeout_ms: int,
         emit_fn: Any,
         config_timeout_ms: int,
+        backend: str = "thread",
     ) -> None:
-        """Schedule a cancellation callback via the shared timeout pool.
+        """Schedule a cancellation callback for the configured deadline.
 
         Args:
             timeout_ms: Milliseconds until timeout fires.
@@ -68,49 +114,89 @@ class TimeoutManager:
                 when the timeout fires.
             config_timeout_ms: The configured timeout_ms value, used for the
                 event detail message.
+            backend: ``"thread"`` for the shared timeout pool, ``"asyncio"``
+                for ``loop.call_at`` on the running event loop.  The asyncio
+                backend falls back to the pool when no loop is running.
         """
-        from veronica_core.containment.timeout_pool import _timeout_pool
+        loop: asyncio.AbstractEventLoop | None = None
+        if backend == "asyncio":
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.debug(
+                    "TimeoutManager: no running event loop; "
+                    "using the shared timeout pool"
+                )
 
         timeout_s = timeout_ms / 1000.0
-        deadline = time.monotonic() + timeout_s
         token = self._token  # Capture for closure; avoids holding self._lock.
+        detail = f"timeout_ms={config_timeout_ms} elapsed"
 
         def _on_timeout() -> None:
-            if not token.is_cancelled:
-                try:
-                    emit_fn(
-                        "timeout",
-                        f"timeout_ms={config_timeout_ms} elapsed",
-                    )
-                finally:
-                    token.cancel()
+            if token.is_cancelled:
+                return
+            try:
+                emit_fn("timeout", detail)
+            finally:
+                token.cancel()
+                self._cancel_bound_task(detail)
+
+        if loop is not None:
+
+            def _on_loop_timeout() -> None:
+                with self._lock:
+                    if self._pool_handle is handle:
+                        self._pool_handle = None
+                _on_timeout()
+
+            handle: Any = loop.call_at(loop.time() + timeout_s, _on_loop_timeout)
+        else:
+            from veronica_core.containment.timeout_pool import _timeout_pool
+
+            handle = _timeout_pool.schedule(time.monotonic() + timeout_s, _on_timeout)
 
         with self._lock:
-            old_handle = self._pool_handle
-            self._pool_handle = _timeout_pool.schedule(deadline, _on_timeout)
+            old_handle, old_loop = self._pool_handle, self._loop
+            self._pool_handle, self._loop = handle, loop
 
         # Cancel previous handle if start_watcher() was called twice.
         if old_handle is not None:
-            try:
-                _timeout_pool.cancel(old_handle)
-            except Exception:
-                pass
+            self._cancel_handle(old_handle, old_loop)
 
     def cancel_watcher(self) -> None:
         """Cancel the scheduled timeout callback (if any).
 
-        Idempotent and exception-safe. Should be called during context cleanup.
+        Also unbinds the task registered with bind_task().  Idempotent and
+        exception-safe. Should be called during context cleanup.
+        May be called from any thread; asyncio timers are cancelled on their
+        own loop.
         """
-        from veronica_core.containment.timeout_pool import _timeout_pool
-
         with self._lock:
-            handle = self._pool_handle
+            handle, loop = self._pool_handle, self._loop
             self._pool_handle = None
+            self._loop = None
+            self._task = None
 
         if handle is not None:
-            try:
+            self._cancel_handle(handle, loop)
+
+    @staticmethod
+    def _cancel_handle(handle: Any, loop: asyncio.AbstractEventLoop | None) -> None:
+        try:
+            if loop is None:
+                from veronica_core.containment.timeout_pool import _timeout_pool
+
                 _timeout_pool.cancel(handle)
-            except Exception:
-                # Intentionally swallowed: cancel is best-effort; the callback
-                # fires harmlessly if the context is already marked aborted.
-                pass
+                return
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop or loop.is_closed():
+                handle.cancel()
+            else:
+                loop.call_soon_threadsafe(handle.cancel)
+        except Exception:
+            # Intentionally swallowed: cancel is best-effort; the callback
+            # fires harmlessly if the context is already marked aborted.
+            pass
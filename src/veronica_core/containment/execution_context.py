@@ -36,26 +36,33 @@ Usage::
 #   - kind="tool" routes to pipeline.before_tool_call(); before_charge skipped
 # v0.11 -- WrapOptions.partial_buffer field; _current_partial_buffer ContextVar;
 #          get_current_partial_buffer(); ExecutionContext.get_partial_result().
+# Node history moved to _node_history.py; ExecutionConfig.node_retention adds
+#          ring-buffer retention, evicted-node aggregates and NDJSON spill;
+#          ExecutionContext.iter_node_history().
 # ---------------------------------------------------------------------------
 
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import logging
 import threading
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Callable, Literal, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, Literal, TYPE_CHECKING
 
 from veronica_core.containment._chain_event_log import _ChainEventLog
 from veronica_core.containment._limit_checker import _LimitChecker
+from veronica_core.containment._node_history import _NodeHistory
 from veronica_core.containment.execution_graph import ExecutionGraph
 from veronica_core.containment.types import (
     CancellationToken,
     ChainMetadata,
+    ContextCounters,
     ContextSnapshot,
     ExecutionConfig,
     NodeRecord,
+    NodeRetentionPolicy,
     WrapOptions,
 )
 from veronica_core.shield.event import SafetyEvent
@@ -106,10 +113,12 @@ def attach_partial_buffer(buf: PartialResultBuffer) -> None:
 __all__ = [
     "CancellationToken",
     "ChainMetadata",
+    "ContextCounters",
     "ContextSnapshot",
     "ExecutionConfig",
     "ExecutionContext",
     "NodeRecord",
+    "NodeRetentionPolicy",
     "WrapOptions",
     "get_current_partial_buffer",
     "attach_partial_buffer",
@@ -120,14 +129,76 @@ __all__ = [
 # ExecutionContext
 # ---------------------------------------------------------------------------
 
-# Maximum number of NodeRecords stored per chain. Prevents unbounded growth in
-# long-running agents or run-away loops that generate many nodes.
+# Maximum number of NodeRecords stored per chain when no NodeRetentionPolicy
+# is configured. Prevents unbounded growth in long-running agents or run-away
+# loops that generate many nodes.
 _MAX_NODES: int = 10_000
 
 # Maximum number of partial-buffer entries. Each entry holds a reference to a
 # PartialResultBuffer object; cap prevents unbounded dict growth.
 _MAX_PARTIAL_BUFFERS: int = 1_000
 
+# Lite contexts share these two ContextVars instead of creating two per
+# instance (ContextVar objects are never garbage-collected).  Each value is a
+# small dict keyed by id(context); see _ScopedContextVar.
+_LITE_NODE_STACKS: contextvars.ContextVar[dict[int, Any] | None] = (
+    contextvars.ContextVar("veronica_lite_node_stacks", default=None)
+)
+_LITE_NESTING_DEPTHS: contextvars.ContextVar[dict[int, Any] | None] = (
+    contextvars.ContextVar("veronica_lite_nesting_depths", default=None)
+)
+
+# Serialises lazy ExecutionGraph creation for lite contexts.  Held only for
+# the first wrapped call of each context.
+_GRAPH_INIT_LOCK = threading.Lock()
+
+_empty_aggregates: dict[str, Any] | None = None
+
+
+def _empty_graph_aggregates() -> dict[str, Any]:
+    """Aggregates of a graph with no nodes (reported before lazy creation)."""
+    global _empty_aggregates
+    if _empty_aggregates is None:
+        _empty_aggregates = ExecutionGraph(chain_id="").aggregates()
+    return dict(_empty_aggregates)
+
+
+class _ScopedContextVar:
+    """Per-owner view onto a shared ContextVar holding ``{owner_key: value}``.
+
+    Offers the ``get()`` / ``set()`` subset of ContextVar used by
+    ExecutionContext.  The dict is copied on every ``set()`` so that
+    asyncio tasks keep the copy-on-inherit semantics of a plain
+    ContextVar.  Entries equal to the default are removed so that pooled
+    threads do not accumulate one entry per finished request.
+    """
+
+    __slots__ = ("_var", "_key", "_default")
+
+    def __init__(
+        self,
+        var: contextvars.ContextVar[dict[int, Any] | None],
+        key: int,
+        default: Any,
+    ) -> None:
+        self._var = var
+        self._key = key
+        self._default = default
+
+    def get(self) -> Any:
+        values = self._var.get()
+        if values is None:
+            return self._default
+        return values.get(self._key, self._default)
+
+    def set(self, value: Any) -> None:
+        values = dict(self._var.get() or ())
+        if value is self._default or value == self._default:
+            values.pop(self._key, None)
+        else:
+            values[self._key] = value
+        self._var.set(values or None)
+
 
 class ExecutionContext:
     """Chain-level containment for one agent run or request.
@@ -136,6 +207,13 @@ class ExecutionContext:
     across all nested LLM and tool calls. Wraps ShieldPipeline for per-call
     hook evaluation; does not replace it.
 
+    ``lite=True`` is meant for short, request-scoped contexts such as the
+    ones VeronicaASGIMiddleware creates per request.  It uses one UUID for
+    both chain_id and request_id (unless metadata is given), shares two
+    module-level ContextVars instead of creating two per instance, and
+    builds the ExecutionGraph on the first wrapped call (or graph access)
+    instead of in the constructor.  Limits and decisions are identical.
+
     Can be used as a context manager or standalone::
 
         # Context manager (auto-cleanup on exit)
@@ -160,6 +238,7 @@ class ExecutionContext:
         agent_identity: "AgentIdentity | None" = None,
         memory_governor: "MemoryGovernor | None" = None,
         policy_view_holder: "PolicyViewHolder | None" = None,
+        lite: bool = False,
     ) -> None:
         self._config = config
         self._pipeline = pipeline
@@ -171,10 +250,16 @@ class ExecutionContext:
         self._memory_governor: MemoryGovernor | None = memory_governor
         # Policy view holder -- active policy metadata for audit enrichment (v3.3).
         self._policy_view_holder: PolicyViewHolder | None = policy_view_holder
-        self._metadata = metadata or ChainMetadata(
-            request_id=str(uuid.uuid4()),
-            chain_id=str(uuid.uuid4()),
-        )
+        if metadata is None:
+            if lite:
+                chain_id = str(uuid.uuid4())
+                metadata = ChainMetadata(request_id=chain_id, chain_id=chain_id)
+            else:
+                metadata = ChainMetadata(
+                    request_id=str(uuid.uuid4()),
+                    chain_id=str(uuid.uuid4()),
+                )
+        self._metadata = metadata
         self._parent: ExecutionContext | None = parent
 
         if self._circuit_breaker is not None:
@@ -200,7 +285,9 @@ class ExecutionContext:
         # lock for its own state.
         self._lock = threading.Lock()
         self._closed: bool = False
-        self._nodes: list[NodeRecord] = []
+        self._nodes = _NodeHistory(
+            config.node_retention, _MAX_NODES, self._metadata.chain_id
+        )
 
         # Initialise CancellationToken before _LimitChecker so the token is
         # available when passed to the checker.
@@ -213,9 +300,13 @@ class ExecutionContext:
         # Pre-built emit callback for _check_limits_delegate (avoid per-call lambda).
         self._emit_chain_event_cb = self._make_emit_chain_event_cb()
 
-        # Execution graph for DAG tracking of all nodes.
-        self._graph = ExecutionGraph(chain_id=self._metadata.chain_id)
-        self._root_node_id = self._graph.create_root("chain_root", {})
+        # Execution graph for DAG tracking of all nodes.  Lite contexts build
+        # it on first access (see the _graph property).
+        self._graph_obj: ExecutionGraph | None = None
+        self._root_node_id = ""
+        if not lite:
+            self._graph_obj = ExecutionGraph(chain_id=self._metadata.chain_id)
+            self._root_node_id = self._graph_obj.create_root("chain_root", {})
         # ContextVar-backed stack for nested parent tracking.
         # Design: the ContextVar stores a list[str] that is lazily created per
         # context on first use.  The _nesting_depth_var tracks how many _wrap()
@@ -224,19 +315,25 @@ class ExecutionContext:
         # entry / decrements on exit.  A depth of 0 means no wrap is active, so
         # _begin_graph_node must create a fresh list even if a non-None list was
         # inherited via context copy (K: asyncio task isolation fix).
-        self._node_stack_var: contextvars.ContextVar[list[str] | None] = (
-            contextvars.ContextVar(
-                f"veronica_node_stack_{self._metadata.chain_id[:8]}",
-                default=None,
-            )
-        )
         # Tracks active nesting depth per context. Always starts at 0 for a new
         # context, even if the list was inherited.  This is the invariant that
         # distinguishes "first wrap in this context" from "nested wrap".
-        self._nesting_depth_var: contextvars.ContextVar[int] = contextvars.ContextVar(
-            f"veronica_nesting_depth_{self._metadata.chain_id[:8]}",
-            default=0,
-        )
+        self._node_stack_var: contextvars.ContextVar[list[str] | None] | _ScopedContextVar
+        self._nesting_depth_var: contextvars.ContextVar[int] | _ScopedContextVar
+        if lite:
+            self._node_stack_var = _ScopedContextVar(_LITE_NODE_STACKS, id(self), None)
+            self._nesting_depth_var = _ScopedContextVar(
+                _LITE_NESTING_DEPTHS, id(self), 0
+            )
+        else:
+            self._node_stack_var = contextvars.ContextVar(
+                f"veronica_node_stack_{self._metadata.chain_id[:8]}",
+                default=None,
+            )
+            self._nesting_depth_var = contextvars.ContextVar(
+                f"veronica_nesting_depth_{self._metadata.chain_id[:8]}",
+                default=0,
+            )
 
         # Partial buffers keyed by graph_node_id. Populated when WrapOptions.partial_buffer
         # is set; used by get_partial_result() to look up partial text per node.
@@ -247,6 +344,7 @@ class ExecutionContext:
                 timeout_ms=config.timeout_ms,
                 emit_fn=self._emit_chain_event,
                 config_timeout_ms=config.timeout_ms,
+                backend=config.timeout_backend,
             )
 
     # ------------------------------------------------------------------
@@ -264,6 +362,51 @@ class ExecutionContext:
     ) -> None:
         self.close()
 
+    async def __aenter__(self) -> ExecutionContext:
+        """Bind the current task (see bind_task()) for the ``async with`` body."""
+        self.bind_task()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
+
+    def bind_task(self, task: asyncio.Task[Any] | None = None) -> None:
+        """Cancel *task* (default: the current task) when timeout_ms elapses.
+
+        Without a bound task a timeout only signals the CancellationToken
+        and halts further wrap calls; no task is cancelled implicitly.
+        Binding is per context: children do not inherit it.  Binding again
+        replaces the previous task; close() unbinds it.
+
+        Raises:
+            RuntimeError: If *task* is None and no task is running.
+        """
+        if task is None:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:  # no running event loop
+                task = None
+            if task is None:
+                raise RuntimeError("bind_task() called outside a running task")
+        self._limits.timeout.bind_task(task)
+
+    @property
+    def _graph(self) -> ExecutionGraph:
+        graph = self._graph_obj
+        if graph is None:
+            with _GRAPH_INIT_LOCK:
+                graph = self._graph_obj
+                if graph is None:
+                    graph = ExecutionGraph(chain_id=self._metadata.chain_id)
+                    self._root_node_id = graph.create_root("chain_root", {})
+                    self._graph_obj = graph
+        return graph
+
     @property
     def agent_identity(self) -> "AgentIdentity | None":
         """Return the agent identity associated with this context, or None."""
@@ -368,9 +511,10 @@ class ExecutionContext:
         with self._lock:
             # Warn when non-terminal graph nodes exist (in-flight wrap calls).
             try:
+                graph = self._graph_obj
                 _non_terminal = [
                     nid
-                    for nid, node in self._graph._nodes.items()
+                    for nid, node in (graph._nodes.items() if graph is not None else ())
                     if node.status not in ("success", "fail", "halt")
                     and nid != self._root_node_id
                 ]
@@ -389,6 +533,7 @@ class ExecutionContext:
 
             # Clear partial buffers to release references.
             self._partial_buffers.clear()
+            self._nodes.close()
 
         # Signal cancellation token and cancel the scheduled timeout callback
         # (outside lock to avoid deadlock if the timeout callback tries to
@@ -524,12 +669,12 @@ class ExecutionContext:
         """
         counters = self._limits.snapshot_counters()
         with self._lock:
-            nodes_copy = list(self._nodes)
+            nodes_copy = self._nodes.snapshot()
+            node_history_summary = self._nodes.summary()
             parent_chain_id = (
                 self._parent._metadata.chain_id if self._parent is not None else None
             )
-            graph_snap = self._graph.snapshot()
-        graph_summary = graph_snap["aggregates"]
+            graph_summary = self._graph.aggregates()
         return ContextSnapshot(
             chain_id=self._metadata.chain_id,
             request_id=self._metadata.request_id,
@@ -545,6 +690,55 @@ class ExecutionContext:
             parent_chain_id=parent_chain_id,
             agent_identity=self._agent_identity,
             policy_metadata=self._get_policy_audit_metadata(),
+            node_history_summary=node_history_summary,
+        )
+
+    def iter_node_history(self) -> Iterator[NodeRecord]:
+        """Yield every NodeRecord of the chain, oldest first, for forensic export.
+
+        Nodes evicted by ``ExecutionConfig.node_retention`` are read lazily
+        from its ``spill_path`` (without partial buffers), followed by the
+        nodes still held in memory.  Without a spill path only the in-memory
+        nodes are yielded.  Nodes evicted while iterating may be skipped.
+        """
+        with self._lock:
+            spilled = self._nodes.prepare_spill_read()
+            in_memory = self._nodes.snapshot()
+        yield from self._nodes.iter_spilled(spilled)
+        yield from in_memory
+
+    def get_counters(self, include_graph: bool = True) -> ContextCounters:
+        """Return counters and graph aggregates without copying nodes or events.
+
+        O(1) in chain length; prefer this over get_snapshot() for pre/post
+        flight checks that only need ``aborted`` or cost/step totals.
+
+        Args:
+            include_graph: When False, ``graph_summary`` is None and the
+                graph is not consulted at all.
+
+        Returns:
+            ContextCounters with the same counter values get_snapshot()
+            would report.
+        """
+        counters = self._limits.snapshot_counters()
+        graph_summary: dict[str, Any] | None = None
+        if include_graph:
+            graph_summary = (
+                self._graph_obj.aggregates()
+                if self._graph_obj is not None
+                else _empty_graph_aggregates()
+            )
+        return ContextCounters(
+            chain_id=self._metadata.chain_id,
+            request_id=self._metadata.request_id,
+            step_count=counters["step_count"],
+            cost_usd_accumulated=counters["cost_usd_accumulated"],
+            retries_used=counters["retries_used"],
+            aborted=counters["aborted"],
+            abort_reason=counters["abort_reason"],
+            elapsed_ms=counters["elapsed_ms"],
+            graph_summary=graph_summary,
         )
 
     def get_graph_snapshot(self) -> dict[str, Any]:
@@ -599,7 +793,7 @@ class ExecutionContext:
         node_id = str(uuid.uuid4())
 
         with self._lock:
-            parent_id = self._nodes[-1].node_id if self._nodes else None
+            parent_id = self._nodes.last_node_id()
 
         # H5: parent_id is read under lock above, but _begin_graph_node is called
         # outside the lock below.  A concurrent thread can append to _nodes between
@@ -753,6 +947,9 @@ class ExecutionContext:
             d = self._nesting_depth_var.get()
             if d > 0:
                 self._nesting_depth_var.set(d - 1)
+                if d == 1:
+                    # Outermost wrap finished: release the stack list.
+                    self._node_stack_var.set(None)
 
     def _try_rollback(self, reservation_id: str | None) -> None:
         """Roll back a reservation against the configured backend, swallowing all exceptions."""
@@ -791,6 +988,7 @@ class ExecutionContext:
         Returns:
             (stack, graph_node_id) where stack is the per-context call stack.
         """
+        graph = self._graph  # lite contexts create the graph (and root) here
         depth = self._nesting_depth_var.get()
         stack: list[str] | None = self._node_stack_var.get()
         if depth == 0 or stack is None:
@@ -802,7 +1000,7 @@ class ExecutionContext:
         self._nesting_depth_var.set(depth + 1)
         graph_parent_id = stack[-1] if stack else self._root_node_id
 
-        graph_node_id = self._graph.begin_node(
+        graph_node_id = graph.begin_node(
             parent_id=graph_parent_id,
             kind=kind,
             name=opts.operation_name or "unnamed",
@@ -822,9 +1020,7 @@ class ExecutionContext:
         node.status = "halted"
         node.end_ts = datetime.now(timezone.utc)
         with self._lock:
-            if len(self._nodes) < _MAX_NODES:
-                self._nodes.append(node)
-            else:
+            if not self._nodes.append(node):
                 logger.warning(
                     "ExecutionContext: _nodes cap (%d) reached; node %s will not be recorded",
                     _MAX_NODES,
@@ -858,8 +1054,7 @@ class ExecutionContext:
             node.status = "halted"
             node.end_ts = datetime.now(timezone.utc)
             with self._lock:
-                if len(self._nodes) < _MAX_NODES:
-                    self._nodes.append(node)
+                self._nodes.append(node)
             if self._metrics is not None:
                 try:
                     self._metrics.record_decision(self._metadata.chain_id, "HALT")
@@ -905,8 +1100,7 @@ class ExecutionContext:
             node.end_ts = datetime.now(timezone.utc)
             self._event_log.append_batch(pre_halt_events)
             with self._lock:
-                if len(self._nodes) < _MAX_NODES:
-                    self._nodes.append(node)
+                self._nodes.append(node)
             stack.pop()
             self._graph.mark_halt(graph_node_id, stop_reason="pipeline_halt")
             return pipeline_decision
@@ -938,8 +1132,7 @@ class ExecutionContext:
             node.status = "halted"
             node.end_ts = datetime.now(timezone.utc)
             with self._lock:
-                if len(self._nodes) < _MAX_NODES:
-                    self._nodes.append(node)
+                self._nodes.append(node)
             stack.pop()
             self._graph.mark_halt(graph_node_id, stop_reason="circuit_open")
             if self._metrics is not None:
@@ -1174,8 +1367,7 @@ class ExecutionContext:
             node.status = "timeout"
             node.end_ts = datetime.now(timezone.utc)
             with self._lock:
-                if len(self._nodes) < _MAX_NODES:
-                    self._nodes.append(node)
+                self._nodes.append(node)
             stack.pop()
             self._graph.mark_halt(graph_node_id, stop_reason="timeout")
             return Decision.HALT
@@ -1213,8 +1405,7 @@ class ExecutionContext:
 
         node.end_ts = datetime.now(timezone.utc)
         with self._lock:
-            if len(self._nodes) < _MAX_NODES:
-                self._nodes.append(node)
+            self._nodes.append(node)
         stack.pop()
         logger.debug(
             "[execution_context] step %s failed: %s",
@@ -1298,8 +1489,7 @@ class ExecutionContext:
             node.end_ts = datetime.now(timezone.utc)
             self._event_log.append_batch(before_charge_events)
             with self._lock:
-                if len(self._nodes) < _MAX_NODES:
-                    self._nodes.append(node)
+                self._nodes.append(node)
             stack.pop()
             self._graph.mark_halt(graph_node_id, stop_reason="before_charge_halt")
             return charge_decision
@@ -1377,9 +1567,7 @@ class ExecutionContext:
         node.status = "ok"
         node.end_ts = datetime.now(timezone.utc)
         with self._lock:
-            if len(self._nodes) < _MAX_NODES:
-                self._nodes.append(node)
-            else:
+            if not self._nodes.append(node):
                 logger.warning(
                     "ExecutionContext: _nodes cap (%d) reached; successful node %s will not be recorded",
                     _MAX_NODES,
@@ -1459,6 +1647,82 @@ class ExecutionContext:
             emit_fn=self._emit_chain_event_cb,
         )
 
+    def _reserve_steps(self, count: int) -> int:
+        """Reserve up to *count* steps for calls accounted outside _wrap().
+
+        Used by adapters that dispatch a batch of calls under one budget
+        reservation: the steps are taken up front so the batch can never run
+        past max_steps.  Returns the number of steps granted (0..count); a
+        short grant emits a step_limit_exceeded chain event.
+        """
+        granted = self._limits.reserve_steps(count)
+        if granted < count:
+            self._emit_chain_event(
+                "step_limit_exceeded",
+                f"batch of {count} calls granted {granted} of "
+                f"max_steps {self._config.max_steps}",
+            )
+        return granted
+
+    def _record_batch_call(
+        self,
+        operation_name: str,
+        status: Literal["ok", "halted", "error"],
+        cost_usd: float = 0.0,
+        duration_ms: float = 0.0,
+        stop_reason: str | None = None,
+    ) -> None:
+        """Record one tool call dispatched by an adapter batch.
+
+        Appends the NodeRecord and the matching graph node that _wrap() would
+        have produced.  For status "ok", *cost_usd* is added to the chain cost
+        (and propagated to the parent); the step must already have been taken
+        with _reserve_steps().  Backend charging stays with the caller, which
+        settles the batch reservation itself.  *stop_reason* is the halt
+        reason for "halted" and the error class for "error".
+        """
+        end_ts = datetime.now(timezone.utc)
+        graph = self._graph
+        stack = self._node_stack_var.get()
+        graph_parent_id = (
+            stack[-1] if stack and self._nesting_depth_var.get() > 0 else self._root_node_id
+        )
+        graph_node_id = graph.begin_node(
+            parent_id=graph_parent_id, kind="tool", name=operation_name or "unnamed"
+        )
+        with self._lock:
+            parent_id = self._nodes.last_node_id()
+        node = NodeRecord(
+            node_id=str(uuid.uuid4()),
+            parent_id=parent_id,
+            kind="tool",
+            operation_name=operation_name,
+            start_ts=end_ts - timedelta(milliseconds=duration_ms),
+            end_ts=end_ts,
+            status=status,
+            cost_usd=cost_usd if status == "ok" else 0.0,
+            retries_used=0,
+        )
+        with self._lock:
+            if not self._nodes.append(node):
+                logger.warning(
+                    "ExecutionContext: _nodes cap (%d) reached; node %s will not be recorded",
+                    _MAX_NODES,
+                    node.node_id,
+                )
+        if status == "halted":
+            graph.mark_halt(graph_node_id, stop_reason=stop_reason)
+            return
+        graph.mark_running(graph_node_id)
+        self._forward_divergence_events(graph_node_id)
+        if status == "ok":
+            self._limits.add_cost(cost_usd)
+            graph.mark_success(graph_node_id, cost_usd=cost_usd)
+            if self._parent is not None and cost_usd > 0.0:
+                self._parent._propagate_child_cost(cost_usd)
+        else:
+            graph.mark_failure(graph_node_id, error_class=stop_reason or "error")
+
     def _make_tool_ctx(
         self,
         node_id: str,
@@ -1569,6 +1833,8 @@ class ExecutionContext:
             timeout_ms: Child timeout in milliseconds. 0 = no timeout.
             pipeline: Optional ShieldPipeline for child.
 
+        The child inherits the parent's node_retention and timeout_backend.
+
         Returns:
             A new ExecutionContext linked to this parent with an allocated
             budget ceiling.
@@ -1617,6 +1883,8 @@ class ExecutionContext:
                 else self._config.max_retries_total
             ),
             timeout_ms=timeout_ms,
+            node_retention=self._config.node_retention,
+            timeout_backend=self._config.timeout_backend,
         )
         return ExecutionContext(
             config=child_cfg,
@@ -1643,6 +1911,8 @@ class ExecutionContext:
             timeout_ms: Child timeout. 0 = no timeout.
             pipeline: Optional ShieldPipeline for child.
 
+        The child inherits the parent's node_retention and timeout_backend.
+
         Returns:
             A new ExecutionContext linked to this parent.
 
@@ -1662,6 +1932,8 @@ class ExecutionContext:
                 else self._config.max_retries_total
             ),
             timeout_ms=timeout_ms,
+            node_retention=self._config.node_retention,
+            timeout_backend=self._config.timeout_backend,
         )
         return ExecutionContext(
             config=child_cfg,
@@ -790,6 +790,19 @@ class ExecutionGraph:
                 "snapshot_ts_ms": _now_ms(),
             }
 
+    def aggregates(self) -> dict[str, Any]:
+        """Return only the "aggregates" part of :meth:`snapshot`.
+
+        O(1) in the number of nodes: the counters are maintained
+        incrementally, so no node is serialised.  Use this instead of
+        ``snapshot()["aggregates"]`` on hot paths.
+
+        Returns:
+            Fresh dict with the same keys as ``snapshot()["aggregates"]``.
+        """
+        with self._lock:
+            return self._build_aggregates_snapshot()
+
     @staticmethod
     def _build_node_snapshot(node: "Node") -> dict[str, Any]:
         """Serialize a single Node to a JSON-serializable dict.
@@ -1,25 +1,48 @@
 """SharedTimeoutPool -- shared daemon-thread timeout scheduler.
 
-Replaces per-context threading.Thread with a single shared heap-based
-scheduler.  One daemon thread wakes up at the earliest deadline and fires
-callbacks; cancellation is O(1) via a cancelled-set.
+Replaces per-context threading.Thread with a single shared scheduler backed
+by a hierarchical timing wheel.  One daemon thread wakes up at the next
+tick that has work and fires every callback due at that point in one batch.
 
 Module-level singleton ``_timeout_pool`` is used by ExecutionContext when
 available; falls back to legacy threading.Thread when the pool raises.
 
+Timing wheel
+------------
+Time is divided into ticks of ``tick_s`` seconds (1 ms by default), counted
+from the pool's creation.  A deadline is rounded *up* to its tick, so a
+callback never fires before its deadline.  The wheel has ``_LEVELS`` levels
+of ``_SLOTS`` slots each; level *k* slots span ``_SLOTS ** k`` ticks:
+
+* level 0: 64 x 1 ms      (next ~64 ms)
+* level 1: 64 x 64 ms     (next ~4 s)
+* level 2: 64 x 4.1 s     (next ~4.5 min)
+* level 3: 64 x 4.4 min   (next ~4.7 h; longer deadlines are parked in the
+  last level-3 slot and re-placed when it cascades)
+
+Each slot is a dict keyed by handle, and ``_timers`` maps a handle to its
+timer, so schedule() and cancel() are O(1).  cancel() removes the timer
+from its slot immediately -- nothing lingers until the deadline, and
+cancel-after-fire is a no-op because fired handles are no longer in
+``_timers``.  When the wheel crosses a level-*k* slot boundary that slot is
+cascaded: its timers are re-placed into lower levels relative to the new
+position.
+
 Thread safety
 -------------
-* ``_lock`` protects ``_heap`` and ``_cancelled``.
+* ``_lock`` protects the wheel, ``_timers``, the tick cursor and counters.
 * ``_wakeup`` is an ``Event`` used to interrupt the daemon thread when a
-  new earliest deadline is scheduled before the current sleep expires.
+  new deadline is scheduled before the tick it is currently sleeping to.
+* Callbacks run outside ``_lock`` so they may schedule or cancel freely.
 """
 
 from __future__ import annotations
 
-import heapq
 import logging
+import math
 import threading
 import time
+from dataclasses import dataclass
 from typing import Callable
 
 logger = logging.getLogger(__name__)
@@ -27,9 +50,56 @@ logger = logging.getLogger(__name__)
 # Handle type (int counter) returned by schedule() and accepted by cancel().
 _Handle = int
 
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+# Ticks covered by the whole wheel; later deadlines are parked at the top.
+_WHEEL_SPAN = 1 << (_SLOT_BITS * _LEVELS)
+
+
+class _Timer:
+    """One scheduled callback and its current wheel position."""
+
+    __slots__ = ("handle", "tick", "callback", "level", "slot")
+
+    def __init__(self, handle: int, tick: int, callback: Callable[[], None]) -> None:
+        self.handle = handle
+        self.tick = tick
+        self.callback = callback
+        self.level = 0
+        self.slot = 0
+
+
+@dataclass(frozen=True)
+class TimeoutPoolStats:
+    """Point-in-time metrics of a SharedTimeoutPool.
+
+    Attributes:
+        pending: Timers currently scheduled (queue depth).
+        pending_by_level: Queue depth per wheel level, finest first.
+        scheduled_total: schedule() calls since creation.
+        fired_total: Callbacks invoked.
+        cancelled_total: Timers removed by cancel() before firing.
+        callback_errors: Callbacks that raised (logged and ignored).
+        dispatch_batches: Non-empty batches handed to callbacks.
+        max_batch_size: Largest number of callbacks fired in one batch.
+        tick_s: Wheel resolution in seconds.
+    """
+
+    pending: int
+    pending_by_level: tuple[int, ...]
+    scheduled_total: int
+    fired_total: int
+    cancelled_total: int
+    callback_errors: int
+    dispatch_batches: int
+    max_batch_size: int
+    tick_s: float
+
 
 class SharedTimeoutPool:
-    """Single daemon thread + heapq priority queue for timeout callbacks.
+    """Single daemon thread + hierarchical timing wheel for timeout callbacks.
 
     Usage::
 
@@ -39,17 +109,38 @@ class SharedTimeoutPool:
         pool.cancel(handle)
 
     The pool starts the daemon thread lazily on first schedule() call.
+
+    Args:
+        tick_s: Wheel resolution in seconds.  Callbacks fire up to one tick
+            after their deadline (plus scheduling jitter), never before.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, tick_s: float = 0.001) -> None:
+        if not (tick_s > 0 and math.isfinite(tick_s)):
+            raise ValueError(f"tick_s must be a positive finite number, got {tick_s}")
+        self._tick_s = tick_s
+        self._origin = time.monotonic()
         self._lock = threading.Lock()
-        self._heap: list[tuple[float, int, Callable[[], None]]] = []
-        self._cancelled: set[int] = set()
+        self._wheel: list[list[dict[int, _Timer]]] = [
+            [{} for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        self._level_counts = [0] * _LEVELS
+        self._timers: dict[int, _Timer] = {}
+        # Next tick to process; every tick before it has been dispatched.
+        self._next_tick = 0
+        # Tick the daemon thread is sleeping until (None = indefinitely).
+        self._wake_tick: int | None = None
         self._counter: int = 0
         self._thread: threading.Thread | None = None
         self._started: bool = False
         self._wakeup = threading.Event()
         self._shutdown = False
+        self._scheduled_total = 0
+        self._fired_total = 0
+        self._cancelled_total = 0
+        self._callback_errors = 0
+        self._dispatch_batches = 0
+        self._max_batch_size = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -65,14 +156,18 @@ class SharedTimeoutPool:
         Returns:
             Handle that can be passed to cancel().
         """
+        tick = self._deadline_tick(deadline)
         with self._lock:
             if self._shutdown:
                 raise RuntimeError("SharedTimeoutPool has been shut down")
             self._counter += 1
             handle = self._counter
-            heapq.heappush(self._heap, (deadline, handle, callback))
+            timer = _Timer(handle, tick, callback)
+            self._timers[handle] = timer
+            self._place(timer)
+            self._scheduled_total += 1
             # Start daemon thread lazily on first use.
-            if not self._started:
+            if self._thread is None:
                 self._thread = threading.Thread(
                     target=self._run,
                     daemon=True,
@@ -80,99 +175,222 @@ class SharedTimeoutPool:
                 )
                 self._thread.start()
                 self._started = True
-        # Interrupt sleeping thread so it recalculates earliest deadline.
-        self._wakeup.set()
+                wake = True
+            else:
+                # Only interrupt the thread if it would sleep past this timer.
+                wake = self._wake_tick is None or timer.tick < self._wake_tick
+        if wake:
+            self._wakeup.set()
         return handle
 
     def cancel(self, handle: _Handle) -> None:
         """Cancel a previously scheduled callback.
 
-        Idempotent -- safe to call multiple times or after the callback
-        has already fired (in which case cancel() is a no-op).
-
-        C2 NOTE: If ``cancel()`` is called for a handle that has ALREADY fired
-        (i.e. the callback was executed and the handle was discarded from the
-        heap), the handle ID is added to ``_cancelled`` but will never be
-        removed by ``_run()`` (because the handle is no longer in the heap).
-        This causes a bounded memory leak proportional to the number of
-        cancel()-after-fire calls. In practice, callers typically cancel
-        during teardown or as a timeout race (cancel before fire wins), so
-        this pattern is rare. If cancel()-after-fire becomes frequent in a
-        deployment, consider calling ``shutdown()`` and creating a new pool
-        to reclaim the memory.
+        Idempotent -- safe to call multiple times, after shutdown(), or after
+        the callback has already fired (in which case cancel() is a no-op).
+        The timer is unlinked from the wheel immediately, so cancelled
+        timers hold no memory.
 
         Args:
             handle: Value returned by schedule().
         """
         with self._lock:
-            self._cancelled.add(handle)
+            timer = self._timers.pop(handle, None)
+            if timer is None:
+                return
+            del self._wheel[timer.level][timer.slot][handle]
+            self._level_counts[timer.level] -= 1
+            self._cancelled_total += 1
+
+    def pending(self) -> int:
+        """Return the number of scheduled, not yet fired or cancelled timers."""
+        return len(self._timers)
+
+    def stats(self) -> TimeoutPoolStats:
+        """Return queue-depth and dispatch metrics."""
+        with self._lock:
+            return TimeoutPoolStats(
+                pending=len(self._timers),
+                pending_by_level=tuple(self._level_counts),
+                scheduled_total=self._scheduled_total,
+                fired_total=self._fired_total,
+                cancelled_total=self._cancelled_total,
+                callback_errors=self._callback_errors,
+                dispatch_batches=self._dispatch_batches,
+                max_batch_size=self._max_batch_size,
+                tick_s=self._tick_s,
+            )
 
     def shutdown(self) -> None:
         """Stop the daemon thread.  Primarily for testing.
 
-        Pending callbacks are discarded. The heap and cancelled-handle set are
-        cleared to prevent unbounded memory growth across repeated test cycles.
+        Pending callbacks are discarded and the wheel is cleared, so no
+        callback fires after shutdown() returns (except one already handed
+        to the dispatch loop).
 
         M8 NOTE: There is a brief window between ``self._shutdown = True`` and
         ``self._wakeup.set()`` during which the daemon thread may still be
         running its loop body. The thread checks ``_shutdown`` at the top of
         each iteration, so it will exit on the NEXT iteration after being woken.
         This is safe because the thread is a daemon (it will not prevent process
-        exit) and the cleared heap/cancelled state means no callbacks will fire
-        after shutdown() returns.
+        exit).
         """
         with self._lock:
             self._shutdown = True
-            self._heap.clear()
-            self._cancelled.clear()
+            self._timers.clear()
+            for level in self._wheel:
+                for slot in level:
+                    slot.clear()
+            self._level_counts = [0] * _LEVELS
         self._wakeup.set()
 
     # ------------------------------------------------------------------
-    # Internal
+    # Wheel internals (caller holds _lock unless noted)
     # ------------------------------------------------------------------
 
+    def _deadline_tick(self, deadline: float) -> int:
+        """First tick at or after *deadline*.  Lock-free."""
+        offset = (deadline - self._origin) / self._tick_s
+        if offset <= 0:
+            return 0
+        return math.ceil(offset)
+
+    def _place(self, timer: _Timer) -> None:
+        """Link *timer* into the slot matching its distance from the cursor."""
+        now_tick = self._next_tick
+        if timer.tick < now_tick:
+            # Already due: fire on the next dispatch.
+            timer.tick = now_tick
+        tick = timer.tick
+        delta = tick - now_tick
+        if delta >= _WHEEL_SPAN:
+            # Beyond the wheel: park in the farthest level-3 slot; it is
+            # re-placed when that slot cascades.
+            tick = now_tick + _WHEEL_SPAN - 1
+            delta = _WHEEL_SPAN - 1
+        level = (delta.bit_length() - 1) // _SLOT_BITS if delta else 0
+        slot = (tick >> (_SLOT_BITS * level)) & _SLOT_MASK
+        timer.level = level
+        timer.slot = slot
+        self._wheel[level][slot][timer.handle] = timer
+        self._level_counts[level] += 1
+
+    def _cascade(self, level: int, slot: int) -> None:
+        """Re-place every timer of a higher-level slot relative to the cursor."""
+        bucket = self._wheel[level][slot]
+        if not bucket:
+            return
+        self._wheel[level][slot] = {}
+        self._level_counts[level] -= len(bucket)
+        for timer in bucket.values():
+            self._place(timer)
+
+    def _advance(self, target_tick: int) -> list[Callable[[], None]]:
+        """Process every tick up to *target_tick*; return due callbacks in order."""
+        fired: list[Callable[[], None]] = []
+        counts = self._level_counts
+        while self._next_tick <= target_tick:
+            if not self._timers:
+                self._next_tick = target_tick + 1
+                break
+            tick = self._next_tick
+            # Skip whole blocks of ticks whose lower levels hold nothing:
+            # no slot can fire and no cascade is due before the boundary.
+            skip_bits = 0
+            while skip_bits < _LEVELS - 1 and counts[skip_bits] == 0:
+                skip_bits += 1
+            if skip_bits and tick & ((1 << (_SLOT_BITS * skip_bits)) - 1):
+                boundary = (tick | ((1 << (_SLOT_BITS * skip_bits)) - 1)) + 1
+                self._next_tick = min(boundary, target_tick + 1)
+                continue
+            # Cascade higher levels at slot boundaries (coarsest first only
+            # when the finer index wraps to 0, as in classic timer wheels).
+            if tick & _SLOT_MASK == 0:
+                for level in range(1, _LEVELS):
+                    index = (tick >> (_SLOT_BITS * level)) & _SLOT_MASK
+                    self._cascade(level, index)
+                    if index != 0:
+                        break
+            bucket = self._wheel[0][tick & _SLOT_MASK]
+            if bucket:
+                self._wheel[0][tick & _SLOT_MASK] = {}
+                counts[0] -= len(bucket)
+                for handle, timer in bucket.items():
+                    del self._timers[handle]
+                    fired.append(timer.callback)
+            self._next_tick = tick + 1
+        return fired
+
+    def _next_due_tick(self) -> int | None:
+        """Earliest tick at which the wheel has work (fire or cascade)."""
+        if not self._timers:
+            return None
+        cursor = self._next_tick
+        best: int | None = None
+        for level in range(_LEVELS):
+            if self._level_counts[level] == 0:
+                continue
+            shift = _SLOT_BITS * level
+            base = cursor >> shift
+            slots = self._wheel[level]
+            # Level 0: the cursor slot itself may be due.  A higher level's
+            # cursor slot was cascaded when the cursor entered it, unless the
+            # cursor sits exactly on its boundary: that cascade runs when the
+            # cursor tick is processed, so the slot is still pending.
+            start = 0 if level == 0 or cursor & ((1 << shift) - 1) == 0 else 1
+            for step in range(start, _SLOTS + 1):
+                if slots[(base + step) & _SLOT_MASK]:
+                    candidate = max(cursor, (base + step) << shift)
+                    if best is None or candidate < best:
+                        best = candidate
+                    break
+        return best
+
     def _run(self) -> None:
-        """Daemon thread loop.  Fires callbacks at their scheduled deadlines."""
+        """Daemon thread loop.  Fires due callbacks in batches."""
         while True:
-            now = time.monotonic()
+            now_tick = math.floor((time.monotonic() - self._origin) / self._tick_s)
 
             with self._lock:
                 if self._shutdown:
                     return
-
-                # Drain expired (or cancelled) entries from heap head.
-                fired: list[Callable[[], None]] = []
-                while self._heap:
-                    deadline, handle, callback = self._heap[0]
-                    if deadline <= now:
-                        heapq.heappop(self._heap)
-                        if handle not in self._cancelled:
-                            fired.append(callback)
-                        else:
-                            self._cancelled.discard(handle)
-                    else:
-                        break
-
-                # Determine how long to sleep until next deadline.
-                if self._heap:
-                    next_deadline = self._heap[0][0]
-                    sleep_s = max(0.0, next_deadline - now)
-                else:
-                    # No pending work; sleep indefinitely until woken.
-                    sleep_s = None  # type: ignore[assignment]
+                fired = self._advance(now_tick)
+                next_tick = self._next_due_tick()
+                self._wake_tick = next_tick
+                # Clear under the lock: a schedule() that races with this
+                # computation either sees the new _wake_tick or sets the
+                # event after this clear.
+                self._wakeup.clear()
+                if fired:
+                    self._fired_total += len(fired)
+                    self._dispatch_batches += 1
+                    if len(fired) > self._max_batch_size:
+                        self._max_batch_size = len(fired)
 
             # Fire callbacks outside the lock to avoid re-entrant deadlocks.
+            errors = 0
             for cb in fired:
                 try:
                     cb()
                 except Exception:
+                    errors += 1
                     logger.debug(
                         "SharedTimeoutPool: callback raised, ignoring",
                         exc_info=True,
                     )
-
-            # Sleep until next deadline or until woken by schedule()/cancel().
-            self._wakeup.clear()
+            if errors:
+                with self._lock:
+                    self._callback_errors += errors
+
+            if fired:
+                # Callbacks took time; re-check before sleeping.
+                continue
+            if next_tick is None:
+                sleep_s = None
+            else:
+                wake_at = self._origin + next_tick * self._tick_s
+                sleep_s = max(0.0, wake_at - time.monotonic())
+            # Sleep until next due tick or until woken by schedule().
             self._wakeup.wait(timeout=sleep_s)
 
     @classmethod
@@ -8,7 +8,7 @@ Note: ``ExecutionContext`` itself is defined in
 ``veronica_core.containment.execution_context``, not here.
 This module contains only the supporting data types (``CancellationToken``,
 ``ChainMetadata``, ``ContextSnapshot``, ``ExecutionConfig``, ``NodeRecord``,
-``WrapOptions``).
+``NodeRetentionPolicy``, ``WrapOptions``).
 """
 
 from __future__ import annotations
@@ -29,9 +29,11 @@ if TYPE_CHECKING:
 __all__ = [
     "CancellationToken",
     "ChainMetadata",
+    "ContextCounters",
     "ContextSnapshot",
     "ExecutionConfig",
     "NodeRecord",
+    "NodeRetentionPolicy",
     "WrapOptions",
 ]
 
@@ -97,6 +99,44 @@ class ChainMetadata:
         freeze_mapping(self, "tags")
 
 
+@dataclass(frozen=True)
+class NodeRetentionPolicy:
+    """How many NodeRecords an ExecutionContext keeps in memory.
+
+    Without a policy the context keeps the first 10,000 nodes and drops
+    later ones.  With a policy it keeps the most recent ``max_nodes``
+    nodes (ring buffer).  Older nodes are evicted into running aggregates
+    (``ContextSnapshot.node_history_summary``).  If ``spill_path`` is set
+    they are also appended to an NDJSON file, which
+    ``ExecutionContext.iter_node_history()`` reads back lazily.
+
+    Attributes:
+        max_nodes: Maximum NodeRecords held in memory.
+        max_age_s: Evict nodes recorded more than this many seconds ago.
+            None disables age-based eviction.
+        spill_path: Append-only NDJSON file for evicted nodes. None keeps
+            only the aggregates.  Partial buffers are not spilled.  Contexts
+            sharing the policy may share the file: records carry chain_id
+            and a per-context history_id, and each context reads back only
+            its own records.
+    """
+
+    max_nodes: int = 10_000
+    max_age_s: float | None = None
+    spill_path: str | None = None
+
+    def __post_init__(self) -> None:
+        from veronica_core._utils import require_strict_int
+
+        require_strict_int(self.max_nodes, "max_nodes", min_value=1)
+        if self.max_age_s is not None and not (
+            math.isfinite(self.max_age_s) and self.max_age_s > 0
+        ):
+            raise ValueError(
+                f"max_age_s must be a positive finite number or None, got {self.max_age_s!r}"
+            )
+
+
 @dataclass(frozen=True)
 class ExecutionConfig:
     """Hard limits for one chain execution.
@@ -114,6 +154,16 @@ class ExecutionConfig:
         timeout_ms: Wall-clock timeout in milliseconds. 0 disables the
             timeout. When elapsed, the CancellationToken is signalled and
             all new wrap calls return Decision.HALT immediately.
+        node_retention: Optional NodeRetentionPolicy bounding the in-memory
+            node history. None keeps the legacy first-10,000 cap.
+        timeout_backend: Where the ``timeout_ms`` deadline is scheduled.
+            ``"thread"`` (default) uses the shared timeout-pool thread.
+            ``"asyncio"`` uses ``loop.call_at`` on the event loop running
+            when the context is created, so the token is cancelled on the
+            loop.  Falls back to ``"thread"`` when no event loop is
+            running.  With either backend, only a task bound with
+            ``ExecutionContext.bind_task()`` or ``async with ctx`` is
+            cancelled on timeout.
     """
 
     max_cost_usd: float
@@ -124,6 +174,8 @@ class ExecutionConfig:
         None  # BudgetBackend instance for cross-process tracking
     )
     redis_url: str | None = None  # Convenience: auto-create RedisBudgetBackend
+    node_retention: NodeRetentionPolicy | None = None
+    timeout_backend: Literal["thread", "asyncio"] = "thread"
 
     def __post_init__(self) -> None:
         if math.isnan(self.max_cost_usd) or math.isinf(self.max_cost_usd):
@@ -139,6 +191,11 @@ class ExecutionConfig:
         require_strict_int(self.max_steps, "max_steps")
         require_strict_int(self.max_retries_total, "max_retries_total")
         require_strict_int(self.timeout_ms, "timeout_ms")
+        if self.timeout_backend not in ("thread", "asyncio"):
+            raise ValueError(
+                "timeout_backend must be 'thread' or 'asyncio', "
+                f"got {self.timeout_backend!r}"
+            )
 
 
 @dataclass(frozen=True)
@@ -211,6 +268,7 @@ class ContextSnapshot:
     parent_chain_id: str | None = None
     agent_identity: "AgentIdentity | None" = None
     policy_metadata: Optional[dict[str, Any]] = None
+    node_history_summary: Optional[dict[str, Any]] = None
 
     def __post_init__(self) -> None:
         from veronica_core._utils import freeze_mapping
@@ -224,3 +282,31 @@ class ContextSnapshot:
             freeze_mapping(self, "graph_summary")
         if self.policy_metadata is not None:
             freeze_mapping(self, "policy_metadata")
+        if self.node_history_summary is not None:
+            freeze_mapping(self, "node_history_summary")
+
+
+@dataclass(frozen=True)
+class ContextCounters:
+    """Counter-only view of chain state, cheap enough for per-request checks.
+
+    Returned by ExecutionContext.get_counters(). Unlike ContextSnapshot it
+    does not copy nodes, events or policy metadata, so its cost does not
+    grow with chain length.
+    """
+
+    chain_id: str
+    request_id: str
+    step_count: int
+    cost_usd_accumulated: float
+    retries_used: int
+    aborted: bool
+    abort_reason: str | None
+    elapsed_ms: float
+    graph_summary: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        from veronica_core._utils import freeze_mapping
+
+        if self.graph_summary is not None:
+            freeze_mapping(self, "graph_summary")
@@ -6,8 +6,9 @@
 #   - RedisBudgetBackend: _using_fallback and _client are read under
 #     self._lock in add(), get(), reserve(), commit(), rollback(),
 #     get_reserved(), reset(), and is_using_fallback. No changes needed.
-#   - get_default_backend() is a pure factory (no module-level singleton).
-#     No changes needed.
+#   - get_default_backend() builds a new backend per call; the Redis client it
+#     uses comes from the process-wide RedisPoolRegistry (redis_pool.py),
+#     which guards its own state with a lock.
 
 from __future__ import annotations
 
@@ -17,8 +18,10 @@ __all__ = [
     "LocalBudgetBackend",
     "RedisBudgetBackend",
     "ReservationExpiredError",
+    "AsyncBudgetBackend",
     "get_default_backend",
     # Re-exports from distributed_circuit_breaker for backward compatibility:
+    "CircuitBreakerGroup",
     "CircuitSnapshot",
     "DistributedCircuitBreaker",
     "get_default_circuit_breaker",
@@ -26,14 +29,19 @@ __all__ = [
     # excluded from __all__ as they are private implementation details.
 ]
 
+import asyncio
+import inspect
 import logging
 import threading
 import time
 import uuid
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from veronica_core._utils import redact_exc as _redact_exc
 
+if TYPE_CHECKING:
+    from veronica_core.redis_pool import RedisPoolRegistry
+
 logger = logging.getLogger(__name__)
 
 # H1: INCRBYFLOAT accumulates IEEE-754 rounding errors across many small increments.
@@ -50,6 +58,14 @@ class ReservationExpiredError(Exception):
     """Raised when a reservation ID has passed its deadline."""
 
 
+def _check_settle_amount(amount: float) -> None:
+    """Raise ValueError unless *amount* is a finite, non-negative number."""
+    if not (amount >= 0 and amount < float("inf")):
+        raise ValueError(
+            f"settle() amount must be non-negative and finite, got {amount!r}"
+        )
+
+
 @runtime_checkable
 class BudgetBackend(Protocol):
     def add(self, amount: float) -> float: ...
@@ -160,6 +176,29 @@ class LocalBudgetBackend:
             amount, _ = self._reservations.pop(reservation_id)
             self._reserved_total -= amount
 
+    def settle(self, reservation_id: str, amount: float) -> float:
+        """Release a reservation and charge *amount* in one step.
+
+        Used when the actual cost differs from the reserved estimate (e.g. a
+        batch where some calls failed): the full escrow is released and only
+        *amount* is committed. *amount* may exceed the reserved estimate.
+
+        Returns the new total committed cost.
+        Raises KeyError if the reservation_id is not found.
+        Raises ValueError for invalid amount (NaN, Inf, negative).
+        """
+        _check_settle_amount(amount)
+        with self._lock:
+            self._expire_reservations_locked()
+            if reservation_id not in self._reservations:
+                raise KeyError(
+                    f"Reservation {reservation_id!r} not found (expired or already committed/rolled back)"
+                )
+            reserved, _ = self._reservations.pop(reservation_id)
+            self._reserved_total -= reserved
+            self._cost += amount
+            return self._cost
+
     def reset(self) -> None:
         with self._lock:
             self._cost = 0.0
@@ -193,6 +232,11 @@ class RedisBudgetBackend:
 
     Uses INCRBYFLOAT for atomic float increments.
     Falls back to LocalBudgetBackend if Redis is unreachable.
+
+    When ``pool_registry`` is given, the Redis client comes from the registry
+    (one connection pool per URL per process, no PING per construction) and
+    failover/recovery follow the registry's shared health flag instead of a
+    per-backend reconnect loop.  ``close()`` leaves the shared client open.
     """
 
     KEY_PREFIX = "veronica:budget:"
@@ -203,9 +247,11 @@ class RedisBudgetBackend:
         chain_id: str,
         ttl_seconds: int = 3600,
         fallback_on_error: bool = True,
+        pool_registry: RedisPoolRegistry | None = None,
     ) -> None:
         self._redis_url = redis_url
         self._chain_id = chain_id
+        self._pool_registry = pool_registry
         self._key = f"{self.KEY_PREFIX}{chain_id}"
         self._ttl = ttl_seconds
         self._fallback_on_error = fallback_on_error
@@ -221,10 +267,16 @@ class RedisBudgetBackend:
 
     def _connect(self) -> None:
         try:
-            import redis
+            registry = getattr(self, "_pool_registry", None)
+            if registry is not None:
+                self._client = registry.get_client(self._redis_url)
+                if not registry.is_healthy(self._redis_url):
+                    raise ConnectionError("shared Redis pool is marked unhealthy")
+            else:
+                import redis
 
-            self._client = redis.from_url(self._redis_url, decode_responses=True)
-            self._client.ping()
+                self._client = redis.from_url(self._redis_url, decode_responses=True)
+                self._client.ping()
             # Successful connection: clear fallback flag so Redis is used again.
             self._using_fallback = False
         except Exception as exc:
@@ -305,21 +357,30 @@ class RedisBudgetBackend:
         ``add()`` acquires the lock for the entire check-and-dispatch block
         (H4 TOCTOU fix), so ``_last_reconnect_attempt`` reads/writes here are
         automatically serialised -- no additional lock acquisition needed.
-        """
-        now = time.monotonic()
-        last = getattr(self, "_last_reconnect_attempt", 0.0)
-        if now - last < self._RECONNECT_INTERVAL:
-            return False
-        self._last_reconnect_attempt = now
-
-        try:
-            self._connect()
-        except Exception:
-            return False
 
-        # _connect() sets _using_fallback=False on success, True on failure.
-        if self._using_fallback:
-            return False
+        With a pool registry no connection attempt is made here: the
+        registry's background thread probes Redis, and this method only
+        reconciles once the shared health flag reports it reachable.
+        """
+        registry = getattr(self, "_pool_registry", None)
+        if registry is not None:
+            if not registry.is_healthy(self._redis_url):
+                return False
+        else:
+            now = time.monotonic()
+            last = getattr(self, "_last_reconnect_attempt", 0.0)
+            if now - last < self._RECONNECT_INTERVAL:
+                return False
+            self._last_reconnect_attempt = now
+
+            try:
+                self._connect()
+            except Exception:
+                return False
+
+            # _connect() sets _using_fallback=False on success, True on failure.
+            if self._using_fallback:
+                return False
 
         # _connect() cleared _using_fallback; we're connected but not yet safe
         # to route new adds to Redis until the local delta is flushed.
@@ -332,8 +393,42 @@ class RedisBudgetBackend:
             logger.info("RedisBudgetBackend: reconnected to Redis successfully.")
             return True
         # Reconcile failed -- stay on fallback.
+        if registry is not None:
+            registry.mark_unhealthy(self._redis_url)
         return False
 
+    def _sync_connection_state(self) -> None:
+        """Follow failover/recovery before dispatching ``add()``.
+
+        Must be called with ``self._lock`` held.  Without a pool registry this
+        is the original rate-limited ``_try_reconnect()``.
+        """
+        if not self._fallback_on_error:
+            return
+        if self._using_fallback:
+            self._try_reconnect()
+        else:
+            self._follow_shared_failover()
+
+    def _follow_shared_failover(self) -> None:
+        """Switch to fallback if another holder already saw Redis fail.
+
+        Must be called with ``self._lock`` held.  A failure observed by any
+        holder of the same registry URL moves this backend to fallback without
+        waiting for its own timeout.  The fallback is not seeded (Redis is
+        known unreachable), so reconciliation later flushes the full local
+        total.
+        """
+        registry = getattr(self, "_pool_registry", None)
+        if (
+            registry is not None
+            and self._fallback_on_error
+            and not self._using_fallback
+            and not registry.is_healthy(self._redis_url)
+        ):
+            self._fallback_seed_base = 0.0
+            self._using_fallback = True
+
     def _enter_fallback_mode(self, operation: str, exc: BaseException) -> None:
         """Seed the local fallback from Redis and activate fallback mode.
 
@@ -354,6 +449,9 @@ class RedisBudgetBackend:
                 operation,
                 exc,
             )
+            registry = getattr(self, "_pool_registry", None)
+            if registry is not None:
+                registry.mark_unhealthy(self._redis_url, exc)
 
     def _seed_fallback_from_redis(self) -> None:
         """Seed the local fallback with the current Redis total before failover.
@@ -400,8 +498,7 @@ class RedisBudgetBackend:
         # the outer read (reconnect guard) and the dispatch read below, causing
         # either double-routing or missed fallback transitions.
         with self._lock:
-            if self._using_fallback and self._fallback_on_error:
-                self._try_reconnect()
+            self._sync_connection_state()
             if self._using_fallback or self._client is None:
                 return self._fallback.add(amount)
         # H1 NOTE: The lock is intentionally released before the Redis pipeline
@@ -510,6 +607,7 @@ class RedisBudgetBackend:
                 f"reserve() amount must be positive and finite, got {amount!r}"
             )
         with self._lock:
+            self._follow_shared_failover()
             if self._using_fallback or self._client is None:
                 return self._fallback.reserve(amount, ceiling)
             client = self._client
@@ -702,9 +800,72 @@ return 1
             else:
                 raise
 
+    def settle(self, reservation_id: str, amount: float) -> float:
+        """Release a reservation and charge *amount* in one Redis round trip.
+
+        Returns the new total committed cost.
+        Raises KeyError if the reservation_id is not found.
+        Raises ValueError for invalid amount (NaN, Inf, negative).
+        """
+        _check_settle_amount(amount)
+        with self._lock:
+            if self._using_fallback or self._client is None:
+                return self._fallback.settle(reservation_id, amount)
+            client = self._client
+
+        try:
+            reservations_key = f"{self._key}:reservations"
+            lua_settle = """
+local committed_key = KEYS[1]
+local reservations_key = KEYS[2]
+local rid = ARGV[1]
+local amount = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+
+local existed = redis.call('HDEL', reservations_key, rid)
+if existed == 0 then
+    return redis.error_reply('ERR reservation not found: ' .. rid)
+end
+
+local new_total = redis.call('INCRBYFLOAT', committed_key, amount)
+if ttl ~= nil and ttl > 0 then
+    redis.call('EXPIRE', committed_key, ttl)
+end
+return tostring(new_total)
+"""
+            result = client.eval(
+                lua_settle,
+                2,
+                self._key,
+                reservations_key,
+                reservation_id,
+                repr(float(amount)),
+                str(self._ttl),
+            )
+            return float(result)
+        except Exception as exc:
+            exc_str = str(exc)
+            if "reservation not found" in exc_str:
+                raise KeyError(f"Reservation {reservation_id!r} not found") from exc
+            if self._fallback_on_error:
+                logger.error(
+                    "RedisBudgetBackend.settle failed: %s -- using local fallback",
+                    _redact_exc(exc),
+                )
+                with self._lock:
+                    self._enter_fallback_mode("settle", exc)
+                try:
+                    return self._fallback.settle(reservation_id, amount)
+                except KeyError:
+                    # Reservation lived in Redis; charge the amount locally so
+                    # the spend is not lost during the outage.
+                    return self._fallback.add(amount)
+            raise
+
     def close(self) -> None:
         try:
-            if self._client is not None:
+            # Clients from a pool registry are shared with other holders.
+            if self._client is not None and getattr(self, "_pool_registry", None) is None:
                 self._client.close()
         except Exception:
             # Intentionally swallowed: close() is best-effort cleanup; callers
@@ -717,15 +878,131 @@ return 1
             return self._using_fallback
 
 
+class AsyncBudgetBackend:
+    """Awaitable facade over a budget backend for use inside an event loop.
+
+    Satisfies ``AsyncBudgetBackendProtocol`` for any backend:
+
+    - Backends whose methods are coroutine functions are awaited directly.
+    - ``LocalBudgetBackend`` (exact type) is called inline: it is purely in-process and its
+      lock is held for microseconds, so a thread hop would cost more than the
+      call itself.
+    - Every other backend (``RedisBudgetBackend``, custom sync backends) is
+      dispatched to the default executor via ``asyncio.to_thread`` so that
+      network round trips and ``threading`` locks never stall the loop.
+
+    Pass ``offload=False`` to force inline calls (e.g. for benchmarking the
+    blocking behaviour) or ``offload=True`` to force thread dispatch.
+
+    If the awaiting coroutine is cancelled while an offloaded ``reserve()`` is
+    still in flight, the reservation is rolled back once the worker thread
+    returns so that cancellation cannot leak escrow until expiry.
+    """
+
+    def __init__(self, backend: Any, offload: bool | None = None) -> None:
+        self._backend = backend
+        if offload is None:
+            # Exact type check: subclasses may override methods with real I/O.
+            offload = type(backend) is not LocalBudgetBackend and not (
+                inspect.iscoroutinefunction(getattr(backend, "reserve", None))
+            )
+        self._offload = offload
+
+    @property
+    def backend(self) -> Any:
+        """The wrapped backend."""
+        return self._backend
+
+    @property
+    def offloaded(self) -> bool:
+        """True when calls are dispatched to a worker thread."""
+        return self._offload
+
+    async def _call(self, name: str, *args: Any) -> Any:
+        method = getattr(self._backend, name)
+        if self._offload:
+            result = await asyncio.to_thread(method, *args)
+        else:
+            result = method(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def reserve(self, amount: float, ceiling: float) -> str:
+        """Reserve *amount* against *ceiling*. Raises OverflowError if exceeded."""
+        if not self._offload:
+            return await self._call("reserve", amount, ceiling)
+        fut = asyncio.ensure_future(self._call("reserve", amount, ceiling))
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            fut.add_done_callback(self._rollback_orphan)
+            raise
+
+    async def commit(self, reservation_id: str) -> float:
+        """Commit a reservation. Returns the new committed total."""
+        return await self._call("commit", reservation_id)
+
+    async def rollback(self, reservation_id: str) -> None:
+        """Roll back a reservation without charging cost."""
+        await self._call("rollback", reservation_id)
+
+    async def settle(self, reservation_id: str, amount: float) -> float:
+        """Release a reservation and charge *amount*. Returns the new total.
+
+        Backends without ``settle()`` fall back to ``rollback()`` + ``add()``.
+        """
+        if hasattr(self._backend, "settle"):
+            return await self._call("settle", reservation_id, amount)
+        await self._call("rollback", reservation_id)
+        return await self._call("add", amount)
+
+    async def add(self, amount: float) -> float:
+        """Add *amount* to committed cost. Returns the new total."""
+        return await self._call("add", amount)
+
+    async def get(self) -> float:
+        """Return the current committed cost."""
+        return await self._call("get")
+
+    def _rollback_orphan(self, fut: "asyncio.Future[Any]") -> None:
+        """Roll back a reservation whose awaiting coroutine was cancelled."""
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        rid = fut.result()
+
+        def _rollback() -> None:
+            try:
+                self._backend.rollback(rid)
+            except Exception:  # noqa: BLE001
+                logger.debug(
+                    "AsyncBudgetBackend: rollback of orphaned reservation %r failed",
+                    rid,
+                    exc_info=True,
+                )
+
+        asyncio.get_running_loop().run_in_executor(None, _rollback)
+
+
 def get_default_backend(
     redis_url: str | None = None,
     chain_id: str = "default",
     ttl_seconds: int = 3600,
 ) -> BudgetBackend:
-    """Factory: returns RedisBudgetBackend if redis_url given, else LocalBudgetBackend."""
+    """Factory: returns RedisBudgetBackend if redis_url given, else LocalBudgetBackend.
+
+    Redis backends share the process-wide pool from
+    ``redis_pool.get_redis_pool_registry()``, so calling this per request
+    does not open a new connection pool or PING Redis each time.
+    """
     if redis_url:
+        from veronica_core.redis_pool import get_redis_pool_registry
+
         return RedisBudgetBackend(
-            redis_url=redis_url, chain_id=chain_id, ttl_seconds=ttl_seconds
+            redis_url=redis_url,
+            chain_id=chain_id,
+            ttl_seconds=ttl_seconds,
+            pool_registry=get_redis_pool_registry(),
         )
     return LocalBudgetBackend()
 
@@ -735,6 +1012,7 @@ def get_default_backend(
 # ---------------------------------------------------------------------------
 
 from veronica_core.distributed_circuit_breaker import (  # noqa: E402, F401
+    CircuitBreakerGroup,
     CircuitSnapshot,
     DistributedCircuitBreaker,
     _LUA_CHECK,
@@ -17,8 +17,10 @@ backward compatibility.
 from __future__ import annotations
 
 __all__ = [
+    "CircuitBreakerGroup",
     "CircuitSnapshot",
     "DistributedCircuitBreaker",
+    "INVALIDATION_CHANNEL_PREFIX",
     "get_default_circuit_breaker",
     # Note: _LUA_CHECK, _LUA_RECORD_FAILURE, _LUA_RECORD_SUCCESS are intentionally
     # private implementation details; they are not included in __all__.
@@ -26,14 +28,30 @@ __all__ = [
 
 import dataclasses
 import logging
+import math
+import os
 import threading
 import time
-from typing import Dict, Optional
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from veronica_core._utils import redact_exc as _redact_exc
 from veronica_core.circuit_breaker import CircuitBreaker, CircuitState, FailurePredicate
 from veronica_core.runtime_policy import PolicyContext, PolicyDecision
 
+if TYPE_CHECKING:
+    from veronica_core.redis_pool import RedisPoolRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,31 +150,27 @@ redis.call('EXPIRE', key, ttl)
 return new_count
 """
 
-# check Lua script:
+# record_success_batch Lua script (near-cache mode):
 # KEYS[1] = hash key
-# ARGV[1] = recovery_timeout (float seconds)
-# ARGV[2] = current_time (float, Unix timestamp)
-# ARGV[3] = ttl_seconds (int)
-# ARGV[4] = half_open_slot_timeout (float seconds, 0 = no timeout)
-# Returns: table [state_str, slot_claimed, failure_count]
-#   slot_claimed = 1 if we successfully claimed the HALF_OPEN slot (old in_flight was 0)
-#               = 0 if slot was already taken by another caller
-#               = 0 if state is OPEN or CLOSED (not relevant)
-_LUA_CHECK = """
+# ARGV[1] = ttl_seconds (int)
+# ARGV[2] = number of successes to add (int)
+# ARGV[3] = wall-clock time of the latest batched success (float)
+# Returns: new success_count (int)
+#
+# Unlike _LUA_RECORD_SUCCESS this never closes a HALF_OPEN circuit: the
+# batched successes were observed while the circuit was CLOSED.  The
+# consecutive failure counter is reset only if no failure was recorded after
+# the latest batched success.
+_LUA_RECORD_SUCCESS_BATCH = """
 local key = KEYS[1]
-local recovery_timeout = tonumber(ARGV[1])
-local now = tonumber(ARGV[2])
-local ttl = tonumber(ARGV[3])
-local half_open_slot_timeout = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[1])
+local count = tonumber(ARGV[2])
+local last_success = tonumber(ARGV[3])
 
--- H6: Validate ARGV values; return error if malformed to prevent nil arithmetic.
-if recovery_timeout == nil or now == nil or ttl == nil then
-    return redis.error_reply('ERR invalid args: recovery_timeout/now/ttl must be numeric')
+if ttl == nil or count == nil or last_success == nil then
+    return redis.error_reply('ERR invalid args: ttl/count/last_success must be numeric')
 end
--- half_open_slot_timeout defaults to 0 (no timeout) if nil/malformed.
-if half_open_slot_timeout == nil then half_open_slot_timeout = 0 end
 
--- Initialize fields if missing
 if redis.call('EXISTS', key) == 0 then
     redis.call('HSET', key,
         'state', 'CLOSED',
@@ -165,61 +179,266 @@ if redis.call('EXISTS', key) == 0 then
         'last_failure_time', '',
         'half_open_in_flight', 0,
         'half_open_claimed_at', 0)
-    redis.call('EXPIRE', key, ttl)
-    return {'CLOSED', 0, 0}
 end
 
-local state = redis.call('HGET', key, 'state')
-local last_failure_time_str = redis.call('HGET', key, 'last_failure_time')
-local half_open_in_flight = tonumber(redis.call('HGET', key, 'half_open_in_flight') or '0')
-local failure_count = tonumber(redis.call('HGET', key, 'failure_count') or '0')
-
--- Attempt OPEN -> HALF_OPEN transition if recovery timeout elapsed
-if state == 'OPEN' and last_failure_time_str ~= nil and last_failure_time_str ~= '' then
-    local last_failure_time = tonumber(last_failure_time_str)
-    if last_failure_time ~= nil and (now - last_failure_time) >= recovery_timeout then
-        state = 'HALF_OPEN'
-        redis.call('HSET', key, 'state', 'HALF_OPEN', 'half_open_in_flight', 0,
-                   'half_open_claimed_at', 0)
-        half_open_in_flight = 0
+if redis.call('HGET', key, 'state') == 'CLOSED' then
+    local last_failure = tonumber(redis.call('HGET', key, 'last_failure_time') or '')
+    if last_failure == nil or last_failure <= last_success then
+        redis.call('HSET', key, 'failure_count', 0)
     end
 end
 
--- For HALF_OPEN: atomically claim the in-flight slot.
--- Return slot_claimed=1 if WE claimed it (old value was 0), 0 if already taken.
-local slot_claimed = 0
-if state == 'HALF_OPEN' then
-    local old_in_flight = half_open_in_flight
-
-    -- Auto-release stale slot if half_open_slot_timeout is configured and elapsed.
-    -- This prevents permanent lock-out when the claiming process crashes.
-    if old_in_flight == 1 and half_open_slot_timeout > 0 then
-        -- C2: Use explicit nil/empty guard before tonumber to handle garbage values.
-        -- Lua's `or '0'` only substitutes for falsy (nil/false); empty string '' is
-        -- truthy in Lua, so tonumber('') returns nil instead of 0, causing the
-        -- stale-slot release to silently skip -- a permanent lockout bug.
-        local raw_claimed_at = redis.call('HGET', key, 'half_open_claimed_at')
-        local claimed_at = (raw_claimed_at ~= nil and raw_claimed_at ~= '') and tonumber(raw_claimed_at) or nil
-        if claimed_at ~= nil and claimed_at > 0 and (now - claimed_at) >= half_open_slot_timeout then
-            old_in_flight = 0
-            redis.call('HSET', key, 'half_open_in_flight', 0, 'half_open_claimed_at', 0)
-        elseif claimed_at == nil and old_in_flight == 1 then
-            -- Garbage/empty claimed_at with slot held: fail-safe -- release the stale slot
-            -- to prevent permanent lockout from corrupted state.
-            old_in_flight = 0
-            redis.call('HSET', key, 'half_open_in_flight', 0, 'half_open_claimed_at', 0)
+local new_count = redis.call('HINCRBY', key, 'success_count', count)
+redis.call('EXPIRE', key, ttl)
+return new_count
+"""
+
+# Shared body of the check scripts.  check_one() returns
+# {state_str, slot_claimed, failure_count} for one circuit hash, or an error
+# reply table when its numeric arguments are malformed.
+#   slot_claimed = 1 if we successfully claimed the HALF_OPEN slot (old in_flight was 0)
+#               = 0 if slot was already taken by another caller
+#               = 0 if state is OPEN or CLOSED (not relevant)
+_LUA_CHECK_ONE = """
+local function check_one(key, recovery_timeout, now, ttl, half_open_slot_timeout)
+    -- H6: Validate ARGV values; return error if malformed to prevent nil arithmetic.
+    if recovery_timeout == nil or now == nil or ttl == nil then
+        return redis.error_reply('ERR invalid args: recovery_timeout/now/ttl must be numeric')
+    end
+    -- half_open_slot_timeout defaults to 0 (no timeout) if nil/malformed.
+    if half_open_slot_timeout == nil then half_open_slot_timeout = 0 end
+
+    -- Initialize fields if missing
+    if redis.call('EXISTS', key) == 0 then
+        redis.call('HSET', key,
+            'state', 'CLOSED',
+            'failure_count', 0,
+            'success_count', 0,
+            'last_failure_time', '',
+            'half_open_in_flight', 0,
+            'half_open_claimed_at', 0)
+        redis.call('EXPIRE', key, ttl)
+        return {'CLOSED', 0, 0}
+    end
+
+    local state = redis.call('HGET', key, 'state')
+    local last_failure_time_str = redis.call('HGET', key, 'last_failure_time')
+    local half_open_in_flight = tonumber(redis.call('HGET', key, 'half_open_in_flight') or '0')
+    local failure_count = tonumber(redis.call('HGET', key, 'failure_count') or '0')
+
+    -- Attempt OPEN -> HALF_OPEN transition if recovery timeout elapsed
+    if state == 'OPEN' and last_failure_time_str ~= nil and last_failure_time_str ~= '' then
+        local last_failure_time = tonumber(last_failure_time_str)
+        if last_failure_time ~= nil and (now - last_failure_time) >= recovery_timeout then
+            state = 'HALF_OPEN'
+            redis.call('HSET', key, 'state', 'HALF_OPEN', 'half_open_in_flight', 0,
+                       'half_open_claimed_at', 0)
+            half_open_in_flight = 0
         end
     end
 
-    if old_in_flight == 0 then
-        redis.call('HSET', key, 'half_open_in_flight', 1, 'half_open_claimed_at', now)
-        slot_claimed = 1
+    -- For HALF_OPEN: atomically claim the in-flight slot.
+    -- Return slot_claimed=1 if WE claimed it (old value was 0), 0 if already taken.
+    local slot_claimed = 0
+    if state == 'HALF_OPEN' then
+        local old_in_flight = half_open_in_flight
+
+        -- Auto-release stale slot if half_open_slot_timeout is configured and elapsed.
+        -- This prevents permanent lock-out when the claiming process crashes.
+        if old_in_flight == 1 and half_open_slot_timeout > 0 then
+            -- C2: Use explicit nil/empty guard before tonumber to handle garbage values.
+            -- Lua's `or '0'` only substitutes for falsy (nil/false); empty string '' is
+            -- truthy in Lua, so tonumber('') returns nil instead of 0, causing the
+            -- stale-slot release to silently skip -- a permanent lockout bug.
+            local raw_claimed_at = redis.call('HGET', key, 'half_open_claimed_at')
+            local claimed_at = (raw_claimed_at ~= nil and raw_claimed_at ~= '') and tonumber(raw_claimed_at) or nil
+            if claimed_at ~= nil and claimed_at > 0 and (now - claimed_at) >= half_open_slot_timeout then
+                old_in_flight = 0
+                redis.call('HSET', key, 'half_open_in_flight', 0, 'half_open_claimed_at', 0)
+            elseif claimed_at == nil and old_in_flight == 1 then
+                -- Garbage/empty claimed_at with slot held: fail-safe -- release the stale slot
+                -- to prevent permanent lockout from corrupted state.
+                old_in_flight = 0
+                redis.call('HSET', key, 'half_open_in_flight', 0, 'half_open_claimed_at', 0)
+            end
+        end
+
+        if old_in_flight == 0 then
+            redis.call('HSET', key, 'half_open_in_flight', 1, 'half_open_claimed_at', now)
+            slot_claimed = 1
+        end
     end
+
+    redis.call('EXPIRE', key, ttl)
+    return {state, slot_claimed, failure_count}
 end
+"""
 
-redis.call('EXPIRE', key, ttl)
-return {state, slot_claimed, failure_count}
+# check Lua script:
+# KEYS[1] = hash key
+# ARGV[1] = recovery_timeout (float seconds)
+# ARGV[2] = current_time (float, Unix timestamp)
+# ARGV[3] = ttl_seconds (int)
+# ARGV[4] = half_open_slot_timeout (float seconds, 0 = no timeout)
+# Returns: table [state_str, slot_claimed, failure_count]
+_LUA_CHECK = (
+    _LUA_CHECK_ONE
+    + """
+return check_one(KEYS[1], tonumber(ARGV[1]), tonumber(ARGV[2]),
+                 tonumber(ARGV[3]), tonumber(ARGV[4]))
 """
+)
+
+# check_many Lua script (CircuitBreakerGroup):
+# KEYS[i] = hash key of circuit i
+# ARGV[1] = current_time (float, Unix timestamp)
+# ARGV[2 + 3*(i-1)] = recovery_timeout of circuit i
+# ARGV[3 + 3*(i-1)] = ttl_seconds of circuit i
+# ARGV[4 + 3*(i-1)] = half_open_slot_timeout of circuit i
+# Returns: one [state_str, slot_claimed, failure_count] table per key, in order.
+_LUA_CHECK_MANY = (
+    _LUA_CHECK_ONE
+    + """
+local now = tonumber(ARGV[1])
+local results = {}
+for i, key in ipairs(KEYS) do
+    local base = 3 * (i - 1)
+    local r = check_one(key, tonumber(ARGV[base + 2]), now,
+                        tonumber(ARGV[base + 3]), tonumber(ARGV[base + 4]))
+    if r.err then
+        return r
+    end
+    results[i] = r
+end
+return results
+"""
+)
+
+
+# ---------------------------------------------------------------------------
+# Near-cache invalidation
+# ---------------------------------------------------------------------------
+
+# Pub/sub channel prefix; a breaker that trips OPEN publishes to
+# ``<prefix><circuit_id>``.
+INVALIDATION_CHANNEL_PREFIX = "veronica:circuit-invalidate:"
+
+
+class _InvalidationHub:
+    """One pattern subscription per Redis client, fanned out to every
+    near-cached breaker of that client in this process.
+
+    Keeps a single listener thread per client no matter how many breakers
+    (one per tool is typical) are registered.  Breakers are held weakly.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, "weakref.WeakSet[DistributedCircuitBreaker]"] = {}
+        self._pubsub: Any = None
+        self._thread: Any = None
+
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def register(self, breaker: "DistributedCircuitBreaker") -> None:
+        with self._lock:
+            self._breakers.setdefault(breaker._circuit_id, weakref.WeakSet()).add(
+                breaker
+            )
+            if not self.running():
+                self._start_locked()
+
+    def unregister(self, breaker: "DistributedCircuitBreaker") -> bool:
+        """Remove *breaker*; returns True if no breakers remain."""
+        with self._lock:
+            group = self._breakers.get(breaker._circuit_id)
+            if group is not None:
+                group.discard(breaker)
+                if not group:
+                    del self._breakers[breaker._circuit_id]
+            if self._breakers:
+                return False
+            self._stop_locked()
+            return True
+
+    def _start_locked(self) -> None:
+        self._stop_locked()
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(**{f"{INVALIDATION_CHANNEL_PREFIX}*": self._on_message})
+        self._pubsub = pubsub
+        self._thread = pubsub.run_in_thread(
+            sleep_time=0.05, daemon=True, exception_handler=self._on_error
+        )
+
+    def _stop_locked(self) -> None:
+        thread, self._thread = self._thread, None
+        pubsub, self._pubsub = self._pubsub, None
+        try:
+            if thread is not None:
+                thread.stop()
+            if pubsub is not None:
+                pubsub.close()
+        except Exception:  # noqa: BLE001
+            # Best-effort teardown of a possibly broken connection.
+            pass
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8", "replace")
+        if not isinstance(channel, str):
+            return
+        circuit_id = channel[len(INVALIDATION_CHANNEL_PREFIX) :]
+        with self._lock:
+            group = self._breakers.get(circuit_id)
+            breakers = list(group) if group is not None else []
+        for breaker in breakers:
+            breaker._invalidate_near_cache()
+
+    def _on_error(self, exc: BaseException, pubsub: Any, thread: Any) -> None:
+        # Listener lost: drop every lease so callers go back to Redis, and let
+        # the next lease renewal resubscribe.
+        logger.warning(
+            "DistributedCircuitBreaker: invalidation listener failed (%s); "
+            "near-cache leases dropped.",
+            _redact_exc(exc),
+        )
+        with self._lock:
+            breakers = [b for group in self._breakers.values() for b in group]
+            if self._thread is thread:
+                self._thread = None
+                self._pubsub = None
+        thread.stop()
+        for breaker in breakers:
+            breaker._invalidate_near_cache()
+
+
+_hubs: Dict[int, _InvalidationHub] = {}
+_hubs_lock = threading.Lock()
+_hubs_pid = os.getpid()
+
+
+def _get_invalidation_hub(client: Any) -> _InvalidationHub:
+    """Return the process-wide hub for *client*, creating it on first use."""
+    global _hubs_pid
+    with _hubs_lock:
+        if _hubs_pid != os.getpid():
+            # Listener threads do not survive fork(); start fresh in the child.
+            _hubs.clear()
+            _hubs_pid = os.getpid()
+        hub = _hubs.get(id(client))
+        if hub is None or hub.client is not client:
+            hub = _hubs[id(client)] = _InvalidationHub(client)
+        return hub
+
+
+def _release_invalidation_hub(hub: _InvalidationHub, breaker: Any) -> None:
+    with _hubs_lock:
+        if hub.unregister(breaker) and _hubs.get(id(hub.client)) is hub:
+            del _hubs[id(hub.client)]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -263,6 +482,22 @@ class DistributedCircuitBreaker:
             Recommended: ``2 * max_llm_call_timeout``.  0 = no timeout.
         redis_client: Optional pre-created ``redis.Redis`` instance for
             connection pool sharing across multiple breakers.
+        pool_registry: Optional ``RedisPoolRegistry``.  The client is taken
+            from the registry (shared with budget backends for the same URL)
+            and failover/recovery follow its shared health flag.  Ignored when
+            ``redis_client`` is given.
+        near_cache_ttl: Opt-in near-cache lease in seconds (0 = disabled).
+            After a ``check()`` sees CLOSED, further ``check()`` calls in this
+            process are answered locally for this long, and successes are
+            counted locally.  Any process that trips the circuit OPEN publishes
+            on ``INVALIDATION_CHANNEL_PREFIX + circuit_id``, which drops every
+            lease immediately; the lease bounds staleness if that message is
+            lost.  OPEN/HALF_OPEN are never cached, so HALF_OPEN slot claiming
+            still goes through Redis atomically.
+        success_batch_size: With near-cache enabled, pending successes are
+            written to Redis in one call once this many have accumulated (and
+            whenever the lease is renewed, a failure is recorded, counters are
+            read, or the breaker is closed).
 
     Example::
 
@@ -286,6 +521,18 @@ class DistributedCircuitBreaker:
     # Minimum seconds between reconnect attempts (prevents hot-loop log storms).
     _RECONNECT_INTERVAL: float = 5.0
 
+    # Near-cache state.  Class-level defaults keep the near-cache disabled on
+    # instances that skip __init__.
+    _near_cache_ttl: float = 0.0
+    _success_batch_size: int = 1
+    _near_lock: Optional[threading.Lock] = None
+    _lease_until: float = 0.0
+    _lease_generation: int = 0
+    _pending_successes: int = 0
+    _pending_success_ts: float = 0.0
+    _script_success_batch: Any = None
+    _hub: Optional[_InvalidationHub] = None
+
     def __init__(
         self,
         redis_url: str,
@@ -297,6 +544,9 @@ class DistributedCircuitBreaker:
         half_open_slot_timeout: float = 120.0,
         redis_client: object = None,
         failure_predicate: Optional[FailurePredicate] = None,
+        pool_registry: Optional["RedisPoolRegistry"] = None,
+        near_cache_ttl: float = 0.0,
+        success_batch_size: int = 64,
     ) -> None:
         if failure_threshold < 1:
             raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
@@ -308,6 +558,18 @@ class DistributedCircuitBreaker:
             raise ValueError(
                 f"half_open_slot_timeout must be >= 0, got {half_open_slot_timeout}"
             )
+        if not math.isfinite(near_cache_ttl) or near_cache_ttl < 0:
+            raise ValueError(
+                f"near_cache_ttl must be a finite number >= 0, got {near_cache_ttl}"
+            )
+        if success_batch_size < 1:
+            raise ValueError(
+                f"success_batch_size must be >= 1, got {success_batch_size}"
+            )
+        self._near_cache_ttl = float(near_cache_ttl)
+        self._success_batch_size = success_batch_size
+        if self._near_cache_ttl > 0.0:
+            self._near_lock = threading.Lock()
         self._redis_url = redis_url
         self._circuit_id = circuit_id
         self._key = f"{self.KEY_PREFIX}{circuit_id}"
@@ -324,7 +586,8 @@ class DistributedCircuitBreaker:
         )
         self._using_fallback = False
         self._client = None
-        self._owns_client = redis_client is None
+        self._pool_registry = pool_registry if redis_client is None else None
+        self._owns_client = redis_client is None and self._pool_registry is None
         self._lock = threading.Lock()
         self._last_reconnect_attempt: float = 0.0
         # Compiled Lua scripts (registered after connect)
@@ -342,15 +605,26 @@ class DistributedCircuitBreaker:
         self._script_failure = self._client.register_script(_LUA_RECORD_FAILURE)
         self._script_success = self._client.register_script(_LUA_RECORD_SUCCESS)
         self._script_check = self._client.register_script(_LUA_CHECK)
+        if self._near_cache_ttl > 0.0:
+            self._script_success_batch = self._client.register_script(
+                _LUA_RECORD_SUCCESS_BATCH
+            )
 
     def _connect(self) -> None:
         """Connect to Redis and register Lua scripts."""
         try:
-            import redis
+            registry = getattr(self, "_pool_registry", None)
+            if registry is not None:
+                self._client = registry.get_client(self._redis_url)
+                self._register_scripts()
+                if not registry.is_healthy(self._redis_url):
+                    raise ConnectionError("shared Redis pool is marked unhealthy")
+            else:
+                import redis
 
-            self._client = redis.from_url(self._redis_url, decode_responses=True)
-            self._client.ping()
-            self._register_scripts()
+                self._client = redis.from_url(self._redis_url, decode_responses=True)
+                self._client.ping()
+                self._register_scripts()
             self._using_fallback = False
         except Exception as exc:
             if self._fallback_on_error:
@@ -470,19 +744,28 @@ class DistributedCircuitBreaker:
         lock. The benign TOCTOU in ``_attempt_reconnect_if_on_fallback()``'s outer
         ``if self._using_fallback`` check (before lock acquisition) only risks an
         unnecessary lock acquisition -- it is not a data race on ``_last_reconnect_attempt``.
+
+        With a pool registry no connection attempt is made here; the
+        registry's background thread probes Redis and this method only
+        reconciles once the shared health flag reports it reachable.
         """
-        now = time.monotonic()
-        if now - self._last_reconnect_attempt < self._RECONNECT_INTERVAL:
-            return False
-        self._last_reconnect_attempt = now
+        registry = getattr(self, "_pool_registry", None)
+        if registry is not None:
+            if not registry.is_healthy(self._redis_url):
+                return False
+        else:
+            now = time.monotonic()
+            if now - self._last_reconnect_attempt < self._RECONNECT_INTERVAL:
+                return False
+            self._last_reconnect_attempt = now
 
-        try:
-            self._connect()
-        except Exception:
-            return False
+            try:
+                self._connect()
+            except Exception:
+                return False
 
-        if self._using_fallback:
-            return False
+            if self._using_fallback:
+                return False
 
         # Connected -- stay on fallback until reconcile succeeds.
         self._using_fallback = True
@@ -492,6 +775,8 @@ class DistributedCircuitBreaker:
             logger.info("DistributedCircuitBreaker: reconnected to Redis successfully.")
             return True
         # Reconcile failed -- stay on fallback.
+        if registry is not None:
+            registry.mark_unhealthy(self._redis_url)
         return False
 
     # ------------------------------------------------------------------
@@ -504,7 +789,21 @@ class DistributedCircuitBreaker:
         Double-checked locking: the outer check avoids lock acquisition on
         the fast path (already using Redis); the inner check guards against
         concurrent threads both entering the reconnect path.
+
+        With a pool registry, a failure already observed by another holder of
+        the same URL also switches this breaker to fallback (unseeded, since
+        Redis is known unreachable) without waiting for its own timeout.
         """
+        registry = getattr(self, "_pool_registry", None)
+        if (
+            registry is not None
+            and self._fallback_on_error
+            and not self._using_fallback
+            and not registry.is_healthy(self._redis_url)
+        ):
+            with self._lock:
+                self._using_fallback = True
+            return
         if self._using_fallback and self._fallback_on_error:
             with self._lock:
                 if self._using_fallback:
@@ -525,10 +824,14 @@ class DistributedCircuitBreaker:
             method_name,
             _redact_exc(exc),
         )
+        self._invalidate_near_cache()
         with self._lock:
             if not self._using_fallback:
                 self._seed_fallback_from_redis()
                 self._using_fallback = True
+        registry = getattr(self, "_pool_registry", None)
+        if registry is not None:
+            registry.mark_unhealthy(self._redis_url, exc)
 
     def _resolve_state_str(
         self, state_str: str, last_failure_time: Optional[float]
@@ -547,6 +850,87 @@ class DistributedCircuitBreaker:
         except ValueError:
             return CircuitState.CLOSED
 
+    # ------------------------------------------------------------------
+    # Near-cache helpers
+    # ------------------------------------------------------------------
+
+    def _invalidate_near_cache(self) -> None:
+        """Drop the CLOSED lease; the next check() goes to Redis."""
+        lock = self._near_lock
+        if lock is None:
+            return
+        with lock:
+            self._lease_generation += 1
+            self._lease_until = 0.0
+
+    def _ensure_invalidation_subscription(self) -> None:
+        """(Re)subscribe to OPEN-trip invalidations for the current client."""
+        hub = self._hub
+        if hub is not None and hub.client is self._client and hub.running():
+            return
+        try:
+            hub = _get_invalidation_hub(self._client)
+            hub.register(self)
+            self._hub = hub
+        except Exception as exc:  # noqa: BLE001
+            # Leases still expire on their own; retry at the next renewal.
+            logger.debug(
+                "DistributedCircuitBreaker: invalidation subscribe failed (%s)",
+                _redact_exc(exc),
+            )
+
+    def _drain_pending_successes(self) -> Tuple[int, float]:
+        """Take (count, latest wall-clock time) of batched successes."""
+        lock = self._near_lock
+        if lock is None:
+            return 0, 0.0
+        with lock:
+            count = self._pending_successes
+            self._pending_successes = 0
+            return count, self._pending_success_ts
+
+    def _install_lease(self, generation: int) -> None:
+        """Lease CLOSED unless an invalidation arrived since *generation*."""
+        with self._near_lock:
+            if self._lease_generation == generation:
+                self._lease_until = time.monotonic() + self._near_cache_ttl
+
+    def _lease_valid(self) -> bool:
+        return self._near_cache_ttl > 0.0 and time.monotonic() < self._lease_until
+
+    def _flush_successes(self) -> None:
+        """Write batched successes to Redis.  Raises on Redis errors."""
+        count, last_ts = self._drain_pending_successes()
+        if count:
+            self._script_success_batch(
+                keys=[self._key], args=[self._ttl, count, last_ts]
+            )
+
+    def _flush_successes_quietly(self) -> None:
+        """Flush batched successes before a counter read; fall back on error."""
+        if not self._pending_successes or self._using_fallback:
+            return
+        try:
+            self._flush_successes()
+        except Exception as exc:
+            if not self._fallback_on_error:
+                raise
+            self._activate_fallback(exc, "flush_successes")
+
+    def _publish_open(self) -> None:
+        """Tell every near-cached process that this circuit tripped OPEN."""
+        self._invalidate_near_cache()
+        try:
+            self._client.publish(
+                f"{INVALIDATION_CHANNEL_PREFIX}{self._circuit_id}", "OPEN"
+            )
+        except Exception as exc:  # noqa: BLE001
+            # Other processes' leases still expire within near_cache_ttl.
+            logger.warning(
+                "DistributedCircuitBreaker: invalidation publish failed (%s)",
+                _redact_exc(exc),
+            )
+
     @staticmethod
     def _parse_last_failure_time(raw: str) -> Optional[float]:
         """Parse last_failure_time from Redis string, returning None on garbage."""
@@ -601,6 +985,7 @@ class DistributedCircuitBreaker:
     @property
     def failure_count(self) -> int:
         """Consecutive failure count (reads from Redis or fallback)."""
+        self._flush_successes_quietly()
         # nogil: capture under lock -- same rationale as state property.
         with self._lock:
             on_fallback = self._using_fallback or self._client is None
@@ -622,6 +1007,7 @@ class DistributedCircuitBreaker:
     @property
     def success_count(self) -> int:
         """Total success count (reads from Redis or fallback)."""
+        self._flush_successes_quietly()
         # nogil: capture under lock -- same rationale as state property.
         with self._lock:
             on_fallback = self._using_fallback or self._client is None
@@ -644,7 +1030,10 @@ class DistributedCircuitBreaker:
         """RuntimePolicy protocol: check if circuit allows the operation.
 
         Atomically reads state, handles OPEN->HALF_OPEN timeout transition,
-        and claims the half-open in-flight slot via Lua script.
+        and claims the half-open in-flight slot via Lua script.  With
+        ``near_cache_ttl`` set, a CLOSED result is leased locally and later
+        calls are answered without Redis until the lease expires or an
+        OPEN-trip invalidation arrives.
 
         Args:
             context: PolicyContext (fields unused by circuit breaker)
@@ -657,7 +1046,16 @@ class DistributedCircuitBreaker:
         if self._using_fallback or self._client is None:
             return self._fallback.check(context)
 
+        near_cache = self._near_cache_ttl > 0.0
+        if near_cache:
+            if time.monotonic() < self._lease_until:
+                return PolicyDecision(allowed=True, policy_type=self.policy_type)
+            self._ensure_invalidation_subscription()
+            generation = self._lease_generation
+
         try:
+            if near_cache:
+                self._flush_successes()
             result = self._script_check(
                 keys=[self._key],
                 args=[
@@ -667,12 +1065,15 @@ class DistributedCircuitBreaker:
                     self._half_open_slot_timeout,
                 ],
             )
-            return self._interpret_check_result(result)
         except Exception as exc:
             if self._fallback_on_error:
                 self._activate_fallback(exc, "check")
                 return self._fallback.check(context)
             raise
+        if near_cache and result[0] == "CLOSED":
+            # An invalidation that raced with the script wins.
+            self._install_lease(generation)
+        return self._interpret_check_result(result)
 
     def _interpret_check_result(self, result: list) -> PolicyDecision:
         """Convert the Lua script result into a PolicyDecision.
@@ -710,12 +1111,28 @@ class DistributedCircuitBreaker:
         """Record a successful operation.
 
         Closes the circuit if currently half-open. Resets failure counter.
+        While a near-cache lease is held the success is only counted locally
+        and written in the next batch.
         """
         self._attempt_reconnect_if_on_fallback()
 
         if self._using_fallback or self._client is None:
             self._fallback.record_success()
             return
+        if self._lease_valid():
+            with self._near_lock:
+                self._pending_successes += 1
+                self._pending_success_ts = time.time()
+                if self._pending_successes < self._success_batch_size:
+                    return
+            try:
+                self._flush_successes()
+            except Exception as exc:
+                if not self._fallback_on_error:
+                    raise
+                self._activate_fallback(exc, "record_success")
+                self._fallback.record_success()
+            return
         try:
             self._script_success(
                 keys=[self._key],
@@ -750,21 +1167,8 @@ class DistributedCircuitBreaker:
             ``True`` if the failure was counted, ``False`` if filtered.
         """
         # Predicate evaluation BEFORE any Redis call (zero overhead for filtered).
-        if error is not None and self._failure_predicate is not None:
-            try:
-                if not self._failure_predicate(error):
-                    logger.debug(
-                        "[VERONICA_CIRCUIT] DistributedCircuitBreaker: failure "
-                        "filtered by predicate (circuit_id=%s, error=%s)",
-                        self._circuit_id,
-                        type(error).__name__,
-                    )
-                    return False
-            except Exception:
-                logger.warning(
-                    "[VERONICA_CIRCUIT] DistributedCircuitBreaker: "
-                    "failure_predicate raised; counting failure as fail-safe"
-                )
+        if not self._counts_failure(error):
+            return False
 
         self._attempt_reconnect_if_on_fallback()
 
@@ -774,6 +1178,8 @@ class DistributedCircuitBreaker:
             self._fallback.record_failure()
             return True
         try:
+            # Batched successes happened before this failure.
+            self._flush_successes()
             new_count = self._script_failure(
                 keys=[self._key],
                 args=[
@@ -783,12 +1189,7 @@ class DistributedCircuitBreaker:
                 ],
             )
             if int(new_count) >= self._failure_threshold:
-                logger.warning(
-                    "[VERONICA_CIRCUIT] DistributedCircuitBreaker: circuit opened "
-                    "(circuit_id=%s, failures=%d)",
-                    self._circuit_id,
-                    int(new_count),
-                )
+                self._log_opened(int(new_count))
         except Exception as exc:
             if self._fallback_on_error:
                 self._activate_fallback(exc, "record_failure")
@@ -797,8 +1198,41 @@ class DistributedCircuitBreaker:
                 raise
         return True
 
+    def _counts_failure(self, error: Optional[BaseException]) -> bool:
+        """Evaluate ``failure_predicate``; True if the failure should count."""
+        if error is not None and self._failure_predicate is not None:
+            try:
+                if not self._failure_predicate(error):
+                    logger.debug(
+                        "[VERONICA_CIRCUIT] DistributedCircuitBreaker: failure "
+                        "filtered by predicate (circuit_id=%s, error=%s)",
+                        self._circuit_id,
+                        type(error).__name__,
+                    )
+                    return False
+            except Exception:
+                logger.warning(
+                    "[VERONICA_CIRCUIT] DistributedCircuitBreaker: "
+                    "failure_predicate raised; counting failure as fail-safe"
+                )
+        return True
+
+    def _log_opened(self, new_count: int) -> None:
+        """Log (and, with near-cache, publish) an OPEN trip."""
+        logger.warning(
+            "[VERONICA_CIRCUIT] DistributedCircuitBreaker: circuit opened "
+            "(circuit_id=%s, failures=%d)",
+            self._circuit_id,
+            new_count,
+        )
+        if self._near_cache_ttl > 0.0:
+            self._publish_open()
+
     def reset(self) -> None:
         """Reset circuit to CLOSED state."""
+        if self._near_lock is not None:
+            with self._near_lock:
+                self._pending_successes = 0
         # nogil: capture under lock -- same rationale as state property.
         with self._lock:
             on_fallback = self._using_fallback or self._client is None
@@ -840,6 +1274,7 @@ class DistributedCircuitBreaker:
         Prefer this over reading ``state``/``failure_count``/``success_count``
         individually when you need multiple fields (avoids N+1 Redis reads).
         """
+        self._flush_successes_quietly()
         # nogil: read _using_fallback under lock to prevent TOCTOU with
         # _activate_fallback() flipping the flag concurrently.
         with self._lock:
@@ -918,8 +1353,18 @@ class DistributedCircuitBreaker:
         """Close the Redis client if this instance owns it.
 
         Safe to call multiple times.  Does nothing if using a shared client
-        (``redis_client`` was passed to the constructor) or already closed.
+        (``redis_client`` or ``pool_registry`` was passed to the constructor)
+        or already closed.  With near-cache enabled, pending successes are
+        flushed and the invalidation subscription is released first.
         """
+        try:
+            self._flush_successes_quietly()
+        except Exception:  # noqa: BLE001
+            pass  # fallback_on_error=False: closing must not raise.
+        hub, self._hub = self._hub, None
+        if hub is not None:
+            _release_invalidation_hub(hub, self)
+        self._invalidate_near_cache()
         try:
             if self._owns_client and self._client is not None:
                 self._client.close()
@@ -935,6 +1380,252 @@ class DistributedCircuitBreaker:
             return self._using_fallback
 
 
+# One queued script invocation: (script, keys, args).
+_ScriptCall = Tuple[Any, List[str], List[Any]]
+
+
+def _run_pipelined(client: Any, calls: List[_ScriptCall]) -> List[Any]:
+    """Run script *calls* against *client* in one round trip.
+
+    Uses a non-transactional pipeline of EVALSHA.  redis-py's Script objects
+    would add a SCRIPT EXISTS round trip to every pipeline execute, so the
+    SHAs are sent directly and any call rejected with NOSCRIPT (e.g. after a
+    server restart) is re-run through its Script object, which loads it.
+    """
+    if len(calls) == 1:
+        script, keys, args = calls[0]
+        return [script(keys=keys, args=args)]
+    from redis.exceptions import NoScriptError
+
+    pipe = client.pipeline(transaction=False)
+    for script, keys, args in calls:
+        pipe.evalsha(script.sha, len(keys), *keys, *args)
+    results = pipe.execute(raise_on_error=False)
+    for i, result in enumerate(results):
+        if isinstance(result, NoScriptError):
+            script, keys, args = calls[i]
+            results[i] = script(keys=keys, args=args)
+        elif isinstance(result, Exception):
+            raise result
+    return results
+
+
+class CircuitBreakerGroup:
+    """Check or record several DistributedCircuitBreakers in one round trip.
+
+    A turn guarded by N breakers would otherwise pay N ``_LUA_CHECK`` round
+    trips before dispatch.  ``check()`` runs one ``_LUA_CHECK_MANY`` script
+    that evaluates and claims (HALF_OPEN slot) every circuit atomically, and
+    ``record()`` sends every outcome in one pipeline.  Each circuit keeps its
+    own configuration, fallback and near-cache; breakers on their local
+    fallback or holding a near-cache lease are answered without Redis.
+
+    Breakers sharing a Redis client (same ``redis_client`` or
+    ``pool_registry``) cost one round trip together; breakers on different
+    clients are batched per client.  Under Redis Cluster all circuit keys
+    must hash to one slot, e.g. circuit ids sharing a ``{tag}``.
+
+    As with individual breakers, a HALF_OPEN slot claimed by ``check()``
+    stays claimed until its outcome is recorded or
+    ``half_open_slot_timeout`` elapses, even if another circuit in the
+    group denied the turn.
+
+    Args:
+        breakers: Breakers to group.  Circuit ids must be unique.
+
+    Example::
+
+        group = CircuitBreakerGroup([search_cb, db_cb, llm_cb])
+        decisions = group.check(PolicyContext())
+        if all(d.allowed for d in decisions.values()):
+            ...
+        group.record({"search": True, "db": exc, "llm": True})
+    """
+
+    def __init__(self, breakers: Sequence[DistributedCircuitBreaker]) -> None:
+        self._breakers: Dict[str, DistributedCircuitBreaker] = {}
+        for breaker in breakers:
+            circuit_id = breaker._circuit_id
+            if circuit_id in self._breakers:
+                raise ValueError(f"duplicate circuit_id in group: {circuit_id!r}")
+            self._breakers[circuit_id] = breaker
+        self._lock = threading.Lock()
+        # id(client) -> (client, registered _LUA_CHECK_MANY script)
+        self._check_scripts: Dict[int, Tuple[Any, Any]] = {}
+
+    @property
+    def circuit_ids(self) -> List[str]:
+        """Circuit ids in group order."""
+        return list(self._breakers)
+
+    def _check_script_for(self, client: Any) -> Any:
+        with self._lock:
+            entry = self._check_scripts.get(id(client))
+            if entry is None or entry[0] is not client:
+                entry = (client, client.register_script(_LUA_CHECK_MANY))
+                self._check_scripts[id(client)] = entry
+            return entry[1]
+
+    def check(self, context: PolicyContext) -> Dict[str, PolicyDecision]:
+        """Check every circuit; returns ``{circuit_id: PolicyDecision}``.
+
+        Args:
+            context: PolicyContext passed to local fallbacks.
+
+        Returns:
+            Per-circuit decisions, in group order.
+        """
+        decisions: Dict[str, PolicyDecision] = {}
+        remote: Dict[int, List[DistributedCircuitBreaker]] = {}
+        for circuit_id, breaker in self._breakers.items():
+            breaker._attempt_reconnect_if_on_fallback()
+            client = breaker._client
+            if breaker._using_fallback or client is None:
+                decisions[circuit_id] = breaker._fallback.check(context)
+            elif breaker._lease_valid():
+                decisions[circuit_id] = PolicyDecision(
+                    allowed=True, policy_type=breaker.policy_type
+                )
+            else:
+                remote.setdefault(id(client), []).append(breaker)
+        for breakers in remote.values():
+            self._check_remote(breakers, context, decisions)
+        return {circuit_id: decisions[circuit_id] for circuit_id in self._breakers}
+
+    def _check_remote(
+        self,
+        breakers: List[DistributedCircuitBreaker],
+        context: PolicyContext,
+        decisions: Dict[str, PolicyDecision],
+    ) -> None:
+        client = breakers[0]._client
+        generations: Dict[str, int] = {}
+        calls: List[_ScriptCall] = []
+        for breaker in breakers:
+            if breaker._near_cache_ttl > 0.0:
+                breaker._ensure_invalidation_subscription()
+                generations[breaker._circuit_id] = breaker._lease_generation
+                count, last_ts = breaker._drain_pending_successes()
+                if count:
+                    calls.append(
+                        (
+                            breaker._script_success_batch,
+                            [breaker._key],
+                            [breaker._ttl, count, last_ts],
+                        )
+                    )
+        keys: List[str] = []
+        args: List[Any] = [time.time()]
+        for breaker in breakers:
+            keys.append(breaker._key)
+            args.extend(
+                [
+                    breaker._recovery_timeout,
+                    breaker._ttl,
+                    breaker._half_open_slot_timeout,
+                ]
+            )
+        try:
+            calls.append((self._check_script_for(client), keys, args))
+            results = _run_pipelined(client, calls)[-1]
+        except Exception as exc:
+            if not all(b._fallback_on_error for b in breakers):
+                raise
+            for breaker in breakers:
+                breaker._activate_fallback(exc, "group_check")
+                decisions[breaker._circuit_id] = breaker._fallback.check(context)
+            return
+        for breaker, result in zip(breakers, results):
+            generation = generations.get(breaker._circuit_id)
+            if generation is not None and result[0] == "CLOSED":
+                breaker._install_lease(generation)
+            decisions[breaker._circuit_id] = breaker._interpret_check_result(result)
+
+    def record(
+        self, outcomes: Mapping[str, Union[bool, BaseException, None]]
+    ) -> None:
+        """Record one outcome per circuit in a single pipeline.
+
+        Args:
+            outcomes: ``{circuit_id: outcome}``.  ``True`` records a success;
+                ``False``/``None`` records a failure; an exception records a
+                failure filtered through that breaker's ``failure_predicate``.
+
+        Raises:
+            ValueError: If an outcome names a circuit not in the group.
+        """
+        unknown = [cid for cid in outcomes if cid not in self._breakers]
+        if unknown:
+            raise ValueError(f"unknown circuit_id(s) in outcomes: {unknown!r}")
+        remote: Dict[int, List[Tuple[DistributedCircuitBreaker, bool]]] = {}
+        for circuit_id, outcome in outcomes.items():
+            breaker = self._breakers[circuit_id]
+            success = outcome is True
+            if not success:
+                error = outcome if isinstance(outcome, BaseException) else None
+                if not breaker._counts_failure(error):
+                    continue
+            breaker._attempt_reconnect_if_on_fallback()
+            if breaker._using_fallback or breaker._client is None:
+                if success:
+                    breaker._fallback.record_success()
+                else:
+                    breaker._fallback.record_failure()
+            elif success and breaker._lease_valid():
+                breaker.record_success()  # batched locally
+            else:
+                remote.setdefault(id(breaker._client), []).append((breaker, success))
+        for items in remote.values():
+            self._record_remote(items)
+
+    def _record_remote(
+        self, items: List[Tuple[DistributedCircuitBreaker, bool]]
+    ) -> None:
+        client = items[0][0]._client
+        now = time.time()
+        calls: List[_ScriptCall] = []
+        # Breaker whose failure count is at each call index (None otherwise).
+        failures: List[Optional[DistributedCircuitBreaker]] = []
+        for breaker, success in items:
+            count, last_ts = breaker._drain_pending_successes()
+            if count:
+                calls.append(
+                    (
+                        breaker._script_success_batch,
+                        [breaker._key],
+                        [breaker._ttl, count, last_ts],
+                    )
+                )
+                failures.append(None)
+            if success:
+                calls.append((breaker._script_success, [breaker._key], [breaker._ttl]))
+                failures.append(None)
+            else:
+                calls.append(
+                    (
+                        breaker._script_failure,
+                        [breaker._key],
+                        [breaker._failure_threshold, now, breaker._ttl],
+                    )
+                )
+                failures.append(breaker)
+        try:
+            results = _run_pipelined(client, calls)
+        except Exception as exc:
+            if not all(b._fallback_on_error for b, _ in items):
+                raise
+            for breaker, success in items:
+                breaker._activate_fallback(exc, "group_record")
+                if success:
+                    breaker._fallback.record_success()
+                else:
+                    breaker._fallback.record_failure()
+            return
+        for breaker, result in zip(failures, results):
+            if breaker is not None and int(result) >= breaker._failure_threshold:
+                breaker._log_opened(int(result))
+
+
 def get_default_circuit_breaker(
     redis_url: Optional[str] = None,
     circuit_id: str = "default",
@@ -958,8 +1649,12 @@ def get_default_circuit_breaker(
 
     Returns:
         DistributedCircuitBreaker if redis_url is provided, else CircuitBreaker.
+        Distributed breakers share the process-wide pool from
+        ``redis_pool.get_redis_pool_registry()``.
     """
     if redis_url:
+        from veronica_core.redis_pool import get_redis_pool_registry
+
         return DistributedCircuitBreaker(
             redis_url=redis_url,
             circuit_id=circuit_id,
@@ -967,6 +1662,7 @@ def get_default_circuit_breaker(
             recovery_timeout=recovery_timeout,
             ttl_seconds=ttl_seconds,
             failure_predicate=failure_predicate,
+            pool_registry=get_redis_pool_registry(),
         )
     return CircuitBreaker(
         failure_threshold=failure_threshold,
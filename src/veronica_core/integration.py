@@ -199,6 +199,17 @@ class VeronicaIntegration:
         self.operation_count = 0
         self._op_lock = threading.Lock()
 
+        # Delta-capable backends (e.g. WALBackend) log every mutation as it
+        # happens and compact on their own, so periodic full saves are
+        # skipped.  Write one full snapshot first so the log starts from
+        # this state (including the startup transition above).
+        self._delta_persistence = (
+            getattr(self.backend, "supports_deltas", False) is True
+        )
+        if self._delta_persistence:
+            self.backend.save(self.state.to_dict())
+            self.state.set_delta_listener(self.backend.append_delta)
+
         logger.info(
             f"[VERONICA_INTEGRATION] Initialized: "
             f"cooldown_fails={self.state.cooldown_fails}, "
@@ -326,12 +337,16 @@ class VeronicaIntegration:
             )
             return False
 
+        if self._delta_persistence:
+            # The backend's view already matches the logged deltas; writing
+            # it avoids racing concurrent mutations against to_dict().
+            return self.backend.compact()
         return self.backend.save(state_data)
 
     def _maybe_auto_save(self) -> None:
         """Auto-save if interval reached."""
-        if self.auto_save_interval <= 0:
-            return  # Auto-save disabled
+        if self.auto_save_interval <= 0 or self._delta_persistence:
+            return  # Auto-save disabled, or every operation is already logged
 
         with self._op_lock:
             self.operation_count += 1
@@ -14,6 +14,7 @@ from veronica_core.memory.hooks import (
     DefaultMemoryGovernanceHook,
     DenyAllMemoryGovernanceHook,
     MemoryGovernanceHook,
+    MemoryHookTraits,
 )
 from veronica_core.memory.message_governance import (
     DefaultMessageGovernanceHook,
@@ -50,6 +51,7 @@ __all__ = [
     "GovernanceVerdict",
     "MemoryGovernanceDecision",
     "MemoryGovernanceHook",
+    "MemoryHookTraits",
     "DefaultMemoryGovernanceHook",
     "DenyAllMemoryGovernanceHook",
     "MemoryGovernor",
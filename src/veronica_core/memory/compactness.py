@@ -7,6 +7,7 @@ __all__ = ["CompactnessEvaluator"]
 import math
 from typing import Any
 
+from veronica_core.memory.hooks import MemoryHookTraits
 from veronica_core.memory.types import (
     CompactnessConstraints,
     DegradeDirective,
@@ -43,6 +44,8 @@ class CompactnessEvaluator:
     object, which is itself immutable (frozen dataclass).
     """
 
+    memory_hook_traits = MemoryHookTraits(pure=True)
+
     def __init__(
         self, default_constraints: CompactnessConstraints | None = None
     ) -> None:
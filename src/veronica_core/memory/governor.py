@@ -9,7 +9,17 @@ and aggregates their verdicts according to fail-closed semantics by default:
 - Hook raises                  -> treated as DENY (fail-closed)
 - QUARANTINE / DEGRADE         -> worst verdict propagates (QUARANTINE > DEGRADE > ALLOW)
 
-Thread safety: add_hook() and evaluate() are protected by a non-reentrant lock.
+Scheduling: hooks declaring ``MemoryHookTraits(pure=True)`` may be reordered
+within a run of consecutive pure hooks (cheap deny-capable hooks first),
+have their decisions memoised per (chain_id, operation fingerprint), and --
+with ``max_workers > 1`` -- have their expensive members evaluated
+concurrently.  Hooks without traits are barriers evaluated in registration
+order, so a governor built only from such hooks behaves exactly as before.
+Decisions are always aggregated in registration order; only which hook's
+DENY is reported can differ when several reorderable hooks would deny.
+
+Thread safety: add_hook() is protected by a non-reentrant lock; evaluate()
+reads an immutable hook snapshot that add_hook() replaces.
 Hooks MUST NOT call back into the same MemoryGovernor instance from within
 before_op() or after_op() -- doing so will deadlock.
 notify_after() never raises regardless of hook errors.
@@ -21,9 +31,12 @@ __all__ = ["MemoryGovernor"]
 
 import logging
 import threading
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Hashable
 
-from veronica_core.memory.hooks import MemoryGovernanceHook
+from veronica_core.memory.hooks import MemoryGovernanceHook, MemoryHookTraits
 from veronica_core.memory.message_governance import MessageGovernanceHook
 from veronica_core.memory.types import (
     DegradeDirective,
@@ -39,6 +52,12 @@ logger = logging.getLogger(__name__)
 
 _MAX_HOOKS = 100
 
+# Pure-hook memo bounds: chains kept (LRU) and fingerprints kept per chain.
+_MEMO_MAX_CHAINS = 256
+_MEMO_MAX_OPS_PER_CHAIN = 1024
+
+_DEFAULT_TRAITS = MemoryHookTraits()
+
 # Verdict severity ordering -- higher index wins when merging non-DENY verdicts.
 _VERDICT_RANK: dict[GovernanceVerdict, int] = {
     GovernanceVerdict.ALLOW: 0,
@@ -137,6 +156,90 @@ def _merge_directives(
     )
 
 
+def _hook_traits(hook: MemoryGovernanceHook) -> MemoryHookTraits:
+    traits = getattr(hook, "memory_hook_traits", None)
+    return traits if isinstance(traits, MemoryHookTraits) else _DEFAULT_TRAITS
+
+
+@dataclass(frozen=True)
+class _Stage:
+    """Hook indices evaluated one after another, then (optionally) in parallel."""
+
+    sequential: tuple[int, ...]
+    parallel: tuple[int, ...] = ()
+
+
+def _build_plan(
+    traits: list[MemoryHookTraits],
+    concurrent: bool,
+) -> tuple[_Stage, ...]:
+    """Split hooks into stages; impure hooks are single-hook barriers.
+
+    Each run of consecutive pure hooks becomes one stage: cheap before
+    expensive, deny-capable before never-deny, registration order otherwise.
+    With *concurrent*, two or more expensive hooks of a run form its
+    parallel part.
+    """
+    stages: list[_Stage] = []
+    run: list[int] = []
+
+    def flush() -> None:
+        if not run:
+            return
+        order = sorted(
+            run,
+            key=lambda i: (traits[i].cost == "expensive", not traits[i].may_deny),
+        )
+        expensive = tuple(i for i in order if traits[i].cost == "expensive")
+        if concurrent and len(expensive) > 1:
+            cheap = tuple(i for i in order if traits[i].cost == "cheap")
+            stages.append(_Stage(sequential=cheap, parallel=expensive))
+        else:
+            stages.append(_Stage(sequential=tuple(order)))
+        run.clear()
+
+    for index, hook_traits in enumerate(traits):
+        if hook_traits.pure:
+            run.append(index)
+        else:
+            flush()
+            stages.append(_Stage(sequential=(index,)))
+    flush()
+    return tuple(stages)
+
+
+def _fingerprint(
+    operation: MemoryOperation,
+    context: MemoryPolicyContext,
+) -> Hashable | None:
+    """Key for memoised pure-hook decisions, or None if not hashable.
+
+    Covers every operation and context field except the operation timestamp,
+    the request_id and the per-chain counters, which change on every call.
+    """
+    try:
+        key = (
+            operation.action,
+            operation.resource_id,
+            operation.agent_id,
+            operation.namespace,
+            operation.content_hash,
+            operation.content_size_bytes,
+            operation.provenance,
+            tuple(sorted(operation.metadata.items())),
+            context.trust_level,
+            context.memory_view,
+            context.execution_mode,
+            context.source_role,
+            context.compactness,
+        )
+        hash(key)
+    except TypeError:
+        # Unhashable or unorderable metadata: evaluate without memoisation.
+        return None
+    return key
+
+
 class MemoryGovernor:
     """Orchestrates memory governance hooks in a thread-safe pipeline.
 
@@ -150,14 +253,18 @@ class MemoryGovernor:
         if decision.denied:
             raise PermissionError(decision.reason)
 
-    Hooks are evaluated in registration order.  The first DENY terminates
-    evaluation.  QUARANTINE and DEGRADE accumulate (worst verdict wins).
+    Hooks are evaluated in registration order, except that runs of pure
+    hooks (see MemoryHookTraits) are scheduled cheap-first.  The first DENY
+    terminates evaluation.  QUARANTINE and DEGRADE accumulate (worst verdict
+    wins).
     """
 
     def __init__(
         self,
         hooks: list[MemoryGovernanceHook] | None = None,
         fail_closed: bool = True,
+        max_workers: int = 0,
+        memoize: bool = True,
     ) -> None:
         """Create a MemoryGovernor.
 
@@ -165,11 +272,32 @@ class MemoryGovernor:
             hooks: Initial list of hooks (copied, not stored directly).
             fail_closed: If True, zero-hook evaluations return DENY.
                          If False, zero-hook evaluations return ALLOW.
+            max_workers: With a value above 1, expensive pure hooks of the
+                same run are evaluated concurrently on a thread pool of
+                this size.  0 or 1 evaluates every hook on the caller's
+                thread.
+            memoize: Reuse pure-hook decisions for operations with the same
+                fingerprint within one chain (non-empty chain_id).
+
+        Raises:
+            ValueError: If max_workers is negative.
         """
+        if max_workers < 0:
+            raise ValueError(f"max_workers must be >= 0, got {max_workers}")
         self._hooks: list[MemoryGovernanceHook] = list(hooks or [])
         self._message_hooks: list[MessageGovernanceHook] = []
         self._fail_closed = fail_closed
         self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._memoize = memoize
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._memo: OrderedDict[str, dict[Hashable, dict[int, Any]]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._traits: list[MemoryHookTraits] = [_hook_traits(h) for h in self._hooks]
+        # (hooks, plan, any_pure) -- replaced as a whole by add_hook() so
+        # evaluate() reads a consistent snapshot without taking the lock.
+        self._schedule = self._build_schedule_locked()
 
     # ------------------------------------------------------------------
     # Public API
@@ -191,6 +319,24 @@ class MemoryGovernor:
                     "cannot add more hooks"
                 )
             self._hooks.append(hook)
+            self._traits.append(_hook_traits(hook))
+            self._schedule = self._build_schedule_locked()
+
+    def end_chain(self, chain_id: str) -> None:
+        """Drop memoised pure-hook decisions for *chain_id*."""
+        with self._memo_lock:
+            self._memo.pop(chain_id, None)
+
+    def close(self) -> None:
+        """Shut down the hook thread pool (if one was started).
+
+        Later evaluations run every hook on the caller's thread.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     def add_message_hook(self, hook: MessageGovernanceHook) -> None:
         """Register a message governance hook.
@@ -365,8 +511,7 @@ class MemoryGovernor:
         if context is None:
             context = MemoryPolicyContext(operation=operation)
 
-        with self._lock:
-            hooks_snapshot = tuple(self._hooks)
+        hooks_snapshot, plan, any_pure = self._schedule
 
         if not hooks_snapshot:
             verdict = (
@@ -384,68 +529,48 @@ class MemoryGovernor:
                 operation=operation,
             )
 
-        # Accumulate worst non-DENY verdict across all hooks.
-        accumulated_verdict = GovernanceVerdict.ALLOW
-        accumulated_reason = ""
-        accumulated_policy_id = "governor"
-        accumulated_directive: DegradeDirective | None = None
-        accumulated_threat: ThreatContext | None = None
+        memo = (
+            self._memo_for(operation, context)
+            if any_pure and self._memoize and context.chain_id
+            else None
+        )
 
         # Bug #10: use a sentinel so early exits (exception, DENY, unknown verdict)
         # can still call notify_after before returning.
         early_exit_decision: MemoryGovernanceDecision | None = None
-
-        for hook in hooks_snapshot:
-            try:
-                decision = hook.before_op(operation, context)
-                if decision is None:
-                    raise TypeError(
-                        f"hook {type(hook).__name__}.before_op() returned None"
-                    )
-            except Exception as exc:  # noqa: BLE001
-                logger.error(
-                    "[memory.governor] hook %s raised during before_op: %s",
-                    type(hook).__name__,
-                    exc,
-                )
-                early_exit_decision = MemoryGovernanceDecision(
-                    verdict=GovernanceVerdict.DENY,
-                    reason="hook error: hook raised unexpectedly",
-                    policy_id=type(hook).__name__,
-                    operation=operation,
+        decisions: list[MemoryGovernanceDecision | None] = [None] * len(hooks_snapshot)
+
+        for stage in plan:
+            for index in stage.sequential:
+                hook = hooks_snapshot[index]
+                outcome = self._invoke(index, hook, operation, context, memo)
+                early_exit_decision = self._screen(hook, outcome, operation)
+                if early_exit_decision is not None:
+                    break
+                decisions[index] = outcome  # type: ignore[assignment]
+            if early_exit_decision is None and stage.parallel:
+                early_exit_decision = self._run_parallel(
+                    stage.parallel, hooks_snapshot, operation, context, memo, decisions
                 )
+            if early_exit_decision is not None:
                 break
 
-            if decision.verdict is GovernanceVerdict.DENY:
-                # Fail-closed: first DENY stops evaluation immediately.
-                early_exit_decision = MemoryGovernanceDecision(
-                    verdict=GovernanceVerdict.DENY,
-                    reason=decision.reason,
-                    policy_id=decision.policy_id,
-                    operation=operation,
-                    audit_metadata=dict(decision.audit_metadata),
-                )
-                break
+        if early_exit_decision is not None:
+            # Bug #10: notify_after must be called even on early-exit paths.
+            self.notify_after(operation, early_exit_decision)
+            return early_exit_decision
 
-            # Track worst non-DENY verdict.  Fail-closed: unknown verdicts
-            # are treated as DENY to prevent silent degradation.
-            try:
-                hook_rank = _VERDICT_RANK[decision.verdict]
-            except KeyError:
-                logger.error(
-                    "[memory.governor] hook %s returned unknown verdict %r; "
-                    "failing closed (DENY)",
-                    type(hook).__name__,
-                    decision.verdict,
-                )
-                early_exit_decision = MemoryGovernanceDecision(
-                    verdict=GovernanceVerdict.DENY,
-                    reason=f"unknown verdict: {decision.verdict!r}",
-                    policy_id=type(hook).__name__,
-                    operation=operation,
-                )
-                break
+        # Accumulate worst non-DENY verdict across all hooks, in registration
+        # order regardless of the order in which they were evaluated.
+        accumulated_verdict = GovernanceVerdict.ALLOW
+        accumulated_reason = ""
+        accumulated_policy_id = "governor"
+        accumulated_directive: DegradeDirective | None = None
+        accumulated_threat: ThreatContext | None = None
 
+        for decision in decisions:
+            assert decision is not None
+            hook_rank = _VERDICT_RANK[decision.verdict]
             current_rank = _VERDICT_RANK[accumulated_verdict]
             if hook_rank > current_rank:
                 accumulated_verdict = decision.verdict
@@ -463,11 +588,6 @@ class MemoryGovernor:
                     accumulated_directive, decision.degrade_directive
                 )
 
-        if early_exit_decision is not None:
-            # Bug #10: notify_after must be called even on early-exit paths.
-            self.notify_after(operation, early_exit_decision)
-            return early_exit_decision
-
         # Bug #9: preserve accumulated DEGRADE directive when the final verdict
         # is QUARANTINE (a later hook may have escalated from DEGRADE). The
         # directive still carries valid content-transformation instructions.
@@ -494,6 +614,164 @@ class MemoryGovernor:
             threat_context=final_threat,
         )
 
+    # ------------------------------------------------------------------
+    # Hook scheduling
+    # ------------------------------------------------------------------
+
+    def _build_schedule_locked(
+        self,
+    ) -> tuple[tuple[MemoryGovernanceHook, ...], tuple[_Stage, ...], bool]:
+        plan = _build_plan(self._traits, concurrent=self._max_workers > 1)
+        return tuple(self._hooks), plan, any(t.pure for t in self._traits)
+
+    def _memo_for(
+        self,
+        operation: MemoryOperation,
+        context: MemoryPolicyContext,
+    ) -> dict[int, Any] | None:
+        """Return the hook-index -> decision memo for this chain and operation."""
+        key = _fingerprint(operation, context)
+        if key is None:
+            return None
+        with self._memo_lock:
+            chain = self._memo.get(context.chain_id)
+            if chain is None:
+                chain = self._memo[context.chain_id] = {}
+                if len(self._memo) > _MEMO_MAX_CHAINS:
+                    self._memo.popitem(last=False)
+            else:
+                self._memo.move_to_end(context.chain_id)
+            memo = chain.get(key)
+            if memo is None:
+                if len(chain) >= _MEMO_MAX_OPS_PER_CHAIN:
+                    chain.clear()
+                memo = chain[key] = {}
+            return memo
+
+    @staticmethod
+    def _invoke(
+        index: int,
+        hook: MemoryGovernanceHook,
+        operation: MemoryOperation,
+        context: MemoryPolicyContext,
+        memo: dict[int, Any] | None,
+    ) -> MemoryGovernanceDecision | Exception:
+        """Call hook.before_op(), returning the exception instead of raising.
+
+        *memo* is only passed for pure hooks' lookups; impure hooks never
+        have an entry because only pure hooks are stored.
+        """
+        if memo is not None:
+            cached = memo.get(index)
+            if cached is not None:
+                return cached
+        try:
+            decision = hook.before_op(operation, context)
+            if decision is None:
+                raise TypeError(f"hook {type(hook).__name__}.before_op() returned None")
+        except Exception as exc:  # noqa: BLE001
+            return exc
+        if memo is not None and _hook_traits(hook).pure:
+            memo[index] = decision
+        return decision
+
+    @staticmethod
+    def _screen(
+        hook: MemoryGovernanceHook,
+        outcome: MemoryGovernanceDecision | Exception,
+        operation: MemoryOperation,
+    ) -> MemoryGovernanceDecision | None:
+        """Return the early-exit DENY for *outcome*, or None to continue."""
+        if isinstance(outcome, Exception):
+            logger.error(
+                "[memory.governor] hook %s raised during before_op: %s",
+                type(hook).__name__,
+                outcome,
+            )
+            return MemoryGovernanceDecision(
+                verdict=GovernanceVerdict.DENY,
+                reason="hook error: hook raised unexpectedly",
+                policy_id=type(hook).__name__,
+                operation=operation,
+            )
+
+        if outcome.verdict is GovernanceVerdict.DENY:
+            # Fail-closed: first DENY stops evaluation immediately.
+            return MemoryGovernanceDecision(
+                verdict=GovernanceVerdict.DENY,
+                reason=outcome.reason,
+                policy_id=outcome.policy_id,
+                operation=operation,
+                audit_metadata=dict(outcome.audit_metadata),
+            )
+
+        # Fail-closed: unknown verdicts are treated as DENY to prevent
+        # silent degradation.
+        if outcome.verdict not in _VERDICT_RANK:
+            logger.error(
+                "[memory.governor] hook %s returned unknown verdict %r; "
+                "failing closed (DENY)",
+                type(hook).__name__,
+                outcome.verdict,
+            )
+            return MemoryGovernanceDecision(
+                verdict=GovernanceVerdict.DENY,
+                reason=f"unknown verdict: {outcome.verdict!r}",
+                policy_id=type(hook).__name__,
+                operation=operation,
+            )
+        return None
+
+    def _run_parallel(
+        self,
+        indices: tuple[int, ...],
+        hooks: tuple[MemoryGovernanceHook, ...],
+        operation: MemoryOperation,
+        context: MemoryPolicyContext,
+        memo: dict[int, Any] | None,
+        decisions: list[MemoryGovernanceDecision | None],
+    ) -> MemoryGovernanceDecision | None:
+        """Evaluate expensive pure hooks concurrently; return an early exit.
+
+        Returns as soon as one hook denies; hooks still running finish in
+        the background and their results are discarded.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            for index in indices:
+                outcome = self._invoke(index, hooks[index], operation, context, memo)
+                early = self._screen(hooks[index], outcome, operation)
+                if early is not None:
+                    return early
+                decisions[index] = outcome  # type: ignore[assignment]
+            return None
+
+        futures: dict[Future[MemoryGovernanceDecision | Exception], int] = {
+            executor.submit(
+                self._invoke, index, hooks[index], operation, context, memo
+            ): index
+            for index in indices
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            outcome = future.result()
+            early = self._screen(hooks[index], outcome, operation)
+            if early is not None:
+                return early
+            decisions[index] = outcome  # type: ignore[assignment]
+        return None
+
+    def _get_executor(self) -> ThreadPoolExecutor | None:
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="veronica-memory-governor",
+                )
+            return self._executor
+
     def notify_after(
         self,
         operation: MemoryOperation,
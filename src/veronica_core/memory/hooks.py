@@ -6,18 +6,24 @@ implements MemoryGovernanceHook (structurally, via Protocol) can be registered.
 Two built-in implementations are provided:
 - DefaultMemoryGovernanceHook: allows all operations (fail-open default)
 - DenyAllMemoryGovernanceHook: denies all operations (fail-closed default)
+
+Hooks may also expose a ``memory_hook_traits`` attribute (MemoryHookTraits)
+telling the governor how it may schedule them.  Hooks without one are
+evaluated exactly in registration order.
 """
 
 from __future__ import annotations
 
 __all__ = [
     "MemoryGovernanceHook",
+    "MemoryHookTraits",
     "DefaultMemoryGovernanceHook",
     "DenyAllMemoryGovernanceHook",
 ]
 
 import logging
-from typing import Any, Protocol, runtime_checkable
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from veronica_core.memory.types import (
     GovernanceVerdict,
@@ -76,6 +82,36 @@ class MemoryGovernanceHook(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class MemoryHookTraits:
+    """Scheduling hints a hook declares as its ``memory_hook_traits`` attribute.
+
+    Attributes:
+        cost: ``"cheap"`` or ``"expensive"``.  Within a run of pure hooks the
+            governor evaluates cheap hooks first, so a cheap DENY skips the
+            expensive ones; with ``max_workers > 1`` several expensive hooks
+            of the same run are evaluated concurrently.
+        pure: before_op() has no side effects, is thread-safe, and its
+            decision depends only on the operation and context fields of
+            the governor's fingerprint (everything except the operation
+            timestamp, request_id and the per-chain counters).  Only pure
+            hooks are reordered, memoised per chain or run concurrently;
+            impure hooks keep their registration position.
+        may_deny: False if before_op() never returns DENY.  Such hooks are
+            evaluated after the deny-capable hooks of the same cost.
+    """
+
+    cost: Literal["cheap", "expensive"] = "cheap"
+    pure: bool = False
+    may_deny: bool = True
+
+    def __post_init__(self) -> None:
+        if self.cost not in ("cheap", "expensive"):
+            raise ValueError(
+                f"cost must be 'cheap' or 'expensive', got {self.cost!r}"
+            )
+
+
 class DefaultMemoryGovernanceHook:
     """Fail-open hook -- allows all operations.
 
@@ -83,6 +119,8 @@ class DefaultMemoryGovernanceHook:
     after_op() logs any error at WARNING level without re-raising.
     """
 
+    memory_hook_traits = MemoryHookTraits(pure=True, may_deny=False)
+
     def before_op(
         self,
         operation: MemoryOperation,
@@ -120,6 +158,8 @@ class DenyAllMemoryGovernanceHook:
     and fail-closed semantics are required.
     """
 
+    memory_hook_traits = MemoryHookTraits(pure=True)
+
     def before_op(
         self,
         operation: MemoryOperation,
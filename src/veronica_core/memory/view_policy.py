@@ -6,6 +6,7 @@ __all__ = ["ViewPolicyEvaluator"]
 
 from typing import Any
 
+from veronica_core.memory.hooks import MemoryHookTraits
 from veronica_core.memory.types import (
     ExecutionMode,
     GovernanceVerdict,
@@ -61,6 +62,8 @@ class ViewPolicyEvaluator:
     Thread-safe: no mutable instance state (owner_agent_id is immutable str).
     """
 
+    memory_hook_traits = MemoryHookTraits(pure=True)
+
     def __init__(self, owner_agent_id: str = "") -> None:
         """Create a ViewPolicyEvaluator.
 
@@ -26,11 +26,17 @@ get_current_execution_context().
 #   for synchronous WSGI apps.
 # Added get_current_execution_context(): returns the ExecutionContext
 #   bound to the current request, or None if called outside a request.
+# Perf: pre/post-flight checks use get_counters() instead of get_snapshot(),
+#   so they no longer copy every node and event of the chain per request.
+# Perf: lite_contexts=True builds per-request contexts from one shared
+#   template in lite mode (ExecutionContext(lite=True)): lazy graph, shared
+#   ContextVars, one UUID.  Off by default; full contexts are unchanged.
 # ---------------------------------------------------------------------------
 
 from __future__ import annotations
 
 import contextvars
+import functools
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Iterable
 
@@ -51,6 +57,17 @@ _current_execution_context: contextvars.ContextVar[ExecutionContext | None] = (
 )
 
 
+def _context_template(
+    config: ExecutionConfig,
+    pipeline: ShieldPipeline | None,
+    lite: bool,
+) -> Callable[[], ExecutionContext]:
+    """Return a zero-argument factory for per-request contexts."""
+    return functools.partial(
+        ExecutionContext, config=config, pipeline=pipeline, lite=lite
+    )
+
+
 def get_current_execution_context() -> ExecutionContext | None:
     """Return the ExecutionContext for the current request.
 
@@ -84,6 +101,11 @@ class VeronicaASGIMiddleware:
     When the context is already aborted on pre-flight (limits already hit),
     or when the context is found to be aborted after the app call completes,
     the middleware responds with HTTP 429 instead of forwarding the app's response.
+
+    Pass ``lite_contexts=True`` to create per-request contexts in lite mode
+    (see ``ExecutionContext(lite=True)``): request_id equals chain_id and the
+    graph is built on the first wrapped call.  By default each request gets
+    a full context.
     """
 
     def __init__(
@@ -91,10 +113,12 @@ class VeronicaASGIMiddleware:
         app: _ASGIApp,
         config: ExecutionConfig,
         pipeline: ShieldPipeline | None = None,
+        lite_contexts: bool = False,
     ) -> None:
         self._app = app
         self._config = config
         self._pipeline = pipeline
+        self._new_context = _context_template(config, pipeline, lite_contexts)
 
     async def __call__(
         self,
@@ -110,7 +134,7 @@ class VeronicaASGIMiddleware:
             await self._app(scope, receive, send)
             return
 
-        ctx = ExecutionContext(config=self._config, pipeline=self._pipeline)
+        ctx = self._new_context()
         token = _current_execution_context.set(ctx)
         halted = False
         try:
@@ -125,7 +149,7 @@ class VeronicaASGIMiddleware:
 
             # Pre-flight: check if context is already at limits without
             # consuming a step count (unlike wrap_llm_call).
-            snap = ctx.get_snapshot()
+            snap = ctx.get_counters(include_graph=False)
             if snap.aborted or snap.cost_usd_accumulated >= self._config.max_cost_usd:
                 halted = True
             else:
@@ -138,7 +162,7 @@ class VeronicaASGIMiddleware:
                 # Only set halted when the response has not yet started; once
                 # http.response.start has been forwarded to the client, sending
                 # a second response would violate the ASGI protocol.
-                if ctx.get_snapshot().aborted and not response_started:
+                if ctx.get_counters(include_graph=False).aborted and not response_started:
                     halted = True
 
                 if app_exception is not None:
@@ -180,12 +204,12 @@ class VeronicaASGIMiddleware:
         """
         from veronica_core.containment.execution_context import WrapOptions
 
-        ctx = ExecutionContext(config=self._config, pipeline=self._pipeline)
+        ctx = self._new_context()
         token = _current_execution_context.set(ctx)
         halted = False
 
         try:
-            snap = ctx.get_snapshot()
+            snap = ctx.get_counters(include_graph=False)
             if snap.aborted or snap.cost_usd_accumulated >= self._config.max_cost_usd:
                 halted = True
             else:
@@ -264,6 +288,8 @@ class VeronicaWSGIMiddleware:
     When the context is already aborted on pre-flight (limits already hit),
     or when the context is found to be aborted after the app call completes,
     responds with '429 Too Many Requests'.
+
+    ``lite_contexts`` has the same meaning as for VeronicaASGIMiddleware.
     """
 
     def __init__(
@@ -271,23 +297,25 @@ class VeronicaWSGIMiddleware:
         app: _WSGIApp,
         config: ExecutionConfig,
         pipeline: ShieldPipeline | None = None,
+        lite_contexts: bool = False,
     ) -> None:
         self._app = app
         self._config = config
         self._pipeline = pipeline
+        self._new_context = _context_template(config, pipeline, lite_contexts)
 
     def __call__(
         self,
         environ: dict[str, Any],
         start_response: Callable[..., Any],
     ) -> Iterable[bytes]:
-        ctx = ExecutionContext(config=self._config, pipeline=self._pipeline)
+        ctx = self._new_context()
         token = _current_execution_context.set(ctx)
         environ["veronica.context"] = ctx
         try:
             # Pre-flight: check if context is already at limits without
             # consuming a step count (unlike wrap_llm_call).
-            snap = ctx.get_snapshot()
+            snap = ctx.get_counters(include_graph=False)
             if snap.aborted or snap.cost_usd_accumulated >= self._config.max_cost_usd:
                 return _wsgi_429(start_response)
 
@@ -306,7 +334,7 @@ class VeronicaWSGIMiddleware:
             # Run this check even when the app raised so that a halted context
             # returns 429 instead of propagating the exception (mirrors ASGI
             # behaviour where the halted flag takes priority).
-            if ctx.get_snapshot().aborted and not tracker.started:
+            if ctx.get_counters(include_graph=False).aborted and not tracker.started:
                 if app_exception is not None:
                     logger.warning(
                         "WSGI app raised %s but context was halted; "
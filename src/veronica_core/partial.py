@@ -5,9 +5,10 @@ with a dedicated streaming buffer for LLM output preservation.
 """
 
 from __future__ import annotations
+import tempfile
 import threading
 from dataclasses import dataclass, field
-from typing import Final, List, Any, Dict
+from typing import IO, Final, List, Any, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,12 @@ logger = logging.getLogger(__name__)
 # Hard limits to prevent DoS via unbounded streaming buffers.
 MAX_CHUNKS: Final[int] = 10_000
 MAX_BYTES: Final[int] = 10 * 1024 * 1024  # 10 MB
+# Extra bytes a spilling buffer may write to its temp file beyond MAX_BYTES.
+MAX_SPILL_BYTES: Final[int] = 1024 * 1024 * 1024  # 1 GiB
+# Rope segments start small (most partial results are short) and double up
+# to this size; they are never resized, so memoryviews stay valid.
+_MIN_SEGMENT: Final[int] = 256
+_MAX_SEGMENT: Final[int] = 64 * 1024
 # Backward-compatible aliases (deprecated; use MAX_CHUNKS / MAX_BYTES).
 _MAX_CHUNKS = MAX_CHUNKS
 _MAX_BYTES = MAX_BYTES
@@ -60,10 +67,26 @@ class PartialResultBuffer:
     When an LLM call is interrupted (timeout, abort, budget exceeded),
     accumulated chunks are preserved instead of silently discarded.
 
+    Chunks are stored UTF-8 encoded in a rope of fixed-capacity bytearray
+    segments: each chunk is encoded exactly once, its size is counted from
+    the encoded bytes, and no per-chunk object is kept.  memory_views()
+    exposes the stored bytes without copying.
+
     Limits:
         - Maximum 10,000 chunks (raises ValueError when exceeded).
         - Maximum 10 MB total bytes across all chunks (raises ValueError when exceeded).
 
+    With ``spill_to_disk=True`` the first MAX_BYTES stay in memory and
+    later bytes are appended to an anonymous temporary file (deleted when
+    the buffer is cleared or garbage-collected).  The chunk limit is not
+    enforced and the byte limit becomes MAX_BYTES + ``max_spill_bytes``.
+
+    Args:
+        spill_to_disk: Spill bytes beyond MAX_BYTES to a temporary file
+            instead of raising PartialBufferOverflow.
+        max_spill_bytes: Upper bound on spilled bytes.
+        spill_dir: Directory for the temporary file (default: system temp).
+
     Example:
         buf = PartialResultBuffer()
         for chunk in llm_stream:
@@ -72,16 +95,33 @@ class PartialResultBuffer:
         # On interruption: buf.get_partial() returns accumulated text
     """
 
-    _chunks: List[str] = field(default_factory=list, init=False)
+    spill_to_disk: bool = False
+    max_spill_bytes: int = MAX_SPILL_BYTES
+    spill_dir: Optional[str] = None
+    _segments: List[bytearray] = field(default_factory=list, init=False)
+    _chunk_count: int = field(default=0, init=False)
     _metadata: Dict[str, Any] = field(default_factory=dict, init=False)
     _is_complete: bool = field(default=False, init=False)
     _total_bytes: int = field(default=0, init=False)
     _is_partial_overflow: bool = field(default=False, init=False)
 
     def __post_init__(self) -> None:
-        # Not declared as a dataclass field to avoid dataclass machinery (not
+        if self.max_spill_bytes <= 0:
+            raise ValueError(
+                f"max_spill_bytes must be > 0, got {self.max_spill_bytes!r}"
+            )
+        # Not declared as dataclass fields to avoid dataclass machinery (not
         # serialisable, not comparable). Assigned directly on the instance.
         object.__setattr__(self, "_lock", threading.Lock())
+        # Bytes used in the last segment, bytes held in memory, spill state.
+        object.__setattr__(self, "_tail_used", 0)
+        object.__setattr__(self, "_memory_bytes", 0)
+        object.__setattr__(self, "_spill_file", None)
+        object.__setattr__(
+            self,
+            "_byte_limit",
+            MAX_BYTES + (self.max_spill_bytes if self.spill_to_disk else 0),
+        )
 
     def append(self, chunk: str) -> None:
         """Append a streaming chunk.
@@ -94,37 +134,105 @@ class PartialResultBuffer:
                 exceeded. Subclasses ValueError for backward compatibility.
             ValueError: If the buffer has already been marked complete.
         """
+        data = chunk.encode("utf-8")
+        self._append_encoded(data, len(data))
+
+    def append_bytes(self, data: bytes | bytearray | memoryview) -> None:
+        """Append an already UTF-8 encoded chunk without decoding it.
+
+        A multi-byte character split across chunks is reassembled when the
+        buffer is read; an incomplete trailing character reads as U+FFFD.
+
+        Raises:
+            PartialBufferOverflow: As for append().
+            ValueError: If the buffer has already been marked complete.
+        """
+        self._append_encoded(data, memoryview(data).nbytes)
+
+    def _append_encoded(
+        self, data: bytes | bytearray | memoryview, chunk_bytes: int
+    ) -> None:
         with self._lock:
             if self._is_complete:
                 raise ValueError(
                     "Cannot append to a PartialResultBuffer that has been marked complete."
                 )
-            if len(self._chunks) >= MAX_CHUNKS:
+            if not self.spill_to_disk and self._chunk_count >= MAX_CHUNKS:
                 self._is_partial_overflow = True
                 raise PartialBufferOverflow(
                     f"PartialResultBuffer exceeded max chunk count ({MAX_CHUNKS}). "
                     "Possible streaming DoS.",
                     total_bytes=self._total_bytes,
                     kept_bytes=self._total_bytes,
-                    total_chunks=len(self._chunks) + 1,
-                    kept_chunks=len(self._chunks),
+                    total_chunks=self._chunk_count + 1,
+                    kept_chunks=self._chunk_count,
                     truncation_point="chunk_count",
                 )
-            chunk_bytes = len(chunk.encode("utf-8"))
-            if self._total_bytes + chunk_bytes > MAX_BYTES:
+            limit = self._byte_limit
+            if self._total_bytes + chunk_bytes > limit:
                 self._is_partial_overflow = True
                 raise PartialBufferOverflow(
-                    f"PartialResultBuffer exceeded max byte size ({MAX_BYTES} bytes). "
+                    f"PartialResultBuffer exceeded max byte size ({limit} bytes). "
                     "Possible streaming DoS.",
                     total_bytes=self._total_bytes + chunk_bytes,
                     kept_bytes=self._total_bytes,
-                    total_chunks=len(self._chunks) + 1,
-                    kept_chunks=len(self._chunks),
+                    total_chunks=self._chunk_count + 1,
+                    kept_chunks=self._chunk_count,
                     truncation_point="byte_size",
                 )
-            self._chunks.append(chunk)
+            # Fast path: the chunk fits in the tail segment.
+            used = self._tail_used
+            tail = self._segments[-1] if self._segments else None
+            if (
+                tail is not None
+                and used + chunk_bytes <= len(tail)
+                and self._memory_bytes + chunk_bytes <= MAX_BYTES
+            ):
+                tail[used : used + chunk_bytes] = data
+                self._tail_used = used + chunk_bytes
+                self._memory_bytes += chunk_bytes
+                self._chunk_count += 1
+                self._total_bytes += chunk_bytes
+                return
+            view = memoryview(data).cast("B")
+            in_memory = min(chunk_bytes, MAX_BYTES - self._memory_bytes)
+            if in_memory > 0:
+                self._write_memory_locked(view[:in_memory])
+            if in_memory < chunk_bytes:
+                # Only reachable with spill_to_disk: the byte check above
+                # caps non-spilling buffers at MAX_BYTES.
+                self._write_spill_locked(view[in_memory:])
+            self._chunk_count += 1
             self._total_bytes += chunk_bytes
 
+    def _write_memory_locked(self, view: memoryview) -> None:
+        offset = 0
+        remaining = len(view)
+        while remaining:
+            if self._segments and self._tail_used < len(self._segments[-1]):
+                segment = self._segments[-1]
+            else:
+                prev = len(self._segments[-1]) if self._segments else 0
+                size = min(_MAX_SEGMENT, max(_MIN_SEGMENT, prev * 2))
+                segment = bytearray(max(size, min(remaining, _MAX_SEGMENT)))
+                self._segments.append(segment)
+                self._tail_used = 0
+            take = min(remaining, len(segment) - self._tail_used)
+            # Same-size slice assignment never resizes the bytearray, so
+            # memoryviews handed out earlier stay valid.
+            segment[self._tail_used : self._tail_used + take] = view[
+                offset : offset + take
+            ]
+            self._tail_used += take
+            offset += take
+            remaining -= take
+        self._memory_bytes += len(view)
+
+    def _write_spill_locked(self, view: memoryview) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._spill_file.write(view)
+
     def mark_complete(self) -> None:
         """Mark the result as complete (not partial)."""
         with self._lock:
@@ -132,15 +240,59 @@ class PartialResultBuffer:
 
     def get_partial(self) -> str:
         """Get accumulated partial result as a single string."""
+        return self.get_partial_bytes().decode("utf-8", errors="replace")
+
+    def get_partial_bytes(self) -> bytes:
+        """Get the accumulated UTF-8 bytes, including any spilled to disk."""
+        with self._lock:
+            data = b"".join(self._views_locked())
+            spilled = self._read_spill_locked()
+        return data + spilled if spilled else data
+
+    def memory_views(self) -> List[memoryview]:
+        """Return read-only, zero-copy views of the in-memory bytes, in order.
+
+        The views stay valid and unchanged after later appends and after
+        clear().  Bytes spilled to disk are not included; use
+        get_partial_bytes() for the full content.
+        """
+        with self._lock:
+            return self._views_locked()
+
+    def _views_locked(self) -> List[memoryview]:
+        if not self._segments:
+            return []
+        views = [memoryview(seg).toreadonly() for seg in self._segments[:-1]]
+        views.append(memoryview(self._segments[-1])[: self._tail_used].toreadonly())
+        return views
+
+    def _read_spill_locked(self) -> bytes:
+        fh: Optional[IO[bytes]] = self._spill_file
+        if fh is None:
+            return b""
+        fh.flush()
+        fh.seek(0)
+        data = fh.read()
+        fh.seek(0, 2)
+        return data
+
+    @property
+    def byte_size(self) -> int:
+        """Total UTF-8 bytes accumulated (in memory and spilled)."""
+        with self._lock:
+            return self._total_bytes
+
+    @property
+    def spilled_bytes(self) -> int:
+        """Bytes written to the spill file (0 unless spill_to_disk is set)."""
         with self._lock:
-            chunks = list(self._chunks)
-        return "".join(chunks)
+            return self._total_bytes - self._memory_bytes
 
     @property
     def chunk_count(self) -> int:
         """Number of chunks accumulated."""
         with self._lock:
-            return len(self._chunks)
+            return self._chunk_count
 
     @property
     def is_complete(self) -> bool:
@@ -152,7 +304,7 @@ class PartialResultBuffer:
     def is_partial(self) -> bool:
         """True if chunks exist but result is incomplete."""
         with self._lock:
-            return len(self._chunks) > 0 and not self._is_complete
+            return self._chunk_count > 0 and not self._is_complete
 
     def set_metadata(self, key: str, value: Any) -> None:
         """Attach metadata (e.g., model, token count, abort reason).
@@ -171,28 +323,41 @@ class PartialResultBuffer:
             return dict(self._metadata)
 
     def clear(self) -> None:
-        """Clear buffer for reuse."""
+        """Clear buffer for reuse and delete any spill file."""
         with self._lock:
-            self._chunks.clear()
+            # New segments on reuse: views handed out earlier keep the old ones.
+            self._segments = []
+            self._tail_used = 0
+            self._chunk_count = 0
             self._metadata.clear()
             self._is_complete = False
             self._total_bytes = 0
+            self._memory_bytes = 0
             self._is_partial_overflow = False
+            fh, self._spill_file = self._spill_file, None
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                logger.debug("PartialResultBuffer: spill close failed", exc_info=True)
 
     def to_dict(self) -> Dict:
         """Serialize buffer state."""
         with self._lock:
-            chunks = list(self._chunks)
-            chunk_count = len(chunks)
+            data = b"".join(self._views_locked()) + self._read_spill_locked()
+            chunk_count = self._chunk_count
             is_complete = self._is_complete
             metadata = dict(self._metadata)
             truncated = self._is_partial_overflow
+            spilled = self._total_bytes - self._memory_bytes
         result: Dict = {
-            "partial_text": "".join(chunks),
+            "partial_text": data.decode("utf-8", errors="replace"),
             "chunk_count": chunk_count,
             "is_complete": is_complete,
             "metadata": metadata,
         }
         if truncated:
             result["truncated"] = True
+        if spilled:
+            result["spilled_bytes"] = spilled
         return result
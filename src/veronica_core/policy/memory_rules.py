@@ -7,6 +7,12 @@ The compiler validates rule parameters at compile time (fail-fast on
 unknown or invalid parameters).  The evaluator applies compiled rules
 deterministically in priority order with fail-closed semantics.
 
+The evaluator indexes rules by (action, namespace) at construction, so an
+operation is only tested against rules that can match its action and
+namespace, in their original order (first match still wins).  Results
+are memoised per operation shape -- the five fields rule matching reads:
+action, namespace, provenance, memory view and execution mode.
+
 No memory backend or storage is implemented here.
 """
 
@@ -18,10 +24,12 @@ __all__ = [
     "MemoryRuleEvaluator",
 ]
 
+import functools
 import math
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
+from veronica_core.memory.hooks import MemoryHookTraits
 from veronica_core.memory.types import (
     DegradeDirective,
     GovernanceVerdict,
@@ -69,6 +77,12 @@ _VALID_VIEWS: frozenset[str] = frozenset(v.value for v in MemoryView)
 _VALID_MODES: frozenset[str] = frozenset(m.value for m in ExecutionMode)
 _VALID_PROVENANCE: frozenset[str] = frozenset(p.value for p in MemoryProvenance)
 
+# (action, namespace, provenance, memory_view, execution_mode) as enum values;
+# view and mode are None when no MemoryPolicyContext is given.
+_OpShape = tuple[str, str, str, Optional[str], Optional[str]]
+
+_DEFAULT_CACHE_SIZE = 1024
+
 
 # ------------------------------------------------------------------
 # Compiled rule -- immutable, pre-validated
@@ -382,10 +396,30 @@ class MemoryRuleEvaluator:
         rules = compiler.compile_bundle(policy_rules)
         evaluator = MemoryRuleEvaluator(rules)
         governor.add_hook(evaluator)
+
+    Args:
+        rules: Compiled rules in evaluation order (as returned by
+            MemoryRuleCompiler.compile_bundle()).
+        cache_size: Maximum number of operation shapes whose matching rule
+            is memoised; 0 disables the cache.
     """
 
-    def __init__(self, rules: tuple[CompiledMemoryRule, ...] = ()) -> None:
-        self._rules = rules
+    memory_hook_traits = MemoryHookTraits(pure=True)
+
+    def __init__(
+        self,
+        rules: tuple[CompiledMemoryRule, ...] = (),
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+    ) -> None:
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+        self._rules = tuple(rules)
+        self._by_action, self._by_action_namespace = self._build_index(self._rules)
+        self._select = (
+            functools.lru_cache(maxsize=cache_size)(self._select_uncached)
+            if cache_size
+            else self._select_uncached
+        )
 
     @property
     def rule_count(self) -> int:
@@ -413,9 +447,9 @@ class MemoryRuleEvaluator:
                 operation=operation,
             )
 
-        for rule in self._rules:
-            if self._matches(rule, operation, context):
-                return self._apply(rule, operation, context)
+        rule = self._select(self._shape(operation, context))
+        if rule is not None:
+            return self._apply(rule, operation, context)
 
         return MemoryGovernanceDecision(
             verdict=GovernanceVerdict.DENY,
@@ -437,10 +471,73 @@ class MemoryRuleEvaluator:
     ) -> None:
         """No-op -- rule evaluator has no post-operation side effects."""
 
+    # ------------------------------------------------------------------
+    # Rule index
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _build_index(
+        rules: tuple[CompiledMemoryRule, ...],
+    ) -> tuple[
+        dict[str, tuple[CompiledMemoryRule, ...]],
+        dict[tuple[str, str], tuple[CompiledMemoryRule, ...]],
+    ]:
+        """Group *rules* into per-(action, namespace) candidate lists.
+
+        Returns ``(by_action, by_action_namespace)``.  ``by_action[a]`` holds
+        the rules matching action *a* that have no namespace filter (the
+        candidates for any namespace no rule names);
+        ``by_action_namespace[(a, ns)]`` additionally holds the rules scoped
+        to *ns*.  Every list keeps the order of *rules*.
+        """
+        by_action: dict[str, tuple[CompiledMemoryRule, ...]] = {}
+        by_action_namespace: dict[tuple[str, str], tuple[CompiledMemoryRule, ...]] = {}
+        for action in _VALID_ACTIONS:
+            applicable = [r for r in rules if not r.actions or action in r.actions]
+            namespaces = {ns for r in applicable for ns in r.namespaces}
+            unscoped: list[CompiledMemoryRule] = []
+            scoped: dict[str, list[CompiledMemoryRule]] = {ns: [] for ns in namespaces}
+            for rule in applicable:
+                if rule.namespaces:
+                    for ns in rule.namespaces:
+                        scoped[ns].append(rule)
+                else:
+                    unscoped.append(rule)
+                    for candidates in scoped.values():
+                        candidates.append(rule)
+            by_action[action] = tuple(unscoped)
+            for ns, candidates in scoped.items():
+                by_action_namespace[(action, ns)] = tuple(candidates)
+        return by_action, by_action_namespace
+
+    def _select_uncached(self, shape: _OpShape) -> CompiledMemoryRule | None:
+        """Return the first rule matching *shape*, or None."""
+        action, namespace = shape[0], shape[1]
+        candidates = self._by_action_namespace.get((action, namespace))
+        if candidates is None:
+            candidates = self._by_action.get(action, self._rules)
+        for rule in candidates:
+            if self._matches_shape(rule, shape):
+                return rule
+        return None
+
     # ------------------------------------------------------------------
     # Rule matching
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _shape(op: MemoryOperation, ctx: MemoryPolicyContext | None) -> _OpShape:
+        """Reduce *op* and *ctx* to the fields rule matching depends on."""
+        if ctx is None:
+            return (op.action.value, op.namespace, op.provenance.value, None, None)
+        return (
+            op.action.value,
+            op.namespace,
+            op.provenance.value,
+            ctx.memory_view.value,
+            ctx.execution_mode.value,
+        )
+
     @staticmethod
     def _matches(
         rule: CompiledMemoryRule,
@@ -448,33 +545,38 @@ class MemoryRuleEvaluator:
         ctx: MemoryPolicyContext | None,
     ) -> bool:
         """Return True if *rule*'s match conditions are satisfied."""
+        return MemoryRuleEvaluator._matches_shape(
+            rule, MemoryRuleEvaluator._shape(op, ctx)
+        )
+
+    @staticmethod
+    def _matches_shape(rule: CompiledMemoryRule, shape: _OpShape) -> bool:
+        """Return True if *rule*'s match conditions are satisfied by *shape*."""
+        action, namespace, provenance, view, mode = shape
         # Action filter.
-        if rule.actions and op.action.value not in rule.actions:
+        if rule.actions and action not in rule.actions:
             return False
 
         # Namespace filter.
-        if rule.namespaces and op.namespace not in rule.namespaces:
+        if rule.namespaces and namespace not in rule.namespaces:
             return False
 
         # Provenance filter.
-        if (
-            rule.allowed_provenance
-            and op.provenance.value not in rule.allowed_provenance
-        ):
+        if rule.allowed_provenance and provenance not in rule.allowed_provenance:
             return False
 
         # verified_only filter.
-        if rule.verified_only and op.provenance is not MemoryProvenance.VERIFIED:
+        if rule.verified_only and provenance != MemoryProvenance.VERIFIED.value:
             return False
 
         # View filter: fail-closed when context is absent.
         if rule.allowed_views:
-            if ctx is None or ctx.memory_view.value not in rule.allowed_views:
+            if view is None or view not in rule.allowed_views:
                 return False
 
         # Mode filter: fail-closed when context is absent.
         if rule.allowed_modes:
-            if ctx is None or ctx.execution_mode.value not in rule.allowed_modes:
+            if mode is None or mode not in rule.allowed_modes:
                 return False
 
         return True
@@ -2,14 +2,26 @@
 
 Provides pricing lookup and cost estimation for common LLM models.
 Estimates are approximate and may differ from actual billing by +/-30%.
+
+The built-in PRICING_TABLE can be replaced at runtime from a JSON or YAML
+catalog (load_pricing_catalog / set_pricing_table / watch_pricing_catalog).
+Prefix resolution walks a character trie compiled from the table, so a
+lookup costs O(len(model)) regardless of how many models are priced.
 """
 
 from __future__ import annotations
 
 import functools
+import json
 import logging
+import math
+import threading
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from veronica_core.policy.loader import WatchHandle
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +71,78 @@ PRICING_TABLE: dict[str, Pricing] = {
 _UNKNOWN_MODEL_FALLBACK = Pricing(0.030, 0.060)
 
 
+# ---------------------------------------------------------------------------
+# Prefix trie
+# ---------------------------------------------------------------------------
+
+# Marks a trie node at which a pricing key ends.  Model characters are
+# always length 1, so "" never collides with a child.
+_TERMINAL = ""
+
+
+class _PricingTrie:
+    """Character trie over pricing keys (immutable once built).
+
+    Only keys are stored; prices are read from PRICING_TABLE at lookup time
+    so that updating an existing entry in place takes effect immediately.
+    """
+
+    __slots__ = ("_root", "size")
+
+    def __init__(self, table: Mapping[str, Pricing]) -> None:
+        root: dict[str, Any] = {}
+        for key in table:
+            node = root
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[_TERMINAL] = key
+        self._root = root
+        self.size = len(table)
+
+    def prefixes(self, model: str) -> list[str]:
+        """Return the keys that are prefixes of *model*, shortest first."""
+        node = self._root
+        found = [node[_TERMINAL]] if _TERMINAL in node else []
+        for ch in model:
+            node = node.get(ch)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                found.append(node[_TERMINAL])
+        return found
+
+
+_table_lock = threading.Lock()
+_trie = _PricingTrie(PRICING_TABLE)
+
+
+def _current_trie(stale: _PricingTrie | None = None) -> _PricingTrie:
+    """Return the trie for PRICING_TABLE, recompiling it if keys were added
+    or removed by mutating the dict directly (or *stale* is still current)."""
+    global _trie
+    trie = _trie
+    if trie is stale or trie.size != len(PRICING_TABLE):
+        with _table_lock:
+            trie = _trie
+            if trie is stale or trie.size != len(PRICING_TABLE):
+                trie = _trie = _PricingTrie(dict(PRICING_TABLE))
+    return trie
+
+
+def _longest_prefix_pricing(model: str) -> Pricing | None:
+    """Pricing of the longest PRICING_TABLE key that is a prefix of *model*."""
+    trie = _current_trie()
+    keys = trie.prefixes(model)
+    if any(key not in PRICING_TABLE for key in keys):
+        # Keys were removed (and possibly others added) directly: recompile.
+        keys = _current_trie(stale=trie).prefixes(model)
+    for key in reversed(keys):
+        pricing = PRICING_TABLE.get(key)
+        if pricing is not None:
+            return pricing
+    return None
+
+
 @functools.lru_cache(maxsize=256)
 def resolve_model_pricing(model: str) -> Pricing:
     """Return pricing for *model*, falling back gracefully for unknown models.
@@ -91,11 +175,10 @@ def resolve_model_pricing(model: str) -> Pricing:
     if model in PRICING_TABLE:
         return PRICING_TABLE[model]
 
-    # 2. Prefix match -- find the longest key that is a prefix of model
-    prefix_matches = [key for key in PRICING_TABLE if model.startswith(key)]
-    if prefix_matches:
-        best = max(prefix_matches, key=len)
-        return PRICING_TABLE[best]
+    # 2. Prefix match -- the longest key that is a prefix of model
+    best = _longest_prefix_pricing(model)
+    if best is not None:
+        return best
 
     logger.warning(
         "[VERONICA_PRICING] Unknown model %r -- using fallback pricing "
@@ -133,6 +216,233 @@ def estimate_cost_usd(model: str, tokens_in: int, tokens_out: int) -> float:
     return cost
 
 
+def estimate_cost_usd_batch(
+    models: Sequence[str],
+    tokens_in: Sequence[int],
+    tokens_out: Sequence[int],
+) -> list[float]:
+    """Estimate API cost in USD for many LLM calls at once.
+
+    Equivalent to ``[estimate_cost_usd(m, i, o) for m, i, o in zip(...)]``
+    but resolves each distinct model only once, which is what bulk cost
+    attribution (replay, reporting) over a few models and many calls needs.
+
+    Args:
+        models: Model identifier per call.
+        tokens_in: Input token count per call.
+        tokens_out: Output token count per call.
+
+    Returns:
+        Estimated cost per call, in input order.
+
+    Raises:
+        ValueError: If the sequences differ in length or any token count
+            is negative.
+    """
+    n = len(models)
+    if len(tokens_in) != n or len(tokens_out) != n:
+        raise ValueError(
+            f"estimate_cost_usd_batch: length mismatch, got models={n}, "
+            f"tokens_in={len(tokens_in)}, tokens_out={len(tokens_out)}"
+        )
+    resolved: dict[str, tuple[float, float]] = {}
+    costs: list[float] = []
+    for i, (model, t_in, t_out) in enumerate(zip(models, tokens_in, tokens_out)):
+        if t_in < 0 or t_out < 0:
+            raise ValueError(
+                f"estimate_cost_usd_batch: tokens must be non-negative, "
+                f"got tokens_in={t_in}, tokens_out={t_out} at index {i}"
+            )
+        if t_in == 0 and t_out == 0:
+            costs.append(0.0)
+            continue
+        rates = resolved.get(model)
+        if rates is None:
+            pricing = resolve_model_pricing(model)
+            rates = resolved[model] = (pricing.input_per_1k, pricing.output_per_1k)
+        costs.append((t_in / 1000.0) * rates[0] + (t_out / 1000.0) * rates[1])
+    return costs
+
+
+# ---------------------------------------------------------------------------
+# Pricing catalogs
+# ---------------------------------------------------------------------------
+
+
+def _parse_catalog(data: Any, source: str) -> dict[str, Pricing]:
+    """Validate a decoded catalog and convert it to ``{model: Pricing}``.
+
+    Accepted layouts: ``{"models": {name: {...}}}`` or ``{name: {...}}``,
+    where each entry has ``input_per_1k`` and ``output_per_1k``.
+    """
+    if isinstance(data, dict) and "models" in data:
+        data = data["models"]
+    if not isinstance(data, dict):
+        raise ValueError(f"pricing catalog {source}: expected a mapping of models")
+    table: dict[str, Pricing] = {}
+    for model, entry in data.items():
+        if not isinstance(model, str) or not model:
+            raise ValueError(
+                f"pricing catalog {source}: model keys must be non-empty strings, "
+                f"got {model!r}"
+            )
+        if not isinstance(entry, dict):
+            raise ValueError(
+                f"pricing catalog {source}: entry for {model!r} must be a mapping"
+            )
+        rates = []
+        for field_name in ("input_per_1k", "output_per_1k"):
+            value = entry.get(field_name)
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not math.isfinite(value)
+                or value < 0
+            ):
+                raise ValueError(
+                    f"pricing catalog {source}: {model!r}.{field_name} must be a "
+                    f"finite non-negative number, got {value!r}"
+                )
+            rates.append(float(value))
+        table[model] = Pricing(rates[0], rates[1])
+    return table
+
+
+def load_pricing_catalog(path: str | Path) -> dict[str, Pricing]:
+    """Read and validate a pricing catalog file without installing it.
+
+    ``.yaml`` / ``.yml`` files need pyyaml; anything else is parsed as JSON.
+
+    Args:
+        path: Catalog file path.
+
+    Returns:
+        Mapping of model key to Pricing.
+
+    Raises:
+        ValueError: If the file is not a valid catalog.
+        RuntimeError: If a YAML catalog is given and pyyaml is missing.
+    """
+    file_path = Path(path)
+    content = file_path.read_text(encoding="utf-8")
+    if file_path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml  # type: ignore[import-untyped]
+        except ImportError:
+            raise RuntimeError(
+                "pyyaml is required to load YAML pricing catalogs. "
+                "Install with: pip install pyyaml  "
+                "(or: pip install veronica-core[yaml])"
+            ) from None
+        data = yaml.safe_load(content)
+    else:
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as exc:
+            raise ValueError(
+                f"pricing catalog {file_path}: invalid JSON: {exc}"
+            ) from exc
+    return _parse_catalog(data, str(file_path))
+
+
+def set_pricing_table(table: Mapping[str, Pricing]) -> None:
+    """Replace the active pricing table.
+
+    Compiles the prefix trie, updates PRICING_TABLE in place (so existing
+    references to it see the new catalog) and clears the
+    resolve_model_pricing cache.
+
+    Args:
+        table: Mapping of model key to Pricing.
+    """
+    global _trie
+    new_table = dict(table)
+    for model, pricing in new_table.items():
+        if not isinstance(model, str) or not model or not isinstance(pricing, Pricing):
+            raise ValueError(
+                f"set_pricing_table: expected non-empty str -> Pricing, "
+                f"got {model!r} -> {pricing!r}"
+            )
+    trie = _PricingTrie(new_table)
+    with _table_lock:
+        _trie = trie
+        PRICING_TABLE.clear()
+        PRICING_TABLE.update(new_table)
+    resolve_model_pricing.cache_clear()
+
+
+def reload_pricing_catalog(path: str | Path) -> int:
+    """Load *path* and install it as the active pricing table.
+
+    The current table is kept if the file is invalid.
+
+    Returns:
+        Number of models in the installed catalog.
+    """
+    table = load_pricing_catalog(path)
+    set_pricing_table(table)
+    return len(table)
+
+
+def watch_pricing_catalog(path: str | Path, poll_interval: float = 5.0) -> WatchHandle:
+    """Reload the pricing catalog at *path* whenever its mtime changes.
+
+    Polls with threading.Timer like PolicyLoader.watch(). A failed reload
+    is logged and retried on the next poll; the previous table stays active.
+
+    Args:
+        path: Catalog file to watch.
+        poll_interval: Polling interval in seconds (default 5.0).
+
+    Returns:
+        WatchHandle -- call handle.cancel() to stop watching.
+    """
+    from veronica_core.policy.loader import WatchHandle
+
+    file_path = Path(path)
+    handle = WatchHandle()
+    try:
+        last_mtime: float | None = file_path.stat().st_mtime
+    except OSError:
+        last_mtime = None
+
+    def _poll() -> None:
+        nonlocal last_mtime
+        if handle.cancelled:
+            return
+        try:
+            mtime = file_path.stat().st_mtime
+            if mtime != last_mtime:
+                try:
+                    count = reload_pricing_catalog(file_path)
+                    last_mtime = mtime
+                    logger.info(
+                        "[VERONICA_PRICING] Reloaded %d models from %s",
+                        count,
+                        file_path,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "[VERONICA_PRICING] Catalog reload failed for %s: %s",
+                        file_path,
+                        exc,
+                    )
+        except OSError:
+            pass  # File temporarily unavailable; retry next poll.
+
+        if not handle.cancelled:
+            next_timer = threading.Timer(poll_interval, _poll)
+            next_timer.daemon = True
+            handle._arm(next_timer)
+            next_timer.start()
+
+    first_timer = threading.Timer(poll_interval, _poll)
+    first_timer.daemon = True
+    handle._arm(first_timer)
+    first_timer.start()
+    return handle
+
+
 def extract_usage_from_response(response: Any) -> tuple[int, int] | None:
     """Extract (input_tokens, output_tokens) from an LLM response object.
 
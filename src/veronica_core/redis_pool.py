@@ -0,0 +1,289 @@
+"""Process-wide registry of shared Redis clients.
+
+``RedisBudgetBackend`` and ``DistributedCircuitBreaker`` historically called
+``redis.from_url()`` and a blocking ``PING`` on construction.  When an
+``ExecutionContext`` is created per request, that means a fresh connection
+pool and a network round trip per request.
+
+``RedisPoolRegistry`` keeps one client (and therefore one connection pool) per
+URL per process, plus a shared health flag per URL:
+
+- The first lookup of a URL creates the client and PINGs it once.  Later
+  lookups return the same client without any I/O.
+- When any holder observes a Redis failure it calls ``mark_unhealthy()``.
+  Every other holder sees the flag on its next call and switches to its
+  local fallback without paying for its own timeout.
+- A single daemon thread PINGs unhealthy URLs every ``reconnect_interval``
+  seconds and flips them back to healthy; holders then reconcile on their
+  next call instead of each running its own reconnect loop.
+- Clients are rebuilt after ``fork()`` (PID change) so that children never
+  share sockets with their parent.
+"""
+# nogil-audited: 2026-10-18
+# Findings:
+#   - _entries, _pid and _reconnect_thread are mutated only under self._lock.
+#   - is_healthy() reads a single bool attribute of an entry fetched from a
+#     dict; a stale read only delays failover/recovery by one call.
+
+from __future__ import annotations
+
+__all__ = [
+    "RedisPoolRegistry",
+    "get_redis_pool_registry",
+]
+
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Optional
+
+from veronica_core._utils import redact_exc as _redact_exc
+
+logger = logging.getLogger(__name__)
+
+ClientFactory = Callable[[str], Any]
+
+
+def _default_client_factory(url: str) -> Any:
+    import redis
+
+    return redis.from_url(url, decode_responses=True)
+
+
+class _PoolEntry:
+    """Shared client and health state for one URL."""
+
+    __slots__ = ("client", "healthy", "last_failure", "failure_count")
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self.healthy = True
+        self.last_failure: float = 0.0
+        self.failure_count = 0
+
+
+class RedisPoolRegistry:
+    """Share one Redis client per URL across backends and circuit breakers.
+
+    Args:
+        client_factory: Callable ``(url) -> client``.  Defaults to
+            ``redis.from_url(url, decode_responses=True)``.
+        reconnect_interval: Seconds between background PINGs of unhealthy URLs.
+
+    Example::
+
+        registry = get_redis_pool_registry()
+        backend = RedisBudgetBackend(url, chain_id, pool_registry=registry)
+        breaker = DistributedCircuitBreaker(url, "llm", pool_registry=registry)
+        # backend and breaker share one connection pool and one health flag.
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[ClientFactory] = None,
+        reconnect_interval: float = 5.0,
+    ) -> None:
+        if reconnect_interval <= 0:
+            raise ValueError(
+                f"reconnect_interval must be > 0, got {reconnect_interval}"
+            )
+        self._client_factory = client_factory or _default_client_factory
+        self._reconnect_interval = reconnect_interval
+        self._lock = threading.Lock()
+        self._entries: dict[str, _PoolEntry] = {}
+        self._pid = os.getpid()
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get_client(self, url: str) -> Any:
+        """Return the shared client for *url*, creating it on first use.
+
+        The first call for a URL PINGs the server once; a failed PING marks
+        the URL unhealthy and starts the background reconnect thread.  The
+        client is returned either way so that callers can keep a reference
+        for when Redis comes back.
+
+        Raises:
+            Exception: Whatever ``client_factory`` raises (e.g. ImportError
+                when redis-py is not installed, ValueError for a bad URL).
+        """
+        entry = self._entries.get(url)
+        if entry is not None and self._pid == os.getpid():
+            return entry.client
+        with self._lock:
+            self._check_fork_locked()
+            entry = self._entries.get(url)
+            if entry is not None:
+                return entry.client
+            client = self._client_factory(url)
+            entry = _PoolEntry(client)
+            self._entries[url] = entry
+        try:
+            client.ping()
+        except Exception as exc:
+            self.mark_unhealthy(url, exc)
+        return client
+
+    def is_healthy(self, url: str) -> bool:
+        """Return the shared health flag for *url* (False if never looked up)."""
+        entry = self._entries.get(url)
+        return entry is not None and entry.healthy
+
+    def mark_unhealthy(self, url: str, exc: Optional[BaseException] = None) -> None:
+        """Record a Redis failure for *url* and schedule a background reconnect.
+
+        Only the healthy -> unhealthy transition is logged, so an outage
+        produces one warning per URL rather than one per holder.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            entry.last_failure = time.monotonic()
+            entry.failure_count += 1
+            if not entry.healthy:
+                return
+            entry.healthy = False
+            self._ensure_reconnect_thread_locked()
+        logger.warning(
+            "RedisPoolRegistry: marking Redis unhealthy (%s); "
+            "holders switch to local fallback.",
+            _redact_exc(exc) if exc is not None else "no detail",
+        )
+
+    def mark_healthy(self, url: str) -> None:
+        """Record that *url* is reachable again."""
+        entry = self._entries.get(url)
+        if entry is not None and not entry.healthy:
+            entry.healthy = True
+            logger.info("RedisPoolRegistry: Redis reachable again.")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return ``{url: {"healthy": bool, "failure_count": int}}``.
+
+        URLs are returned as registered; redact them before logging.
+        """
+        with self._lock:
+            return {
+                url: {"healthy": e.healthy, "failure_count": e.failure_count}
+                for url, e in self._entries.items()
+            }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Stop the reconnect thread and close every shared client.
+
+        Holders keep working through their local fallback after this; the
+        next ``get_client()`` builds fresh clients.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries = {}
+            thread = self._reconnect_thread
+            self._reconnect_thread = None
+            self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self._reconnect_interval + 1.0)
+        for entry in entries:
+            try:
+                entry.client.close()
+            except Exception:  # noqa: BLE001
+                # Best-effort cleanup; the client may already be broken.
+                pass
+
+    def _after_fork_in_child(self) -> None:
+        # Threads do not survive fork() and inherited sockets belong to the
+        # parent: start over without closing anything.
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._reconnect_thread = None
+        self._stop = threading.Event()
+        self._pid = os.getpid()
+
+    def _check_fork_locked(self) -> None:
+        if self._pid != os.getpid():
+            self._entries = {}
+            self._reconnect_thread = None
+            self._stop = threading.Event()
+            self._pid = os.getpid()
+
+    # ------------------------------------------------------------------
+    # Background reconnect
+    # ------------------------------------------------------------------
+
+    def _ensure_reconnect_thread_locked(self) -> None:
+        thread = self._reconnect_thread
+        if thread is not None and thread.is_alive():
+            return
+        self._stop = threading.Event()
+        thread = threading.Thread(
+            target=self._reconnect_loop,
+            args=(self._stop,),
+            name="veronica-redis-reconnect",
+            daemon=True,
+        )
+        self._reconnect_thread = thread
+        thread.start()
+
+    def _reconnect_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(self._reconnect_interval):
+            if self._probe_unhealthy():
+                continue
+            with self._lock:
+                # Exit only if nothing became unhealthy since the probe.
+                if not any(not e.healthy for e in self._entries.values()):
+                    if self._reconnect_thread is threading.current_thread():
+                        self._reconnect_thread = None
+                    return
+
+    def _probe_unhealthy(self) -> bool:
+        """PING every unhealthy URL once.  Returns True if any is still down."""
+        with self._lock:
+            pending = [(u, e) for u, e in self._entries.items() if not e.healthy]
+        still_down = False
+        for url, entry in pending:
+            try:
+                entry.client.ping()
+            except Exception:  # noqa: BLE001
+                still_down = True
+                continue
+            self.mark_healthy(url)
+        return still_down
+
+
+_default_registry: Optional[RedisPoolRegistry] = None
+_default_registry_lock = threading.Lock()
+_fork_hooked: "weakref.WeakSet[RedisPoolRegistry]" = weakref.WeakSet()
+
+
+def _reinit_after_fork() -> None:
+    global _default_registry_lock
+    _default_registry_lock = threading.Lock()
+    for registry in list(_fork_hooked):
+        registry._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
+
+
+def get_redis_pool_registry() -> RedisPoolRegistry:
+    """Return the process-wide registry used by the ``get_default_*`` factories."""
+    global _default_registry
+    registry = _default_registry
+    if registry is not None:
+        return registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = RedisPoolRegistry()
+            _fork_hooked.add(_default_registry)
+        return _default_registry
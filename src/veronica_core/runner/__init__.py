@@ -1,5 +1,6 @@
 """VERONICA Runner -- sandboxed command execution."""
 
+from veronica_core.runner.pool import SandboxPool, SandboxPoolStats
 from veronica_core.runner.sandbox import SandboxConfig, SandboxRunner
 
-__all__ = ["SandboxConfig", "SandboxRunner"]
+__all__ = ["SandboxConfig", "SandboxPool", "SandboxPoolStats", "SandboxRunner"]
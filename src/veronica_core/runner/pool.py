@@ -0,0 +1,459 @@
+"""SandboxPool -- pre-warmed SandboxRunner workspaces.
+
+A plain SandboxRunner materialises its workspace in ``__enter__`` and
+deletes it in ``__exit__``, so the caller waits on both.  SandboxPool keeps
+up to ``size`` workspaces prepared by a background thread, hands one out on
+``acquire()`` without touching the filesystem, and disposes of returned
+workspaces on the same thread.
+
+Lifecycle of a workspace
+------------------------
+* prepared: materialised exactly as SandboxRunner would (same ignore rules,
+  workspace mode and template cache) and parked in the ready queue.
+* in use: handed out by ``acquire()``; when the ready queue is empty the
+  caller prepares one synchronously (a pool miss).
+* returned: queued for the background thread, which either recycles it
+  (``max_uses > 1`` and its strict stat fingerprint is unchanged, i.e.
+  nothing was written) or deletes it and prepares a replacement.
+
+Ready workspaces older than ``max_age_s`` are deleted rather than handed
+out, which bounds how stale a workspace can be relative to ``repo_root``.
+
+Hard-link workspaces share inodes with their template and with each other,
+so a write through one link (e.g. by a process running as root) reaches
+all of them.  ``acquire()`` re-verifies the template of a ready hard-link
+workspace before handing it out; if the template was modified, discarded
+or rebuilt, every ready workspace cloned from it is deleted instead.
+
+Thread safety
+-------------
+``_cond`` (wrapping ``_lock``) protects the queues and counters.  All
+filesystem work runs outside the lock.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import TracebackType
+
+from veronica_core.runner.sandbox import (
+    SandboxConfig,
+    SandboxRunner,
+    _materialise_repo,
+    _release_template,
+    _template_identity,
+    _template_intact,
+)
+from veronica_core.runner.workspace import tree_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Back-off after a failed background prepare, so a broken repo_root does not
+# spin the worker thread.
+_PREPARE_RETRY_S = 1.0
+
+
+@dataclass(frozen=True)
+class SandboxPoolStats:
+    """Point-in-time metrics of a SandboxPool.
+
+    Attributes:
+        size: Target number of ready workspaces.
+        ready: Workspaces prepared and waiting to be handed out.
+        in_use: Workspaces currently handed out.
+        hits: acquire() calls served from the ready queue.
+        misses: acquire() calls that had to prepare a workspace inline.
+        prepared_total: Workspaces materialised (background and inline).
+        recycled_total: Returned workspaces put back into the ready queue.
+        discarded_total: Workspaces deleted (used up, dirty, expired,
+            stale template or surplus).
+        expired_total: Ready workspaces dropped for exceeding max_age_s.
+        prepare_errors: Background prepares that raised (logged).
+        stale_total: Ready hard-link workspaces dropped because their
+            template was modified, discarded or rebuilt.
+    """
+
+    size: int
+    ready: int
+    in_use: int
+    hits: int
+    misses: int
+    prepared_total: int
+    recycled_total: int
+    discarded_total: int
+    expired_total: int
+    prepare_errors: int
+    stale_total: int
+
+
+class _Workspace:
+    __slots__ = (
+        "root",
+        "repo_dir",
+        "template",
+        "template_id",
+        "created",
+        "fingerprint",
+        "uses",
+    )
+
+    def __init__(
+        self,
+        root: str,
+        repo_dir: str,
+        template: str | None,
+        template_id: tuple[int, int] | None = None,
+    ) -> None:
+        self.root = root
+        self.repo_dir = repo_dir
+        self.template = template
+        self.template_id = template_id
+        self.created = time.monotonic()
+        self.fingerprint: str | None = None
+        self.uses = 0
+
+
+class _PooledSandboxRunner(SandboxRunner):
+    """SandboxRunner that checks its workspace out of a SandboxPool."""
+
+    def __init__(self, pool: "SandboxPool") -> None:
+        super().__init__(pool.config)
+        self._pool = pool
+        self._workspace: _Workspace | None = None
+
+    def _setup(self) -> None:
+        self._workspace = self._pool._checkout()
+        self._temp_dir = self._workspace.repo_dir
+
+    def _teardown(self) -> None:
+        workspace, self._workspace = self._workspace, None
+        self._temp_dir = None
+        if workspace is not None:
+            self._pool._checkin(workspace)
+
+
+class SandboxPool:
+    """Pool of pre-materialised SandboxRunner workspaces.
+
+    Usage::
+
+        pool = SandboxPool(SandboxConfig(repo_root=repo, executor=ex), size=4)
+        with pool.acquire() as runner:
+            rc, out, err = runner.run_in_sandbox(["pytest", "tests/"])
+        pool.close()
+
+    Args:
+        config: SandboxConfig for every workspace.  Must use
+            ``read_only=True`` and no ``ephemeral_dir``.
+        size: Number of ready workspaces the background thread maintains.
+        max_age_s: Ready workspaces older than this (since preparation) are
+            deleted instead of handed out.
+        max_uses: How many times one workspace may be handed out.  With the
+            default of 1 every returned workspace is deleted.  Higher values
+            recycle returned workspaces whose strict stat fingerprint is
+            unchanged; hard-link workspaces rarely qualify because linking
+            new workspaces changes the ctime of the shared inodes.
+
+    With ``workspace="hardlink"`` every checkout of a ready workspace costs
+    one stat walk of its template (see SandboxConfig for why hard links do
+    not isolate processes running as root).
+    """
+
+    def __init__(
+        self,
+        config: SandboxConfig,
+        size: int = 4,
+        max_age_s: float = 300.0,
+        max_uses: int = 1,
+    ) -> None:
+        if not config.read_only or config.ephemeral_dir is not None:
+            raise ValueError(
+                "SandboxPool requires read_only=True and ephemeral_dir=None"
+            )
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        if not (max_age_s > 0 and math.isfinite(max_age_s)):
+            raise ValueError(
+                f"max_age_s must be a positive finite number, got {max_age_s}"
+            )
+        if max_uses < 1:
+            raise ValueError(f"max_uses must be >= 1, got {max_uses}")
+        self._config = config
+        self._size = size
+        self._max_age_s = max_age_s
+        self._max_uses = max_uses
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._ready: deque[_Workspace] = deque()
+        self._returned: deque[tuple[_Workspace, bool]] = deque()
+        self._in_use = 0
+        self._preparing = 0
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._prepared_total = 0
+        self._recycled_total = 0
+        self._discarded_total = 0
+        self._expired_total = 0
+        self._prepare_errors = 0
+        self._stale_total = 0
+        self._thread = threading.Thread(
+            target=self._run, name="veronica-sandbox-pool", daemon=True
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def config(self) -> SandboxConfig:
+        return self._config
+
+    def acquire(self) -> SandboxRunner:
+        """Return a SandboxRunner backed by a pooled workspace.
+
+        The workspace is checked out when the runner is entered and
+        returned to the pool when it exits.
+        """
+        return _PooledSandboxRunner(self)
+
+    def stats(self) -> SandboxPoolStats:
+        """Return pool occupancy and hit/miss metrics."""
+        with self._lock:
+            return SandboxPoolStats(
+                size=self._size,
+                ready=len(self._ready),
+                in_use=self._in_use,
+                hits=self._hits,
+                misses=self._misses,
+                prepared_total=self._prepared_total,
+                recycled_total=self._recycled_total,
+                discarded_total=self._discarded_total,
+                expired_total=self._expired_total,
+                prepare_errors=self._prepare_errors,
+                stale_total=self._stale_total,
+            )
+
+    def close(self) -> None:
+        """Stop the background thread and delete every idle workspace.
+
+        Workspaces still in use are deleted when their runner exits.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._lock:
+            leftovers = list(self._ready) + [ws for ws, _ in self._returned]
+            self._ready.clear()
+            self._returned.clear()
+        for ws in leftovers:
+            self._remove(ws)
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Checkout / checkin (called by _PooledSandboxRunner)
+    # ------------------------------------------------------------------
+
+    def _checkout(self) -> _Workspace:
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("SandboxPool is closed")
+                self._expire_locked(time.monotonic())
+                workspace = self._ready.popleft() if self._ready else None
+                if workspace is None or workspace.template_id is None:
+                    break
+            # Hard-link workspace: check its template outside the lock.
+            if _template_intact(
+                self._config, workspace.template, workspace.template_id
+            ):
+                break
+            self._drop_template(workspace)
+        with self._cond:
+            # close() may have run while the template was being verified.
+            closed = self._closed
+            if not closed:
+                if workspace is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                self._in_use += 1
+                # Wake the worker to refill the slot just taken.
+                self._cond.notify()
+        if closed:
+            if workspace is not None:
+                self._remove(workspace)
+            raise RuntimeError("SandboxPool is closed")
+        if workspace is None:
+            try:
+                workspace = self._prepare()
+            except BaseException:
+                with self._lock:
+                    self._in_use -= 1
+                raise
+        workspace.uses += 1
+        return workspace
+
+    def _checkin(self, workspace: _Workspace) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if not self._closed:
+                self._returned.append((workspace, True))
+                self._cond.notify()
+                return
+        self._remove(workspace)
+
+    # ------------------------------------------------------------------
+    # Workspace lifecycle (no lock held)
+    # ------------------------------------------------------------------
+
+    def _prepare(self) -> _Workspace:
+        root = tempfile.mkdtemp(prefix="veronica_sandbox_")
+        repo_dir = os.path.join(root, "_repo")
+        try:
+            template = _materialise_repo(self._config, repo_dir)
+        except BaseException:
+            shutil.rmtree(root, ignore_errors=True)
+            raise
+        template_id = None
+        if template is not None:
+            template_id = _template_identity(self._config, template)
+        workspace = _Workspace(root, repo_dir, template, template_id)
+        if self._max_uses > 1:
+            workspace.fingerprint = tree_fingerprint(repo_dir, strict=True)
+        with self._lock:
+            self._prepared_total += 1
+        return workspace
+
+    def _remove(self, workspace: _Workspace) -> None:
+        try:
+            if workspace.template is not None:
+                _release_template(self._config, workspace.template)
+        except Exception:  # noqa: BLE001
+            logger.debug("SandboxPool: template verification failed", exc_info=True)
+        shutil.rmtree(workspace.root, ignore_errors=True)
+        with self._lock:
+            self._discarded_total += 1
+
+    def _drop_template(self, workspace: _Workspace) -> None:
+        """Dispose of *workspace* and every ready workspace of its template build."""
+        with self._cond:
+            stale = [workspace]
+            fresh: deque[_Workspace] = deque()
+            for ws in self._ready:
+                if (ws.template, ws.template_id) == (
+                    workspace.template,
+                    workspace.template_id,
+                ):
+                    stale.append(ws)
+                else:
+                    fresh.append(ws)
+            self._ready = fresh
+            self._stale_total += len(stale)
+            if not self._closed:
+                self._returned.extend((ws, False) for ws in stale)
+                self._cond.notify()
+                return
+        for ws in stale:
+            self._remove(ws)
+
+    def _reusable(self, workspace: _Workspace) -> bool:
+        if workspace.uses >= self._max_uses or workspace.fingerprint is None:
+            return False
+        if time.monotonic() - workspace.created >= self._max_age_s:
+            return False
+        try:
+            current = tree_fingerprint(workspace.repo_dir, strict=True)
+        except OSError:
+            return False
+        return current == workspace.fingerprint
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def _expire_locked(self, now: float) -> None:
+        """Move expired ready workspaces to the disposal queue."""
+        # Recycled workspaces re-enter at the back, so the queue is not
+        # ordered by age; it is at most ``size`` long.
+        if not any(now - ws.created >= self._max_age_s for ws in self._ready):
+            return
+        fresh: deque[_Workspace] = deque()
+        for ws in self._ready:
+            if now - ws.created >= self._max_age_s:
+                self._returned.append((ws, False))
+                self._expired_total += 1
+            else:
+                fresh.append(ws)
+        self._ready = fresh
+
+    def _next_expiry_locked(self, now: float) -> float | None:
+        if not self._ready:
+            return None
+        oldest = min(ws.created for ws in self._ready)
+        return max(0.0, oldest + self._max_age_s - now)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    self._expire_locked(now)
+                    if self._returned:
+                        workspace, recyclable = self._returned.popleft()
+                        break
+                    if len(self._ready) + self._preparing < self._size:
+                        workspace, recyclable = None, False
+                        self._preparing += 1
+                        break
+                    self._cond.wait(self._next_expiry_locked(now))
+
+            if workspace is not None:
+                if recyclable and self._reusable(workspace):
+                    with self._lock:
+                        if not self._closed and len(self._ready) < self._size:
+                            self._ready.append(workspace)
+                            self._recycled_total += 1
+                            continue
+                self._remove(workspace)
+                continue
+
+            try:
+                prepared = self._prepare()
+            except Exception:  # noqa: BLE001
+                logger.warning("SandboxPool: background prepare failed", exc_info=True)
+                with self._cond:
+                    self._preparing -= 1
+                    self._prepare_errors += 1
+                    self._cond.wait(_PREPARE_RETRY_S)
+                continue
+            with self._lock:
+                self._preparing -= 1
+                if not self._closed:
+                    self._ready.append(prepared)
+                    continue
+            self._remove(prepared)
@@ -14,6 +14,13 @@ from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING
 
+from veronica_core.runner.workspace import (
+    WORKSPACE_MODES,
+    WorkspaceMode,
+    clone_tree,
+    get_template_cache,
+)
+
 if TYPE_CHECKING:
     from veronica_core.adapters.exec import SecureExecutor
 
@@ -35,12 +42,47 @@ class SandboxConfig:
             still cleaned up on exit unless it was pre-existing.
         read_only: When True (default), the original repo is copied into a
             fresh temp directory so writes cannot affect it.
+        workspace: How the read-only copy is materialised. ``"reflink"``
+            (default) clones files copy-on-write where the filesystem
+            supports FICLONE and falls back to a plain copy otherwise;
+            ``"copy"`` always copies bytes; ``"hardlink"`` links files from a
+            read-only template snapshot and requires *template_cache_dir*.
+            Hard-linked files cannot be modified in place; replace them
+            (write a new file and rename) instead.  This is not isolation:
+            a process running as root (or one that chmods the file first)
+            writes through the link into the template and every other
+            workspace cloned from it.  The template is re-verified and
+            rebuilt when that is detected, but use ``"reflink"`` or
+            ``"copy"`` for commands that run as root.
+        template_cache_dir: Directory for filtered template snapshots of
+            *repo_root*, keyed by a stat fingerprint of the tree. When set,
+            sandboxes are cloned from the cached snapshot instead of being
+            filtered and copied from *repo_root* each time. Should live on
+            the same filesystem as the sandboxes.
     """
 
     repo_root: str
     executor: "SecureExecutor"
     ephemeral_dir: str | None = None
     read_only: bool = True
+    workspace: WorkspaceMode = "reflink"
+    template_cache_dir: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.workspace not in WORKSPACE_MODES:
+            raise ValueError(
+                f"workspace must be one of {sorted(WORKSPACE_MODES)}, "
+                f"got {self.workspace!r}"
+            )
+        if self.workspace == "hardlink" and self.template_cache_dir is None:
+            # Never hard-link into repo_root: a write through the link would
+            # modify the original repository.
+            raise ValueError("workspace='hardlink' requires template_cache_dir")
+        if self.template_cache_dir is not None:
+            repo = os.path.realpath(self.repo_root)
+            cache = os.path.realpath(self.template_cache_dir)
+            if os.path.commonpath([repo, cache]) == repo:
+                raise ValueError("template_cache_dir must not be inside repo_root")
 
 
 # ---------------------------------------------------------------------------
@@ -137,6 +179,62 @@ def _sandbox_ignore(directory: str, names: list[str]) -> set[str]:
     return ignored
 
 
+# ---------------------------------------------------------------------------
+# Workspace helpers (shared with SandboxPool)
+# ---------------------------------------------------------------------------
+
+
+def _materialise_repo(config: SandboxConfig, dest: str) -> str | None:
+    """Create the filtered repo view at *dest* (which must not exist).
+
+    Returns the template directory it was cloned from, or None when it was
+    cloned straight from ``repo_root``.
+    """
+    if config.template_cache_dir is None:
+        clone_tree(config.repo_root, dest, config.workspace, _sandbox_ignore)
+        return None
+    cache = get_template_cache(config.template_cache_dir)
+    template = cache.get(
+        config.repo_root,
+        _sandbox_ignore,
+        read_only=config.workspace == "hardlink",
+    )
+    cache.materialise(template, dest, config.workspace)
+    return template
+
+
+def _template_identity(
+    config: SandboxConfig, template: str
+) -> tuple[int, int] | None:
+    """Identity of the *template* build a hard-link workspace links into."""
+    if config.workspace != "hardlink" or config.template_cache_dir is None:
+        return None
+    return get_template_cache(config.template_cache_dir).identity(template)
+
+
+def _template_intact(
+    config: SandboxConfig, template: str, identity: tuple[int, int] | None
+) -> bool:
+    """Return True if a hard-link workspace cloned from *template* is clean.
+
+    False when the template was written through (and is discarded here) or
+    has since been discarded or rebuilt: the workspace shares inodes with
+    the modified build.  Always True for other workspace modes.
+    """
+    if config.workspace != "hardlink" or config.template_cache_dir is None:
+        return True
+    cache = get_template_cache(config.template_cache_dir)
+    return cache.identity(template) == identity and cache.verify(template)
+
+
+def _release_template(config: SandboxConfig, template: str) -> None:
+    """Called when a workspace cloned from *template* is removed."""
+    if config.workspace == "hardlink" and config.template_cache_dir is not None:
+        # A process that chmod'ed a linked file may have written through to
+        # the template; drop it so the next workspace rebuilds it.
+        get_template_cache(config.template_cache_dir).verify(template)
+
+
 # ---------------------------------------------------------------------------
 # SandboxRunner
 # ---------------------------------------------------------------------------
@@ -169,6 +267,7 @@ class SandboxRunner:
         self._config = config
         self._temp_dir: str | None = None
         self._owns_temp_dir: bool = False
+        self._template: str | None = None
 
     # ------------------------------------------------------------------
     # Context manager
@@ -253,18 +352,16 @@ class SandboxRunner:
             # deleted-source files to persist in the sandbox (data contamination).
             if dest.exists():
                 shutil.rmtree(dest)
-            shutil.copytree(
-                self._config.repo_root,
-                str(dest),
-                dirs_exist_ok=False,
-                ignore=_sandbox_ignore,
-            )
+            self._template = _materialise_repo(self._config, str(dest))
             self._temp_dir = str(dest)
 
     def _teardown(self) -> None:
         """Remove the ephemeral directory."""
         if self._temp_dir is None:
             return
+        if self._template is not None:
+            template, self._template = self._template, None
+            _release_template(self._config, template)
         if not self._owns_temp_dir:
             self._temp_dir = None
             return
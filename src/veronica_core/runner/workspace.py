@@ -0,0 +1,391 @@
+"""Workspace providers for SandboxRunner.
+
+A read-only sandbox needs a private, writable view of ``repo_root``.  The
+original implementation copied every byte with ``shutil.copytree``; on large
+repositories that dominates sandbox setup.  This module provides cheaper
+ways to materialise the same tree (after ``_sandbox_ignore`` filtering):
+
+``copy``
+    Byte-for-byte ``shutil.copy2`` (the previous behaviour).
+
+``reflink``
+    Per-file copy-on-write clones via the Linux ``FICLONE`` ioctl (btrfs,
+    XFS with reflink, bcachefs, ...).  Only metadata is written; blocks are
+    shared until either side writes.  Falls back to ``copy`` transparently,
+    and stops trying once a filesystem pair is known not to support it.
+
+``hardlink``
+    Hard links into a cached template snapshot (never into ``repo_root``
+    itself).  Template files are made read-only, so in-place writes fail
+    and tools that write by replacing the file (editors, git, pip, most
+    build tools) get a private copy on first write.  Processes running as
+    root, or that chmod the file first, can still write through the link:
+    that changes the template, never the repository, and the template is
+    discarded at teardown when its fingerprint no longer matches.
+
+``TemplateCache`` keeps filtered snapshots of a repository keyed by a stat
+fingerprint (relative path, size, mtime_ns and mode of every kept entry).
+Computing the fingerprint is a metadata walk; a sandbox is then cloned from
+the snapshot instead of being re-filtered and re-copied from ``repo_root``.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Literal
+
+WorkspaceMode = Literal["copy", "reflink", "hardlink"]
+
+WORKSPACE_MODES: frozenset[str] = frozenset({"copy", "reflink", "hardlink"})
+
+IgnoreFn = Callable[[str, list[str]], set[str]]
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# errno values meaning "this filesystem pair cannot clone".
+_NO_REFLINK_ERRNOS = frozenset(
+    {
+        errno.EOPNOTSUPP,
+        errno.ENOTTY,
+        errno.EXDEV,
+        errno.EINVAL,
+        getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    }
+)
+
+_FINGERPRINT_FILE = ".veronica_template"
+
+
+# ---------------------------------------------------------------------------
+# File cloning
+# ---------------------------------------------------------------------------
+
+
+class _Cloner:
+    """copy_function for shutil.copytree implementing one workspace mode.
+
+    Remembers (source device, destination device) pairs that rejected a
+    reflink or hard link so later files skip straight to copy2.
+    """
+
+    def __init__(self, mode: WorkspaceMode) -> None:
+        self._mode = mode
+        self._unsupported: set[tuple[int, int]] = set()
+        self.cloned = 0
+        self.copied = 0
+
+    def __call__(self, src: str, dst: str) -> str:
+        if self._mode != "copy":
+            src_dev = os.stat(src).st_dev
+            dst_dev = os.stat(os.path.dirname(dst)).st_dev
+            pair = (src_dev, dst_dev)
+            if pair not in self._unsupported:
+                try:
+                    if self._mode == "hardlink":
+                        os.link(src, dst)
+                    else:
+                        _reflink(src, dst)
+                    self.cloned += 1
+                    return dst
+                except OSError as exc:
+                    if exc.errno not in _NO_REFLINK_ERRNOS and exc.errno != errno.EPERM:
+                        raise
+                    self._unsupported.add(pair)
+        shutil.copy2(src, dst)
+        self.copied += 1
+        return dst
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone *src* to *dst* with FICLONE, preserving mode and times."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported") from None
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                fdst.close()
+                os.unlink(dst)
+                raise
+    shutil.copystat(src, dst)
+
+
+def reflink_supported(directory: str) -> bool:
+    """Return True if files in *directory* can be cloned with FICLONE."""
+    probe = os.path.join(directory, f".veronica_reflink_{uuid.uuid4().hex}")
+    try:
+        with open(probe, "wb") as fh:
+            fh.write(b"x")
+        _reflink(probe, probe + ".clone")
+        os.unlink(probe + ".clone")
+        return True
+    except OSError:
+        return False
+    finally:
+        try:
+            os.unlink(probe)
+        except OSError:
+            pass
+
+
+def clone_tree(
+    src: str,
+    dst: str,
+    mode: WorkspaceMode,
+    ignore: IgnoreFn | None = None,
+) -> _Cloner:
+    """Materialise *src* at *dst* (which must not exist) using *mode*.
+
+    Returns the cloner so callers can inspect how many files were cloned
+    versus copied.
+    """
+    cloner = _Cloner(mode)
+    shutil.copytree(
+        src,
+        dst,
+        ignore=ignore,
+        copy_function=cloner,
+        dirs_exist_ok=False,
+    )
+    return cloner
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint
+# ---------------------------------------------------------------------------
+
+
+def tree_fingerprint(
+    root: str,
+    ignore: IgnoreFn | None = None,
+    *,
+    strict: bool = False,
+) -> str:
+    """Stat-based fingerprint of the tree under *root*.
+
+    Hashes (relative path, type, size, mtime_ns, mode) of every entry kept
+    by *ignore*, in sorted order.  No file contents are read.  *strict*
+    also hashes inode and ctime_ns of every entry (directories included);
+    ctime cannot be set from user space, so a strict fingerprint detects
+    writes that restored the original mtime.
+    """
+    digest = hashlib.sha256()
+    root = os.path.abspath(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        names = sorted(dirnames + filenames)
+        skipped = ignore(dirpath, names) if ignore is not None else set()
+        dirnames[:] = sorted(d for d in dirnames if d not in skipped)
+        rel_dir = os.path.relpath(dirpath, root)
+        if strict:
+            st = os.lstat(dirpath)
+            entry = f"{rel_dir}\0{st.st_ino}\0{st.st_ctime_ns}\n"
+            digest.update(entry.encode("utf-8", "surrogateescape"))
+        for name in names:
+            if name in skipped or (dirpath == root and name == _FINGERPRINT_FILE):
+                continue
+            st = os.lstat(os.path.join(dirpath, name))
+            kind = "d" if stat.S_ISDIR(st.st_mode) else "f"
+            size = 0 if kind == "d" else st.st_size
+            mtime = 0 if kind == "d" else st.st_mtime_ns
+            entry = f"{rel_dir}/{name}\0{kind}\0{size}\0{mtime}\0{st.st_mode:o}"
+            if strict:
+                entry += f"\0{st.st_ino}\0{st.st_ctime_ns}"
+            digest.update((entry + "\n").encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Template cache
+# ---------------------------------------------------------------------------
+
+
+def _make_read_only(root: str) -> None:
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            mode = stat.S_IMODE(os.lstat(path).st_mode)
+            os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def _make_writable(root: str) -> None:
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                os.chmod(path, stat.S_IMODE(os.lstat(path).st_mode) | stat.S_IWUSR)
+            except OSError:
+                pass
+
+
+def _remove_tree(path: str) -> None:
+    # Read-only template files must be made writable first on Windows.
+    _make_writable(path)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _skip_marker(directory: str, names: list[str]) -> set[str]:
+    return {_FINGERPRINT_FILE} if _FINGERPRINT_FILE in names else set()
+
+
+class TemplateCache:
+    """Filtered repository snapshots keyed by ``tree_fingerprint``.
+
+    Templates live in ``cache_dir/<fingerprint>``; each stores the
+    fingerprint of its own contents in ``.veronica_template`` so that a
+    template modified through a hard link can be detected and dropped.
+    Builds are atomic (copy to a temp name, then rename), so concurrent
+    processes sharing *cache_dir* never see a partial template.
+
+    Args:
+        cache_dir: Directory holding the templates.  Put it on the same
+            filesystem as the sandboxes so reflinks and hard links work.
+        max_templates: Templates kept per cache; older ones are pruned
+            after a new template is built.
+    """
+
+    def __init__(self, cache_dir: str, max_templates: int = 2) -> None:
+        if max_templates < 1:
+            raise ValueError(f"max_templates must be >= 1, got {max_templates}")
+        self._cache_dir = os.path.abspath(cache_dir)
+        self._max_templates = max_templates
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def get(
+        self,
+        repo_root: str,
+        ignore: IgnoreFn | None = None,
+        read_only: bool = False,
+    ) -> str:
+        """Return the template directory for the current state of *repo_root*.
+
+        Builds it (with ``reflink`` cloning where possible) when no template
+        matches the repository fingerprint.  *read_only* templates have
+        their write bits cleared (used for hard-link workspaces).
+        """
+        key = tree_fingerprint(repo_root, ignore)
+        if read_only:
+            key += "-ro"
+        path = os.path.join(self._cache_dir, key)
+        if os.path.isfile(os.path.join(path, _FINGERPRINT_FILE)):
+            return path
+        with self._lock:
+            if os.path.isfile(os.path.join(path, _FINGERPRINT_FILE)):
+                return path
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp = os.path.join(self._cache_dir, f".build-{uuid.uuid4().hex}")
+            try:
+                clone_tree(repo_root, tmp, "reflink", ignore)
+                if read_only:
+                    _make_read_only(tmp)
+                Path(tmp, _FINGERPRINT_FILE).write_text(
+                    tree_fingerprint(tmp), encoding="utf-8"
+                )
+                try:
+                    os.rename(tmp, path)
+                except OSError:
+                    # Another process published the same template first.
+                    if not os.path.isfile(os.path.join(path, _FINGERPRINT_FILE)):
+                        raise
+            finally:
+                if os.path.exists(tmp):
+                    _remove_tree(tmp)
+            self._prune_locked(keep=path)
+        return path
+
+    def materialise(
+        self,
+        template: str,
+        dst: str,
+        mode: WorkspaceMode,
+    ) -> _Cloner:
+        """Clone *template* (minus its fingerprint marker) to *dst*."""
+        return clone_tree(template, dst, mode, ignore=_skip_marker)
+
+    def identity(self, template: str) -> tuple[int, int] | None:
+        """Return an identifier of this build of *template*, or None if gone.
+
+        A template rebuilt at the same path (same repository fingerprint)
+        gets a new identity, so hard-link workspaces cloned from the old
+        build can be told apart from ones cloned from the new build.
+        """
+        try:
+            st = os.stat(os.path.join(template, _FINGERPRINT_FILE))
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns)
+
+    def verify(self, template: str) -> bool:
+        """Return True if *template* still matches its recorded fingerprint.
+
+        A mismatching template is removed so the next ``get()`` rebuilds it.
+        """
+        marker = os.path.join(template, _FINGERPRINT_FILE)
+        try:
+            expected = Path(marker).read_text(encoding="utf-8")
+        except OSError:
+            return False
+        if tree_fingerprint(template) == expected:
+            return True
+        self.discard(template)
+        return False
+
+    def discard(self, template: str) -> None:
+        """Remove *template* from the cache."""
+        trash = os.path.join(self._cache_dir, f".trash-{uuid.uuid4().hex}")
+        try:
+            os.rename(template, trash)
+        except OSError:
+            return
+        _remove_tree(trash)
+
+    def _prune_locked(self, keep: str) -> None:
+        try:
+            entries = [
+                e
+                for e in os.scandir(self._cache_dir)
+                if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+            ]
+        except OSError:
+            return
+        entries.sort(key=lambda e: e.stat(follow_symlinks=False).st_mtime, reverse=True)
+        kept = 1
+        for entry in entries:
+            if entry.path == keep:
+                continue
+            if kept < self._max_templates:
+                kept += 1
+                continue
+            self.discard(entry.path)
+
+
+_caches: dict[str, TemplateCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_template_cache(cache_dir: str) -> TemplateCache:
+    """Return the process-wide TemplateCache for *cache_dir*.
+
+    Sharing one instance per directory lets concurrent sandboxes wait for a
+    single template build instead of each building their own.
+    """
+    key = os.path.abspath(cache_dir)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = TemplateCache(key)
+        return cache
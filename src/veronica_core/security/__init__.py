@@ -8,7 +8,7 @@ from veronica_core.security.key_providers import (
     KeyProvider,
     VaultKeyProvider,
 )
-from veronica_core.security.masking import SecretMasker
+from veronica_core.security.masking import SecretMasker, StreamingMasker
 from veronica_core.security.policy_engine import (
     ExecPolicyContext,
     ExecPolicyDecision,
@@ -29,6 +29,7 @@ __all__ = [
     "KeyProvider",
     "VaultKeyProvider",
     "SecretMasker",
+    "StreamingMasker",
     "ExecPolicyContext",
     "ExecPolicyDecision",
     "PolicyContext",
@@ -244,3 +244,81 @@ class SecretMasker:
     def mask_args(self, args: list[str]) -> list[str]:
         """Mask secrets in each element of a list of strings."""
         return [self.mask(arg) for arg in args]
+
+
+class StreamingMasker:
+    """Chunk-aware wrapper around SecretMasker for streamed text.
+
+    ``feed()`` returns the masked prefix of everything fed so far that can
+    no longer be affected by data still to come; ``flush()`` returns the
+    masked remainder.  Concatenating every returned piece gives the same
+    redactions as masking the whole text at once, except that a secret
+    longer than *max_pending* characters may be cut at a forced flush.
+
+    A cut is placed at a line boundary at least *overlap* characters before
+    the end of the pending buffer and moved back to the start of any
+    pattern match that crosses it, so a secret split across chunks is never
+    emitted half-masked.
+
+    Args:
+        masker: SecretMasker to apply (a new one by default).
+        overlap: Characters held back for matches spanning chunk boundaries.
+        max_pending: Buffer size at which everything pending is flushed even
+            if a match crosses the end; bounds memory for pathological input.
+    """
+
+    def __init__(
+        self,
+        masker: SecretMasker | None = None,
+        overlap: int = 4096,
+        max_pending: int = 1 << 20,
+    ) -> None:
+        if overlap < 1:
+            raise ValueError(f"overlap must be >= 1, got {overlap}")
+        if max_pending <= overlap:
+            raise ValueError(
+                f"max_pending must be > overlap, got {max_pending} <= {overlap}"
+            )
+        self._masker = masker if masker is not None else SecretMasker()
+        self._patterns = [pattern for _, pattern in _PATTERNS]
+        self._overlap = overlap
+        self._max_pending = max_pending
+        self._pending = ""
+
+    def feed(self, text: str) -> str:
+        """Add *text* and return the masked output that is now final."""
+        buf = self._pending + text
+        if len(buf) >= self._max_pending:
+            self._pending = ""
+            return self._masker.mask(buf)
+        limit = len(buf) - self._overlap
+        if limit <= 0:
+            self._pending = buf
+            return ""
+        cut = buf.rfind("\n", 0, limit) + 1 or limit
+        cut = self._safe_cut(buf, cut)
+        self._pending = buf[cut:]
+        return self._masker.mask(buf[:cut]) if cut else ""
+
+    def flush(self) -> str:
+        """Return the masked remainder and reset the buffer."""
+        buf, self._pending = self._pending, ""
+        return self._masker.mask(buf) if buf else ""
+
+    def _safe_cut(self, buf: str, cut: int) -> int:
+        """Move *cut* back until no pattern match crosses it."""
+        # Scan from the start of the buffer: it begins at a previous safe
+        # cut, and a long match may start well before ``cut - overlap``.
+        while cut > 0:
+            moved = False
+            for pattern in self._patterns:
+                for m in pattern.finditer(buf):
+                    if m.start() >= cut:
+                        break
+                    if m.end() > cut:
+                        cut = m.start()
+                        moved = True
+                        break
+            if not moved:
+                return cut
+        return 0
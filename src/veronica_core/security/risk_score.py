@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import math
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from veronica_core.shield.types import Decision, ToolCallContext
 
@@ -34,64 +36,223 @@ class RiskScoreConfig:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class _Entry:
-    """A single decision record."""
-
-    delta: int
-    verdict: str
-
-
 class RiskScoreAccumulator:
     """Thread-safe accumulator of risk score deltas.
 
     When ``current_score`` reaches or exceeds ``config.deny_threshold``,
     ``is_safe_mode`` becomes True.  Call ``reset()`` to clear the state.
+
+    The last ``window_size`` deltas live in a fixed-size ring buffer with a
+    running sum, so ``add()``, ``current_score`` and ``is_safe_mode`` are
+    all O(1).
     """
 
     def __init__(self, config: RiskScoreConfig | None = None) -> None:
         self._config = config or RiskScoreConfig()
+        if self._config.window_size < 1:
+            raise ValueError(
+                f"window_size must be >= 1, got {self._config.window_size}"
+            )
         self._lock = threading.Lock()
-        self._window: list[_Entry] = []
+        self._ring: list[int] = [0] * self._config.window_size
+        self._next = 0  # slot the next delta is written to
+        self._count = 0  # filled slots, <= window_size
+        self._score = 0  # sum of the filled slots
 
     def add(self, delta: int, verdict: str) -> None:
         """Record a decision delta.  Maintains a sliding window of size ``window_size``."""
         with self._lock:
-            self._window.append(_Entry(delta=delta, verdict=verdict))
-            # Trim to window_size
-            max_size = self._config.window_size
-            if len(self._window) > max_size:
-                self._window = self._window[-max_size:]
-            # Optionally reset on ALLOW
             if self._config.reset_on_allow and verdict == "ALLOW":
-                self._window.clear()
-
-    def _score_locked(self) -> int:
-        """Return current score; MUST be called with self._lock held."""
-        return sum(e.delta for e in self._window)
+                self._clear_locked()
+                return
+            ring = self._ring
+            slot = self._next
+            if self._count == len(ring):
+                # Window full: the slot being overwritten holds the oldest delta.
+                self._score -= ring[slot]
+            else:
+                self._count += 1
+            ring[slot] = delta
+            self._score += delta
+            self._next = (slot + 1) % len(ring)
+
+    def _clear_locked(self) -> None:
+        if self._count:
+            self._ring = [0] * len(self._ring)
+        self._next = 0
+        self._count = 0
+        self._score = 0
 
     @property
     def current_score(self) -> int:
         """Sum of risk_score_delta values in the current window."""
         with self._lock:
-            return self._score_locked()
+            return self._score
 
     @property
     def is_safe_mode(self) -> bool:
         """Return True when cumulative score has reached the deny threshold.
 
-        Both the score computation and the threshold comparison are performed
-        under a single lock acquisition to prevent a TOCTOU race where another
+        Both the score read and the threshold comparison are performed under
+        a single lock acquisition to prevent a TOCTOU race where another
         thread adds a high-delta entry between the score read and the
         comparison.
         """
         with self._lock:
-            return self._score_locked() >= self._config.deny_threshold
+            return self._score >= self._config.deny_threshold
 
     def reset(self) -> None:
         """Clear all accumulated entries and reset score to zero."""
         with self._lock:
-            self._window.clear()
+            self._clear_locked()
+
+
+# ---------------------------------------------------------------------------
+# RiskScoreMap
+# ---------------------------------------------------------------------------
+
+
+class _RiskShard:
+    __slots__ = ("lock", "accumulators", "last_used", "last_sweep")
+
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        self.accumulators: dict[str, RiskScoreAccumulator] = {}
+        self.last_used: dict[str, float] = {}
+        self.last_sweep = now
+
+
+class RiskScoreMap:
+    """Per-key (agent, tenant, session...) RiskScoreAccumulators.
+
+    Keys are spread over ``shards`` independently locked dicts, so recording
+    a denial for one agent never waits on another agent's shard, and the
+    accumulator lock itself is per key.
+
+    An accumulator is created on the first ``add()`` for its key.  Keys not
+    used for ``idle_ttl_s`` seconds are evicted (a shard sweeps itself on
+    ``add()`` at most every ``idle_ttl_s / 2``; ``evict_idle()`` sweeps all
+    shards).  Keys in SAFE_MODE are never evicted: leaving SAFE_MODE always
+    requires an explicit ``reset()``.
+
+    Args:
+        config: RiskScoreConfig shared by every accumulator.
+        shards: Number of independently locked shards.
+        idle_ttl_s: Idle time after which a key's score is forgotten.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        config: RiskScoreConfig | None = None,
+        *,
+        shards: int = 16,
+        idle_ttl_s: float = 3600.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        if not (idle_ttl_s > 0 and math.isfinite(idle_ttl_s)):
+            raise ValueError(
+                f"idle_ttl_s must be a positive finite number, got {idle_ttl_s}"
+            )
+        self._config = config or RiskScoreConfig()
+        # Validate window_size once here rather than on the first add().
+        RiskScoreAccumulator(self._config)
+        self._idle_ttl_s = idle_ttl_s
+        self._clock = clock or time.monotonic
+        now = self._clock()
+        self._shards = [_RiskShard(now) for _ in range(shards)]
+
+    def _shard(self, key: str) -> _RiskShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def add(self, key: str, delta: int, verdict: str) -> None:
+        """Record a decision delta for *key*."""
+        shard = self._shard(key)
+        now = self._clock()
+        with shard.lock:
+            acc = shard.accumulators.get(key)
+            if acc is None:
+                acc = shard.accumulators[key] = RiskScoreAccumulator(self._config)
+            shard.last_used[key] = now
+            # Under the shard lock so a concurrent reset() cannot drop it.
+            acc.add(delta, verdict)
+            if now - shard.last_sweep >= self._idle_ttl_s / 2:
+                self._sweep_locked(shard, now)
+
+    def get(self, key: str) -> RiskScoreAccumulator | None:
+        """Return the accumulator for *key*, or None if it has none."""
+        # Lock-free: dict.get is atomic and every writer holds the shard lock.
+        return self._shards[hash(key) % len(self._shards)].accumulators.get(key)
+
+    def current_score(self, key: str) -> int:
+        """Score of *key*'s window (0 for unknown keys)."""
+        acc = self.get(key)
+        return acc.current_score if acc is not None else 0
+
+    def is_safe_mode(self, key: str) -> bool:
+        """Return True when *key* has reached the deny threshold."""
+        acc = self.get(key)
+        return acc is not None and acc.is_safe_mode
+
+    def reset(self, key: str) -> None:
+        """Forget *key*'s score, taking it out of SAFE_MODE."""
+        shard = self._shard(key)
+        with shard.lock:
+            acc = shard.accumulators.pop(key, None)
+            shard.last_used.pop(key, None)
+        if acc is not None:
+            # Callers may still hold the accumulator from get().
+            acc.reset()
+
+    def reset_all(self) -> None:
+        """Forget every key's score."""
+        for shard in self._shards:
+            with shard.lock:
+                accumulators = list(shard.accumulators.values())
+                shard.accumulators.clear()
+                shard.last_used.clear()
+            for acc in accumulators:
+                acc.reset()
+
+    def safe_mode_keys(self) -> list[str]:
+        """Return the keys currently in SAFE_MODE."""
+        keys: list[str] = []
+        for shard in self._shards:
+            with shard.lock:
+                items = list(shard.accumulators.items())
+            keys.extend(key for key, acc in items if acc.is_safe_mode)
+        return keys
+
+    def evict_idle(self) -> int:
+        """Evict idle keys from every shard; return how many were evicted."""
+        now = self._clock()
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                evicted += self._sweep_locked(shard, now)
+        return evicted
+
+    def _sweep_locked(self, shard: _RiskShard, now: float) -> int:
+        shard.last_sweep = now
+        cutoff = now - self._idle_ttl_s
+        idle = [
+            key
+            for key, used in shard.last_used.items()
+            if used <= cutoff and not shard.accumulators[key].is_safe_mode
+        ]
+        for key in idle:
+            del shard.accumulators[key]
+            del shard.last_used[key]
+        return len(idle)
+
+    def __len__(self) -> int:
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.accumulators)
+        return total
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +262,11 @@ class RiskScoreAccumulator:
 _DEFAULT_DENY_DELTA = 10
 
 
+def _default_risk_key(ctx: ToolCallContext) -> str:
+    """Scope a call to its session, else its user, else one shared key."""
+    return ctx.session_id or ctx.user_id or ""
+
+
 class RiskAwareHook:
     """Wraps a PolicyHook and enforces SAFE_MODE via RiskScoreAccumulator.
 
@@ -110,20 +276,32 @@ class RiskAwareHook:
     1. If accumulator.is_safe_mode → HALT immediately (no inner call).
     2. Otherwise delegate to inner PolicyHook.
     3. If inner returns HALT → accumulate risk_score_delta from last_decision.
+
+    Passing a RiskScoreMap instead of a single accumulator scores each key
+    returned by *key_fn* (default: session_id, then user_id) separately, so
+    one agent entering SAFE_MODE does not halt the others.
     """
 
     def __init__(
         self,
         inner: "PolicyHook",
-        accumulator: RiskScoreAccumulator,
+        accumulator: RiskScoreAccumulator | RiskScoreMap,
+        key_fn: Callable[[ToolCallContext], str] | None = None,
     ) -> None:
         self._inner = inner
         self._accumulator = accumulator
+        self._key_fn = key_fn or _default_risk_key
 
     def _delegate(self, ctx: ToolCallContext, *, llm: bool) -> Decision | None:
         """Shared logic for before_llm_call and before_tool_call."""
+        scores = self._accumulator
+        key = self._key_fn(ctx) if isinstance(scores, RiskScoreMap) else ""
         # SAFE_MODE check takes absolute priority
-        if self._accumulator.is_safe_mode:
+        if (
+            scores.is_safe_mode(key)
+            if isinstance(scores, RiskScoreMap)
+            else scores.is_safe_mode
+        ):
             return Decision.HALT
 
         if llm:
@@ -135,7 +313,10 @@ class RiskAwareHook:
         if inner_result == Decision.HALT:
             last = self._inner.last_decision
             delta = last.risk_score_delta if last is not None else _DEFAULT_DENY_DELTA
-            self._accumulator.add(delta, "DENY")
+            if isinstance(scores, RiskScoreMap):
+                scores.add(key, delta, "DENY")
+            else:
+                scores.add(delta, "DENY")
 
         return inner_result
 
@@ -13,6 +13,16 @@ Typical use:
         raise PermissionError(result.reason)
     # result.verdict, result.expected_hash, result.actual_hash, result.pin
     # are available for policy decisions and audit logging.
+
+    # At session start, check a whole MCP tool list under one lock:
+    results = registry.verify_many({t["name"]: t for t in tools})
+
+Schemas presented repeatedly (MCP servers resend identical tool lists) hit a
+bounded cache of canonical hashes.  The cache key is a SHA-256 of the
+schema's ``marshal`` encoding: an exact, type-preserving serialisation
+(``True``, ``1`` and ``1.0`` differ) that is several times cheaper than the
+sorted canonical JSON dump.  Equal keys therefore imply identical content,
+so a cache hit can never turn a modified schema into a MATCH.
 """
 
 from __future__ import annotations
@@ -20,9 +30,16 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
+import marshal
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+# marshal format 2 has no back-references, so equal content always encodes
+# to the same bytes regardless of object sharing or reference counts.
+_MARSHAL_VERSION = 2
 
 
 class PinVerdict(enum.Enum):
@@ -103,16 +120,86 @@ class ToolSchemaPin:
     raw_schema: str  # canonical JSON (for debugging)
 
 
+@dataclass(frozen=True)
+class SchemaHashCacheInfo:
+    """Counters of a ToolPinRegistry schema hash cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class _SchemaHashCache:
+    """LRU map from an exact schema fingerprint to its canonical hash."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(schema: dict) -> bytes | None:
+        """Return the cache key for *schema*, or None if it is uncacheable."""
+        try:
+            encoded = marshal.dumps(schema, _MARSHAL_VERSION)
+        except ValueError:
+            # Objects marshal cannot encode (custom types, str subclasses...).
+            return None
+        return hashlib.sha256(encoded).digest()
+
+    def get(self, key: bytes) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> SchemaHashCacheInfo:
+        with self._lock:
+            return SchemaHashCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+
 class ToolPinRegistry:
     """Thread-safe registry for tool schema pins.
 
     Fail-closed: if a tool is not pinned, verify() returns False.
     Re-registration overwrites the existing pin.
+
+    Args:
+        hash_cache_size: Maximum number of distinct schemas whose canonical
+            hash is cached for verify(); 0 disables the cache.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, hash_cache_size: int = 1024) -> None:
+        if hash_cache_size < 0:
+            raise ValueError(f"hash_cache_size must be >= 0, got {hash_cache_size}")
         self._pins: dict[str, ToolSchemaPin] = {}
         self._lock = threading.Lock()
+        self._hash_cache = (
+            _SchemaHashCache(hash_cache_size) if hash_cache_size else None
+        )
 
     @staticmethod
     def _canonical_json(schema: dict) -> str:
@@ -194,35 +281,101 @@ class ToolPinRegistry:
             PinVerification with verdict, hashes, and pin reference.
         """
         try:
-            schema_hash = self.hash_schema(schema)
+            schema_hash = self._cached_hash(schema)
         except (TypeError, ValueError, OverflowError):
             return PinVerification(
                 verdict=PinVerdict.UNSERIALIZABLE,
                 tool_name=tool_name,
             )
         with self._lock:
-            pin = self._pins.get(tool_name)
-            if pin is None:
-                return PinVerification(
-                    verdict=PinVerdict.NOT_PINNED,
-                    tool_name=tool_name,
-                    actual_hash=schema_hash,
-                )
-            if pin.schema_hash == schema_hash:
-                return PinVerification(
-                    verdict=PinVerdict.MATCH,
-                    tool_name=tool_name,
-                    expected_hash=pin.schema_hash,
-                    actual_hash=schema_hash,
-                    pin=pin,
+            return self._verdict_locked(tool_name, schema_hash)
+
+    def verify_many(
+        self,
+        tools: Mapping[str, dict] | Iterable[tuple[str, dict]],
+    ) -> dict[str, PinVerification]:
+        """Verify several tools at once, e.g. an MCP tool list at session start.
+
+        Hashes are computed (or taken from the cache) before acquiring the
+        lock; all comparisons then run under a single lock acquisition, so
+        the results reflect one consistent registry state.
+
+        Args:
+            tools: Mapping of tool name to schema, or (name, schema) pairs.
+                With duplicate names the last schema wins.
+
+        Returns:
+            Dict of tool name to PinVerification, in input order.
+        """
+        items = tools.items() if isinstance(tools, Mapping) else tools
+        hashes: dict[str, str | None] = {}
+        for tool_name, schema in items:
+            try:
+                hashes[tool_name] = self._cached_hash(schema)
+            except (TypeError, ValueError, OverflowError):
+                hashes[tool_name] = None
+        with self._lock:
+            return {
+                tool_name: (
+                    PinVerification(
+                        verdict=PinVerdict.UNSERIALIZABLE, tool_name=tool_name
+                    )
+                    if schema_hash is None
+                    else self._verdict_locked(tool_name, schema_hash)
                 )
+                for tool_name, schema_hash in hashes.items()
+            }
+
+    def hash_cache_info(self) -> SchemaHashCacheInfo:
+        """Return hit/miss counters of the schema hash cache."""
+        if self._hash_cache is None:
+            return SchemaHashCacheInfo(hits=0, misses=0, size=0, maxsize=0)
+        return self._hash_cache.info()
+
+    def _cached_hash(self, schema: dict) -> str:
+        """hash_schema() through the fingerprint cache.
+
+        Raises:
+            TypeError / ValueError / OverflowError: As hash_schema().
+        """
+        cache = self._hash_cache
+        if cache is None:
+            return self.hash_schema(schema)
+        key = cache.fingerprint(schema)
+        if key is None:
+            return self.hash_schema(schema)
+        schema_hash = cache.get(key)
+        if schema_hash is None:
+            # Only successfully hashed schemas are cached, so NaN or
+            # non-serialisable schemas keep failing closed every time.
+            schema_hash = self.hash_schema(schema)
+            cache.put(key, schema_hash)
+        return schema_hash
+
+    def _verdict_locked(self, tool_name: str, schema_hash: str) -> PinVerification:
+        """Compare *schema_hash* with the pin for *tool_name* (lock held)."""
+        pin = self._pins.get(tool_name)
+        if pin is None:
             return PinVerification(
-                verdict=PinVerdict.HASH_MISMATCH,
+                verdict=PinVerdict.NOT_PINNED,
+                tool_name=tool_name,
+                actual_hash=schema_hash,
+            )
+        if pin.schema_hash == schema_hash:
+            return PinVerification(
+                verdict=PinVerdict.MATCH,
                 tool_name=tool_name,
                 expected_hash=pin.schema_hash,
                 actual_hash=schema_hash,
                 pin=pin,
             )
+        return PinVerification(
+            verdict=PinVerdict.HASH_MISMATCH,
+            tool_name=tool_name,
+            expected_hash=pin.schema_hash,
+            actual_hash=schema_hash,
+            pin=pin,
+        )
 
     def is_pinned(self, tool_name: str) -> bool:
         """Return True if *tool_name* has a registered pin."""
@@ -258,6 +411,7 @@ class ToolPinRegistry:
 __all__ = [
     "PinVerdict",
     "PinVerification",
+    "SchemaHashCacheInfo",
     "ToolSchemaPin",
     "ToolPinRegistry",
 ]
@@ -12,9 +12,11 @@ __all__ = [
     "StateTransition",
     "VALID_TRANSITIONS",
 ]
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, Final, List
+from typing import Any, Callable, Deque, Dict, Final, List, Optional, Tuple
+import heapq
 import threading
 import time
 import logging
@@ -54,6 +56,11 @@ VALID_TRANSITIONS: Final[Dict[VeronicaState, frozenset]] = {
 }
 
 
+# Default and maximum number of transitions kept in state_history.
+DEFAULT_HISTORY_LIMIT: Final[int] = 100
+MAX_HISTORY_LIMIT: Final[int] = 10_000
+
+
 @dataclass
 class StateTransition:
     """Record of state transition."""
@@ -64,9 +71,67 @@ class StateTransition:
     reason: str
 
 
+class _CooldownMap(Dict[str, float]):
+    """``cooldowns`` dict that indexes every expiry written to it.
+
+    Each write pushes ``(expiry, pair)`` onto a min-heap, so direct writes
+    (``sm.cooldowns[pair] = t``) are indexed exactly like set_cooldown().
+    Heap entries whose expiry no longer matches the dict are stale and are
+    skipped by cleanup_expired(); the heap is rebuilt from the dict when
+    stale entries dominate it.
+    """
+
+    __slots__ = ("_heap",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._heap: Optional[List[Tuple[float, str]]] = None  # built lazily
+
+    def __setitem__(self, pair: str, expiry: float) -> None:
+        super().__setitem__(pair, expiry)
+        # Unset while unpickling: items are restored before the heap.
+        heap = getattr(self, "_heap", None)
+        if heap is not None:
+            heapq.heappush(heap, (expiry, pair))
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        for pair, expiry in dict(*args, **kwargs).items():
+            self[pair] = expiry
+
+    def __ior__(self, other: Any) -> "_CooldownMap":  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def setdefault(  # type: ignore[override]
+        self, pair: str, expiry: Any = None
+    ) -> Any:
+        if pair not in self:
+            self[pair] = expiry
+        return self[pair]
+
+    def expiry_heap(self) -> List[Tuple[float, str]]:
+        """Return the expiry index, rebuilding it if missing or mostly stale."""
+        heap = getattr(self, "_heap", None)
+        if heap is None or len(heap) > 2 * len(self) + 64:
+            heap = [(expiry, pair) for pair, expiry in self.items()]
+            heapq.heapify(heap)
+            self._heap = heap
+        return heap
+
+
 @dataclass
 class VeronicaStateMachine:
-    """VERONICA state machine with cooldown and fail tracking."""
+    """VERONICA state machine with cooldown and fail tracking.
+
+    Cooldown expiries are indexed in a min-heap, so cleanup_expired() only
+    touches entries that have actually expired.  Writing to ``cooldowns``
+    directly is still supported: it is a dict subclass that indexes every
+    write, and a plain dict assigned to ``cooldowns`` is converted (copied)
+    into one.
+
+    ``state_history`` is a ring buffer (``deque(maxlen=history_limit)``)
+    keeping the most recent transitions.
+    """
 
     # Configuration
     # L2: These are public mutable fields (dataclass default). They should be
@@ -79,17 +144,72 @@ class VeronicaStateMachine:
     # State tracking (per-pair)
     fail_counts: Dict[str, int] = field(default_factory=dict)
     cooldowns: Dict[str, float] = field(
-        default_factory=dict
+        default_factory=_CooldownMap
     )  # {pair: expiry_timestamp}
 
     # Global state
     current_state: VeronicaState = VeronicaState.IDLE
-    state_history: List[StateTransition] = field(default_factory=list)
+    state_history: Deque[StateTransition] = field(default_factory=deque)
+    history_limit: int = DEFAULT_HISTORY_LIMIT
 
     # Thread safety
     _lock: threading.Lock = field(
         default_factory=threading.Lock, init=False, repr=False
     )
+    # Optional per-mutation listener (see set_delta_listener()).
+    _delta_listener: Optional[Callable[[Dict[str, Any]], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if (
+            isinstance(self.history_limit, bool)
+            or not isinstance(self.history_limit, int)
+            or not 1 <= self.history_limit <= MAX_HISTORY_LIMIT
+        ):
+            raise ValueError(
+                f"history_limit must be an int in [1, {MAX_HISTORY_LIMIT}], "
+                f"got {self.history_limit!r}"
+            )
+        self.state_history = deque(self.state_history, maxlen=self.history_limit)
+
+    def set_delta_listener(
+        self, listener: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> None:
+        """Register a callable that receives one delta dict per mutation.
+
+        Used by delta-capable persistence backends (e.g. WALBackend) to log
+        each change instead of re-serialising the whole state.  Deltas carry
+        absolute values, so replaying one twice is harmless (except
+        ``transition``, which backends de-duplicate by sequence number):
+
+        - ``{"op": "fail", "pair", "count"}``
+        - ``{"op": "pass", "pair"}``
+        - ``{"op": "cooldown", "pair", "until"[, "count"]}``
+        - ``{"op": "expire", "pair"}``
+        - ``{"op": "transition", "from_state", "to_state", "timestamp", "reason"}``
+
+        The listener is called while the state lock is held, so deltas are
+        delivered in mutation order; it must be fast and must not call back
+        into this state machine.  Exceptions are logged and swallowed.
+        Pass None to detach.
+        """
+        with self._lock:
+            self._delta_listener = listener
+
+    def _emit_delta_locked(self, delta: Dict[str, Any]) -> None:
+        """Deliver *delta* to the listener. Must be called with _lock held."""
+        listener = self._delta_listener
+        if listener is None:
+            return
+        try:
+            listener(delta)
+        except Exception:
+            logger.warning(
+                "[VERONICA_STATE] Delta listener failed for op=%s",
+                delta.get("op"),
+                exc_info=True,
+            )
 
     def is_in_cooldown(self, pair: str) -> bool:
         """Check if pair is in cooldown.
@@ -115,14 +235,25 @@ class VeronicaStateMachine:
                 # Activate cooldown and reset counter so that subsequent
                 # record_fail() calls don't re-trigger cooldown immediately
                 # after the current one expires.
-                self.cooldowns[pair] = time.time() + self.cooldown_seconds
+                self._set_cooldown_locked(pair, time.time() + self.cooldown_seconds)
                 self.fail_counts[pair] = 0
+                self._emit_delta_locked(
+                    {
+                        "op": "cooldown",
+                        "pair": pair,
+                        "until": self.cooldowns[pair],
+                        "count": 0,
+                    }
+                )
                 logger.warning(
                     f"[VERONICA_STATE] {pair} cooldown activated: "
                     f"{self.cooldown_fails} consecutive fails, "
                     f"expires in {self.cooldown_seconds}s"
                 )
                 return True
+            self._emit_delta_locked(
+                {"op": "fail", "pair": pair, "count": self.fail_counts[pair]}
+            )
 
         return False
 
@@ -134,6 +265,7 @@ class VeronicaStateMachine:
                     f"[VERONICA_STATE] {pair} fail counter reset (was {self.fail_counts[pair]})"
                 )
                 self.fail_counts.pop(pair, None)
+                self._emit_delta_locked({"op": "pass", "pair": pair})
 
     def set_cooldown(self, pair: str, cooldown_until: float) -> None:
         """Set cooldown expiry timestamp for pair via the state machine.
@@ -143,16 +275,29 @@ class VeronicaStateMachine:
             cooldown_until: Unix timestamp when the cooldown expires.
         """
         with self._lock:
-            self.cooldowns[pair] = cooldown_until
+            self._set_cooldown_locked(pair, cooldown_until)
+            self._emit_delta_locked(
+                {"op": "cooldown", "pair": pair, "until": cooldown_until}
+            )
             logger.info(
                 f"[VERONICA_STATE] {pair} cooldown set until {cooldown_until:.0f}"
             )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "cooldowns" and not isinstance(value, _CooldownMap):
+            value = _CooldownMap(value)
+        object.__setattr__(self, name, value)
+
+    def _set_cooldown_locked(self, pair: str, expiry: float) -> None:
+        """Set (and thereby index) a cooldown. Must be called with _lock held."""
+        self.cooldowns[pair] = expiry
+
     def _cleanup_pair_locked(self, pair: str) -> None:
         """Cleanup cooldown entry for pair. Must be called with _lock held."""
         if pair in self.cooldowns:
             del self.cooldowns[pair]
             self.fail_counts.pop(pair, None)
+            self._emit_delta_locked({"op": "expire", "pair": pair})
             logger.info(f"[VERONICA_STATE] {pair} cooldown expired and cleaned up")
 
     def cleanup_expired_pair(self, pair: str) -> None:
@@ -161,12 +306,24 @@ class VeronicaStateMachine:
             self._cleanup_pair_locked(pair)
 
     def cleanup_expired(self) -> List[str]:
-        """Cleanup all expired cooldowns. Returns list of cleaned pairs."""
+        """Cleanup all expired cooldowns. Returns list of cleaned pairs.
+
+        Cost is proportional to the number of expired (or stale) index
+        entries, not to the number of tracked pairs.
+        """
         now = time.time()
+        expired: List[str] = []
         with self._lock:
-            expired = [pair for pair, expiry in self.cooldowns.items() if now >= expiry]
-            for pair in expired:
+            heap = self.cooldowns.expiry_heap()  # type: ignore[attr-defined]
+            while heap and heap[0][0] <= now:
+                _expiry, pair = heapq.heappop(heap)
+                current = self.cooldowns.get(pair)
+                if current is None or current > now:
+                    # Cleaned up, or overwritten with a later expiry (which
+                    # has its own heap entry): this entry is stale.
+                    continue
                 self._cleanup_pair_locked(pair)
+                expired.append(pair)
         return expired
 
     def transition(self, to_state: VeronicaState, reason: str) -> None:
@@ -189,11 +346,20 @@ class VeronicaStateMachine:
                 timestamp=time.time(),
                 reason=reason,
             )
-            self.state_history.append(transition)
-
-            # Keep only last 100 transitions (in-place to avoid list re-assignment)
-            if len(self.state_history) > 100:
-                del self.state_history[:-100]
+            history = self.state_history
+            history.append(transition)
+            if not isinstance(history, deque) and len(history) > self.history_limit:
+                # state_history was replaced with a plain list: trim in place.
+                del history[: -self.history_limit]
+            self._emit_delta_locked(
+                {
+                    "op": "transition",
+                    "from_state": transition.from_state.value,
+                    "to_state": transition.to_state.value,
+                    "timestamp": transition.timestamp,
+                    "reason": reason,
+                }
+            )
 
             logger.info(
                 f"[VERONICA_STATE] Transition: {self.current_state.value} -> {to_state.value} ({reason})"
@@ -236,6 +402,7 @@ class VeronicaStateMachine:
                 "fail_counts": dict(self.fail_counts),
                 "cooldowns": dict(self.cooldowns),
                 "current_state": self.current_state.value,
+                "history_limit": self.history_limit,
                 "state_history": [
                     {
                         "from_state": t.from_state.value,
@@ -243,7 +410,7 @@ class VeronicaStateMachine:
                         "timestamp": t.timestamp,
                         "reason": t.reason,
                     }
-                    for t in self.state_history[-100:]  # Last 100 only
+                    for t in list(self.state_history)[-self.history_limit :]
                 ],
             }
 
@@ -253,15 +420,16 @@ class VeronicaStateMachine:
         instance = cls(
             cooldown_fails=data.get("cooldown_fails", 3),
             cooldown_seconds=data.get("cooldown_seconds", 600),
+            history_limit=data.get("history_limit", DEFAULT_HISTORY_LIMIT),
         )
         instance.fail_counts = dict(data.get("fail_counts", {}))
         instance.cooldowns = dict(data.get("cooldowns", {}))
         instance.current_state = VeronicaState(data.get("current_state", "IDLE"))
         raw_history = data.get("state_history", [])
-        # M1: Cap history at 100 entries to prevent DoS via malformed/large files.
-        # During normal operation, transition() enforces the same cap in-place.
-        raw_history = raw_history[-100:]
-        instance.state_history = []
+        # M1: Cap history at history_limit (<= MAX_HISTORY_LIMIT) entries to
+        # prevent DoS via malformed/large files.  During normal operation the
+        # ring buffer enforces the same cap.
+        raw_history = raw_history[-instance.history_limit :]
         for t in raw_history:
             try:
                 instance.state_history.append(
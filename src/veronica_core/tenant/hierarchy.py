@@ -2,12 +2,14 @@
 
 Each :class:`Tenant` has an optional *parent_id* which links it to a parent
 in the same :class:`TenantRegistry`.  Policies and budget pools are resolved
-by walking up the tree until a non-``None`` value is found.
+by walking up the tree until a non-``None`` value is found.  The registry
+precomputes that resolution per tenant so lookups do not walk the tree.
 """
 
 from __future__ import annotations
 
 import threading
+import weakref
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generator
 
@@ -26,6 +28,11 @@ class TenantNotFoundError(KeyError):
     """Raised when a requested tenant ID is not found in the registry."""
 
 
+# Tenant fields the registry indexes by, and fields it resolves from.
+_KEY_FIELDS = frozenset({"id", "parent_id"})
+_RESOLVED_FIELDS = frozenset({"budget_pool", "policy"})
+
+
 @dataclass
 class Tenant:
     """A single node in the tenant hierarchy.
@@ -36,6 +43,11 @@ class Tenant:
         budget_pool: Pool owned by this tenant.  ``None`` means "use parent's pool".
         policy: Shield pipeline for this tenant.  ``None`` means "inherit from parent".
         metadata: Arbitrary key/value pairs stored alongside the tenant.
+
+    While the tenant is registered, reassigning ``budget_pool`` or
+    ``policy`` re-resolves it and its descendants in the registry, and
+    reassigning ``id`` or ``parent_id`` raises ``AttributeError`` (remove
+    and re-register the tenant instead).
     """
 
     id: str
@@ -43,19 +55,56 @@ class Tenant:
     budget_pool: "BudgetPool | None" = None
     policy: "ShieldPipeline | None" = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    _registry: "weakref.ref[TenantRegistry] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _registered_in(self) -> "TenantRegistry | None":
+        ref = self.__dict__.get("_registry")
+        registry = ref() if ref is not None else None
+        if registry is None or registry._tenants.get(self.id) is not self:
+            return None
+        return registry
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _KEY_FIELDS and self._registered_in() is not None:
+            raise AttributeError(
+                f"Cannot reassign Tenant.{name} of registered tenant {self.id!r}."
+            )
+        object.__setattr__(self, name, value)
+        if name in _RESOLVED_FIELDS:
+            registry = self._registered_in()
+            if registry is not None:
+                registry._reresolve(self)
+
+
+@dataclass(frozen=True)
+class _Resolved:
+    """Precomputed hierarchy resolution for one tenant."""
+
+    pool: "BudgetPool | None"
+    policy: "ShieldPipeline | None"
 
 
 class TenantRegistry:
     """Thread-safe registry of tenants with parent/child relationships.
 
     Tenants are stored in a flat dictionary keyed by ``tenant_id``.  The
-    hierarchy is encoded via :attr:`Tenant.parent_id` references.  All
-    traversal helpers (``resolve_policy``, ``get_effective_budget``) walk the
-    tree iteratively via :meth:`_walk_ancestors` to avoid Python's default
-    recursion limit.
+    hierarchy is encoded via :attr:`Tenant.parent_id` references.  Ancestor
+    walks (:meth:`invalidate`) are iterative via :meth:`_walk_ancestors` to
+    avoid Python's default recursion limit.
 
     A ``_children`` index (parent_id -> set of child IDs) is maintained for
     O(1) child lookups in :meth:`get_children` and :meth:`remove`.
+
+    ``resolve_policy`` and ``get_effective_budget`` read a precomputed
+    map (tenant_id -> immutable nearest pool and policy) without taking the
+    lock.  Mutations re-resolve only the affected subtree under the lock and
+    publish it with one ``dict.update``, so readers see each entry either
+    before or after the change; :attr:`version` increments on every
+    publish.  Reassigning a registered tenant's ``budget_pool`` or
+    ``policy`` re-resolves its subtree automatically; its ``id`` and
+    ``parent_id`` cannot be reassigned while it is registered.
     """
 
     def __init__(self) -> None:
@@ -63,6 +112,9 @@ class TenantRegistry:
         # O(1) child lookup: parent_id -> set of direct child IDs
         self._children: dict[str, set[str]] = {}
         self._lock = threading.Lock()
+        # Resolution map; entries are immutable and replaced under the lock.
+        self._resolved: dict[str, _Resolved] = {}
+        self._version = 0
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -93,6 +145,54 @@ class TenantRegistry:
             yield tenant
             current_id = tenant.parent_id
 
+    def _resolve_locked(
+        self, tenant: Tenant, parent: _Resolved | None
+    ) -> _Resolved:
+        """Resolve *tenant* from its parent's already-resolved entry."""
+        if parent is None:
+            return _Resolved(pool=tenant.budget_pool, policy=tenant.policy)
+        return _Resolved(
+            pool=tenant.budget_pool if tenant.budget_pool is not None else parent.pool,
+            policy=tenant.policy if tenant.policy is not None else parent.policy,
+        )
+
+    def _publish_locked(self, resolved: dict[str, _Resolved]) -> None:
+        """Publish re-resolved entries.  Must hold ``self._lock``."""
+        self._resolved.update(resolved)
+        self._version += 1
+
+    def _resolve_subtree_locked(self, tenant_id: str) -> None:
+        """Re-resolve *tenant_id* and its descendants.  Must hold ``self._lock``.
+
+        O(depth + subtree size).
+        """
+        # Re-derive the subtree root from its full ancestor chain so the
+        # result does not depend on any previously cached entry.
+        chain = list(self._walk_ancestors(tenant_id))
+        entry: _Resolved | None = None
+        for tenant in reversed(chain):
+            entry = self._resolve_locked(tenant, entry)
+        resolved = {tenant_id: entry}
+        # Breadth-first over descendants; each child reads its parent's
+        # freshly computed entry.
+        frontier = [tenant_id]
+        while frontier:
+            next_frontier: list[str] = []
+            for parent_id in frontier:
+                for child_id in self._children.get(parent_id, ()):
+                    resolved[child_id] = self._resolve_locked(
+                        self._tenants[child_id], resolved[parent_id]
+                    )
+                    next_frontier.append(child_id)
+            frontier = next_frontier
+        self._publish_locked(resolved)  # type: ignore[arg-type]
+
+    def _reresolve(self, tenant: Tenant) -> None:
+        """Called by :class:`Tenant` after its pool or policy is reassigned."""
+        with self._lock:
+            if self._tenants.get(tenant.id) is tenant:
+                self._resolve_subtree_locked(tenant.id)
+
     # ------------------------------------------------------------------
     # Mutation
     # ------------------------------------------------------------------
@@ -101,13 +201,18 @@ class TenantRegistry:
         """Register a tenant.
 
         Raises:
-            ValueError: If a tenant with the same *id* already exists.
+            ValueError: If a tenant with the same *id* already exists, or
+                *tenant* is registered in another registry.
             TenantNotFoundError: If *parent_id* is set but the parent is not
                 registered.
         """
         with self._lock:
             if tenant.id in self._tenants:
                 raise ValueError(f"Tenant {tenant.id!r} already registered.")
+            if tenant._registered_in() is not None:
+                raise ValueError(
+                    f"Tenant {tenant.id!r} is registered in another registry."
+                )
             if tenant.parent_id is not None and tenant.parent_id not in self._tenants:
                 raise TenantNotFoundError(
                     f"Parent tenant {tenant.parent_id!r} not found."
@@ -118,6 +223,14 @@ class TenantRegistry:
                 self._children.setdefault(tenant.parent_id, set()).add(tenant.id)
             # Ensure entry exists for this tenant (even if it has no children yet).
             self._children.setdefault(tenant.id, set())
+            # A new tenant is always a leaf: only its own entry is computed.
+            parent = (
+                self._resolved[tenant.parent_id]
+                if tenant.parent_id is not None
+                else None
+            )
+            self._publish_locked({tenant.id: self._resolve_locked(tenant, parent)})
+            object.__setattr__(tenant, "_registry", weakref.ref(self))
 
     def remove(self, tenant_id: str) -> None:
         """Remove a leaf tenant from the registry.
@@ -141,11 +254,34 @@ class TenantRegistry:
                 self._children.get(tenant.parent_id, set()).discard(tenant_id)
             # Drop the now-empty children entry.
             self._children.pop(tenant_id, None)
+            # Only leaves can be removed, so no other entry depends on this one.
+            self._resolved.pop(tenant_id, None)
+            self._version += 1
+            object.__setattr__(tenant, "_registry", None)
+
+    def invalidate(self, tenant_id: str) -> None:
+        """Re-resolve *tenant_id* and its descendants.
+
+        Reassigning ``budget_pool`` or ``policy`` on a registered
+        :class:`Tenant` already does this; call it after changing state the
+        registry cannot observe (e.g. a subclass property).
+
+        Raises:
+            TenantNotFoundError: If *tenant_id* is not registered.
+            ValueError: If a cycle is detected in the hierarchy.
+        """
+        with self._lock:
+            self._resolve_subtree_locked(tenant_id)
 
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the resolution map changes."""
+        return self._version
+
     def get(self, tenant_id: str) -> Tenant:
         """Return the tenant with *tenant_id*.
 
@@ -170,18 +306,18 @@ class TenantRegistry:
             return [self._tenants[cid] for cid in child_ids]
 
     def resolve_policy(self, tenant_id: str) -> "ShieldPipeline | None":
-        """Walk the hierarchy upward until a non-``None`` policy is found.
+        """Return the nearest policy walking the hierarchy upward.
 
         Returns ``None`` if no tenant in the chain has a policy configured.
+        O(1): served from the precomputed map without locking.
 
         Raises:
             TenantNotFoundError: If *tenant_id* is not registered.
         """
-        with self._lock:
-            for tenant in self._walk_ancestors(tenant_id):
-                if tenant.policy is not None:
-                    return tenant.policy
-            return None
+        entry = self._resolved.get(tenant_id)
+        if entry is None:
+            raise TenantNotFoundError(f"Tenant {tenant_id!r} not found.")
+        return entry.policy
 
     def get_effective_budget(self, tenant_id: str) -> float:
         """Return remaining budget considering the hierarchy.
@@ -192,18 +328,14 @@ class TenantRegistry:
 
         Returns ``float("inf")`` if no ancestor has a pool (unconstrained).
 
-        Note: The pool reference is extracted inside the lock, but
-        ``remaining()`` is called outside to avoid nested lock acquisition
-        (TenantRegistry._lock -> BudgetPool._lock) which could deadlock
-        if the inverse order is ever taken elsewhere.
+        The pool reference comes from the precomputed map, so the
+        registry lock is never taken here; ``remaining()`` is always live.
 
         Raises:
             TenantNotFoundError: If *tenant_id* is not registered.
         """
-        pool: "BudgetPool | None" = None
-        with self._lock:
-            for tenant in self._walk_ancestors(tenant_id):
-                if tenant.budget_pool is not None:
-                    pool = tenant.budget_pool
-                    break
+        entry = self._resolved.get(tenant_id)
+        if entry is None:
+            raise TenantNotFoundError(f"Tenant {tenant_id!r} not found.")
+        pool = entry.pool
         return pool.remaining() if pool is not None else float("inf")
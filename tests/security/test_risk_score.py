@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import random
+import threading
+
+import pytest
 
 from veronica_core.security.capabilities import CapabilitySet
 from veronica_core.security.policy_engine import PolicyEngine
@@ -10,6 +14,7 @@ from veronica_core.security.risk_score import (
     RiskAwareShieldFactory,
     RiskScoreAccumulator,
     RiskScoreConfig,
+    RiskScoreMap,
 )
 from veronica_core.shield.types import Decision, ToolCallContext
 
@@ -102,6 +107,137 @@ class TestRiskScoreAccumulator:
         # reset_on_allow clears window after adding the ALLOW entry
         assert acc.current_score == 0
 
+    def test_window_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            RiskScoreAccumulator(RiskScoreConfig(window_size=0))
+
+    def test_ring_buffer_matches_naive_window(self) -> None:
+        """Running sum equals the sum of the last window_size deltas."""
+        rng = random.Random(1234)
+        for window in (1, 2, 7, 100):
+            acc = RiskScoreAccumulator(RiskScoreConfig(window_size=window))
+            history: list[int] = []
+            for _ in range(500):
+                delta = rng.randint(-5, 20)
+                acc.add(delta, "DENY")
+                history.append(delta)
+                assert acc.current_score == sum(history[-window:])
+
+    def test_add_after_reset_starts_fresh_window(self) -> None:
+        acc = RiskScoreAccumulator(RiskScoreConfig(window_size=3))
+        for delta in (5, 6, 7, 8):
+            acc.add(delta, "DENY")
+        acc.reset()
+        acc.add(1, "DENY")
+        acc.add(2, "DENY")
+        assert acc.current_score == 3
+
+
+# ---------------------------------------------------------------------------
+# RiskScoreMap tests
+# ---------------------------------------------------------------------------
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRiskScoreMap:
+    def test_keys_are_scored_independently(self) -> None:
+        scores = RiskScoreMap(RiskScoreConfig(deny_threshold=10))
+        scores.add("agent-a", 10, "DENY")
+        scores.add("agent-b", 3, "DENY")
+        assert scores.is_safe_mode("agent-a") is True
+        assert scores.is_safe_mode("agent-b") is False
+        assert scores.current_score("agent-b") == 3
+        assert scores.safe_mode_keys() == ["agent-a"]
+
+    def test_unknown_key_is_not_created_by_reads(self) -> None:
+        scores = RiskScoreMap()
+        assert scores.is_safe_mode("ghost") is False
+        assert scores.current_score("ghost") == 0
+        assert scores.get("ghost") is None
+        assert len(scores) == 0
+
+    def test_reset_key(self) -> None:
+        scores = RiskScoreMap(RiskScoreConfig(deny_threshold=5))
+        scores.add("a", 5, "DENY")
+        acc = scores.get("a")
+        scores.reset("a")
+        assert scores.is_safe_mode("a") is False
+        assert acc is not None and acc.current_score == 0
+        assert len(scores) == 0
+
+    def test_reset_all(self) -> None:
+        scores = RiskScoreMap(shards=2)
+        for i in range(10):
+            scores.add(f"agent-{i}", 1, "DENY")
+        scores.reset_all()
+        assert len(scores) == 0
+
+    def test_idle_keys_evicted(self) -> None:
+        clock = _FakeClock()
+        scores = RiskScoreMap(
+            RiskScoreConfig(deny_threshold=100), idle_ttl_s=60.0, clock=clock
+        )
+        scores.add("idle", 5, "DENY")
+        clock.now += 30
+        scores.add("active", 5, "DENY")
+        clock.now += 31
+        assert scores.evict_idle() == 1
+        assert scores.get("idle") is None
+        assert scores.current_score("active") == 5
+
+    def test_add_sweeps_its_shard(self) -> None:
+        clock = _FakeClock()
+        scores = RiskScoreMap(shards=1, idle_ttl_s=60.0, clock=clock)
+        for i in range(5):
+            scores.add(f"agent-{i}", 1, "DENY")
+        clock.now += 61
+        scores.add("new", 1, "DENY")
+        assert len(scores) == 1
+
+    def test_safe_mode_keys_never_evicted(self) -> None:
+        clock = _FakeClock()
+        scores = RiskScoreMap(
+            RiskScoreConfig(deny_threshold=5), idle_ttl_s=60.0, clock=clock
+        )
+        scores.add("bad", 5, "DENY")
+        clock.now += 3600
+        assert scores.evict_idle() == 0
+        assert scores.is_safe_mode("bad") is True
+
+    def test_concurrent_adds_are_counted(self) -> None:
+        scores = RiskScoreMap(RiskScoreConfig(deny_threshold=10**9, window_size=10**4))
+
+        def worker(n: int) -> None:
+            for i in range(500):
+                scores.add(f"agent-{i % 8}", 1, "DENY")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(scores.current_score(f"agent-{i}") for i in range(8)) == 4000
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"shards": 0},
+            {"idle_ttl_s": 0},
+            {"idle_ttl_s": float("inf")},
+            {"config": RiskScoreConfig(window_size=0)},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            RiskScoreMap(**kwargs)
+
 
 # ---------------------------------------------------------------------------
 # RiskAwareHook tests
@@ -160,6 +296,57 @@ class TestRiskAwareHook:
         assert result == Decision.ALLOW
 
 
+class TestRiskAwareHookPerKey:
+    def _make_hook(self) -> tuple[RiskAwareHook, RiskScoreMap]:
+        from veronica_core.security.policy_engine import PolicyHook
+
+        inner = PolicyHook(engine=PolicyEngine(), caps=CapabilitySet.dev())
+        scores = RiskScoreMap(RiskScoreConfig(deny_threshold=5))
+        return RiskAwareHook(inner=inner, accumulator=scores), scores
+
+    def test_safe_mode_is_per_session(self) -> None:
+        hook, scores = self._make_hook()
+        bad = ToolCallContext(
+            request_id="r1",
+            session_id="s-bad",
+            metadata={"action": "shell", "args": ["curl", "http://evil.com"]},
+        )
+        good = ToolCallContext(
+            request_id="r2",
+            session_id="s-good",
+            metadata={"action": "shell", "args": ["pytest"]},
+        )
+        assert hook.before_tool_call(bad) == Decision.HALT
+        assert scores.is_safe_mode("s-bad") is True
+        assert hook.before_tool_call(good) == Decision.ALLOW
+        # The bad session is halted even for otherwise allowed calls.
+        halted = ToolCallContext(
+            request_id="r3", session_id="s-bad", metadata=good.metadata
+        )
+        assert hook.before_tool_call(halted) == Decision.HALT
+
+    def test_custom_key_fn(self) -> None:
+        from veronica_core.security.policy_engine import PolicyHook
+
+        inner = PolicyHook(engine=PolicyEngine(), caps=CapabilitySet.dev())
+        scores = RiskScoreMap(RiskScoreConfig(deny_threshold=5))
+        hook = RiskAwareHook(
+            inner=inner,
+            accumulator=scores,
+            key_fn=lambda ctx: ctx.metadata.get("tenant", ""),
+        )
+        ctx = ToolCallContext(
+            request_id="r1",
+            metadata={
+                "tenant": "acme",
+                "action": "shell",
+                "args": ["curl", "http://evil.com"],
+            },
+        )
+        hook.before_tool_call(ctx)
+        assert scores.safe_mode_keys() == ["acme"]
+
+
 # ---------------------------------------------------------------------------
 # RiskAwareShieldFactory tests
 # ---------------------------------------------------------------------------
@@ -214,3 +214,121 @@ class TestSandboxIgnoreFunction:
         (tmp_path / name).write_text("x")
         result = _sandbox_ignore(str(tmp_path), [name])
         assert name not in result
+
+
+# ---------------------------------------------------------------------------
+# Workspace providers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Template cache outside repo_root (repo_root is tmp_path)."""
+    return str(tmp_path_factory.mktemp("templates"))
+
+
+class TestSandboxWorkspace:
+    """Every workspace mode must give the same isolated, filtered tree."""
+
+    @pytest.mark.parametrize(
+        ("workspace", "cached"),
+        [("copy", False), ("reflink", False), ("reflink", True), ("hardlink", True)],
+    )
+    def test_modes_isolate_and_filter(
+        self,
+        repo_root: str,
+        executor: SecureExecutor,
+        cache_dir: str,
+        workspace: str,
+        cached: bool,
+    ) -> None:
+        (Path(repo_root) / "pkg").mkdir()
+        (Path(repo_root) / "pkg" / "mod.py").write_text("x = 1\n")
+        (Path(repo_root) / "id.pem").write_text("secret")
+        cfg = SandboxConfig(
+            repo_root=repo_root,
+            executor=executor,
+            workspace=workspace,
+            template_cache_dir=cache_dir if cached else None,
+        )
+        with SandboxRunner(cfg) as runner:
+            box = Path(runner.sandbox_dir)
+            assert (box / "hello.txt").read_text() == "hello from repo"
+            assert (box / "pkg" / "mod.py").read_text() == "x = 1\n"
+            assert not (box / "id.pem").exists()
+            assert not (box / ".veronica_template").exists()
+            # Replace-on-write works in every mode.
+            tmp = box / "hello.txt.tmp"
+            tmp.write_text("changed")
+            tmp.replace(box / "hello.txt")
+            (box / "new.txt").write_text("new")
+        assert (Path(repo_root) / "hello.txt").read_text() == "hello from repo"
+        assert not (Path(repo_root) / "new.txt").exists()
+
+    def test_template_reused_until_repo_changes(
+        self, repo_root: str, executor: SecureExecutor, cache_dir: str
+    ) -> None:
+        cfg = SandboxConfig(
+            repo_root=repo_root, executor=executor, template_cache_dir=cache_dir
+        )
+        runner = SandboxRunner(cfg)
+        with runner:
+            first = runner._template
+        with runner:
+            assert runner._template == first
+        (Path(repo_root) / "hello.txt").write_text("edited")
+        with runner:
+            second = runner._template
+            assert (Path(runner.sandbox_dir) / "hello.txt").read_text() == "edited"
+        assert second != first
+
+    def test_hardlink_template_is_read_only(
+        self, repo_root: str, executor: SecureExecutor, cache_dir: str
+    ) -> None:
+        cfg = SandboxConfig(
+            repo_root=repo_root,
+            executor=executor,
+            workspace="hardlink",
+            template_cache_dir=cache_dir,
+        )
+        with SandboxRunner(cfg) as runner:
+            linked = Path(runner.sandbox_dir) / "hello.txt"
+            original = Path(runner._template) / "hello.txt"
+            assert linked.stat().st_ino == original.stat().st_ino
+            assert not linked.stat().st_mode & 0o222
+            source = Path(repo_root) / "hello.txt"
+            assert original.stat().st_ino != source.stat().st_ino
+
+    def test_tampered_hardlink_template_is_discarded(
+        self, repo_root: str, executor: SecureExecutor, cache_dir: str
+    ) -> None:
+        cfg = SandboxConfig(
+            repo_root=repo_root,
+            executor=executor,
+            workspace="hardlink",
+            template_cache_dir=cache_dir,
+        )
+        with SandboxRunner(cfg) as runner:
+            template = runner._template
+            linked = Path(runner.sandbox_dir) / "hello.txt"
+            linked.chmod(0o644)
+            linked.write_text("written through the link")
+        assert not Path(template).exists()
+        assert (Path(repo_root) / "hello.txt").read_text() == "hello from repo"
+        with SandboxRunner(cfg) as runner:
+            box = Path(runner.sandbox_dir)
+            assert (box / "hello.txt").read_text() == "hello from repo"
+
+    def test_invalid_configs_rejected(
+        self, repo_root: str, executor: SecureExecutor
+    ) -> None:
+        with pytest.raises(ValueError, match="workspace"):
+            SandboxConfig(repo_root=repo_root, executor=executor, workspace="fuse")
+        with pytest.raises(ValueError, match="template_cache_dir"):
+            SandboxConfig(repo_root=repo_root, executor=executor, workspace="hardlink")
+        with pytest.raises(ValueError, match="inside repo_root"):
+            SandboxConfig(
+                repo_root=repo_root,
+                executor=executor,
+                template_cache_dir=str(Path(repo_root) / "cache"),
+            )
@@ -0,0 +1,163 @@
+"""Tests for SandboxPool (pre-warmed sandbox workspaces)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from veronica_core.runner import SandboxConfig, SandboxPool, SandboxRunner
+from veronica_core.runner.pool import SandboxPoolStats
+from veronica_core.runner.workspace import get_template_cache
+
+
+@pytest.fixture()
+def config(tmp_path: Path) -> SandboxConfig:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "hello.txt").write_text("hello from repo")
+    (repo / "secret.pem").write_text("x")
+    return SandboxConfig(repo_root=str(repo), executor=None)
+
+
+def _wait_for(pool: SandboxPool, cond: Callable[[SandboxPoolStats], bool]) -> None:
+    deadline = time.monotonic() + 10.0
+    while not cond(pool.stats()):
+        assert time.monotonic() < deadline, f"timed out: {pool.stats()}"
+        threading.Event().wait(0.01)
+
+
+class TestSandboxPool:
+    def test_prewarms_and_serves_hits(self, config: SandboxConfig) -> None:
+        with SandboxPool(config, size=2) as pool:
+            _wait_for(pool, lambda s: s.ready == 2)
+            with pool.acquire() as runner:
+                box = Path(runner.sandbox_dir)
+                assert (box / "hello.txt").read_text() == "hello from repo"
+                assert not (box / "secret.pem").exists()
+                (box / "out.txt").write_text("dirty")
+                assert pool.stats().in_use == 1
+            stats = pool.stats()
+            assert stats.hits == 1
+            assert stats.misses == 0
+            assert stats.in_use == 0
+            # The used workspace is deleted and replaced in the background.
+            _wait_for(pool, lambda s: s.discarded_total == 1 and s.ready == 2)
+            assert not box.exists()
+        assert not (Path(config.repo_root) / "out.txt").exists()
+
+    def test_miss_prepares_inline(self, config: SandboxConfig) -> None:
+        with SandboxPool(config, size=1) as pool:
+            _wait_for(pool, lambda s: s.ready == 1)
+            with pool.acquire() as a, pool.acquire() as b:
+                assert a.sandbox_dir != b.sandbox_dir
+                assert Path(b.sandbox_dir, "hello.txt").exists()
+            stats = pool.stats()
+            assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_clean_workspace_recycled_dirty_discarded(
+        self, config: SandboxConfig
+    ) -> None:
+        with SandboxPool(config, size=1, max_uses=3) as pool:
+            _wait_for(pool, lambda s: s.ready == 1)
+            with pool.acquire() as runner:
+                first = runner.sandbox_dir
+            _wait_for(pool, lambda s: s.recycled_total == 1)
+            with pool.acquire() as runner:
+                assert runner.sandbox_dir == first
+                Path(first, "hello.txt").write_text("changed")
+            _wait_for(pool, lambda s: s.discarded_total == 1 and s.ready == 1)
+            with pool.acquire() as runner:
+                assert runner.sandbox_dir != first
+                assert Path(runner.sandbox_dir, "hello.txt").read_text() == (
+                    "hello from repo"
+                )
+
+    def test_expired_workspaces_are_replaced(self, config: SandboxConfig) -> None:
+        with SandboxPool(config, size=1, max_age_s=0.05) as pool:
+            _wait_for(pool, lambda s: s.expired_total >= 2)
+            assert pool.stats().ready <= 1
+
+    def test_close_removes_idle_and_returned_workspaces(
+        self, config: SandboxConfig
+    ) -> None:
+        pool = SandboxPool(config, size=2)
+        _wait_for(pool, lambda s: s.ready == 2)
+        runner = pool.acquire()
+        runner.__enter__()
+        in_use = Path(runner.sandbox_dir)
+        roots = [Path(ws.root) for ws in pool._ready]
+        pool.close()
+        assert not any(r.exists() for r in roots)
+        assert in_use.exists()
+        runner.__exit__(None, None, None)
+        assert not in_use.exists()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire().__enter__()
+
+    def test_background_prepare_errors_are_counted(
+        self, config: SandboxConfig, tmp_path: Path
+    ) -> None:
+        broken = SandboxConfig(repo_root=str(tmp_path / "missing"), executor=None)
+        with SandboxPool(broken, size=1) as pool:
+            _wait_for(pool, lambda s: s.prepare_errors >= 1)
+            with pytest.raises(OSError):
+                pool.acquire().__enter__()
+            assert pool.stats().in_use == 0
+
+    def test_hardlink_workspaces_of_tampered_template_are_dropped(
+        self, config: SandboxConfig, tmp_path: Path
+    ) -> None:
+        config.workspace = "hardlink"
+        config.template_cache_dir = str(tmp_path / "cache")
+        with SandboxPool(config, size=2) as pool:
+            _wait_for(pool, lambda s: s.ready == 2)
+            # A root process writes through one ready workspace's link: the
+            # template and the other ready workspace share the inode.
+            linked = Path(pool._ready[0].repo_dir, "hello.txt")
+            linked.chmod(0o644)
+            linked.write_text("written through the link")
+            with pool.acquire() as runner:
+                box = Path(runner.sandbox_dir)
+                assert (box / "hello.txt").read_text() == "hello from repo"
+            stats = pool.stats()
+            assert stats.stale_total == 2
+            assert (stats.hits, stats.misses) == (0, 1)
+            _wait_for(pool, lambda s: s.ready == 2)
+            with pool.acquire() as runner:
+                box = Path(runner.sandbox_dir)
+                assert (box / "hello.txt").read_text() == "hello from repo"
+            assert pool.stats().hits == 1
+
+    def test_hardlink_workspaces_of_rebuilt_template_are_dropped(
+        self, config: SandboxConfig, tmp_path: Path
+    ) -> None:
+        config.workspace = "hardlink"
+        config.template_cache_dir = str(tmp_path / "cache")
+        with SandboxPool(config, size=1) as pool:
+            _wait_for(pool, lambda s: s.ready == 1)
+            template = pool._ready[0].template
+            # Discarded elsewhere, then rebuilt at the same path.
+            cache = get_template_cache(config.template_cache_dir)
+            cache.discard(template)
+            with SandboxRunner(config) as runner:
+                assert runner._template == template
+            with pool.acquire():
+                pass
+            assert pool.stats().stale_total == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"size": 0}, {"max_age_s": 0}, {"max_age_s": float("inf")}, {"max_uses": 0}],
+    )
+    def test_invalid_arguments(self, config: SandboxConfig, kwargs) -> None:
+        with pytest.raises(ValueError):
+            SandboxPool(config, **kwargs)
+
+    def test_rejects_non_read_only_config(self, config: SandboxConfig) -> None:
+        config.read_only = False
+        with pytest.raises(ValueError, match="read_only"):
+            SandboxPool(config)
@@ -466,6 +466,13 @@ class TestClientConfigStreamStatsValidation:
         with pytest.raises(ValueError):
             A2AClientConfig(stats_cap=-1)
 
+    def test_zero_max_in_flight_per_agent_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            A2AClientConfig(max_in_flight_per_agent=0)
+
+    def test_max_in_flight_per_agent_defaults_to_unbounded(self) -> None:
+        assert A2AClientConfig().max_in_flight_per_agent is None
+
 
 # ---------------------------------------------------------------------------
 # A2AIncomingRequest content_size_bytes enforcement (Rule 17/18)
@@ -558,6 +565,7 @@ class TestBoolAsIntTypeConfusion:
             ("max_stream_chunks", True),
             ("max_stream_bytes", False),
             ("stats_cap", True),
+            ("max_in_flight_per_agent", True),
         ],
     )
     def test_client_config_bool_rejected(self, field: str, val: object) -> None:
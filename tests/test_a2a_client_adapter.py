@@ -1089,3 +1089,244 @@ class TestAvgLatencyMsCorrectness:
             assert stats["agent-1"].avg_latency_ms >= 0  # non-negative
 
         asyncio.run(_run())
+
+
+# ---------------------------------------------------------------------------
+# Per-agent in-flight limit
+# ---------------------------------------------------------------------------
+
+
+class _GatedClient:
+    """A2A client whose calls block until released; tracks peak concurrency."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def send_message(self, request: Any) -> Any:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        return {"echo": request}
+
+
+class TestMaxInFlightPerAgent:
+    def test_concurrency_bounded_per_agent(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(
+                execution_context=_make_ctx(),
+                config=A2AClientConfig(max_in_flight_per_agent=2),
+            )
+            client = _GatedClient()
+            tasks = [
+                asyncio.create_task(
+                    adapter.send_message(
+                        agent_id="agent-1",
+                        message={"i": i},
+                        tenant_id="t1",
+                        identity=_make_identity(),
+                        client=client,
+                    )
+                )
+                for i in range(6)
+            ]
+            await asyncio.sleep(0.01)
+            assert client.in_flight == 2
+            client.release.set()
+            results = await asyncio.gather(*tasks)
+            assert all(r.success for r in results)
+            assert client.peak == 2
+            # Idle agents release their slot bookkeeping.
+            assert adapter._agent_slots == {}
+            assert adapter._slot_users == {}
+
+        asyncio.run(_run())
+
+    def test_limit_is_per_agent(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(
+                execution_context=_make_ctx(),
+                config=A2AClientConfig(max_in_flight_per_agent=1),
+            )
+            client = _GatedClient()
+            tasks = [
+                asyncio.create_task(
+                    adapter.send_message(
+                        agent_id=f"agent-{i}",
+                        message={},
+                        tenant_id="t1",
+                        identity=_make_identity(),
+                        client=client,
+                    )
+                )
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            assert client.in_flight == 3
+            client.release.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(_run())
+
+    def test_cancelled_waiter_frees_bookkeeping(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(
+                execution_context=_make_ctx(),
+                config=A2AClientConfig(max_in_flight_per_agent=1),
+            )
+            client = _GatedClient()
+
+            def _send() -> asyncio.Task[A2AResult]:
+                return asyncio.create_task(
+                    adapter.send_message(
+                        agent_id="agent-1",
+                        message={},
+                        tenant_id="t1",
+                        identity=_make_identity(),
+                        client=client,
+                    )
+                )
+
+            holder, waiter = _send(), _send()
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            client.release.set()
+            assert (await holder).success is True
+            assert adapter._slot_users == {}
+            assert client.calls == 1
+
+        asyncio.run(_run())
+
+
+# ---------------------------------------------------------------------------
+# Idempotent request coalescing
+# ---------------------------------------------------------------------------
+
+
+class TestIdempotentCoalescing:
+    @staticmethod
+    def _send(
+        adapter: A2AClientContainmentAdapter,
+        client: Any,
+        message: Any,
+        *,
+        tenant_id: str = "t1",
+        idempotent: bool = True,
+    ) -> asyncio.Task[A2AResult]:
+        return asyncio.create_task(
+            adapter.send_message(
+                agent_id="agent-1",
+                message=message,
+                tenant_id=tenant_id,
+                identity=_make_identity(),
+                client=client,
+                idempotent=idempotent,
+            )
+        )
+
+    def test_identical_requests_share_one_outbound_call(self) -> None:
+        async def _run() -> None:
+            costs = {"agent-1": A2AMessageCost("agent-1", cost_per_message=0.05)}
+            adapter = A2AClientContainmentAdapter(
+                execution_context=_make_ctx(), message_costs=costs
+            )
+            client = _GatedClient()
+            tasks = [self._send(adapter, client, {"q": "x", "n": 1}) for _ in range(4)]
+            # Same payload, different key order -> same fingerprint.
+            tasks.append(self._send(adapter, client, {"n": 1, "q": "x"}))
+            await asyncio.sleep(0.01)
+            client.release.set()
+            results = await asyncio.gather(*tasks)
+
+            assert client.calls == 1
+            assert all(r.success for r in results)
+            assert sorted(r.cost_usd for r in results) == [0.0] * 4 + [0.05]
+            assert len({id(r.message) for r in results}) == 1
+            stats = adapter.get_stats()["agent-1"]
+            assert stats.message_count == 5
+            assert stats.coalesced_count == 4
+            assert stats.total_cost_usd == pytest.approx(0.05)
+            assert adapter._pending == {}
+
+        asyncio.run(_run())
+
+    def test_not_coalesced_without_flag_or_across_tenants(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(execution_context=_make_ctx())
+            client = _GatedClient()
+            tasks = [
+                self._send(adapter, client, {"q": "x"}),
+                self._send(adapter, client, {"q": "x"}, idempotent=False),
+                self._send(adapter, client, {"q": "x"}, tenant_id="t2"),
+                self._send(adapter, client, {"q": "y"}),
+            ]
+            await asyncio.sleep(0.01)
+            client.release.set()
+            await asyncio.gather(*tasks)
+            assert client.calls == 4
+
+        asyncio.run(_run())
+
+    def test_unserializable_payload_is_not_coalesced(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(execution_context=_make_ctx())
+            client = _GatedClient()
+            payload = {"obj": object()}
+            tasks = [self._send(adapter, client, payload) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            client.release.set()
+            await asyncio.gather(*tasks)
+            assert client.calls == 2
+
+        asyncio.run(_run())
+
+    def test_joiners_share_failure(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(execution_context=_make_ctx())
+            gate = asyncio.Event()
+            calls = 0
+
+            async def _fail(request: Any) -> Any:
+                nonlocal calls
+                calls += 1
+                await gate.wait()
+                raise ConnectionError("remote down")
+
+            client = MagicMock()
+            client.send_message = _fail
+            tasks = [self._send(adapter, client, {"q": 1}) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            gate.set()
+            results = await asyncio.gather(*tasks)
+            assert calls == 1
+            assert [r.success for r in results] == [False] * 3
+            assert all(r.error == "Agent call failed" for r in results)
+            assert adapter.get_stats()["agent-1"].error_count == 3
+
+        asyncio.run(_run())
+
+    def test_cancelled_leader_lets_joiner_send_its_own(self) -> None:
+        async def _run() -> None:
+            adapter = A2AClientContainmentAdapter(execution_context=_make_ctx())
+            client = _GatedClient()
+            leader = self._send(adapter, client, {"q": 1})
+            await asyncio.sleep(0.01)
+            joiner = self._send(adapter, client, {"q": 1})
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            client.release.set()
+            result = await joiner
+            assert result.success is True
+            assert client.calls == 2
+            assert adapter._pending == {}
+
+        asyncio.run(_run())
@@ -325,3 +325,212 @@ class TestAsyncBudgetBackendProtocol:
         # runtime_checkable only checks for method presence (not signatures)
         backend = ConformingBackend()
         assert isinstance(backend, AsyncBudgetBackendProtocol)
+
+
+# ---------------------------------------------------------------------------
+# Non-blocking budget path (AsyncBudgetBackend)
+# ---------------------------------------------------------------------------
+
+
+class _SlowSyncBackend(LocalBudgetBackend):
+    """Sync reservable backend that sleeps to simulate a Redis round trip."""
+
+    def __init__(self, delay_s: float = 0.05) -> None:
+        super().__init__()
+        self.delay_s = delay_s
+        self.reserve_threads: list[int] = []
+
+    def reserve(self, amount: float, ceiling: float) -> str:
+        self.reserve_threads.append(threading.get_ident())
+        # Event.wait instead of time.sleep: immune to time.sleep patches.
+        threading.Event().wait(self.delay_s)
+        return super().reserve(amount, ceiling)
+
+
+def _make_ctx_with(backend: Any, max_cost: float = 10.0) -> ExecutionContext:
+    config = ExecutionConfig(
+        max_cost_usd=max_cost,
+        max_steps=100,
+        max_retries_total=10,
+        budget_backend=backend,
+    )
+    return ExecutionContext(config=config)
+
+
+class TestAsyncBudgetBackend:
+    def test_satisfies_async_protocol(self):
+        from veronica_core.distributed import AsyncBudgetBackend
+
+        assert isinstance(
+            AsyncBudgetBackend(LocalBudgetBackend()), AsyncBudgetBackendProtocol
+        )
+
+    def test_local_backend_runs_inline(self):
+        from veronica_core.distributed import AsyncBudgetBackend
+
+        assert AsyncBudgetBackend(LocalBudgetBackend()).offloaded is False
+
+    def test_sync_custom_backend_is_offloaded(self):
+        from veronica_core.distributed import AsyncBudgetBackend
+
+        assert AsyncBudgetBackend(_SlowSyncBackend()).offloaded is True
+
+    def test_async_native_backend_awaited_directly(self):
+        from veronica_core.distributed import AsyncBudgetBackend
+
+        class NativeAsync:
+            async def reserve(self, amount: float, ceiling: float) -> str:
+                return "rid-1"
+
+            async def commit(self, reservation_id: str) -> float:
+                return 1.0
+
+            async def rollback(self, reservation_id: str) -> None:
+                pass
+
+            async def get(self) -> float:
+                return 0.0
+
+        async def run():
+            facade = AsyncBudgetBackend(NativeAsync())
+            assert facade.offloaded is False
+            assert await facade.reserve(0.1, 1.0) == "rid-1"
+            assert await facade.commit("rid-1") == 1.0
+
+        asyncio.run(run())
+
+    def test_cancelled_offloaded_reserve_is_rolled_back(self):
+        from veronica_core.distributed import AsyncBudgetBackend
+
+        backend = _SlowSyncBackend(delay_s=0.05)
+
+        async def run():
+            facade = AsyncBudgetBackend(backend)
+            task = asyncio.ensure_future(facade.reserve(0.5, 10.0))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # Let the worker thread finish and the orphan rollback run.
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+        assert backend.get_reserved() == 0.0
+        assert backend.get() == 0.0
+
+
+class TestNonBlockingAdapterBudgetPath:
+    def test_reserve_runs_off_event_loop_thread(self):
+        backend = _SlowSyncBackend(delay_s=0.0)
+
+        async def run():
+            adapter = AsyncMCPContainmentAdapter(
+                execution_context=_make_ctx_with(backend),
+                tool_costs={"tool": MCPToolCost("tool", cost_per_call=0.1)},
+            )
+            result = await adapter.wrap_tool_call("tool", {}, success_fn)
+            assert result.success is True
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert backend.reserve_threads
+        assert all(t != loop_thread for t in backend.reserve_threads)
+        assert backend.get() == pytest.approx(0.1)
+        assert backend.get_reserved() == 0.0
+
+    def test_slow_backend_does_not_stall_event_loop(self):
+        backend = _SlowSyncBackend(delay_s=0.1)
+
+        async def run():
+            adapter = AsyncMCPContainmentAdapter(
+                execution_context=_make_ctx_with(backend),
+                tool_costs={"tool": MCPToolCost("tool", cost_per_call=0.1)},
+            )
+            ticks = 0
+            stop = asyncio.Event()
+
+            async def ticker():
+                nonlocal ticks
+                while not stop.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            t = asyncio.ensure_future(ticker())
+            await adapter.wrap_tool_call("tool", {}, success_fn)
+            stop.set()
+            await t
+            return ticks
+
+        # With an inline blocking reserve the ticker would run at most once.
+        assert asyncio.run(run()) >= 5
+
+    def test_offload_disabled_calls_inline(self):
+        backend = _SlowSyncBackend(delay_s=0.0)
+
+        async def run():
+            adapter = AsyncMCPContainmentAdapter(
+                execution_context=_make_ctx_with(backend),
+                tool_costs={"tool": MCPToolCost("tool", cost_per_call=0.1)},
+                offload_blocking_io=False,
+            )
+            await adapter.wrap_tool_call("tool", {}, success_fn)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert backend.reserve_threads == [loop_thread]
+
+    def test_cancelled_call_releases_reservation(self):
+        backend = LocalBudgetBackend()
+
+        async def run():
+            adapter = AsyncMCPContainmentAdapter(
+                execution_context=_make_ctx_with(backend),
+                tool_costs={"tool": MCPToolCost("tool", cost_per_call=0.1)},
+            )
+
+            async def hang(**kwargs: Any) -> dict:
+                await asyncio.sleep(10.0)
+                return {}
+
+            task = asyncio.ensure_future(adapter.wrap_tool_call("tool", {}, hang))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        assert backend.get_reserved() == 0.0
+        assert backend.get() == 0.0
+
+    def test_distributed_circuit_breaker_checked_off_loop(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        from veronica_core.distributed import DistributedCircuitBreaker
+
+        dcb = DistributedCircuitBreaker.__new__(DistributedCircuitBreaker)
+        DistributedCircuitBreaker.__init__(
+            dcb, redis_url="redis://localhost:1", circuit_id="nb", failure_threshold=2
+        )
+        dcb._client = fakeredis.FakeRedis(decode_responses=True)
+        dcb._using_fallback = False
+        dcb._owns_client = False
+        dcb._register_scripts()
+        check_threads: list[int] = []
+        original_check = dcb.check
+
+        def spy_check(ctx):
+            check_threads.append(threading.get_ident())
+            return original_check(ctx)
+
+        dcb.check = spy_check  # type: ignore[method-assign]
+
+        async def run():
+            adapter = AsyncMCPContainmentAdapter(
+                execution_context=_make_ctx_with(LocalBudgetBackend()),
+                circuit_breaker=dcb,
+            )
+            result = await adapter.wrap_tool_call("tool", {}, success_fn)
+            assert result.success is True
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert check_threads and check_threads[0] != loop_thread
@@ -3,11 +3,13 @@
 import pytest
 import json
 from pathlib import Path
+import threading
 import tempfile
 import shutil
 
-from veronica_core.backends import JSONBackend, MemoryBackend
-from veronica_core.state import VeronicaStateMachine
+from veronica_core.backends import JSONBackend, MemoryBackend, WALBackend
+from veronica_core.integration import VeronicaIntegration
+from veronica_core.state import VeronicaState, VeronicaStateMachine
 
 
 class TestJSONBackend:
@@ -128,3 +130,157 @@ class TestMemoryBackend:
         backend2 = MemoryBackend()
         loaded = backend2.load()
         assert loaded is None
+
+
+class TestWALBackend:
+    """Test WALBackend snapshot + delta log persistence."""
+
+    def _machine(self, backend: WALBackend) -> VeronicaStateMachine:
+        sm = VeronicaStateMachine(cooldown_fails=2, cooldown_seconds=60)
+        backend.load()
+        backend.save(sm.to_dict())
+        sm.set_delta_listener(backend.append_delta)
+        return sm
+
+    def test_deltas_replay_to_same_state(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        sm = self._machine(backend)
+        sm.transition(VeronicaState.SCREENING, "start")
+        sm.record_fail("a")
+        sm.record_fail("b")
+        sm.record_fail("b")  # cooldown
+        sm.record_pass("a")
+        sm.set_cooldown("c", 123.0)
+        sm.cleanup_expired_pair("c")
+        expected = sm.to_dict()
+        backend.close()
+
+        # Only the initial snapshot was written; everything else is deltas.
+        assert len(backend.wal_path.read_text().splitlines()) == 7
+        loaded = WALBackend(path).load()
+        assert VeronicaStateMachine.from_dict(loaded).to_dict() == expected
+
+    def test_compaction_truncates_log(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path, compact_every=3)
+        sm = self._machine(backend)
+        for _ in range(4):
+            sm.record_fail("x")
+        backend.close()
+        # Compacted in the background after the 3rd delta; only deltas newer
+        # than the snapshot remain in the log.
+        wal_seq = json.loads(path.read_text())["wal_seq"]
+        assert wal_seq >= 3
+        assert not backend.old_wal_path.exists()
+        lines = (
+            backend.wal_path.read_text().splitlines()
+            if backend.wal_path.exists()
+            else []
+        )
+        assert len(lines) == 4 - wal_seq
+        loaded = WALBackend(path).load()
+        assert loaded["fail_counts"] == sm.to_dict()["fail_counts"]
+
+    def test_compaction_runs_off_the_listener_thread(self, tmp_path, monkeypatch):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path, compact_every=2)
+        sm = self._machine(backend)
+        threads = []
+        compact = backend._compact
+
+        def spy():
+            threads.append(threading.current_thread())
+            return compact()
+
+        monkeypatch.setattr(backend, "_compact", spy)
+        sm.record_fail("x")
+        sm.record_fail("y")
+        backend.close()
+        assert threads
+        assert threading.current_thread() not in threads
+        assert json.loads(path.read_text())["wal_seq"] == 2
+
+    def test_failed_append_is_persisted_by_next_compaction(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        sm = self._machine(backend)
+        sm.record_fail("ok")
+
+        class FullDisk:
+            def write(self, _text):
+                raise OSError(28, "No space left on device")
+
+            def close(self):
+                pass
+
+        backend._wal = FullDisk()
+        assert backend.append_delta({"op": "fail", "pair": "lost", "count": 1}) is False
+        backend.close()
+        loaded = WALBackend(path).load()
+        assert loaded["fail_counts"] == {"ok": 1, "lost": 1}
+
+    def test_torn_tail_is_truncated_before_new_appends(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        sm = self._machine(backend)
+        sm.record_fail("a")
+        backend.close()
+        with open(backend.wal_path, "a") as f:
+            f.write('{"seq": 2, "op": "fa')
+        backend = WALBackend(path)
+        sm = VeronicaStateMachine.from_dict(backend.load())
+        sm.set_delta_listener(backend.append_delta)
+        sm.record_fail("b")
+        backend.close()
+        loaded = WALBackend(path).load()
+        assert loaded["fail_counts"] == {"a": 1, "b": 1}
+
+    def test_crash_before_truncate_does_not_replay_twice(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        sm = self._machine(backend)
+        sm.transition(VeronicaState.SCREENING, "start")
+        log = backend.wal_path.read_text()
+        backend.compact()
+        backend.close()
+        # Simulate a crash after the snapshot rename but before truncation.
+        backend.wal_path.write_text(log)
+        loaded = WALBackend(path).load()
+        assert len(loaded["state_history"]) == 1
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        sm = self._machine(backend)
+        sm.record_fail("a")
+        backend.close()
+        with open(backend.wal_path, "a") as f:
+            f.write('{"seq": 2, "op": "fa')
+        loaded = WALBackend(path).load()
+        assert loaded["fail_counts"] == {"a": 1}
+
+    def test_load_missing_state(self, tmp_path):
+        assert WALBackend(tmp_path / "none.json").load() is None
+
+    def test_invalid_compact_every(self, tmp_path):
+        with pytest.raises(ValueError):
+            WALBackend(tmp_path / "s.json", compact_every=0)
+
+    def test_integration_logs_instead_of_full_saves(self, tmp_path):
+        path = tmp_path / "state.json"
+        backend = WALBackend(path)
+        integ = VeronicaIntegration(
+            cooldown_fails=3, auto_save_interval=1, backend=backend
+        )
+        snapshot_mtime = path.stat().st_mtime_ns
+        integ.record_fail("pair")
+        integ.record_fail("pair")
+        assert path.stat().st_mtime_ns == snapshot_mtime  # no full rewrite
+        assert integ.save() is True
+        backend.close()
+
+        restored = VeronicaIntegration(backend=WALBackend(path))
+        assert restored.get_fail_count("pair") == 2
+        integ.state.set_delta_listener(None)
+        restored.state.set_delta_listener(None)
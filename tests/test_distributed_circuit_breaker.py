@@ -2321,3 +2321,325 @@ def _make_redis_budget_backend(fake_client, chain_id: str = "h1test"):
     backend._client = fake_client
     backend._fallback_seed_base = 0.0
     return backend
+
+
+# ---------------------------------------------------------------------------
+# Near-cache mode (near_cache_ttl > 0)
+# ---------------------------------------------------------------------------
+
+
+def _near_dcb(fake_server, circuit_id="near", **kwargs) -> DistributedCircuitBreaker:
+    """Near-cached breaker on its own client (one client per 'process')."""
+    client = fakeredis.FakeRedis(server=fake_server, decode_responses=True)
+    kwargs.setdefault("near_cache_ttl", 30.0)
+    kwargs.setdefault("failure_threshold", 3)
+    return DistributedCircuitBreaker(
+        redis_url="redis://fake",
+        circuit_id=circuit_id,
+        redis_client=client,
+        **kwargs,
+    )
+
+
+def _count_calls(dcb: DistributedCircuitBreaker, attr: str) -> List[int]:
+    calls = [0]
+    script = getattr(dcb, attr)
+
+    def counting(*args, **kwargs):
+        calls[0] += 1
+        return script(*args, **kwargs)
+
+    setattr(dcb, attr, counting)
+    return calls
+
+
+def _wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        threading.Event().wait(0.01)
+    return predicate()
+
+
+class TestNearCache:
+    def test_disabled_by_default(self, fake_client):
+        dcb = DistributedCircuitBreaker(
+            redis_url="redis://fake", circuit_id="nc-off", redis_client=fake_client
+        )
+        calls = _count_calls(dcb, "_script_check")
+        for _ in range(5):
+            assert dcb.check(_ctx()).allowed
+        assert calls[0] == 5
+
+    def test_closed_lease_skips_redis(self, fake_server):
+        dcb = _near_dcb(fake_server)
+        calls = _count_calls(dcb, "_script_check")
+        try:
+            for _ in range(100):
+                assert dcb.check(_ctx()).allowed
+            assert calls[0] == 1
+        finally:
+            dcb.close()
+
+    def test_successes_are_batched(self, fake_server):
+        dcb = _near_dcb(fake_server, success_batch_size=10)
+        batch_calls = _count_calls(dcb, "_script_success_batch")
+        single_calls = _count_calls(dcb, "_script_success")
+        try:
+            dcb.check(_ctx())
+            for _ in range(25):
+                dcb.record_success()
+            assert batch_calls[0] == 2
+            assert single_calls[0] == 0
+            # Reading the counter flushes the remainder.
+            assert dcb.success_count == 25
+            assert batch_calls[0] == 3
+        finally:
+            dcb.close()
+
+    def test_open_trip_invalidates_other_process(self, fake_server):
+        watcher = _near_dcb(fake_server, circuit_id="nc-trip")
+        tripper = _near_dcb(fake_server, circuit_id="nc-trip")
+        try:
+            assert watcher.check(_ctx()).allowed
+            assert tripper.check(_ctx()).allowed
+            for _ in range(3):
+                tripper.record_failure()
+            assert not tripper.check(_ctx()).allowed
+            assert _wait_for(lambda: not watcher.check(_ctx()).allowed)
+        finally:
+            watcher.close()
+            tripper.close()
+
+    def test_lease_expiry_bounds_staleness(self, fake_server, fake_client):
+        dcb = _near_dcb(fake_server, circuit_id="nc-expiry", near_cache_ttl=0.05)
+        # A process without near-cache does not publish invalidations.
+        other = _make_dcb(fake_client, circuit_id="nc-expiry")
+        try:
+            assert dcb.check(_ctx()).allowed
+            for _ in range(3):
+                other.record_failure()
+            threading.Event().wait(0.06)
+            assert not dcb.check(_ctx()).allowed
+        finally:
+            dcb.close()
+
+    def test_batched_success_does_not_erase_later_failure(self, fake_server):
+        dcb = _near_dcb(fake_server, circuit_id="nc-order", success_batch_size=100)
+        other = _near_dcb(fake_server, circuit_id="nc-order")
+        try:
+            dcb.check(_ctx())
+            dcb.record_success()
+            threading.Event().wait(0.01)
+            other.record_failure()
+            # Flushing the earlier success must not reset the newer failure.
+            assert dcb.failure_count == 1
+            assert dcb.success_count == 1
+        finally:
+            dcb.close()
+            other.close()
+
+    def test_batched_success_does_not_close_half_open(self, fake_server):
+        dcb = _near_dcb(
+            fake_server,
+            circuit_id="nc-half",
+            success_batch_size=100,
+            recovery_timeout=0.0,
+        )
+        try:
+            dcb.check(_ctx())
+            dcb.record_success()
+            dcb._client.hset(dcb._key, mapping={"state": "HALF_OPEN"})
+            dcb._flush_successes()
+            assert dcb._client.hget(dcb._key, "state") == "HALF_OPEN"
+        finally:
+            dcb.close()
+
+    def test_half_open_slot_still_claimed_in_redis(self, fake_server):
+        a = _near_dcb(fake_server, circuit_id="nc-slot", recovery_timeout=0.0)
+        b = _near_dcb(fake_server, circuit_id="nc-slot", recovery_timeout=0.0)
+        try:
+            for _ in range(3):
+                a.record_failure()
+            a._invalidate_near_cache()
+            b._invalidate_near_cache()
+            results = [a.check(_ctx()).allowed, b.check(_ctx()).allowed]
+            assert results.count(True) == 1
+            # HALF_OPEN is never leased: the loser keeps being denied.
+            assert not (b if results[0] else a).check(_ctx()).allowed
+        finally:
+            a.close()
+            b.close()
+
+    def test_close_stops_listener(self, fake_server):
+        dcb = _near_dcb(fake_server, circuit_id="nc-close")
+        dcb.check(_ctx())
+        hub = dcb._hub
+        assert hub is not None and hub.running()
+        dcb.close()
+        assert not hub.running()
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"near_cache_ttl": -1.0},
+            {"near_cache_ttl": float("inf")},
+            {"success_batch_size": 0},
+        ],
+    )
+    def test_invalid_near_cache_args(self, kwargs):
+        with pytest.raises(ValueError):
+            DistributedCircuitBreaker(
+                redis_url="redis://localhost", circuit_id="val-test", **kwargs
+            )
+
+
+# ---------------------------------------------------------------------------
+# CircuitBreakerGroup
+# ---------------------------------------------------------------------------
+
+
+def _counting_client(fake_server) -> tuple:
+    client = fakeredis.FakeRedis(server=fake_server, decode_responses=True)
+    commands: List[str] = []
+    execute = client.execute_command
+
+    def counting(*args, **kwargs):
+        commands.append(str(args[0]).upper())
+        return execute(*args, **kwargs)
+
+    client.execute_command = counting
+    return client, commands
+
+
+def _group_breakers(client, ids, **kwargs) -> List[DistributedCircuitBreaker]:
+    kwargs.setdefault("failure_threshold", 2)
+    return [
+        DistributedCircuitBreaker(
+            redis_url="redis://fake", circuit_id=cid, redis_client=client, **kwargs
+        )
+        for cid in ids
+    ]
+
+
+class TestCircuitBreakerGroup:
+    def test_check_is_one_round_trip(self, fake_server):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        client, commands = _counting_client(fake_server)
+        group = CircuitBreakerGroup(_group_breakers(client, ["a", "b", "c", "d"]))
+        group.check(_ctx())  # loads the script
+        commands.clear()
+        decisions = group.check(_ctx())
+        assert list(decisions) == ["a", "b", "c", "d"]
+        assert all(d.allowed for d in decisions.values())
+        assert commands == ["EVALSHA"]
+
+    def test_per_circuit_decisions(self, fake_server, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        breakers = _group_breakers(fake_client, ["ok", "bad"])
+        breakers[1].record_failure()
+        breakers[1].record_failure()
+        decisions = CircuitBreakerGroup(breakers).check(_ctx())
+        assert decisions["ok"].allowed
+        assert not decisions["bad"].allowed
+        assert "OPEN" in decisions["bad"].reason
+
+    def test_half_open_slot_claimed_once(self, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        g1 = CircuitBreakerGroup(
+            _group_breakers(fake_client, ["x", "y"], recovery_timeout=0.0)
+        )
+        g2 = CircuitBreakerGroup(
+            _group_breakers(fake_client, ["x", "y"], recovery_timeout=0.0)
+        )
+        g1.record({"x": False})
+        g1.record({"x": False})
+        first, second = g1.check(_ctx()), g2.check(_ctx())
+        assert first["x"].allowed and not second["x"].allowed
+        assert first["y"].allowed and second["y"].allowed
+
+    def test_record_is_one_pipeline(self, fake_server):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        client, commands = _counting_client(fake_server)
+        breakers = _group_breakers(client, ["a", "b", "c"])
+        group = CircuitBreakerGroup(breakers)
+        group.record({"a": True, "b": False, "c": True})  # loads scripts
+        commands.clear()
+        pipelines = []
+        make_pipeline = client.pipeline
+
+        def counting_pipeline(*args, **kwargs):
+            pipelines.append(kwargs)
+            return make_pipeline(*args, **kwargs)
+
+        client.pipeline = counting_pipeline
+        group.record({"a": True, "b": RuntimeError("x"), "c": True})
+        assert pipelines == [{"transaction": False}]
+        assert commands == []  # nothing outside the pipeline
+        assert breakers[1].failure_count == 2
+        assert breakers[0].success_count == 2
+        assert not group.check(_ctx())["b"].allowed
+
+    def test_record_respects_failure_predicate(self, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        breakers = _group_breakers(
+            fake_client,
+            ["p"],
+            failure_predicate=lambda exc: not isinstance(exc, ValueError),
+        )
+        CircuitBreakerGroup(breakers).record({"p": ValueError("ignored")})
+        assert breakers[0].failure_count == 0
+
+    def test_record_recovers_from_script_flush(self, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        breakers = _group_breakers(fake_client, ["a", "b"])
+        group = CircuitBreakerGroup(breakers)
+        group.record({"a": False, "b": False})
+        fake_client.script_flush()
+        group.record({"a": False, "b": False})
+        assert breakers[0].failure_count == 2
+        assert breakers[1].failure_count == 2
+
+    def test_redis_error_falls_back_per_breaker(self, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        breakers = _group_breakers(fake_client, ["a", "b"])
+        group = CircuitBreakerGroup(breakers)
+        with patch.object(
+            fake_client, "register_script", side_effect=ConnectionError("down")
+        ):
+            decisions = group.check(_ctx())
+        assert all(d.allowed for d in decisions.values())
+        assert all(b.is_using_fallback for b in breakers)
+
+    def test_near_cached_breakers_skip_redis(self, fake_server):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        client, commands = _counting_client(fake_server)
+        breakers = _group_breakers(client, ["a", "b"], near_cache_ttl=30.0)
+        group = CircuitBreakerGroup(breakers)
+        try:
+            group.check(_ctx())
+            commands.clear()
+            assert all(d.allowed for d in group.check(_ctx()).values())
+            group.record({"a": True, "b": True})
+            assert commands == []
+        finally:
+            for b in breakers:
+                b.close()
+
+    def test_invalid_arguments(self, fake_client):
+        from veronica_core.distributed import CircuitBreakerGroup
+
+        with pytest.raises(ValueError, match="duplicate"):
+            CircuitBreakerGroup(_group_breakers(fake_client, ["a", "a"]))
+        group = CircuitBreakerGroup(_group_breakers(fake_client, ["a"]))
+        with pytest.raises(ValueError, match="unknown"):
+            group.record({"zzz": True})
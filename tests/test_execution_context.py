@@ -1601,3 +1601,103 @@ class TestContextVarAsyncIsolation:
             f"Parent and child shared the same stack list (id={list_ids['parent']}). "
             "Bug K: asyncio task isolation broken."
         )
+
+
+class TestGetCounters:
+    """get_counters() mirrors get_snapshot() counters without copying nodes."""
+
+    def test_counters_match_snapshot(self) -> None:
+        ctx = ExecutionContext(
+            config=ExecutionConfig(max_cost_usd=10.0, max_steps=50, max_retries_total=5)
+        )
+        for _ in range(3):
+            ctx.wrap_llm_call(
+                fn=lambda: None, options=WrapOptions(cost_estimate_hint=0.1)
+            )
+        ctx.abort("done")
+        snap = ctx.get_snapshot()
+        counters = ctx.get_counters()
+        assert counters.chain_id == snap.chain_id
+        assert counters.step_count == snap.step_count == 3
+        assert counters.cost_usd_accumulated == pytest.approx(snap.cost_usd_accumulated)
+        assert counters.aborted is True
+        assert counters.abort_reason == "done"
+        assert dict(counters.graph_summary) == dict(snap.graph_summary)
+        assert not hasattr(counters, "nodes")
+
+    def test_counters_do_not_copy_nodes_or_events(self, monkeypatch) -> None:
+        ctx = ExecutionContext(
+            config=ExecutionConfig(max_cost_usd=10.0, max_steps=50, max_retries_total=5)
+        )
+        ctx.wrap_llm_call(fn=lambda: None)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("get_counters() must stay O(1)")
+
+        monkeypatch.setattr(ctx._graph, "snapshot", _fail)
+        monkeypatch.setattr(ctx._event_log, "snapshot", _fail)
+        assert ctx.get_counters().step_count == 1
+
+
+class TestLiteContext:
+    """ExecutionContext(lite=True): lazy graph, shared ContextVars, one UUID."""
+
+    @staticmethod
+    def _ctx() -> ExecutionContext:
+        return ExecutionContext(
+            config=ExecutionConfig(max_cost_usd=10.0, max_steps=50, max_retries_total=5),
+            lite=True,
+        )
+
+    def test_graph_created_on_first_wrap(self) -> None:
+        ctx = self._ctx()
+        assert ctx._graph_obj is None
+        counters = ctx.get_counters()
+        assert counters.graph_summary["total_llm_calls"] == 0
+        assert ctx._graph_obj is None
+        assert ctx.wrap_llm_call(fn=lambda: None) == Decision.ALLOW
+        assert ctx._graph_obj is not None
+        assert ctx.get_counters().graph_summary["total_llm_calls"] == 1
+        assert ctx.get_snapshot().chain_id == ctx.get_snapshot().request_id
+
+    def test_nested_contexts_keep_separate_stacks(self) -> None:
+        from veronica_core.containment import execution_context as ec
+
+        outer = self._ctx()
+        inner = self._ctx()
+        depths: list[tuple[int, int]] = []
+
+        def _inner_call() -> None:
+            depths.append((outer._nesting_depth_var.get(), inner._nesting_depth_var.get()))
+
+        def _outer_call() -> None:
+            inner.wrap_llm_call(fn=_inner_call)
+            outer.wrap_tool_call(fn=lambda: None)
+
+        outer.wrap_llm_call(fn=_outer_call)
+        assert depths == [(1, 1)]
+
+        # The tool call nested in outer's llm call is parented to it, even
+        # though inner's wrap ran in between on the shared ContextVars.
+        nodes = outer.get_graph_snapshot()["nodes"].values()
+        llm = next(n for n in nodes if n["kind"] == "llm")
+        tool = next(n for n in nodes if n["kind"] == "tool")
+        assert tool["parent_id"] == llm["node_id"]
+        # No per-context entries are left behind once all wraps finished.
+        assert ec._LITE_NESTING_DEPTHS.get() is None
+        assert ec._LITE_NODE_STACKS.get() is None
+
+    def test_asyncio_tasks_isolated(self) -> None:
+        import asyncio
+
+        ctx = self._ctx()
+
+        async def _task() -> int:
+            ctx.wrap_llm_call(fn=lambda: None)
+            return ctx._nesting_depth_var.get()
+
+        async def _main() -> list[int]:
+            return await asyncio.gather(*(_task() for _ in range(5)))
+
+        assert asyncio.run(_main()) == [0] * 5
+        assert ctx.get_counters().step_count == 5
@@ -583,3 +583,30 @@ def test_frequency_divergence_does_not_spam():
         assert count == 1, (
             f"Frequency divergence for signature {sig} fired {count} times, expected 1"
         )
+
+
+# ---------------------------------------------------------------------------
+# aggregates() accessor
+# ---------------------------------------------------------------------------
+
+
+def test_aggregates_matches_snapshot_without_serialising_nodes(monkeypatch):
+    """aggregates() returns snapshot()["aggregates"] without touching nodes."""
+    graph = ExecutionGraph(chain_id="agg-chain")
+    root_id = graph.create_root("agent_run")
+    for i in range(5):
+        nid = graph.begin_node(parent_id=root_id, kind="llm", name=f"step_{i}")
+        graph.mark_running(nid)
+        graph.mark_success(nid, cost_usd=0.01, tokens_in=1, tokens_out=2)
+
+    expected = graph.snapshot()["aggregates"]
+
+    def _fail(node):
+        raise AssertionError("aggregates() must not serialise nodes")
+
+    monkeypatch.setattr(ExecutionGraph, "_build_node_snapshot", staticmethod(_fail))
+    agg = graph.aggregates()
+    assert agg == expected
+    assert agg["total_llm_calls"] == 5
+    agg["total_llm_calls"] = 999
+    assert graph.aggregates()["total_llm_calls"] == 5
@@ -0,0 +1,373 @@
+"""Tests for MCPContainmentAdapter.wrap_tool_calls / AsyncMCPContainmentAdapter.wrap_tool_calls.
+
+Uses asyncio.run() wrappers since pytest-asyncio is not available.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from veronica_core.adapters.mcp import (
+    MCPContainmentAdapter,
+    MCPToolCall,
+    MCPToolCost,
+)
+from veronica_core.adapters.mcp_async import AsyncMCPContainmentAdapter
+from veronica_core.circuit_breaker import CircuitBreaker
+from veronica_core.containment.execution_context import (
+    ExecutionConfig,
+    ExecutionContext,
+)
+from veronica_core.distributed import LocalBudgetBackend
+from veronica_core.shield.types import Decision
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _CountingBackend(LocalBudgetBackend):
+    """LocalBudgetBackend that counts reserve/settle round trips."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reserve_calls: list[float] = []
+        self.settle_calls: list[float] = []
+
+    def reserve(self, amount: float, ceiling: float) -> str:
+        self.reserve_calls.append(amount)
+        return super().reserve(amount, ceiling)
+
+    def settle(self, reservation_id: str, amount: float) -> float:
+        self.settle_calls.append(amount)
+        return super().settle(reservation_id, amount)
+
+
+def _make_ctx(
+    backend: Any, max_cost_usd: float = 10.0, max_steps: int = 100
+) -> ExecutionContext:
+    return ExecutionContext(
+        config=ExecutionConfig(
+            max_cost_usd=max_cost_usd,
+            max_steps=max_steps,
+            max_retries_total=5,
+            budget_backend=backend,
+        )
+    )
+
+
+_COSTS = {
+    "search": MCPToolCost("search", cost_per_call=0.01),
+    "fetch": MCPToolCost("fetch", cost_per_call=0.02),
+}
+
+
+def _echo(**kwargs: Any) -> dict[str, Any]:
+    return {"echo": kwargs}
+
+
+def _boom(**kwargs: Any) -> Any:
+    raise RuntimeError("tool exploded")
+
+
+async def _aecho(**kwargs: Any) -> dict[str, Any]:
+    return {"echo": kwargs}
+
+
+async def _aboom(**kwargs: Any) -> Any:
+    raise RuntimeError("tool exploded")
+
+
+class _IsErrorResult:
+    isError = True
+
+
+# ---------------------------------------------------------------------------
+# Sync adapter
+# ---------------------------------------------------------------------------
+
+
+class TestSyncWrapToolCalls:
+    def test_results_in_input_order_with_one_reserve_and_settle(self):
+        backend = _CountingBackend()
+        adapter = MCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+        calls = [
+            MCPToolCall("search", {"q": i}, _echo) if i % 2 else ("fetch", {"q": i}, _echo)
+            for i in range(6)
+        ]
+        results = adapter.wrap_tool_calls(calls, max_concurrency=3)
+
+        assert [r.result["echo"]["q"] for r in results] == list(range(6))
+        assert all(r.success and r.decision == Decision.ALLOW for r in results)
+        assert backend.reserve_calls == [pytest.approx(0.09)]
+        assert backend.settle_calls == [pytest.approx(0.09)]
+        assert backend.get() == pytest.approx(0.09)
+        assert backend.get_reserved() == 0.0
+
+    def test_runs_concurrently_up_to_limit(self):
+        adapter = MCPContainmentAdapter(_make_ctx(LocalBudgetBackend()), tool_costs=_COSTS)
+        barrier = threading.Barrier(3, timeout=5.0)
+
+        def _meet(**kwargs: Any) -> str:
+            barrier.wait()
+            return "met"
+
+        results = adapter.wrap_tool_calls(
+            [("search", {}, _meet)] * 3, max_concurrency=3
+        )
+        assert [r.result for r in results] == ["met"] * 3
+
+    def test_failed_calls_release_their_share(self):
+        backend = _CountingBackend()
+        adapter = MCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+        results = adapter.wrap_tool_calls(
+            [
+                ("search", {}, _echo),
+                ("fetch", {}, _boom),
+                ("search", {}, lambda: _IsErrorResult()),
+            ]
+        )
+        assert [r.success for r in results] == [True, False, False]
+        assert results[1].error == "tool call failed"
+        assert results[2].error == "MCP tool returned isError=True"
+        assert backend.get() == pytest.approx(0.01)
+        assert backend.get_reserved() == 0.0
+        stats = adapter.get_tool_stats()
+        assert stats["search"].call_count == 2
+        assert stats["search"].error_count == 1
+        assert stats["fetch"].error_count == 1
+
+    def test_reserve_refused_halts_every_call(self):
+        backend = LocalBudgetBackend()
+        adapter = MCPContainmentAdapter(
+            _make_ctx(backend, max_cost_usd=0.025), tool_costs=_COSTS
+        )
+        invoked: list[int] = []
+
+        def _track(**kwargs: Any) -> None:
+            invoked.append(1)
+
+        results = adapter.wrap_tool_calls([("search", {}, _track)] * 3)
+        assert all(r.decision == Decision.HALT for r in results)
+        assert all(r.error == "Budget limit exceeded" for r in results)
+        assert invoked == []
+        assert backend.get() == 0.0
+        assert backend.get_reserved() == 0.0
+
+    def test_batch_trimmed_to_remaining_steps(self):
+        backend = LocalBudgetBackend()
+        ctx = _make_ctx(backend, max_steps=2)
+        adapter = MCPContainmentAdapter(ctx, tool_costs=_COSTS)
+        invoked: list[int] = []
+
+        def _track(**kwargs: Any) -> str:
+            invoked.append(1)
+            return "ok"
+
+        results = adapter.wrap_tool_calls([("search", {}, _track)] * 5)
+        assert [r.decision for r in results] == [Decision.ALLOW] * 2 + [Decision.HALT] * 3
+        assert all(r.error == "Step limit exceeded" for r in results[2:])
+        assert len(invoked) == 2
+
+        again = adapter.wrap_tool_calls([("search", {}, _track)] * 5)
+        assert all(r.decision == Decision.HALT for r in again)
+        assert len(invoked) == 2
+
+        snap = ctx.get_snapshot()
+        assert snap.step_count == 2
+        assert snap.cost_usd_accumulated == pytest.approx(0.02)
+        assert backend.get() == pytest.approx(0.02)
+        assert backend.get_reserved() == 0.0
+        assert [n.status for n in snap.nodes] == ["ok"] * 2 + ["halted"] * 8
+        assert snap.graph_summary["total_tool_calls"] == 10
+
+    def test_failed_calls_take_steps_and_record_nodes(self):
+        ctx = _make_ctx(LocalBudgetBackend())
+        adapter = MCPContainmentAdapter(ctx, tool_costs=_COSTS)
+        adapter.wrap_tool_calls([("search", {}, _echo), ("fetch", {}, _boom)])
+        snap = ctx.get_snapshot()
+        assert snap.step_count == 2
+        assert [n.status for n in snap.nodes] == ["ok", "error"]
+        assert snap.cost_usd_accumulated == pytest.approx(0.01)
+
+    def test_open_circuit_halts_every_call(self):
+        cb = CircuitBreaker(failure_threshold=1)
+        cb.record_failure()
+        adapter = MCPContainmentAdapter(
+            _make_ctx(LocalBudgetBackend()), tool_costs=_COSTS, circuit_breaker=cb
+        )
+        results = adapter.wrap_tool_calls([("search", {}, _echo)] * 2)
+        assert [r.decision for r in results] == [Decision.HALT, Decision.HALT]
+
+    def test_per_call_timeout_overrides_adapter_timeout(self):
+        backend = LocalBudgetBackend()
+        adapter = MCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+
+        def _slow(**kwargs: Any) -> str:
+            threading.Event().wait(0.05)
+            return "late"
+
+        results = adapter.wrap_tool_calls(
+            [("search", {}, _slow), ("search", {}, _echo)], per_call_timeout=0.01
+        )
+        assert [r.success for r in results] == [False, True]
+        assert backend.get() == pytest.approx(0.01)
+
+    def test_empty_batch(self):
+        adapter = MCPContainmentAdapter(_make_ctx(LocalBudgetBackend()))
+        assert adapter.wrap_tool_calls([]) == []
+
+    @pytest.mark.parametrize("bad", [0, -1, True, 1.5])
+    def test_invalid_max_concurrency(self, bad):
+        adapter = MCPContainmentAdapter(_make_ctx(LocalBudgetBackend()))
+        with pytest.raises((TypeError, ValueError)):
+            adapter.wrap_tool_calls([("search", {}, _echo)], max_concurrency=bad)
+
+    def test_coroutine_call_fn_rejected(self):
+        adapter = MCPContainmentAdapter(_make_ctx(LocalBudgetBackend()))
+        with pytest.raises(TypeError):
+            adapter.wrap_tool_calls([("search", {}, _aecho)])
+
+
+# ---------------------------------------------------------------------------
+# Async adapter
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncWrapToolCalls:
+    def test_results_in_input_order_with_one_reserve_and_settle(self):
+        backend = _CountingBackend()
+        adapter = AsyncMCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+
+        async def _delayed(q: int) -> int:
+            # Later entries finish first; order must still follow the input.
+            await asyncio.sleep(0.001 * (5 - q))
+            return q
+
+        calls = [MCPToolCall("search", {"q": i}, _delayed) for i in range(5)]
+        results = asyncio.run(adapter.wrap_tool_calls(calls, max_concurrency=5))
+
+        assert [r.result for r in results] == list(range(5))
+        assert backend.reserve_calls == [pytest.approx(0.05)]
+        assert backend.settle_calls == [pytest.approx(0.05)]
+        assert backend.get_reserved() == 0.0
+
+    def test_concurrency_is_bounded(self):
+        adapter = AsyncMCPContainmentAdapter(
+            _make_ctx(LocalBudgetBackend()), tool_costs=_COSTS
+        )
+        in_flight = 0
+        peak = 0
+
+        async def _probe(**kwargs: Any) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+
+        asyncio.run(
+            adapter.wrap_tool_calls([("search", {}, _probe)] * 10, max_concurrency=3)
+        )
+        assert peak == 3
+
+    def test_timeout_and_failure_release_their_share(self):
+        backend = LocalBudgetBackend()
+        adapter = AsyncMCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+
+        async def _hang(**kwargs: Any) -> None:
+            await asyncio.sleep(10)
+
+        results = asyncio.run(
+            adapter.wrap_tool_calls(
+                [("search", {}, _aecho), ("fetch", {}, _hang), ("fetch", {}, _aboom)],
+                per_call_timeout=0.02,
+            )
+        )
+        assert [r.success for r in results] == [True, False, False]
+        assert backend.get() == pytest.approx(0.01)
+        assert backend.get_reserved() == 0.0
+        assert adapter.get_tool_stats()["fetch"].error_count == 2
+
+    def test_reserve_refused_halts_every_call(self):
+        backend = LocalBudgetBackend()
+        adapter = AsyncMCPContainmentAdapter(
+            _make_ctx(backend, max_cost_usd=0.025), tool_costs=_COSTS
+        )
+        results = asyncio.run(adapter.wrap_tool_calls([("search", {}, _aecho)] * 3))
+        assert all(r.decision == Decision.HALT for r in results)
+        assert adapter.get_tool_stats()["search"].call_count == 3
+        assert backend.get_reserved() == 0.0
+
+    def test_batches_respect_max_steps_in_snapshot(self):
+        backend = LocalBudgetBackend()
+        ctx = _make_ctx(backend, max_steps=2)
+        adapter = AsyncMCPContainmentAdapter(ctx, tool_costs=_COSTS)
+
+        async def _run() -> list[list[Any]]:
+            return [
+                await adapter.wrap_tool_calls([("search", {}, _aecho)] * 5)
+                for _ in range(3)
+            ]
+
+        batches = asyncio.run(_run())
+        allowed = [r for batch in batches for r in batch if r.success]
+        assert len(allowed) == 2
+        assert all(r.decision == Decision.HALT for r in batches[1] + batches[2])
+
+        snap = ctx.get_snapshot()
+        assert snap.step_count == 2
+        assert snap.cost_usd_accumulated == pytest.approx(backend.get())
+        assert backend.get() == pytest.approx(0.02)
+        assert [n.status for n in snap.nodes].count("ok") == 2
+
+    def test_full_charge_reaches_chain_cost(self):
+        backend = LocalBudgetBackend()
+        ctx = _make_ctx(backend)
+        costs = {"gen": MCPToolCost("gen", cost_per_call=0.01, cost_per_token=0.001)}
+        adapter = AsyncMCPContainmentAdapter(ctx, tool_costs=costs)
+
+        async def _gen(**kwargs: Any) -> Any:
+            return {"token_count": 5}
+
+        results = asyncio.run(adapter.wrap_tool_calls([("gen", {}, _gen)] * 3))
+        assert all(r.success for r in results)
+        snap = ctx.get_snapshot()
+        assert snap.step_count == 3
+        assert snap.cost_usd_accumulated == pytest.approx(0.045)
+        assert backend.get() == pytest.approx(0.045)
+
+    def test_cancelled_batch_rolls_back_reservation(self):
+        backend = LocalBudgetBackend()
+        adapter = AsyncMCPContainmentAdapter(_make_ctx(backend), tool_costs=_COSTS)
+
+        async def _hang(**kwargs: Any) -> None:
+            await asyncio.sleep(10)
+
+        async def _run() -> None:
+            task = asyncio.create_task(
+                adapter.wrap_tool_calls([("search", {}, _hang)] * 4)
+            )
+            await asyncio.sleep(0.02)
+            assert backend.get_reserved() == pytest.approx(0.04)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(_run())
+        assert backend.get() == 0.0
+        assert backend.get_reserved() == 0.0
+
+    def test_zero_cost_batch_uses_individual_calls(self):
+        backend = _CountingBackend()
+        adapter = AsyncMCPContainmentAdapter(
+            _make_ctx(backend), default_cost_per_call=0.0
+        )
+        results = asyncio.run(adapter.wrap_tool_calls([("x", {}, _aecho)] * 3))
+        assert all(r.success for r in results)
+        assert backend.reserve_calls == []
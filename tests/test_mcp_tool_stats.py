@@ -0,0 +1,151 @@
+"""Tests for lock-free MCP tool stats and latency percentiles (_mcp_base)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from veronica_core.adapters._mcp_base import (
+    MCPToolStats,
+    _HIST_BUCKETS,
+    _ToolStatsRecorder,
+    _bucket_midpoint_ms,
+    _latency_bucket,
+    _percentiles_ms,
+)
+from veronica_core.adapters.mcp import MCPContainmentAdapter
+from veronica_core.adapters.mcp_async import AsyncMCPContainmentAdapter
+from veronica_core.containment.execution_context import (
+    ExecutionConfig,
+    ExecutionContext,
+)
+
+
+def _make_ctx() -> ExecutionContext:
+    return ExecutionContext(
+        config=ExecutionConfig(max_cost_usd=100.0, max_steps=10_000, max_retries_total=5)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Histogram buckets
+# ---------------------------------------------------------------------------
+
+
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("ms", [0.001, 0.031, 0.5, 1.0, 12.3, 250.0, 9_999.0])
+    def test_midpoint_within_relative_error(self, ms: float) -> None:
+        midpoint = _bucket_midpoint_ms(_latency_bucket(ms))
+        assert midpoint == pytest.approx(ms, rel=0.04, abs=0.001)
+
+    def test_buckets_are_monotonic(self) -> None:
+        indices = [_latency_bucket(us / 1000.0) for us in range(0, 5000)]
+        assert indices == sorted(indices)
+
+    def test_bucket_count_is_bounded(self) -> None:
+        assert _latency_bucket(-5.0) == 0
+        assert _latency_bucket(float(10**12)) == _HIST_BUCKETS - 1
+        assert _HIST_BUCKETS < 1024
+
+    def test_percentiles(self) -> None:
+        buckets: dict[int, int] = {}
+        for ms in range(1, 101):  # 1..100 ms, one sample each
+            index = _latency_bucket(float(ms))
+            buckets[index] = buckets.get(index, 0) + 1
+        p50, p95, p99 = _percentiles_ms(buckets, (0.5, 0.95, 0.99))
+        assert p50 == pytest.approx(50.0, rel=0.04)
+        assert p95 == pytest.approx(95.0, rel=0.04)
+        assert p99 == pytest.approx(99.0, rel=0.04)
+
+    def test_percentiles_empty(self) -> None:
+        assert _percentiles_ms({}, (0.5, 0.99)) == (0.0, 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Recorder
+# ---------------------------------------------------------------------------
+
+
+class TestToolStatsRecorder:
+    def test_snapshot_merges_thread_shards(self) -> None:
+        recorder = _ToolStatsRecorder()
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            for _ in range(500):
+                recorder.record("t", cost_usd=0.001, duration_ms=2.0)
+            recorder.record("t", error=True)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = recorder.snapshot(MCPToolStats(tool_name="t"))
+        assert stats.call_count == 8 * 501
+        assert stats.error_count == 8
+        assert stats.total_cost_usd == pytest.approx(4.0)
+        assert stats.avg_duration_ms == pytest.approx(2.0)
+        assert stats.p99_duration_ms == pytest.approx(2.0, rel=0.04)
+
+    def test_exited_thread_shards_are_retired(self) -> None:
+        recorder = _ToolStatsRecorder()
+        for _ in range(5):
+            t = threading.Thread(target=recorder.record, args=("t",))
+            t.start()
+            t.join()
+        recorder.record("t")
+        stats = recorder.snapshot(MCPToolStats(tool_name="t"))
+        assert stats.call_count == 6
+        # Only the current (live) thread keeps a shard.
+        assert len(recorder._shards) == 1
+
+    def test_snapshot_adds_base_values(self) -> None:
+        recorder = _ToolStatsRecorder()
+        recorder.record("t", cost_usd=0.5, duration_ms=1.0)
+        stats = recorder.snapshot(MCPToolStats(tool_name="t", call_count=3, total_cost_usd=1.0))
+        assert stats.call_count == 4
+        assert stats.total_cost_usd == pytest.approx(1.5)
+
+
+# ---------------------------------------------------------------------------
+# Adapters
+# ---------------------------------------------------------------------------
+
+
+class TestAdapterPercentiles:
+    def test_sync_adapter_reports_percentiles(self) -> None:
+        adapter = MCPContainmentAdapter(_make_ctx(), default_cost_per_call=0.0)
+
+        def _slow(**kwargs: Any) -> str:
+            threading.Event().wait(0.005)
+            return "ok"
+
+        for _ in range(3):
+            adapter.wrap_tool_call("slow", {}, _slow)
+        stats = adapter.get_tool_stats()["slow"]
+        assert stats.call_count == 3
+        assert 4.0 <= stats.p50_duration_ms <= stats.p99_duration_ms
+
+    def test_async_adapter_counts_without_lock(self) -> None:
+        adapter = AsyncMCPContainmentAdapter(_make_ctx(), default_cost_per_call=0.0)
+
+        async def _echo(**kwargs: Any) -> str:
+            await asyncio.sleep(0)
+            return "ok"
+
+        async def run() -> MCPToolStats:
+            await asyncio.gather(
+                *(adapter.wrap_tool_call("echo", {}, _echo) for _ in range(200))
+            )
+            return (await adapter.get_tool_stats_async())["echo"]
+
+        stats = asyncio.run(run())
+        assert stats.call_count == 200
+        assert stats.error_count == 0
+        assert stats.p50_duration_ms >= 0.0
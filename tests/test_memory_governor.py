@@ -1,7 +1,8 @@
 """Tests for MemoryGovernor -- orchestrator for memory governance hooks.
 
 Covers: fail-closed/fail-open, verdict aggregation, hook error handling,
-        max cap enforcement, notify_after, and thread safety.
+        max cap enforcement, notify_after, thread safety, and trait-based
+        scheduling (reordering, memoisation, concurrent evaluation).
 """
 
 from __future__ import annotations
@@ -15,6 +16,7 @@ from veronica_core.memory.governor import MemoryGovernor
 from veronica_core.memory.hooks import (
     DefaultMemoryGovernanceHook,
     DenyAllMemoryGovernanceHook,
+    MemoryHookTraits,
 )
 from veronica_core.memory.types import (
     GovernanceVerdict,
@@ -550,3 +552,256 @@ class TestDenyEarlyExitNotifyAfter:
         assert after_op_calls[0] is GovernanceVerdict.DENY, (
             "The tracking hook's after_op must receive the DENY decision"
         )
+
+
+# ---------------------------------------------------------------------------
+# Trait-based scheduling
+# ---------------------------------------------------------------------------
+
+
+class _TracedHook:
+    """Hook recording its before_op calls into a shared list."""
+
+    def __init__(
+        self,
+        name: str,
+        calls: list[str],
+        verdict: GovernanceVerdict = GovernanceVerdict.ALLOW,
+        traits: MemoryHookTraits | None = None,
+        gate: threading.Barrier | None = None,
+    ) -> None:
+        self.name = name
+        self.calls = calls
+        self.verdict = verdict
+        self.gate = gate
+        if traits is not None:
+            self.memory_hook_traits = traits
+
+    def before_op(
+        self, operation: MemoryOperation, context: MemoryPolicyContext | None
+    ) -> MemoryGovernanceDecision:
+        self.calls.append(self.name)
+        if self.gate is not None:
+            self.gate.wait()
+        return MemoryGovernanceDecision(
+            verdict=self.verdict,
+            reason=f"{self.name} {self.verdict.value}",
+            policy_id=self.name,
+            operation=operation,
+        )
+
+    def after_op(
+        self,
+        operation: MemoryOperation,
+        decision: MemoryGovernanceDecision,
+        result: Any = None,
+        error: Any = None,
+    ) -> None:
+        pass
+
+
+_CHEAP = MemoryHookTraits(pure=True)
+_EXPENSIVE = MemoryHookTraits(cost="expensive", pure=True)
+
+
+class TestMemoryHookTraits:
+    def test_defaults_are_impure(self) -> None:
+        traits = MemoryHookTraits()
+        assert traits.cost == "cheap"
+        assert traits.pure is False
+        assert traits.may_deny is True
+
+    def test_invalid_cost_raises(self) -> None:
+        with pytest.raises(ValueError):
+            MemoryHookTraits(cost="free")  # type: ignore[arg-type]
+
+    def test_negative_max_workers_raises(self) -> None:
+        with pytest.raises(ValueError):
+            MemoryGovernor(max_workers=-1)
+
+
+class TestHookScheduling:
+    def test_hooks_without_traits_keep_registration_order(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        for name in ("a", "b", "c"):
+            gov.add_hook(_TracedHook(name, calls))
+        gov.evaluate(_op())
+        assert calls == ["a", "b", "c"]
+
+    def test_cheap_pure_deny_skips_expensive_hook(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        gov.add_hook(_TracedHook("slow", calls, traits=_EXPENSIVE))
+        gov.add_hook(
+            _TracedHook("fast", calls, GovernanceVerdict.DENY, traits=_CHEAP)
+        )
+        decision = gov.evaluate(_op())
+        assert decision.denied
+        assert decision.policy_id == "fast"
+        assert calls == ["fast"]
+
+    def test_never_deny_hooks_run_after_deny_capable(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        never_deny = MemoryHookTraits(pure=True, may_deny=False)
+        gov.add_hook(_TracedHook("audit", calls, traits=never_deny))
+        gov.add_hook(_TracedHook("gate", calls, traits=_CHEAP))
+        gov.evaluate(_op())
+        assert calls == ["gate", "audit"]
+
+    def test_impure_hook_is_a_barrier(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        gov.add_hook(_TracedHook("slow1", calls, traits=_EXPENSIVE))
+        gov.add_hook(_TracedHook("impure", calls))
+        gov.add_hook(_TracedHook("fast", calls, traits=_CHEAP))
+        gov.add_hook(_TracedHook("slow2", calls, traits=_EXPENSIVE))
+        gov.evaluate(_op())
+        assert calls == ["slow1", "impure", "fast", "slow2"]
+
+    def test_aggregation_uses_registration_order(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        gov.add_hook(
+            _TracedHook("first", calls, GovernanceVerdict.DEGRADE, traits=_EXPENSIVE)
+        )
+        gov.add_hook(
+            _TracedHook("second", calls, GovernanceVerdict.DEGRADE, traits=_CHEAP)
+        )
+        decision = gov.evaluate(_op())
+        assert calls == ["second", "first"]
+        # Equal severity: the earlier-registered hook's decision is reported.
+        assert decision.verdict is GovernanceVerdict.DEGRADE
+        assert decision.policy_id == "first"
+
+
+class TestPureHookMemo:
+    def _governor(self, calls: list[str], **kwargs: Any) -> MemoryGovernor:
+        gov = MemoryGovernor(**kwargs)
+        gov.add_hook(_TracedHook("pure", calls, traits=_CHEAP))
+        gov.add_hook(_TracedHook("impure", calls))
+        return gov
+
+    def test_memo_hit_within_chain(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls)
+        op = _op()
+        for request in ("r1", "r2"):
+            ctx = MemoryPolicyContext(operation=op, chain_id="c1", request_id=request)
+            assert gov.evaluate(op, ctx).allowed
+        assert calls == ["pure", "impure", "impure"]
+
+    def test_no_memo_without_chain_id(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls)
+        gov.evaluate(_op())
+        gov.evaluate(_op())
+        assert calls.count("pure") == 2
+
+    def test_memo_is_per_chain_and_per_fingerprint(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls)
+        read, write = _op(MemoryAction.READ), _op(MemoryAction.WRITE)
+        gov.evaluate(read, MemoryPolicyContext(operation=read, chain_id="c1"))
+        gov.evaluate(read, MemoryPolicyContext(operation=read, chain_id="c2"))
+        gov.evaluate(write, MemoryPolicyContext(operation=write, chain_id="c1"))
+        assert calls.count("pure") == 3
+
+    def test_end_chain_drops_memo(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls)
+        op = _op()
+        gov.evaluate(op, MemoryPolicyContext(operation=op, chain_id="c1"))
+        gov.end_chain("c1")
+        gov.evaluate(op, MemoryPolicyContext(operation=op, chain_id="c1"))
+        assert calls.count("pure") == 2
+
+    def test_memoize_false_disables_memo(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls, memoize=False)
+        op = _op()
+        for _ in range(2):
+            gov.evaluate(op, MemoryPolicyContext(operation=op, chain_id="c1"))
+        assert calls.count("pure") == 2
+
+    def test_unhashable_metadata_is_not_memoised(self) -> None:
+        calls: list[str] = []
+        gov = self._governor(calls)
+        op = MemoryOperation(action=MemoryAction.READ, metadata={"tags": ["x"]})
+        for _ in range(2):
+            decision = gov.evaluate(op, MemoryPolicyContext(operation=op, chain_id="c"))
+            assert decision.allowed
+        assert calls.count("pure") == 2
+
+    def test_memoised_deny_is_reported(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor()
+        gov.add_hook(_TracedHook("deny", calls, GovernanceVerdict.DENY, traits=_CHEAP))
+        op = _op()
+        for _ in range(2):
+            ctx = MemoryPolicyContext(operation=op, chain_id="c1")
+            decision = gov.evaluate(op, ctx)
+            assert decision.denied
+            assert decision.operation is op
+        assert calls == ["deny"]
+
+
+class TestParallelHooks:
+    def test_expensive_pure_hooks_run_concurrently(self) -> None:
+        calls: list[str] = []
+        # Both hooks must be inside before_op() at once to pass the barrier.
+        gate = threading.Barrier(2, timeout=5.0)
+        gov = MemoryGovernor(max_workers=2)
+        try:
+            gov.add_hook(_TracedHook("a", calls, traits=_EXPENSIVE, gate=gate))
+            gov.add_hook(_TracedHook("b", calls, traits=_EXPENSIVE, gate=gate))
+            assert gov.evaluate(_op()).allowed
+        finally:
+            gov.close()
+        assert sorted(calls) == ["a", "b"]
+
+    def test_parallel_deny_returns_deny(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor(max_workers=2)
+        try:
+            gov.add_hook(_TracedHook("a", calls, traits=_EXPENSIVE))
+            gov.add_hook(
+                _TracedHook("b", calls, GovernanceVerdict.DENY, traits=_EXPENSIVE)
+            )
+            decision = gov.evaluate(_op())
+        finally:
+            gov.close()
+        assert decision.denied
+        assert decision.policy_id == "b"
+
+    def test_parallel_hook_error_fails_closed(self) -> None:
+        class _RaisingPure:
+            memory_hook_traits = _EXPENSIVE
+
+            def before_op(
+                self, operation: MemoryOperation, context: MemoryPolicyContext | None
+            ) -> MemoryGovernanceDecision:
+                raise RuntimeError("boom")
+
+            def after_op(self, *args: Any, **kwargs: Any) -> None:
+                pass
+
+        gov = MemoryGovernor(max_workers=2)
+        try:
+            gov.add_hook(_TracedHook("a", [], traits=_EXPENSIVE))
+            gov.add_hook(_RaisingPure())
+            decision = gov.evaluate(_op())
+        finally:
+            gov.close()
+        assert decision.denied
+        assert "hook error" in decision.reason
+
+    def test_evaluate_after_close_runs_sequentially(self) -> None:
+        calls: list[str] = []
+        gov = MemoryGovernor(max_workers=2)
+        gov.add_hook(_TracedHook("a", calls, traits=_EXPENSIVE))
+        gov.add_hook(_TracedHook("b", calls, traits=_EXPENSIVE))
+        gov.close()
+        assert gov.evaluate(_op()).allowed
+        assert calls == ["a", "b"]
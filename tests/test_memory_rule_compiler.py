@@ -7,6 +7,8 @@ Covers: valid compilation, invalid/unknown parameter rejection,
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from veronica_core.memory.governor import MemoryGovernor
@@ -783,3 +785,120 @@ class TestMissingBranchCoverage:
             ValueError, match=r"max_raw_replay_ratio must be in \[0.0, 1.0\]"
         ):
             MemoryRuleCompiler().compile(_rule(max_raw_replay_ratio=-0.1))
+
+
+# ---------------------------------------------------------------------------
+# Indexed dispatch -- differential against a linear first-match scan
+# ---------------------------------------------------------------------------
+
+
+def _linear_decision(
+    rules: tuple,
+    op: MemoryOperation,
+    ctx: MemoryPolicyContext | None,
+) -> tuple[GovernanceVerdict, str]:
+    """Reference evaluator: walk every rule in order, first match wins."""
+    for rule in rules:
+        if MemoryRuleEvaluator._matches(rule, op, ctx):
+            return rule.verdict, f"matched rule {rule.rule_id}"
+    return GovernanceVerdict.DENY, "no matching memory rule (fail-closed)"
+
+
+def _random_subset(rng: random.Random, values: list, p_empty: float) -> list:
+    if rng.random() < p_empty:
+        return []
+    return rng.sample(values, rng.randint(1, min(3, len(values))))
+
+
+def _random_rules(rng: random.Random, count: int) -> list[PolicyRule]:
+    namespaces = [f"ns{i}" for i in range(12)]
+    rules = []
+    for i in range(count):
+        params: dict[str, object] = {
+            "verdict": rng.choice(["allow", "deny", "degrade", "quarantine"]),
+        }
+        for key, values, p_empty in (
+            ("actions", [a.value for a in MemoryAction], 0.05),
+            ("namespaces", namespaces, 0.1),
+            ("allowed_provenance", [p.value for p in MemoryProvenance], 0.7),
+            ("allowed_views", [v.value for v in MemoryView], 0.8),
+            ("allowed_modes", [m.value for m in ExecutionMode], 0.8),
+        ):
+            chosen = _random_subset(rng, values, p_empty)
+            if chosen:
+                params[key] = chosen
+        if rng.random() < 0.1:
+            params["verified_only"] = True
+        rules.append(_rule(f"rule-{i:03d}", priority=rng.randint(0, 20), **params))
+    return rules
+
+
+class TestIndexedDispatch:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_differential_against_linear_scan(self, seed: int) -> None:
+        rng = random.Random(seed)
+        compiled = MemoryRuleCompiler().compile_bundle(_random_rules(rng, 150))
+        cached = MemoryRuleEvaluator(compiled, cache_size=64)
+        uncached = MemoryRuleEvaluator(compiled, cache_size=0)
+        namespaces = [f"ns{i}" for i in range(14)] + ["", "default"]
+        for _ in range(1500):
+            op = _op(
+                action=rng.choice(list(MemoryAction)),
+                namespace=rng.choice(namespaces),
+                provenance=rng.choice(list(MemoryProvenance)),
+            )
+            ctx = (
+                None
+                if rng.random() < 0.2
+                else _ctx(
+                    op,
+                    view=rng.choice(list(MemoryView)),
+                    mode=rng.choice(list(ExecutionMode)),
+                )
+            )
+            expected = _linear_decision(compiled, op, ctx)
+            for evaluator in (cached, uncached):
+                decision = evaluator.before_op(op, ctx)
+                assert (decision.verdict, decision.reason) == expected
+                assert decision.operation is op
+
+    def test_namespace_scoped_rule_keeps_priority_over_later_wildcard(self) -> None:
+        compiler = MemoryRuleCompiler()
+        rules = compiler.compile_bundle(
+            [
+                _rule("wild-early", priority=1, verdict="degrade", action="write"),
+                _rule("scoped", priority=5, verdict="allow", namespace="ns1"),
+                _rule("wild-late", priority=9, verdict="deny"),
+            ]
+        )
+        evaluator = MemoryRuleEvaluator(rules)
+        assert evaluator.before_op(_op(MemoryAction.WRITE, "ns1"), None).reason == (
+            "matched rule wild-early"
+        )
+        assert evaluator.before_op(_op(MemoryAction.READ, "ns1"), None).reason == (
+            "matched rule scoped"
+        )
+        assert evaluator.before_op(_op(MemoryAction.READ, "ns2"), None).reason == (
+            "matched rule wild-late"
+        )
+
+    def test_repeated_shape_hits_cache(self) -> None:
+        compiled = MemoryRuleCompiler().compile((_rule(verdict="allow")))
+        evaluator = MemoryRuleEvaluator((compiled,), cache_size=8)
+        for _ in range(3):
+            evaluator.before_op(_op(), _ctx())
+        info = evaluator._select.cache_info()  # type: ignore[attr-defined]
+        assert info.hits == 2
+        assert info.misses == 1
+
+    def test_cache_is_bounded(self) -> None:
+        compiled = MemoryRuleCompiler().compile((_rule(verdict="allow")))
+        evaluator = MemoryRuleEvaluator((compiled,), cache_size=4)
+        for i in range(10):
+            evaluator.before_op(_op(namespace=f"ns{i}"), None)
+        info = evaluator._select.cache_info()  # type: ignore[attr-defined]
+        assert info.currsize == 4
+
+    def test_negative_cache_size_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            MemoryRuleEvaluator((), cache_size=-1)
@@ -378,3 +378,74 @@ def test_wsgi_429_returned_when_app_did_not_respond() -> None:
 
     assert len(start_response_calls) == 1
     assert "429" in start_response_calls[0]
+
+
+# ---------------------------------------------------------------------------
+# Lite per-request contexts
+# ---------------------------------------------------------------------------
+
+
+def test_asgi_lite_contexts_opt_in() -> None:
+    """Lite per-request contexts: no graph until the first wrapped call."""
+    captured: list[ExecutionContext] = []
+
+    async def _capturing_app(scope: Any, receive: Any, send: Any) -> None:
+        ctx = get_current_execution_context()
+        assert ctx is not None
+        captured.append(ctx)
+        assert ctx._graph_obj is None
+        ctx.wrap_llm_call(fn=lambda: None)
+        await _ok_app(scope, receive, send)
+
+    middleware = VeronicaASGIMiddleware(
+        _capturing_app, config=_make_config(), lite_contexts=True
+    )
+    status, _ = asyncio.run(_call_asgi_http(middleware))
+
+    assert status == 200
+    snap = captured[0].get_snapshot()
+    assert snap.chain_id == snap.request_id
+    assert snap.step_count == 1
+    assert snap.graph_summary["total_llm_calls"] == 1
+
+
+def test_asgi_uses_full_contexts_by_default() -> None:
+    captured: list[ExecutionContext] = []
+
+    async def _capturing_app(scope: Any, receive: Any, send: Any) -> None:
+        captured.append(get_current_execution_context())
+        await _ok_app(scope, receive, send)
+
+    middleware = VeronicaASGIMiddleware(_capturing_app, config=_make_config())
+    asyncio.run(_call_asgi_http(middleware))
+
+    assert captured[0]._graph_obj is not None
+    snap = captured[0].get_snapshot()
+    assert snap.chain_id != snap.request_id
+
+
+def test_wsgi_uses_full_contexts_by_default() -> None:
+    captured: list[ExecutionContext] = []
+
+    def _capturing_app(environ: Any, start_response: Any) -> list[bytes]:
+        captured.append(get_current_execution_context())
+        start_response("200 OK", [])
+        return [b"ok"]
+
+    status, _ = _run_wsgi(
+        VeronicaWSGIMiddleware(_capturing_app, config=_make_config())
+    )
+    assert status.startswith("200")
+    assert captured[0]._graph_obj is not None
+    snap = captured[0].get_snapshot()
+    assert snap.chain_id != snap.request_id
+
+
+def test_wsgi_lite_context_halts_like_full() -> None:
+    middleware = VeronicaWSGIMiddleware(
+        lambda environ, start_response: [b"ok"],
+        config=_halting_config(),
+        lite_contexts=True,
+    )
+    status, _ = _run_wsgi(middleware)
+    assert status.startswith("429")
@@ -0,0 +1,167 @@
+"""Tests for ExecutionConfig.node_retention (bounded node history with spill)."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from veronica_core.containment import (
+    ExecutionConfig,
+    ExecutionContext,
+    NodeRetentionPolicy,
+    WrapOptions,
+)
+
+
+def _ctx(policy: NodeRetentionPolicy | None, steps: int = 1_000) -> ExecutionContext:
+    return ExecutionContext(
+        config=ExecutionConfig(
+            max_cost_usd=1_000.0,
+            max_steps=steps,
+            max_retries_total=10,
+            node_retention=policy,
+        )
+    )
+
+
+def _run(ctx: ExecutionContext, n: int, cost: float = 0.0) -> None:
+    for i in range(n):
+        ctx.wrap_llm_call(
+            fn=lambda: None,
+            options=WrapOptions(operation_name=f"op{i}", cost_estimate_hint=cost),
+        )
+
+
+class TestNodeRetentionPolicy:
+    @pytest.mark.parametrize("bad", [0, -1, True, 1.5])
+    def test_invalid_max_nodes(self, bad) -> None:
+        with pytest.raises((TypeError, ValueError)):
+            NodeRetentionPolicy(max_nodes=bad)
+
+    @pytest.mark.parametrize("bad", [0, -1.0, float("nan"), float("inf")])
+    def test_invalid_max_age(self, bad) -> None:
+        with pytest.raises(ValueError):
+            NodeRetentionPolicy(max_age_s=bad)
+
+    def test_no_policy_keeps_legacy_summary(self) -> None:
+        ctx = _ctx(None)
+        _run(ctx, 3)
+        snap = ctx.get_snapshot()
+        assert len(snap.nodes) == 3
+        assert snap.node_history_summary is None
+
+
+class TestRingBuffer:
+    def test_keeps_most_recent_nodes_and_aggregates_evicted(self) -> None:
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=5))
+        _run(ctx, 12, cost=0.5)
+        snap = ctx.get_snapshot()
+        assert [n.operation_name for n in snap.nodes] == [f"op{i}" for i in range(7, 12)]
+        summary = snap.node_history_summary
+        assert summary["retained_count"] == 5
+        assert summary["evicted_count"] == 7
+        assert summary["evicted_by_status"] == {"ok": 7}
+        assert summary["evicted_by_kind"] == {"llm": 7}
+        assert summary["spilled_count"] == 0
+        # Chain counters are unaffected by eviction.
+        assert snap.step_count == 12
+
+    def test_age_eviction(self) -> None:
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=100, max_age_s=0.02))
+        _run(ctx, 3)
+        threading.Event().wait(0.05)
+        snap = ctx.get_snapshot()
+        assert snap.nodes == ()
+        assert snap.node_history_summary["evicted_count"] == 3
+
+    def test_parent_linkage_uses_latest_node(self) -> None:
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=2))
+        _run(ctx, 4)
+        nodes = ctx.get_snapshot().nodes
+        assert nodes[1].parent_id == nodes[0].node_id
+
+
+class TestSpill:
+    def test_evicted_nodes_spill_to_ndjson(self, tmp_path) -> None:
+        spill = tmp_path / "nodes.ndjson"
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=3, spill_path=str(spill)))
+        _run(ctx, 10, cost=0.1)
+
+        history = list(ctx.iter_node_history())
+        assert [n.operation_name for n in history] == [f"op{i}" for i in range(10)]
+        assert all(n.status == "ok" for n in history)
+        assert history[0].start_ts.tzinfo is not None
+        assert ctx.get_snapshot().node_history_summary["spilled_count"] == 7
+
+        ctx.close()
+        lines = spill.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 7
+        assert json.loads(lines[0])["operation_name"] == "op0"
+
+    def test_iteration_is_lazy(self, tmp_path) -> None:
+        spill = tmp_path / "nodes.ndjson"
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=2, spill_path=str(spill)))
+        _run(ctx, 6)
+        it = ctx.iter_node_history()
+        first = next(it)
+        assert first.operation_name == "op0"
+        # Nodes evicted after iteration started are not yielded twice.
+        _run(ctx, 3)
+        rest = [n.operation_name for n in it]
+        assert rest == ["op1", "op2", "op3", "op4", "op5"]
+
+    def test_contexts_sharing_a_policy_read_only_their_nodes(self, tmp_path) -> None:
+        policy = NodeRetentionPolicy(max_nodes=2, spill_path=str(tmp_path / "n.ndjson"))
+        ctx_a, ctx_b = _ctx(policy), _ctx(policy)
+        for i in range(4):
+            for name, ctx in (("A", ctx_a), ("B", ctx_b)):
+                ctx.wrap_llm_call(
+                    fn=lambda: None, options=WrapOptions(operation_name=f"{name}{i}")
+                )
+
+        assert [n.operation_name for n in ctx_a.iter_node_history()] == [
+            "A0", "A1", "A2", "A3"
+        ]
+        assert [n.operation_name for n in ctx_b.iter_node_history()] == [
+            "B0", "B1", "B2", "B3"
+        ]
+        ctx_a.close()
+        ctx_b.close()
+        records = [
+            json.loads(line)
+            for line in (tmp_path / "n.ndjson").read_text(encoding="utf-8").splitlines()
+        ]
+        assert len(records) == 4
+        assert {r["chain_id"] for r in records} == {
+            ctx_a.get_snapshot().chain_id,
+            ctx_b.get_snapshot().chain_id,
+        }
+
+    def test_children_inherit_retention_policy(self, tmp_path) -> None:
+        spill = tmp_path / "nodes.ndjson"
+        parent = _ctx(NodeRetentionPolicy(max_nodes=2, spill_path=str(spill)))
+        children = [
+            parent.spawn_child(max_cost_usd=1.0),
+            parent.create_child("a", ["a", "b"]),
+        ]
+        for child in children:
+            _run(child, 5)
+            summary = child.get_snapshot().node_history_summary
+            assert summary["evicted_count"] == 3
+            assert summary["spilled_count"] == 3
+            assert [n.operation_name for n in child.iter_node_history()] == [
+                f"op{i}" for i in range(5)
+            ]
+            child.close()
+        parent.close()
+
+    def test_unwritable_spill_path_keeps_aggregates(self, tmp_path) -> None:
+        bad = tmp_path / "missing-dir" / "nodes.ndjson"
+        ctx = _ctx(NodeRetentionPolicy(max_nodes=1, spill_path=str(bad)))
+        _run(ctx, 4)
+        summary = ctx.get_snapshot().node_history_summary
+        assert summary["evicted_count"] == 3
+        assert summary["spilled_count"] == 0
+        assert [n.operation_name for n in ctx.iter_node_history()] == ["op3"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from veronica_core import partial
 from veronica_core.partial import (
     PartialBufferOverflow,
     PartialResultBuffer,
@@ -119,3 +120,92 @@ class TestAppendAfterComplete:
         buf.mark_complete()
         assert buf.get_partial() == "data"
         assert buf.to_dict()["partial_text"] == "data"
+
+
+class TestByteStorage:
+    def test_byte_size_counts_utf8_bytes(self):
+        buf = PartialResultBuffer()
+        buf.append("hé")
+        buf.append("日本")
+        assert buf.byte_size == 3 + 6
+        assert buf.chunk_count == 2
+        assert buf.get_partial() == "hé日本"
+
+    def test_long_stream_spans_segments(self):
+        buf = PartialResultBuffer()
+        chunks = [f"token-{i} " for i in range(5_000)]
+        for c in chunks:
+            buf.append(c)
+        buf.append("z" * 200_000)
+        expected = "".join(chunks) + "z" * 200_000
+        assert buf.get_partial() == expected
+        assert buf.byte_size == len(expected)
+
+    def test_memory_views_are_zero_copy_and_stable(self):
+        buf = PartialResultBuffer()
+        buf.append("abc")
+        views = buf.memory_views()
+        assert b"".join(views) == b"abc"
+        assert all(v.readonly for v in views)
+        buf.append("def" * 1000)
+        buf.clear()
+        buf.append("xyz")
+        # Earlier views still see exactly what they saw.
+        assert b"".join(views) == b"abc"
+        assert b"".join(buf.memory_views()) == b"xyz"
+
+    def test_append_bytes_reassembles_split_character(self):
+        buf = PartialResultBuffer()
+        encoded = "été".encode("utf-8")
+        buf.append_bytes(encoded[:1])
+        assert buf.get_partial() == "�"
+        buf.append_bytes(encoded[1:])
+        assert buf.get_partial() == "été"
+        assert buf.get_partial_bytes() == encoded
+
+
+class TestSpillToDisk:
+    @pytest.fixture(autouse=True)
+    def _small_limits(self, monkeypatch):
+        monkeypatch.setattr(partial, "MAX_BYTES", 64)
+        monkeypatch.setattr(partial, "MAX_CHUNKS", 5)
+
+    def test_spills_beyond_memory_cap(self):
+        buf = PartialResultBuffer(spill_to_disk=True)
+        text = "".join(f"<{i}>" for i in range(100))
+        for i in range(100):
+            buf.append(f"<{i}>")  # more chunks than MAX_CHUNKS
+        assert buf.get_partial() == text
+        assert buf.spilled_bytes == len(text) - 64
+        assert sum(len(v) for v in buf.memory_views()) == 64
+        d = buf.to_dict()
+        assert d["partial_text"] == text
+        assert d["spilled_bytes"] == len(text) - 64
+        assert "truncated" not in d
+
+    def test_spill_limit_raises(self):
+        buf = PartialResultBuffer(spill_to_disk=True, max_spill_bytes=10)
+        buf.append("a" * 74)
+        with pytest.raises(PartialBufferOverflow) as exc_info:
+            buf.append("b")
+        assert exc_info.value.truncation_point == "byte_size"
+        assert buf.get_partial() == "a" * 74
+
+    def test_clear_drops_spill(self, tmp_path):
+        buf = PartialResultBuffer(spill_to_disk=True, spill_dir=str(tmp_path))
+        buf.append("x" * 100)
+        assert buf.spilled_bytes == 36
+        buf.clear()
+        assert buf.spilled_bytes == 0
+        assert buf.get_partial() == ""
+        buf.append("y")
+        assert buf.get_partial() == "y"
+
+    def test_without_spill_limits_unchanged(self):
+        buf = PartialResultBuffer()
+        with pytest.raises(PartialBufferOverflow):
+            buf.append("a" * 65)
+
+    def test_invalid_max_spill_bytes(self):
+        with pytest.raises(ValueError):
+            PartialResultBuffer(spill_to_disk=True, max_spill_bytes=0)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -12,10 +14,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from veronica_core.pricing import (
     PRICING_TABLE,
+    Pricing,
     _UNKNOWN_MODEL_FALLBACK,
     estimate_cost_usd,
+    estimate_cost_usd_batch,
     extract_usage_from_response,
+    load_pricing_catalog,
+    reload_pricing_catalog,
     resolve_model_pricing,
+    set_pricing_table,
+    watch_pricing_catalog,
 )
 
 
@@ -200,3 +208,140 @@ def test_wrap_llm_call_cost_estimate_hint_takes_precedence():
         snap = ctx.get_snapshot()
 
     assert snap.cost_usd_accumulated == pytest.approx(0.99)
+
+
+# ---------------------------------------------------------------------------
+# Prefix trie, catalogs and batch estimation
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def restore_pricing_table():
+    saved = dict(PRICING_TABLE)
+    yield
+    set_pricing_table(saved)
+
+
+def test_prefix_trie_longest_match_wins(restore_pricing_table):
+    set_pricing_table(
+        {
+            "gpt-4": Pricing(0.03, 0.06),
+            "gpt-4o": Pricing(0.005, 0.015),
+            "gpt-4o-mini": Pricing(0.00015, 0.0006),
+        }
+    )
+    mini = resolve_model_pricing("gpt-4o-mini-2024-07-18")
+    assert mini is PRICING_TABLE["gpt-4o-mini"]
+    assert resolve_model_pricing("gpt-4o-2024-11-20") is PRICING_TABLE["gpt-4o"]
+    assert resolve_model_pricing("gpt-4-0613") is PRICING_TABLE["gpt-4"]
+    assert resolve_model_pricing("gpt-3.5") == _UNKNOWN_MODEL_FALLBACK
+
+
+def test_direct_table_mutation_is_picked_up(restore_pricing_table):
+    PRICING_TABLE["ft:gpt-4o"] = Pricing(0.00375, 0.015)
+    resolve_model_pricing.cache_clear()
+    pricing = resolve_model_pricing("ft:gpt-4o:acme:custom:abc123")
+    assert pricing == Pricing(0.00375, 0.015)
+
+
+def test_direct_value_update_is_picked_up_by_prefix_lookups(restore_pricing_table):
+    PRICING_TABLE["gpt-4o"] = Pricing(9, 9)
+    resolve_model_pricing.cache_clear()
+    assert resolve_model_pricing("gpt-4o-2024-08-06") == Pricing(9, 9)
+
+
+def test_direct_key_swap_is_picked_up_by_prefix_lookups(restore_pricing_table):
+    set_pricing_table({"gpt-4": Pricing(0.03, 0.06), "gpt-4o": Pricing(0.005, 0.015)})
+    # Same size, different keys.
+    del PRICING_TABLE["gpt-4o"]
+    PRICING_TABLE["gpt-4o-mini"] = Pricing(0.00015, 0.0006)
+    resolve_model_pricing.cache_clear()
+    assert resolve_model_pricing("gpt-4o-2024-08-06") == Pricing(0.03, 0.06)
+    assert resolve_model_pricing("gpt-4o-mini-2024-07-18") == Pricing(0.00015, 0.0006)
+
+
+def test_set_pricing_table_rejects_bad_entries(restore_pricing_table):
+    with pytest.raises(ValueError):
+        set_pricing_table({"gpt-4o": (0.005, 0.015)})
+    with pytest.raises(ValueError):
+        set_pricing_table({"": Pricing(0.1, 0.1)})
+    assert "gpt-4o" in PRICING_TABLE
+
+
+def test_load_json_catalog(tmp_path, restore_pricing_table):
+    path = tmp_path / "pricing.json"
+    path.write_text(
+        '{"models": {"acme-1": {"input_per_1k": 0.001, "output_per_1k": 0.002}}}',
+        encoding="utf-8",
+    )
+    assert reload_pricing_catalog(path) == 1
+    assert PRICING_TABLE == {"acme-1": Pricing(0.001, 0.002)}
+    assert resolve_model_pricing("acme-1-beta") == Pricing(0.001, 0.002)
+    assert resolve_model_pricing("gpt-4o") == _UNKNOWN_MODEL_FALLBACK
+
+
+def test_load_yaml_catalog(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "pricing.yaml"
+    path.write_text(
+        "acme-2:\n  input_per_1k: 0.5\n  output_per_1k: 1\n", encoding="utf-8"
+    )
+    assert load_pricing_catalog(path) == {"acme-2": Pricing(0.5, 1.0)}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[1, 2]",
+        '{"m": {"input_per_1k": -1, "output_per_1k": 0}}',
+        '{"m": {"input_per_1k": 0.1}}',
+        '{"m": {"input_per_1k": true, "output_per_1k": 0}}',
+        "{not json",
+    ],
+)
+def test_invalid_catalog_rejected(tmp_path, content):
+    path = tmp_path / "pricing.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_pricing_catalog(path)
+
+
+def test_watch_pricing_catalog_reloads_on_change(tmp_path, restore_pricing_table):
+    path = tmp_path / "pricing.json"
+    path.write_text(
+        '{"acme-1": {"input_per_1k": 0.001, "output_per_1k": 0.002}}',
+        encoding="utf-8",
+    )
+    handle = watch_pricing_catalog(path, poll_interval=0.02)
+    try:
+        path.write_text(
+            '{"acme-2": {"input_per_1k": 0.003, "output_per_1k": 0.004}}',
+            encoding="utf-8",
+        )
+        st = path.stat()
+        os.utime(path, (st.st_atime, st.st_mtime + 5))
+        deadline = time.monotonic() + 5.0
+        while "acme-2" not in PRICING_TABLE and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert resolve_model_pricing("acme-2") == Pricing(0.003, 0.004)
+    finally:
+        handle.cancel()
+
+
+def test_estimate_cost_usd_batch_matches_scalar():
+    models = ["gpt-4o", "gpt-4o-2024-11-20", "o3", "unknown-x", "gpt-4o"]
+    tokens_in = [1000, 2000, 0, 500, 0]
+    tokens_out = [500, 0, 100, 500, 0]
+    expected = [
+        estimate_cost_usd(m, i, o) for m, i, o in zip(models, tokens_in, tokens_out)
+    ]
+    batch = estimate_cost_usd_batch(models, tokens_in, tokens_out)
+    assert batch == pytest.approx(expected)
+    assert estimate_cost_usd_batch([], [], []) == []
+
+
+def test_estimate_cost_usd_batch_validation():
+    with pytest.raises(ValueError):
+        estimate_cost_usd_batch(["gpt-4o"], [1, 2], [1])
+    with pytest.raises(ValueError):
+        estimate_cost_usd_batch(["gpt-4o", "o3"], [1, -1], [1, 1])
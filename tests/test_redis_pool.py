@@ -0,0 +1,231 @@
+"""Tests for the process-wide shared Redis pool registry (redis_pool)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import fakeredis
+import pytest
+
+from veronica_core import redis_pool
+from veronica_core.circuit_breaker import CircuitState
+from veronica_core.distributed import (
+    DistributedCircuitBreaker,
+    RedisBudgetBackend,
+    get_default_backend,
+    get_default_circuit_breaker,
+)
+from veronica_core.redis_pool import RedisPoolRegistry, get_redis_pool_registry
+
+URL = "redis://shared-pool-test:6379/0"
+
+
+class _Factory:
+    """Client factory backed by one FakeServer; counts created clients."""
+
+    def __init__(self, server: fakeredis.FakeServer) -> None:
+        self.server = server
+        self.created: list[Any] = []
+
+    def __call__(self, url: str) -> Any:
+        client = fakeredis.FakeRedis(server=self.server, decode_responses=True)
+        self.created.append(client)
+        return client
+
+
+@pytest.fixture
+def server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def factory(server: fakeredis.FakeServer) -> _Factory:
+    return _Factory(server)
+
+
+@pytest.fixture
+def registry(factory: _Factory):
+    reg = RedisPoolRegistry(client_factory=factory, reconnect_interval=0.02)
+    yield reg
+    reg.close()
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        threading.Event().wait(0.005)
+    return predicate()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+def test_one_client_per_url(registry: RedisPoolRegistry, factory: _Factory) -> None:
+    a = registry.get_client(URL)
+    b = registry.get_client(URL)
+    c = registry.get_client("redis://other:6379/0")
+    assert a is b
+    assert c is not a
+    assert len(factory.created) == 2
+    assert registry.is_healthy(URL)
+
+
+def test_unknown_url_is_not_healthy(registry: RedisPoolRegistry) -> None:
+    assert registry.is_healthy(URL) is False
+
+
+def test_failed_first_ping_marks_unhealthy(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    server.connected = False
+    registry.get_client(URL)
+    assert registry.is_healthy(URL) is False
+    assert registry.stats()[URL]["failure_count"] == 1
+
+
+def test_background_reconnect_restores_health(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    server.connected = False
+    registry.get_client(URL)
+    server.connected = True
+    assert _wait_for(lambda: registry.is_healthy(URL))
+    # The reconnect thread exits once nothing is unhealthy.
+    assert _wait_for(lambda: registry._reconnect_thread is None)
+
+
+def test_pid_change_rebuilds_clients(
+    registry: RedisPoolRegistry, factory: _Factory
+) -> None:
+    first = registry.get_client(URL)
+    registry._pid = -1  # simulate running in a forked child
+    second = registry.get_client(URL)
+    assert second is not first
+    assert len(factory.created) == 2
+
+
+def test_invalid_reconnect_interval() -> None:
+    with pytest.raises(ValueError):
+        RedisPoolRegistry(reconnect_interval=0)
+
+
+# ---------------------------------------------------------------------------
+# Budget backend / circuit breaker integration
+# ---------------------------------------------------------------------------
+
+
+def test_backends_and_breakers_share_one_client(
+    registry: RedisPoolRegistry, factory: _Factory
+) -> None:
+    b1 = RedisBudgetBackend(URL, "chain-1", pool_registry=registry)
+    b2 = RedisBudgetBackend(URL, "chain-2", pool_registry=registry)
+    cb = DistributedCircuitBreaker(URL, "svc", pool_registry=registry)
+    assert b1._client is b2._client is cb._client
+    assert len(factory.created) == 1
+    b1.add(1.0)
+    assert b2.add(2.0) == pytest.approx(2.0)
+    assert b1.get() == pytest.approx(1.0)
+
+
+def test_close_leaves_shared_client_open(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    b1 = RedisBudgetBackend(URL, "chain-1", pool_registry=registry)
+    cb = DistributedCircuitBreaker(URL, "svc", pool_registry=registry)
+    b1.close()
+    cb.close()
+    b2 = RedisBudgetBackend(URL, "chain-2", pool_registry=registry)
+    assert b2.add(0.5) == pytest.approx(0.5)
+    assert not b2.is_using_fallback
+
+
+def test_failover_observed_once_is_shared(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    b1 = RedisBudgetBackend(URL, "chain-1", pool_registry=registry)
+    b2 = RedisBudgetBackend(URL, "chain-2", pool_registry=registry)
+    cb = DistributedCircuitBreaker(
+        URL, "svc", failure_threshold=1, pool_registry=registry
+    )
+    server.connected = False
+    b1.add(1.0)  # observes the failure
+    assert b1.is_using_fallback
+    assert registry.is_healthy(URL) is False
+
+    calls: list[str] = []
+    b2._client = _Tripwire(b2._client, calls)
+    assert b2.add(0.25) == pytest.approx(0.25)
+    assert b2.is_using_fallback
+    cb.record_failure()
+    assert cb.is_using_fallback
+    assert cb.state == CircuitState.OPEN
+    assert calls == []
+
+
+def test_recovery_reconciles_fallback_spend(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    backend = RedisBudgetBackend(URL, "chain-r", pool_registry=registry)
+    backend.add(1.0)
+    server.connected = False
+    backend.add(0.5)
+    assert backend.is_using_fallback
+    server.connected = True
+    assert _wait_for(lambda: registry.is_healthy(URL))
+    assert backend.add(0.25) == pytest.approx(1.75)
+    assert not backend.is_using_fallback
+    assert backend.get() == pytest.approx(1.75)
+
+
+def test_construction_does_not_ping_again(
+    registry: RedisPoolRegistry, factory: _Factory
+) -> None:
+    RedisBudgetBackend(URL, "warm", pool_registry=registry)
+    calls: list[str] = []
+    registry._entries[URL].client = _Tripwire(factory.created[0], calls)
+    for i in range(20):
+        RedisBudgetBackend(URL, f"chain-{i}", pool_registry=registry)
+    DistributedCircuitBreaker(URL, "svc", pool_registry=registry)
+    assert "ping" not in calls
+
+
+def test_unhealthy_registry_without_fallback_raises(
+    registry: RedisPoolRegistry, server: fakeredis.FakeServer
+) -> None:
+    server.connected = False
+    with pytest.raises(ConnectionError):
+        RedisBudgetBackend(URL, "strict", fallback_on_error=False, pool_registry=registry)
+
+
+def test_default_factories_use_process_registry(
+    monkeypatch: pytest.MonkeyPatch, factory: _Factory
+) -> None:
+    reg = RedisPoolRegistry(client_factory=factory)
+    monkeypatch.setattr(redis_pool, "_default_registry", reg)
+    try:
+        assert get_redis_pool_registry() is reg
+        b1 = get_default_backend(redis_url=URL, chain_id="a")
+        b2 = get_default_backend(redis_url=URL, chain_id="b")
+        cb = get_default_circuit_breaker(redis_url=URL, circuit_id="svc")
+        assert b1._client is b2._client is cb._client
+        assert len(factory.created) == 1
+    finally:
+        reg.close()
+
+
+class _Tripwire:
+    """Proxy that records every attribute access on the wrapped client."""
+
+    def __init__(self, client: Any, calls: list[str]) -> None:
+        self._client = client
+        self._calls = calls
+
+    def __getattr__(self, name: str) -> Any:
+        self._calls.append(name)
+        return getattr(self._client, name)
@@ -318,6 +318,68 @@ class TestRedisReserveCommitRollback:
             b.reserve(0.0, ceiling=1.0)
 
 
+class TestSettle:
+    def test_local_settle_charges_amount_and_releases_escrow(self):
+        b = LocalBudgetBackend()
+        rid = b.reserve(0.5, ceiling=1.0)
+        total = b.settle(rid, 0.2)
+        assert total == pytest.approx(0.2)
+        assert b.get() == pytest.approx(0.2)
+        assert b.get_reserved() == 0.0
+
+    def test_local_settle_zero_is_rollback(self):
+        b = LocalBudgetBackend()
+        rid = b.reserve(0.5, ceiling=1.0)
+        b.settle(rid, 0.0)
+        assert b.get() == 0.0
+        assert b.get_reserved() == 0.0
+
+    def test_local_settle_unknown_raises_key_error(self):
+        b = LocalBudgetBackend()
+        with pytest.raises(KeyError):
+            b.settle("nonexistent", 0.1)
+
+    def test_local_settle_twice_raises_key_error(self):
+        b = LocalBudgetBackend()
+        rid = b.reserve(0.5, ceiling=1.0)
+        b.settle(rid, 0.1)
+        with pytest.raises(KeyError):
+            b.settle(rid, 0.1)
+        assert b.get() == pytest.approx(0.1)
+
+    @pytest.mark.parametrize("amount", [-0.1, float("nan"), float("inf")])
+    def test_settle_invalid_amount_raises_value_error(self, amount):
+        b = LocalBudgetBackend()
+        rid = b.reserve(0.5, ceiling=1.0)
+        with pytest.raises(ValueError):
+            b.settle(rid, amount)
+        # Reservation untouched by the rejected call.
+        assert b.get_reserved() == pytest.approx(0.5)
+
+    def test_redis_settle_basic(self, fake_redis_client):
+        b = make_redis_backend(fake_redis_client)
+        rid = b.reserve(0.5, ceiling=1.0)
+        assert b.settle(rid, 0.3) == pytest.approx(0.3)
+        assert b.get() == pytest.approx(0.3)
+        # Escrow released: the full ceiling minus committed is reservable again.
+        b.commit(b.reserve(0.7, ceiling=1.0))
+
+    def test_redis_settle_unknown_raises_key_error(self, fake_redis_client):
+        b = make_redis_backend(fake_redis_client)
+        with pytest.raises(KeyError):
+            b.settle("nonexistent", 0.1)
+
+    def test_redis_settle_falls_back_and_keeps_spend(self, fake_redis_client):
+        b = make_redis_backend(fake_redis_client)
+        rid = b.reserve(0.5, ceiling=1.0)
+        b._client = MagicMock()
+        b._client.get.return_value = "0"
+        b._client.eval.side_effect = ConnectionError("down")
+        b.settle(rid, 0.25)
+        assert b._using_fallback is True
+        assert b._fallback.get() == pytest.approx(0.25)
+
+
 class TestAdversarialRedisReserveConcurrent:
     def test_concurrent_reserve_ceiling_enforced(self, fake_redis_client):
         """10 threads attempt $0.15 each against $1.0 ceiling. At most 6 succeed."""
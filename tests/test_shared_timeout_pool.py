@@ -25,7 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from conftest import wait_for
 
-from veronica_core.containment.timeout_pool import SharedTimeoutPool
+from veronica_core.containment.timeout_pool import SharedTimeoutPool, _Timer
 from veronica_core.containment.execution_context import (
     ExecutionConfig,
     ExecutionContext,
@@ -263,3 +263,140 @@ def test_execution_context_timeout_still_works_via_pool() -> None:
         f"Expected HALT after pool-routed timeout, got {decision}"
     )
     assert fn_called == [], "fn must NOT be called after timeout"
+
+
+# ---------------------------------------------------------------------------
+# Timing wheel
+# ---------------------------------------------------------------------------
+
+
+def test_invalid_tick_rejected() -> None:
+    for bad in (0, -0.001, float("inf"), float("nan")):
+        try:
+            SharedTimeoutPool(tick_s=bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"tick_s={bad!r} must be rejected")
+
+
+def test_cancel_frees_timer_immediately() -> None:
+    """Cancelled timers leave the wheel at once, not at their deadline."""
+    pool = _pool()
+    handles = [
+        pool.schedule(deadline=time.monotonic() + 300.0, callback=lambda: None)
+        for _ in range(1000)
+    ]
+    assert pool.pending() == 1000
+    for h in handles:
+        pool.cancel(h)
+    stats = pool.stats()
+    assert stats.pending == 0
+    assert stats.pending_by_level == (0, 0, 0, 0)
+    assert stats.cancelled_total == 1000
+    pool.shutdown()
+
+
+def test_cancel_after_fire_is_noop() -> None:
+    """cancel() of a fired handle does not count or retain anything."""
+    pool = _pool()
+    fired = threading.Event()
+    handle = pool.schedule(deadline=time.monotonic(), callback=fired.set)
+    assert fired.wait(timeout=2.0)
+    wait_for(lambda: pool.stats().fired_total == 1, timeout=2.0, msg="not counted")
+    pool.cancel(handle)
+    stats = pool.stats()
+    assert stats.pending == 0
+    assert stats.cancelled_total == 0
+    pool.shutdown()
+
+
+def test_queue_depth_by_level() -> None:
+    """Timers are bucketed by distance: ms, seconds, minutes, hours."""
+    pool = _pool()
+    now = time.monotonic()
+    for offset in (0.03, 2.0, 120.0, 3600.0, 86400.0):
+        pool.schedule(deadline=now + offset, callback=lambda: None)
+    stats = pool.stats()
+    assert stats.pending == 5
+    assert stats.pending_by_level == (1, 1, 1, 2)
+    pool.shutdown()
+
+
+def test_same_tick_callbacks_dispatch_as_one_batch() -> None:
+    pool = _pool()
+    fired: list[int] = []
+    deadline = time.monotonic() + 0.1
+    for i in range(100):
+        pool.schedule(deadline=deadline, callback=lambda i=i: fired.append(i))
+    wait_for(lambda: len(fired) == 100, timeout=2.0, msg=f"fired {len(fired)}")
+    stats = pool.stats()
+    assert stats.dispatch_batches == 1
+    assert stats.max_batch_size == 100
+    assert stats.fired_total == 100
+    pool.shutdown()
+
+
+def test_cascaded_timers_fire_in_order_and_not_early() -> None:
+    """With a 10us tick, 50-150ms deadlines sit on level 2 and cascade down."""
+    pool = SharedTimeoutPool(tick_s=0.00001)
+    fired: list[tuple[int, float]] = []
+    now = time.monotonic()
+    deadlines = {i: now + 0.05 + 0.02 * i for i in range(5)}
+    for i in (3, 0, 4, 1, 2):
+        pool.schedule(
+            deadline=deadlines[i],
+            callback=lambda i=i: fired.append((i, time.monotonic())),
+        )
+    assert pool.stats().pending_by_level[2] == 5
+    wait_for(lambda: len(fired) == 5, timeout=2.0, msg=f"fired {fired}")
+    assert [i for i, _ in fired] == [0, 1, 2, 3, 4]
+    for i, ts in fired:
+        assert ts >= deadlines[i]
+    assert pool.stats().callback_errors == 0
+    pool.shutdown()
+
+
+def test_timer_after_level_boundary_fires_on_time() -> None:
+    """A level-1 slot the cursor has just reached is still due for cascade."""
+    pool = SharedTimeoutPool()
+    fired: list[tuple[int, float]] = []
+    origin = pool._origin
+    # Fires at tick 63, leaving the cursor on the level-1 boundary (tick 64)
+    # with the second timer still in the uncascaded level-1 slot.
+    for i, offset in enumerate((0.0625, 0.078)):
+        pool.schedule(
+            deadline=origin + offset,
+            callback=lambda i=i: fired.append((i, time.monotonic() - origin)),
+        )
+    wait_for(lambda: len(fired) == 2, timeout=5.0, msg=f"fired {fired}")
+    assert [i for i, _ in fired] == [0, 1]
+    assert fired[1][1] < 1.0, f"second timer fired late: {fired[1][1]:.3f}s"
+    pool.shutdown()
+
+
+def test_next_due_tick_includes_pending_slot_on_level_boundary() -> None:
+    """Wake-up tick after the cursor lands on a level-1 or level-2 boundary."""
+    pool = SharedTimeoutPool()
+    for level in (1, 2):
+        boundary = 1 << (6 * level)
+        with pool._lock:
+            # The later timer is exactly `boundary` ticks away: it sits on
+            # `level` until the cursor reaches the boundary and cascades it.
+            pool._next_tick = 14
+            pool._place(_timer_at(pool, boundary - 1))
+            late = _timer_at(pool, boundary + 14)
+            pool._place(late)
+            assert late.level == level
+            assert len(pool._advance(boundary - 1)) == 1
+            assert pool._next_tick == boundary
+            assert pool._next_due_tick() == boundary
+            assert len(pool._advance(boundary + 14)) == 1
+            assert not pool._timers
+    pool.shutdown()
+
+
+def _timer_at(pool: SharedTimeoutPool, tick: int) -> _Timer:
+    pool._counter += 1
+    timer = _Timer(pool._counter, tick, lambda: None)
+    pool._timers[timer.handle] = timer
+    return timer
@@ -3,6 +3,8 @@
 import logging
 import time
 
+import pytest
+
 from _nogil_compat import nogil_unstable
 from veronica_core.state import VeronicaState, VeronicaStateMachine
 
@@ -608,3 +610,123 @@ class TestConcurrentStateMachine:
         assert not errors, f"Concurrent access errors: {errors}"
         # After all setters ran, cooldown must be set
         assert sm.is_in_cooldown(entity)
+
+
+class TestExpiryIndex:
+    """cleanup_expired() uses an expiry heap instead of scanning cooldowns."""
+
+    def test_cleanup_only_removes_expired(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        for i in range(50):
+            sm.set_cooldown(f"live{i}", now + 3600)
+        sm.set_cooldown("old1", now - 1)
+        sm.set_cooldown("old2", now - 2)
+
+        assert sorted(sm.cleanup_expired()) == ["old1", "old2"]
+        assert len(sm.cooldowns) == 50
+        assert sm.cleanup_expired() == []
+
+    def test_extended_cooldown_is_not_cleaned_by_stale_entry(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        sm.set_cooldown("pair", now - 1)
+        sm.set_cooldown("pair", now + 3600)
+        assert sm.cleanup_expired() == []
+        assert sm.is_in_cooldown("pair")
+
+    def test_direct_dict_writes_are_indexed(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        sm.set_cooldown("a", now + 3600)
+        sm.cooldowns["b"] = now - 1
+        assert sm.cleanup_expired() == ["b"]
+
+        sm.cooldowns = {"c": now - 1, "d": now + 3600}
+        assert sm.cleanup_expired() == ["c"]
+        assert sm.cooldowns == {"d": now + 3600}
+
+    def test_in_place_overwrite_with_later_expiry_survives(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        sm.set_cooldown("pair", now - 1)
+        sm.cooldowns["pair"] = now + 3600
+        assert sm.cleanup_expired() == []
+        # Re-indexed under the new expiry (no key added or removed).
+        sm.cooldowns["pair"] = now - 1
+        assert sm.cleanup_expired() == ["pair"]
+
+    def test_in_place_shortened_cooldown_is_cleaned(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        sm.set_cooldown("p", now + 3600)
+        sm.cooldowns["p"] = now - 1
+        assert sm.cleanup_expired() == ["p"]
+        assert sm.cooldowns == {}
+
+    def test_assigned_dict_and_bulk_writes_are_indexed(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        sm.cooldowns = {"a": now + 3600}
+        sm.cooldowns.update(a=now - 1, b=now - 2)
+        sm.cooldowns.setdefault("c", now - 3)
+        sm.cooldowns |= {"d": now + 3600}
+        assert sorted(sm.cleanup_expired()) == ["a", "b", "c"]
+        assert sm.cooldowns == {"d": now + 3600}
+
+    def test_stale_entries_do_not_accumulate(self):
+        sm = VeronicaStateMachine()
+        now = time.time()
+        for i in range(10_000):
+            sm.set_cooldown("pair", now + 3600 + i)
+        sm.cleanup_expired()
+        assert len(sm.cooldowns.expiry_heap()) <= 2 * len(sm.cooldowns) + 64
+
+
+class TestHistoryLimit:
+    """state_history is a ring buffer bounded by history_limit."""
+
+    @staticmethod
+    def _flip(sm, n, start=0):
+        for i in range(start, start + n):
+            target = (
+                VeronicaState.IDLE
+                if sm.current_state == VeronicaState.SCREENING
+                else VeronicaState.SCREENING
+            )
+            sm.transition(target, f"t{i}")
+
+    def test_default_limit_is_100(self):
+        sm = VeronicaStateMachine()
+        self._flip(sm, 150)
+        assert len(sm.state_history) == 100
+        assert sm.state_history[-1].reason == "t149"
+        assert sm.state_history[0].reason == "t50"
+
+    def test_custom_limit(self):
+        sm = VeronicaStateMachine(history_limit=5)
+        self._flip(sm, 12)
+        assert [t.reason for t in sm.state_history] == [f"t{i}" for i in range(7, 12)]
+
+    def test_invalid_limit_rejected(self):
+        for bad in (0, -1, True, 1.5, 10**9):
+            with pytest.raises(ValueError):
+                VeronicaStateMachine(history_limit=bad)
+
+    def test_round_trip_preserves_limit(self):
+        sm = VeronicaStateMachine(history_limit=3)
+        self._flip(sm, 5)
+        data = sm.to_dict()
+        assert data["history_limit"] == 3
+        assert len(data["state_history"]) == 3
+
+        restored = VeronicaStateMachine.from_dict(data)
+        assert restored.history_limit == 3
+        self._flip(restored, 1, start=5)
+        assert [t.reason for t in restored.state_history] == ["t3", "t4", "t5"]
+
+    def test_plain_list_assignment_still_trimmed(self):
+        sm = VeronicaStateMachine(history_limit=2)
+        sm.state_history = []
+        self._flip(sm, 4)
+        assert [t.reason for t in sm.state_history] == ["t2", "t3"]
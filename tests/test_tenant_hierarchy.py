@@ -201,3 +201,128 @@ def test_concurrent_register_and_get(registry: TenantRegistry) -> None:
         th.join()
 
     assert errors == [], f"Thread errors: {errors}"
+
+
+# ---------------------------------------------------------------------------
+# Resolution snapshot
+# ---------------------------------------------------------------------------
+
+
+def test_lookups_do_not_take_registry_lock(
+    registry: TenantRegistry, root_policy: ShieldPipeline
+) -> None:
+    pool = BudgetPool(total=10.0, pool_id="org-pool")
+    registry.register(Tenant(id="org", policy=root_policy, budget_pool=pool))
+    registry.register(Tenant(id="team", parent_id="org"))
+    with registry._lock:  # a writer holding the lock must not block readers
+        assert registry.resolve_policy("team") is root_policy
+        assert registry.get_effective_budget("team") == pytest.approx(10.0)
+
+
+def test_version_bumps_on_mutation(registry: TenantRegistry) -> None:
+    v0 = registry.version
+    registry.register(Tenant(id="org"))
+    registry.register(Tenant(id="team", parent_id="org"))
+    registry.remove("team")
+    assert registry.version == v0 + 3
+
+
+def test_removed_tenant_lookup_raises(registry: TenantRegistry) -> None:
+    registry.register(Tenant(id="org"))
+    registry.register(Tenant(id="team", parent_id="org"))
+    registry.remove("team")
+    with pytest.raises(TenantNotFoundError):
+        registry.resolve_policy("team")
+    with pytest.raises(TenantNotFoundError):
+        registry.get_effective_budget("team")
+
+
+def test_invalidate_re_resolves_subtree(
+    registry: TenantRegistry, root_policy: ShieldPipeline, child_policy: ShieldPipeline
+) -> None:
+    org = Tenant(id="org", policy=root_policy)
+    registry.register(org)
+    registry.register(Tenant(id="proj", parent_id="org"))
+    registry.register(Tenant(id="agent", parent_id="proj"))
+    registry.register(Tenant(id="other", policy=root_policy))
+
+    # Bypass Tenant.__setattr__: state the registry cannot observe.
+    object.__setattr__(org, "policy", child_policy)
+    pool = BudgetPool(total=5.0, pool_id="org-pool")
+    object.__setattr__(org, "budget_pool", pool)
+    # Stale until invalidated.
+    assert registry.resolve_policy("agent") is root_policy
+
+    registry.invalidate("org")
+    assert registry.resolve_policy("agent") is child_policy
+    assert registry.get_effective_budget("agent") == pytest.approx(5.0)
+    assert registry.resolve_policy("other") is root_policy
+
+
+def test_reassigning_pool_or_policy_re_resolves_subtree(
+    registry: TenantRegistry, root_policy: ShieldPipeline, child_policy: ShieldPipeline
+) -> None:
+    org = Tenant(id="org", policy=root_policy)
+    registry.register(org)
+    registry.register(Tenant(id="proj", parent_id="org"))
+    registry.register(Tenant(id="agent", parent_id="proj"))
+    v0 = registry.version
+
+    org.policy = child_policy
+    org.budget_pool = BudgetPool(total=5.0, pool_id="org-pool")
+    assert registry.resolve_policy("agent") is child_policy
+    assert registry.get_effective_budget("agent") == pytest.approx(5.0)
+    assert registry.version == v0 + 2
+
+    registry.remove("agent")
+    detached = registry.version
+    agent = Tenant(id="agent", parent_id="proj")
+    registry.register(agent)
+    registry.remove("agent")
+    agent.policy = root_policy  # no longer registered: no re-resolution
+    assert registry.version == detached + 2
+
+
+def test_registered_tenant_keys_cannot_be_reassigned(
+    registry: TenantRegistry,
+) -> None:
+    registry.register(Tenant(id="org"))
+    registry.register(Tenant(id="other"))
+    team = Tenant(id="team", parent_id="org")
+    registry.register(team)
+    with pytest.raises(AttributeError, match="parent_id"):
+        team.parent_id = "other"
+    with pytest.raises(AttributeError, match="id"):
+        team.id = "renamed"
+    assert [t.id for t in registry.get_children("org")] == ["team"]
+
+    registry.remove("team")
+    team.parent_id = "other"
+    registry.register(team)
+    assert [t.id for t in registry.get_children("other")] == ["team"]
+
+
+def test_tenant_cannot_join_two_registries(registry: TenantRegistry) -> None:
+    org = Tenant(id="org")
+    registry.register(org)
+    with pytest.raises(ValueError, match="another registry"):
+        TenantRegistry().register(org)
+
+
+def test_mutations_update_resolution_map_in_place(
+    registry: TenantRegistry,
+) -> None:
+    registry.register(Tenant(id="org"))
+    resolved = registry._resolved
+    sibling = resolved["org"]
+    registry.register(Tenant(id="team", parent_id="org"))
+    registry.invalidate("team")
+    registry.remove("team")
+    # No whole-map copies: the map and untouched entries are kept.
+    assert registry._resolved is resolved
+    assert resolved["org"] is sibling
+
+
+def test_invalidate_unknown_tenant_raises(registry: TenantRegistry) -> None:
+    with pytest.raises(TenantNotFoundError):
+        registry.invalidate("missing")
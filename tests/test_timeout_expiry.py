@@ -10,9 +10,12 @@ No private attribute access -- only public API used: wrap_llm_call, get_snapshot
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -182,3 +185,100 @@ def test_timeout_fn_exception_during_timeout_returns_halt():
     assert decision == Decision.HALT, (
         f"Expected Decision.HALT when fn raises after timeout, got {decision}"
     )
+
+
+def test_asyncio_timeout_backend_halts_context_and_task():
+    """asyncio backend fires on the loop, halts wraps and cancels the bound task."""
+    config = ExecutionConfig(
+        max_cost_usd=10.0,
+        max_steps=100,
+        max_retries_total=10,
+        timeout_ms=30,
+        timeout_backend="asyncio",
+    )
+
+    async def main() -> ExecutionContext:
+        ctx = ExecutionContext(config=config)
+        ctx.bind_task()
+        child = ctx.spawn_child(timeout_ms=1000)
+        assert child._config.timeout_backend == "asyncio"
+        child.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.sleep(5.0)
+        return ctx
+
+    ctx = asyncio.run(main())
+    assert ctx._cancellation_token.is_cancelled
+    assert ctx.wrap_llm_call(fn=lambda: None) == Decision.HALT
+    assert any(e.event_type == "CHAIN_TIMEOUT" for e in ctx.get_snapshot().events)
+    ctx.close()
+
+
+def _timeout_config(timeout_ms: int, backend: str = "asyncio") -> ExecutionConfig:
+    return ExecutionConfig(
+        max_cost_usd=10.0,
+        max_steps=100,
+        max_retries_total=10,
+        timeout_ms=timeout_ms,
+        timeout_backend=backend,
+    )
+
+
+def test_asyncio_timeout_does_not_cancel_creator_task():
+    """Only bound tasks are cancelled: the creating task keeps running."""
+
+    async def main() -> ExecutionContext:
+        ctx = ExecutionContext(config=_timeout_config(20))
+        await asyncio.sleep(0.1)  # no CancelledError
+        return ctx
+
+    ctx = asyncio.run(main())
+    assert ctx._cancellation_token.is_cancelled
+    assert ctx.wrap_llm_call(fn=lambda: None) == Decision.HALT
+    ctx.close()
+
+
+def test_asyncio_child_timeout_does_not_cancel_parent_task():
+    async def main() -> tuple[ExecutionContext, ExecutionContext]:
+        parent = ExecutionContext(config=_timeout_config(5000))
+        parent.bind_task()
+        child = parent.spawn_child(timeout_ms=50)
+        await asyncio.sleep(0.2)  # no CancelledError
+        return parent, child
+
+    parent, child = asyncio.run(main())
+    assert child._cancellation_token.is_cancelled
+    assert not parent._cancellation_token.is_cancelled
+    child.close()
+    parent.close()
+
+
+@pytest.mark.parametrize("backend", ["asyncio", "thread"])
+def test_async_with_cancels_body_on_timeout(backend):
+    config = _timeout_config(30, backend)
+
+    async def main() -> ExecutionContext:
+        async with ExecutionContext(config=config) as ctx:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.sleep(5.0)
+        # Unbound on exit: the task is not cancelled again.
+        await asyncio.sleep(0)
+        return ctx
+
+    ctx = asyncio.run(main())
+    assert ctx._cancellation_token.is_cancelled
+    assert ctx._limits.timeout._task is None
+
+
+def test_bind_task_outside_task_raises():
+    ctx = ExecutionContext(config=_timeout_config(0))
+    with pytest.raises(RuntimeError, match="bind_task"):
+        ctx.bind_task()
+    ctx.close()
+
+
+def test_invalid_timeout_backend_rejected():
+    with pytest.raises(ValueError, match="timeout_backend"):
+        ExecutionConfig(
+            max_cost_usd=1.0, max_steps=1, max_retries_total=1, timeout_backend="gevent"
+        )
@@ -5,6 +5,7 @@ Covers initial state, cancellation detection, elapsed time, and watcher lifecycl
 
 from __future__ import annotations
 
+import asyncio
 import time
 
 from veronica_core.containment._timeout_manager import TimeoutManager
@@ -79,3 +80,90 @@ class TestTimeoutManagerBasic:
         time.sleep(0.05)
         assert not token.is_cancelled
         assert not fired
+
+
+class TestAsyncioBackend:
+    def test_deadline_cancels_token_and_bound_task(self) -> None:
+        events: list[tuple[str, str]] = []
+
+        async def main() -> bool:
+            token = CancellationToken()
+            mgr = TimeoutManager(token)
+            mgr.bind_task(asyncio.current_task())
+            mgr.start_watcher(
+                timeout_ms=20,
+                emit_fn=lambda r, d: events.append((r, d)),
+                config_timeout_ms=20,
+                backend="asyncio",
+            )
+            assert isinstance(mgr._pool_handle, asyncio.TimerHandle)
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                assert token.is_cancelled
+                assert mgr._pool_handle is None
+                return True
+            return False
+
+        assert asyncio.run(main()) is True
+        assert events == [("timeout", "timeout_ms=20 elapsed")]
+
+    def test_deadline_leaves_unbound_task_running(self) -> None:
+        async def main() -> None:
+            token = CancellationToken()
+            mgr = TimeoutManager(token)
+            mgr.start_watcher(
+                timeout_ms=20,
+                emit_fn=lambda r, d: None,
+                config_timeout_ms=20,
+                backend="asyncio",
+            )
+            await asyncio.sleep(0.1)  # not cancelled
+            assert token.is_cancelled
+
+        asyncio.run(main())
+
+    def test_cancel_watcher_before_deadline(self) -> None:
+        async def main() -> None:
+            token = CancellationToken()
+            mgr = TimeoutManager(token)
+            mgr.start_watcher(
+                timeout_ms=20,
+                emit_fn=lambda r, d: None,
+                config_timeout_ms=20,
+                backend="asyncio",
+            )
+            mgr.cancel_watcher()
+            await asyncio.sleep(0.05)  # not cancelled
+            assert not token.is_cancelled
+
+        asyncio.run(main())
+
+    def test_cancel_watcher_from_another_thread(self) -> None:
+        async def main() -> None:
+            token = CancellationToken()
+            mgr = TimeoutManager(token)
+            mgr.start_watcher(
+                timeout_ms=50,
+                emit_fn=lambda r, d: None,
+                config_timeout_ms=50,
+                backend="asyncio",
+            )
+            await asyncio.get_running_loop().run_in_executor(None, mgr.cancel_watcher)
+            await asyncio.sleep(0.1)
+            assert not token.is_cancelled
+
+        asyncio.run(main())
+
+    def test_no_running_loop_falls_back_to_pool(self) -> None:
+        token = CancellationToken()
+        mgr = TimeoutManager(token)
+        mgr.start_watcher(
+            timeout_ms=5000,
+            emit_fn=lambda r, d: None,
+            config_timeout_ms=5000,
+            backend="asyncio",
+        )
+        assert isinstance(mgr._pool_handle, int)
+        assert mgr._loop is None
+        mgr.cancel_watcher()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import threading
 import time
 from typing import Any
@@ -393,3 +394,98 @@ class TestCanonicalJson:
         reg = ToolPinRegistry()
         pin = reg.register("tool", SCHEMA_A)
         assert pin.schema_hash == ToolPinRegistry.hash_schema(SCHEMA_A)
+
+
+# ---------------------------------------------------------------------------
+# Schema hash cache and verify_many
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaHashCache:
+    def test_repeat_verify_hits_cache(self, registry: ToolPinRegistry) -> None:
+        registry.register("web_search", SCHEMA_A)
+        for _ in range(3):
+            assert registry.verify("web_search", SCHEMA_A)
+        info = registry.hash_cache_info()
+        assert info.hits >= 2
+        assert info.size >= 1
+
+    def test_in_place_mutation_detected(self, registry: ToolPinRegistry) -> None:
+        schema = copy.deepcopy(SCHEMA_A)
+        registry.register("web_search", schema)
+        assert registry.verify("web_search", schema)
+        schema["parameters"]["properties"]["query"]["type"] = "integer"
+        result = registry.verify("web_search", schema)
+        assert result.verdict is PinVerdict.HASH_MISMATCH
+
+    def test_bool_and_int_not_conflated(self, registry: ToolPinRegistry) -> None:
+        # True == 1 in Python, but the canonical JSON differs ("true" vs "1").
+        registry.register("tool", {"flag": True})
+        assert registry.verify("tool", {"flag": True})
+        assert not registry.verify("tool", {"flag": 1})
+        assert not registry.verify("tool", {"flag": 1.0})
+
+    def test_key_order_still_matches(self, registry: ToolPinRegistry) -> None:
+        registry.register("tool", {"a": 1, "b": 2})
+        assert registry.verify("tool", {"b": 2, "a": 1})
+
+    def test_unserializable_not_cached(self, registry: ToolPinRegistry) -> None:
+        registry.register("tool", SCHEMA_A)
+        bad = {"val": float("nan")}
+        for _ in range(2):
+            assert registry.verify("tool", bad).verdict is PinVerdict.UNSERIALIZABLE
+        assert registry.hash_cache_info().hits == 0
+
+    def test_unmarshalable_schema_falls_back(self, registry: ToolPinRegistry) -> None:
+        class Name(str):
+            pass
+
+        registry.register("tool", {"name": "x"})
+        assert registry.verify("tool", {"name": Name("x")})
+        assert registry.hash_cache_info().size == 0
+
+    def test_cache_is_bounded(self) -> None:
+        reg = ToolPinRegistry(hash_cache_size=4)
+        for i in range(10):
+            reg.verify("tool", {"i": i})
+        assert reg.hash_cache_info().size == 4
+
+    def test_cache_disabled(self) -> None:
+        reg = ToolPinRegistry(hash_cache_size=0)
+        reg.register("tool", SCHEMA_A)
+        assert reg.verify("tool", SCHEMA_A)
+        assert reg.hash_cache_info().maxsize == 0
+
+    def test_negative_cache_size_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ToolPinRegistry(hash_cache_size=-1)
+
+
+class TestVerifyMany:
+    def test_mixed_verdicts(self, registry: ToolPinRegistry) -> None:
+        registry.register("web_search", SCHEMA_A)
+        registry.register("read_file", SCHEMA_B)
+        results = registry.verify_many(
+            {
+                "web_search": SCHEMA_A,
+                "read_file": {"name": "read_file"},
+                "ghost": SCHEMA_A,
+                "broken": {"val": float("inf")},
+            }
+        )
+        assert list(results) == ["web_search", "read_file", "ghost", "broken"]
+        assert results["web_search"].verdict is PinVerdict.MATCH
+        assert results["read_file"].verdict is PinVerdict.HASH_MISMATCH
+        assert results["ghost"].verdict is PinVerdict.NOT_PINNED
+        assert results["broken"].verdict is PinVerdict.UNSERIALIZABLE
+
+    def test_accepts_pairs(self, registry: ToolPinRegistry) -> None:
+        registry.register("web_search", SCHEMA_A)
+        results = registry.verify_many([("web_search", SCHEMA_A)])
+        assert results["web_search"]
+
+    def test_matches_verify(self, registry: ToolPinRegistry) -> None:
+        registry.register("web_search", SCHEMA_A)
+        many = registry.verify_many({"web_search": SCHEMA_B})
+        single = registry.verify("web_search", SCHEMA_B)
+        assert many["web_search"] == single